@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""CPU and allocation benchmark of decoding search responses.
+
+Builds a SearchDataObjectsResponse with BENCH_SEARCH_LIMIT hits, as Vector
+Search returns it for a search_knowledge call with that limit, and decodes
+it into a SearchResult repeatedly. Reports the CPU time and the memory
+allocated per hit (measured with tracemalloc in a separate pass, so its
+overhead does not skew the timing).
+
+Environment Variables:
+    BENCH_SEARCH_LIMIT: Hits per response (default: 100)
+    BENCH_ROUNDS: Responses decoded for the timing (default: 200)
+
+Usage:
+    uv run python benchmarks/decode_benchmark.py
+"""
+
+import gc
+import os
+import time
+import tracemalloc
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from google.cloud import vectorsearch_v1beta
+
+from mcp_server.infrastructure.vector_search import search_result_from_response
+
+
+def build_response(hits: int) -> vectorsearch_v1beta.SearchDataObjectsResponse:
+    """Build a search response with hits full Knowledge data objects."""
+    now = datetime.now(UTC)
+    results = []
+    for i in range(hits):
+        # A handful of distinct timestamps, as in a real corpus
+        timestamp = (now - timedelta(days=i % 7)).isoformat()
+        data = {
+            "id": str(uuid.uuid4()),
+            "title": f"How to deploy service {i} to Cloud Run",
+            "content": "Build the container, push it and deploy it. " * 20,
+            "tags": ["gcp", "cloud-run", "deploy"],
+            "user_id": "benchmark",
+            "source": "team",
+            "status": "promoted",
+            "github_path": f"knowledge/deploy-{i}.md",
+            "pr_url": "",
+            "promoted_from_id": str(uuid.uuid4()),
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
+        results.append(
+            vectorsearch_v1beta.SearchResult(
+                data_object=vectorsearch_v1beta.DataObject(data=data),
+                distance=1.0 - i / hits,
+            )
+        )
+    return vectorsearch_v1beta.SearchDataObjectsResponse(results=results)
+
+
+def main() -> None:
+    """Run the benchmark and print the per-hit cost."""
+    hits = int(os.environ.get("BENCH_SEARCH_LIMIT", "100"))
+    rounds = int(os.environ.get("BENCH_ROUNDS", "200"))
+    response = build_response(hits)
+    search_result_from_response(response)  # warm up
+
+    gc.disable()
+    started = time.process_time()
+    for _ in range(rounds):
+        search_result_from_response(response)
+    elapsed = time.process_time() - started
+    gc.enable()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = search_result_from_response(response)
+    _, peak = tracemalloc.get_traced_memory()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(f"hits per response: {hits}, rounds: {rounds}")
+    print(f"cpu per response:  {elapsed / rounds * 1e3:.2f} ms")
+    print(f"cpu per hit:       {elapsed / rounds / hits * 1e6:.1f} us")
+    print(f"peak alloc per hit:     {(peak - before) / hits:.0f} B")
+    print(f"retained alloc per hit: {(retained - before) / hits:.0f} B")
+
+
+if __name__ == "__main__":
+    main()
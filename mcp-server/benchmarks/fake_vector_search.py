@@ -0,0 +1,291 @@
+"""In-process gRPC stand-in for the Vector Search 2.0 data object services.
+
+Implements the DataObjectService and DataObjectSearchService RPCs used by
+the knowledge repositories on top of an in-memory store, with a
+configurable latency injected into every call. Semantic and text search
+are both faked with term overlap between the query and title/content.
+
+Point the server at it by setting VECTOR_SEARCH_EMULATOR_HOST to the
+address returned by FakeVectorSearch.start().
+"""
+
+import asyncio
+import random
+import re
+from datetime import UTC, datetime
+
+import grpc
+from google.cloud import vectorsearch_v1beta
+from google.protobuf import empty_pb2, json_format
+
+DATA_OBJECT_SERVICE = "google.cloud.vectorsearch.v1beta.DataObjectService"
+SEARCH_SERVICE = "google.cloud.vectorsearch.v1beta.DataObjectSearchService"
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def _to_dict(message, field: str) -> dict:
+    """Convert a Struct field of a proto-plus message to a plain dict."""
+    return json_format.MessageToDict(getattr(type(message).pb(message), field))
+
+
+def _matches(data: dict, expression: dict) -> bool:
+    """Evaluate the subset of the filter language the repositories use."""
+    for key, condition in expression.items():
+        if key == "$and":
+            if not all(_matches(data, sub) for sub in condition):
+                return False
+            continue
+        value = data.get(key)
+        for op, operand in condition.items():
+            if op == "$eq" and value != operand:
+                return False
+            if op == "$gt" and not (value is not None and value > operand):
+                return False
+            if op == "$in":
+                values = value if isinstance(value, list) else [value]
+                if not set(values) & set(operand):
+                    return False
+    return True
+
+
+def _terms(text: str) -> set[str]:
+    return set(_TERM_PATTERN.findall(text.casefold()))
+
+
+class FakeVectorSearch:
+    """In-memory Vector Search backend served over local gRPC.
+
+    Args:
+        latency: Seconds added to every RPC
+        jitter: Up to this many seconds added on top, uniformly at random
+        seed: Seed for the jitter generator
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.calls: dict[str, int] = {}
+        self._objects: dict[str, dict] = {}  # name -> {"data", "etag", "terms"}
+        self._etag = 0
+        self._random = random.Random(seed)
+        self._server: grpc.aio.Server | None = None
+
+    async def start(self) -> str:
+        """Start serving on a free local port and return host:port."""
+        self._server = grpc.aio.server()
+        self._server.add_generic_rpc_handlers(self._handlers())
+        port = self._server.add_insecure_port("127.0.0.1:0")
+        await self._server.start()
+        return f"127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            await self._server.stop(grace=None)
+            self._server = None
+
+    def seed(self, collection_path: str, data: dict) -> None:
+        """Insert a data object directly, without going through gRPC."""
+        self._put(f"{collection_path}/dataObjects/{data['id']}", dict(data))
+
+    # --- plumbing -----------------------------------------------------
+
+    def _handlers(self):
+        def unary(method, request_type, response_type):
+            serialize = getattr(response_type, "serialize", None) or (
+                response_type.SerializeToString
+            )
+
+            async def handle(request, context):
+                self.calls[method.__name__] = self.calls.get(method.__name__, 0) + 1
+                delay = self.latency + self._random.uniform(0, self.jitter)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                return await method(request, context)
+
+            return grpc.unary_unary_rpc_method_handler(
+                handle,
+                request_deserializer=request_type.deserialize,
+                response_serializer=serialize,
+            )
+
+        vs = vectorsearch_v1beta
+        empty = empty_pb2.Empty
+        return (
+            grpc.method_handlers_generic_handler(
+                DATA_OBJECT_SERVICE,
+                {
+                    "CreateDataObject": unary(
+                        self.create, vs.CreateDataObjectRequest, vs.DataObject
+                    ),
+                    "BatchCreateDataObjects": unary(
+                        self.batch_create,
+                        vs.BatchCreateDataObjectsRequest,
+                        vs.BatchCreateDataObjectsResponse,
+                    ),
+                    "GetDataObject": unary(
+                        self.get, vs.GetDataObjectRequest, vs.DataObject
+                    ),
+                    "UpdateDataObject": unary(
+                        self.update, vs.UpdateDataObjectRequest, vs.DataObject
+                    ),
+                    "BatchUpdateDataObjects": unary(
+                        self.batch_update,
+                        vs.BatchUpdateDataObjectsRequest,
+                        vs.BatchUpdateDataObjectsResponse,
+                    ),
+                    "DeleteDataObject": unary(
+                        self.delete, vs.DeleteDataObjectRequest, empty
+                    ),
+                    "BatchDeleteDataObjects": unary(
+                        self.batch_delete, vs.BatchDeleteDataObjectsRequest, empty
+                    ),
+                },
+            ),
+            grpc.method_handlers_generic_handler(
+                SEARCH_SERVICE,
+                {
+                    "SearchDataObjects": unary(
+                        self.search,
+                        vs.SearchDataObjectsRequest,
+                        vs.SearchDataObjectsResponse,
+                    ),
+                    "QueryDataObjects": unary(
+                        self.query,
+                        vs.QueryDataObjectsRequest,
+                        vs.QueryDataObjectsResponse,
+                    ),
+                },
+            ),
+        )
+
+    def _put(self, name: str, data: dict) -> str:
+        self._etag += 1
+        etag = str(self._etag)
+        terms = _terms(f"{data.get('title', '')} {data.get('content', '')}")
+        self._objects[name] = {"data": data, "etag": etag, "terms": terms}
+        return etag
+
+    def _data_object(self, name: str, fields=None) -> "vectorsearch_v1beta.DataObject":
+        stored = self._objects[name]
+        data = stored["data"]
+        if fields:
+            data = {key: data[key] for key in fields if key in data}
+        return vectorsearch_v1beta.DataObject(
+            name=name,
+            data_object_id=name.rsplit("/", 1)[-1],
+            data=data,
+            etag=stored["etag"],
+        )
+
+    def _in_collection(self, parent: str):
+        prefix = f"{parent}/dataObjects/"
+        for name, stored in list(self._objects.items()):
+            if name.startswith(prefix):
+                yield name, stored
+
+    # --- DataObjectService --------------------------------------------
+
+    async def create(self, request, context):
+        name = f"{request.parent}/dataObjects/{request.data_object_id}"
+        if name in self._objects:
+            await context.abort(grpc.StatusCode.ALREADY_EXISTS, name)
+        self._put(name, _to_dict(request.data_object, "data"))
+        return self._data_object(name)
+
+    async def batch_create(self, request, context):
+        created = []
+        for sub in request.requests:
+            name = f"{request.parent}/dataObjects/{sub.data_object_id}"
+            self._put(name, _to_dict(sub.data_object, "data"))
+            created.append(self._data_object(name))
+        return vectorsearch_v1beta.BatchCreateDataObjectsResponse(data_objects=created)
+
+    async def get(self, request, context):
+        if request.name not in self._objects:
+            await context.abort(grpc.StatusCode.NOT_FOUND, request.name)
+        return self._data_object(request.name)
+
+    async def update(self, request, context):
+        name = request.data_object.name
+        stored = self._objects.get(name)
+        if stored is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, name)
+        if request.data_object.etag and request.data_object.etag != stored["etag"]:
+            await context.abort(grpc.StatusCode.FAILED_PRECONDITION, "etag mismatch")
+        self._apply_update(request)
+        return self._data_object(name)
+
+    async def batch_update(self, request, context):
+        for sub in request.requests:
+            if sub.data_object.name not in self._objects:
+                await context.abort(grpc.StatusCode.NOT_FOUND, sub.data_object.name)
+        for sub in request.requests:
+            self._apply_update(sub)
+        return vectorsearch_v1beta.BatchUpdateDataObjectsResponse()
+
+    def _apply_update(self, request) -> None:
+        name = request.data_object.name
+        data = dict(self._objects[name]["data"])
+        update = _to_dict(request.data_object, "data")
+        for path in request.update_mask.paths:
+            key = path.removeprefix("data.")
+            if key in update:
+                data[key] = update[key]
+        data["updated_at"] = update.get("updated_at", datetime.now(UTC).isoformat())
+        self._put(name, data)
+
+    async def delete(self, request, context):
+        if self._objects.pop(request.name, None) is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, request.name)
+        return empty_pb2.Empty()
+
+    async def batch_delete(self, request, context):
+        for sub in request.requests:
+            self._objects.pop(sub.name, None)
+        return empty_pb2.Empty()
+
+    # --- DataObjectSearchService --------------------------------------
+
+    async def search(self, request, context):
+        # Text search is scored like semantic search: by term overlap
+        if "text_search" in request:
+            search = request.text_search
+        else:
+            search = request.semantic_search
+        query = _terms(search.search_text)
+        expression = _to_dict(search, "filter") if "filter" in search else {}
+        scored = []
+        for name, stored in self._in_collection(request.parent):
+            if expression and not _matches(stored["data"], expression):
+                continue
+            score = len(query & stored["terms"]) / len(query) if query else 0.0
+            scored.append((score, name))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        fields = list(search.output_fields.data_fields)
+        return vectorsearch_v1beta.SearchDataObjectsResponse(
+            results=[
+                vectorsearch_v1beta.SearchResult(
+                    data_object=self._data_object(name, fields), distance=score
+                )
+                for score, name in scored[: search.top_k or 10]
+            ]
+        )
+
+    async def query(self, request, context):
+        expression = _to_dict(request, "filter") if "filter" in request else {}
+        offset = int(request.page_token or 0)
+        page_size = request.page_size or 100
+        names = [
+            name
+            for name, stored in self._in_collection(request.parent)
+            if not expression or _matches(stored["data"], expression)
+        ]
+        page = names[offset : offset + page_size]
+        next_offset = offset + len(page)
+        fields = list(request.output_fields.data_fields)
+        return vectorsearch_v1beta.QueryDataObjectsResponse(
+            data_objects=[self._data_object(name, fields) for name in page],
+            next_page_token=str(next_offset) if next_offset < len(names) else "",
+        )
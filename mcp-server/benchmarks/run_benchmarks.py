@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Latency benchmarks for the MCP tools.
+
+Starts the FastMCP app from mcp_server.main in-process, backed by a local
+gRPC stand-in for Vector Search (see fake_vector_search.py) with injected
+latency, and drives each tool through an in-memory MCP client at several
+concurrency levels. Per tool and concurrency level it records p50/p95/p99
+latency and throughput, writes them to a JSON file and, if a baseline
+file is given, fails when a result regressed beyond the tolerance.
+
+Environment Variables:
+    BENCH_LATENCY_MS: Latency injected into every backend RPC (default: 20)
+    BENCH_JITTER_MS: Extra random latency per RPC, up to (default: 5)
+    BENCH_CONCURRENCY: Comma-separated concurrency levels (default: 1,8,32)
+    BENCH_REQUESTS: Calls per tool and concurrency level (default: 200)
+    BENCH_TOOLS: Comma-separated tools to run (default: all)
+    BENCH_CORPUS_SIZE: Knowledge items seeded for search (default: 500)
+    BENCH_SEARCH_MODE: search_knowledge mode: semantic, text or hybrid
+        (default: semantic)
+    BENCH_SEARCH_LIMIT: search_knowledge limit (default: 10)
+    BENCH_OUTPUT: Result file (default: benchmark-results.json)
+    BENCH_BASELINE: Baseline result file to compare against (optional)
+    BENCH_TOLERANCE: Allowed relative regression of p95 and throughput
+        against the baseline (default: 0.2)
+
+Usage:
+    uv run python benchmarks/run_benchmarks.py
+    BENCH_BASELINE=baseline.json uv run python benchmarks/run_benchmarks.py
+"""
+
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+
+from fake_vector_search import FakeVectorSearch
+
+TOOLS = ("save_knowledge", "search_knowledge", "delete_knowledge", "promote_knowledge")
+
+PROJECT_ID = "benchmark"
+LOCATION = "us-central1"
+COLLECTION_PATH = f"projects/{PROJECT_ID}/locations/{LOCATION}/collections/knowledge"
+
+_VOCABULARY = (
+    "cloud",
+    "run",
+    "deploy",
+    "container",
+    "build",
+    "cache",
+    "grpc",
+    "channel",
+    "python",
+    "async",
+    "retry",
+    "timeout",
+    "index",
+    "vector",
+    "search",
+    "embedding",
+    "filter",
+    "schema",
+    "batch",
+    "stream",
+    "token",
+    "quota",
+    "region",
+    "terraform",
+    "secret",
+    "logging",
+    "metrics",
+    "trace",
+    "latency",
+    "promote",
+)
+
+
+def env_int_list(name: str, default: str) -> list[int]:
+    """Parse a comma-separated list of integers from an environment variable."""
+    return [int(part) for part in os.environ.get(name, default).split(",") if part]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def make_text(rng: random.Random, words: int) -> str:
+    """Build pseudo-random text from the benchmark vocabulary."""
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(words))
+
+
+def seed_knowledge(backend: FakeVectorSearch, rng: random.Random, status: str) -> str:
+    """Insert one knowledge item into the backend and return its ID."""
+    now = datetime.now(UTC).isoformat()
+    knowledge_id = str(uuid.uuid4())
+    backend.seed(
+        COLLECTION_PATH,
+        {
+            "id": knowledge_id,
+            "title": make_text(rng, 4),
+            "content": make_text(rng, 60),
+            "tags": [rng.choice(_VOCABULARY)],
+            "user_id": "benchmark",
+            "source": "personal",
+            "status": status,
+            "github_path": "",
+            "pr_url": "",
+            "promoted_from_id": "",
+            "created_at": now,
+            "updated_at": now,
+        },
+    )
+    return knowledge_id
+
+
+def tool_arguments(
+    tool: str,
+    backend: FakeVectorSearch,
+    rng: random.Random,
+    count: int,
+    mode: str,
+    limit: int,
+) -> list[dict]:
+    """Build the arguments for count calls of a tool, seeding data as needed."""
+    if tool == "save_knowledge":
+        return [
+            {"title": make_text(rng, 4), "content": make_text(rng, 60)}
+            for _ in range(count)
+        ]
+    if tool == "search_knowledge":
+        return [
+            {"query": make_text(rng, 3), "limit": limit, "mode": mode}
+            for _ in range(count)
+        ]
+    # delete and promote consume one existing draft per call
+    return [{"id": seed_knowledge(backend, rng, "draft")} for _ in range(count)]
+
+
+async def run_level(client, tool: str, arguments: list[dict], concurrency: int) -> dict:
+    """Call a tool once per argument set with bounded concurrency."""
+    latencies: list[float] = []
+    errors = 0
+    queue = iter(arguments)
+
+    async def worker():
+        nonlocal errors
+        for args in queue:
+            started = time.perf_counter()
+            result = await client.call_tool(tool, args, raise_on_error=False)
+            latencies.append(time.perf_counter() - started)
+            if result.is_error:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "tool": tool,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def compare(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """Return a description of every result that regressed against baseline."""
+    previous = {(r["tool"], r["concurrency"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        base = previous.get((result["tool"], result["concurrency"]))
+        if base is None:
+            continue
+        label = f"{result['tool']} @ {result['concurrency']}"
+        if result["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{label}: p95 {result['p95_ms']}ms > baseline {base['p95_ms']}ms"
+            )
+        if result["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{label}: throughput {result['throughput_rps']}/s"
+                f" < baseline {base['throughput_rps']}/s"
+            )
+        if result["errors"] > base["errors"]:
+            regressions.append(
+                f"{label}: {result['errors']} errors > baseline {base['errors']}"
+            )
+    return regressions
+
+
+async def run() -> dict:
+    """Run all benchmarks and return the report."""
+    config = {
+        "latency_ms": int(os.environ.get("BENCH_LATENCY_MS", "20")),
+        "jitter_ms": int(os.environ.get("BENCH_JITTER_MS", "5")),
+        "concurrency": env_int_list("BENCH_CONCURRENCY", "1,8,32"),
+        "requests": int(os.environ.get("BENCH_REQUESTS", "200")),
+        "tools": os.environ.get("BENCH_TOOLS", ",".join(TOOLS)).split(","),
+        "corpus_size": int(os.environ.get("BENCH_CORPUS_SIZE", "500")),
+        "search_mode": os.environ.get("BENCH_SEARCH_MODE", "semantic"),
+        "search_limit": int(os.environ.get("BENCH_SEARCH_LIMIT", "10")),
+    }
+    unknown = set(config["tools"]) - set(TOOLS)
+    if unknown:
+        raise SystemExit(f"Error: unknown tools: {', '.join(sorted(unknown))}")
+
+    backend = FakeVectorSearch(
+        latency=config["latency_ms"] / 1000, jitter=config["jitter_ms"] / 1000
+    )
+    address = await backend.start()
+    os.environ.update(
+        {
+            "GCP_PROJECT_ID": PROJECT_ID,
+            "GCP_LOCATION": LOCATION,
+            "VECTOR_SEARCH_EMULATOR_HOST": address,
+        }
+    )
+
+    # Imported only now so the app picks up the emulator settings
+    from fastmcp import Client
+
+    from mcp_server import main
+
+    rng = random.Random(0)
+    for _ in range(config["corpus_size"]):
+        seed_knowledge(backend, rng, "promoted")
+
+    results = []
+    try:
+        async with Client(main.mcp) as client:
+            for tool in config["tools"]:
+                for concurrency in config["concurrency"]:
+                    arguments = tool_arguments(
+                        tool,
+                        backend,
+                        rng,
+                        config["requests"],
+                        config["search_mode"],
+                        config["search_limit"],
+                    )
+                    result = await run_level(client, tool, arguments, concurrency)
+                    print(
+                        f"{tool:<18} c={concurrency:<3} p50={result['p50_ms']:.1f}ms"
+                        f" p95={result['p95_ms']:.1f}ms p99={result['p99_ms']:.1f}ms"
+                        f" {result['throughput_rps']:.1f}/s errors={result['errors']}"
+                    )
+                    results.append(result)
+    finally:
+        await main.channel_pool.close()
+        await backend.stop()
+
+    return {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "config": config,
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Entry point."""
+    report = asyncio.run(run())
+
+    output = os.environ.get("BENCH_OUTPUT", "benchmark-results.json")
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    baseline_path = os.environ.get("BENCH_BASELINE")
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        tolerance = float(os.environ.get("BENCH_TOLERANCE", "0.2"))
+        regressions = compare(report["results"], baseline, tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {baseline_path} (tolerance {tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
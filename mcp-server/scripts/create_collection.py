@@ -3,6 +3,8 @@
 
 This script creates a Collection in Vertex AI Vector Search 2.0.
 It is idempotent - if the Collection already exists, it will be skipped.
+An existing Collection keeps its old schema: to apply schema changes
+without losing data, see scripts/migrate_collection.py.
 
 Environment Variables:
     GCP_PROJECT_ID: GCP project ID (required)
@@ -58,6 +60,10 @@ def create_collection() -> None:
             "promoted_from_id": {"type": "string"},
             "created_at": {"type": "string"},
             "updated_at": {"type": "string"},
+            # SHA-256 of the embedded text; saves skip re-embedding on match
+            "content_hash": {"type": "string"},
+            # Hash of the synced GitHub file; POST /sync skips unchanged files
+            "source_hash": {"type": "string"},
         },
     }
 
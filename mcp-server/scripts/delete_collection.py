@@ -5,8 +5,13 @@ This script deletes a Collection in Vertex AI Vector Search 2.0.
 Use this when you need to recreate a Collection with a new schema.
 
 The script will:
-1. Delete all data objects in the collection first
-2. Then delete the collection itself
+1. List the IDs of all data objects in the collection
+2. Delete them with BatchDeleteDataObjects calls from a pool of workers,
+   rate-limited by a token bucket to stay under the API quota
+3. Then delete the collection itself
+
+Progress is written to a state file after every batch, so an interrupted
+run resumes where it stopped instead of listing and deleting again.
 
 Environment Variables:
     GCP_PROJECT_ID: GCP project ID (required)
@@ -15,19 +20,49 @@ Environment Variables:
 
 Usage:
     export GCP_PROJECT_ID=your-project-id
-    uv run python scripts/delete_collection.py
+    uv run python scripts/delete_collection.py [--dry-run] [--workers N]
+        [--rate REQUESTS_PER_SECOND] [--batch-size N] [--state PATH]
 
 Prerequisites:
     - gcloud auth application-default login
     - google-cloud-vectorsearch installed
 """
 
+import argparse
+import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
-from google.api_core.exceptions import NotFound
+from google.api_core.exceptions import (
+    DeadlineExceeded,
+    InternalServerError,
+    NotFound,
+    ResourceExhausted,
+    ServiceUnavailable,
+)
 from google.cloud import vectorsearch_v1beta
 
+# Objects per BatchDeleteDataObjects call
+BATCH_DELETE_SIZE = 100
+
+# Objects per listing page
+LIST_PAGE_SIZE = 1000
+
+# Attempts per batch before the run stops (it can be resumed)
+MAX_ATTEMPTS = 5
+
+# Errors after which the same batch may succeed if sent again
+RETRYABLE_ERRORS = (
+    DeadlineExceeded,
+    InternalServerError,
+    ResourceExhausted,
+    ServiceUnavailable,
+)
+
 
 def get_env_or_exit(name: str) -> str:
     """Get required environment variable or exit with error."""
@@ -38,63 +73,263 @@ def get_env_or_exit(name: str) -> str:
     return value
 
 
+class TokenBucket:
+    """Thread-safe token bucket limiting requests per second."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst (default: one second worth of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class DeletionState:
+    """Resumable record of the IDs to delete and the batches done.
+
+    The file is JSON Lines: a header with the collection and the listed
+    IDs, then one line per deleted batch, so recording progress is an
+    append no matter how large the collection is.
+    """
+
+    def __init__(self, path: Path | None, collection_path: str):
+        """Load the state for collection_path from path, if present."""
+        self.path = path
+        self.collection_path = collection_path
+        self.ids: list[str] | None = None
+        self.done: set[int] = set()
+        self._lock = threading.Lock()
+        if path is None or not path.exists():
+            return
+        with path.open(encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("collection") != collection_path:
+                return
+            self.ids = header["ids"]
+            for line in f:
+                try:
+                    self.done.add(json.loads(line)["done"])
+                except (ValueError, KeyError):
+                    break  # torn write from an interrupted run
+
+    def start(self, ids: list[str]) -> None:
+        """Record a fresh listing of IDs."""
+        self.ids = ids
+        self.done = set()
+        if self.path is not None:
+            header = {"collection": self.collection_path, "ids": ids}
+            self.path.write_text(json.dumps(header) + "\n", encoding="utf-8")
+
+    def mark_done(self, batch: int) -> None:
+        """Record a deleted batch."""
+        with self._lock:
+            self.done.add(batch)
+            if self.path is not None:
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write(json.dumps({"done": batch}) + "\n")
+
+    def clear(self) -> None:
+        """Forget the listing once all of its batches are deleted."""
+        self.ids = None
+        self.done = set()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+def list_data_object_ids(
+    search_client: vectorsearch_v1beta.DataObjectSearchServiceClient,
+    collection_path: str,
+) -> list[str]:
+    """List the IDs of all data objects in the collection."""
+    request = vectorsearch_v1beta.QueryDataObjectsRequest(
+        parent=collection_path,
+        output_fields=vectorsearch_v1beta.OutputFields(data_fields=["id"]),
+        page_size=LIST_PAGE_SIZE,
+    )
+    # The pager transparently follows next_page_token; the listing is
+    # finished before anything is deleted, so no page shifts under it
+    return [
+        data_object.name.split("/")[-1]
+        for data_object in search_client.query_data_objects(request=request)
+    ]
+
+
+def with_retries(call, bucket: TokenBucket):
+    """Run call under the rate limit, retrying transient errors.
+
+    Waits with exponential backoff between attempts and raises the last
+    error after MAX_ATTEMPTS (the run can then be resumed).
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        bucket.acquire()
+        try:
+            return call()
+        except RETRYABLE_ERRORS:
+            if attempt == MAX_ATTEMPTS:
+                raise
+            time.sleep(0.5 * 2 ** (attempt - 1))
+
+
+def delete_batch(
+    data_client: vectorsearch_v1beta.DataObjectServiceClient,
+    collection_path: str,
+    ids: list[str],
+    bucket: TokenBucket,
+) -> int:
+    """Delete one batch of data objects, retrying transient errors.
+
+    Objects already gone (e.g. deleted by an earlier, interrupted run)
+    are skipped by retrying the remaining IDs one at a time.
+
+    Returns:
+        Number of objects deleted
+    """
+    requests = [
+        vectorsearch_v1beta.DeleteDataObjectRequest(
+            name=f"{collection_path}/dataObjects/{obj_id}"
+        )
+        for obj_id in ids
+    ]
+    try:
+        with_retries(
+            lambda: data_client.batch_delete_data_objects(
+                request=vectorsearch_v1beta.BatchDeleteDataObjectsRequest(
+                    parent=collection_path, requests=requests
+                )
+            ),
+            bucket,
+        )
+        return len(ids)
+    except NotFound:
+        pass
+
+    deleted = 0
+    for request in requests:
+        try:
+            with_retries(
+                lambda request=request: data_client.delete_data_object(request=request),
+                bucket,
+            )
+            deleted += 1
+        except NotFound:
+            pass
+    return deleted
+
+
 def delete_all_data_objects(
     data_client: vectorsearch_v1beta.DataObjectServiceClient,
     search_client: vectorsearch_v1beta.DataObjectSearchServiceClient,
     collection_path: str,
+    *,
+    workers: int = 8,
+    rate: float = 10.0,
+    batch_size: int = BATCH_DELETE_SIZE,
+    state: DeletionState | None = None,
 ) -> int:
     """Delete all data objects in the collection.
 
+    Args:
+        data_client: Data object client
+        search_client: Search client used to list the objects
+        collection_path: Full resource name of the collection
+        workers: Batches deleted concurrently
+        rate: Maximum delete requests per second across all workers
+        batch_size: Objects per BatchDeleteDataObjects call
+        state: Resumable progress (default: not persisted)
+
     Returns the number of deleted objects.
     """
-    deleted_count = 0
-
-    # Query all data objects (using empty filter to match all)
-    request = vectorsearch_v1beta.QueryDataObjectsRequest(
-        parent=collection_path,
-        page_size=100,
-    )
+    state = state or DeletionState(None, collection_path)
+    if state.ids is not None:
+        print(f"  Resuming: {len(state.done)} batches already deleted.")
 
-    try:
-        while True:
-            response = search_client.query_data_objects(request=request)
-            if not response.data_objects:
+    bucket = TokenBucket(rate)
+    deleted_count = 0
+    # Repeat until a listing comes back empty, which also catches objects
+    # created while a pass was running
+    while True:
+        if state.ids is None:
+            ids = list_data_object_ids(search_client, collection_path)
+            if not ids:
                 break
+            state.start(ids)
 
-            # Collect IDs to delete
-            ids_to_delete = []
-            for data_object in response.data_objects:
-                # Extract ID from name (format: .../dataObjects/{id})
-                data_object_id = data_object.name.split("/")[-1]
-                ids_to_delete.append(data_object_id)
-
-            if ids_to_delete:
-                # Batch delete - create individual delete requests
-                delete_requests = [
-                    vectorsearch_v1beta.DeleteDataObjectRequest(
-                        name=f"{collection_path}/dataObjects/{obj_id}"
-                    )
-                    for obj_id in ids_to_delete
-                ]
-                batch_request = vectorsearch_v1beta.BatchDeleteDataObjectsRequest(
-                    parent=collection_path,
-                    requests=delete_requests,
-                )
-                data_client.batch_delete_data_objects(request=batch_request)
-                deleted_count += len(ids_to_delete)
+        ids = state.ids
+        batches = {
+            index: ids[start : start + batch_size]
+            for index, start in enumerate(range(0, len(ids), batch_size))
+            if index not in state.done
+        }
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    delete_batch, data_client, collection_path, batch, bucket
+                ): index
+                for index, batch in batches.items()
+            }
+            for future in as_completed(futures):
+                deleted_count += future.result()
+                state.mark_done(futures[future])
                 print(f"  Deleted {deleted_count} data objects...")
-
-            # Check for next page
-            if not response.next_page_token:
-                break
-            request.page_token = response.next_page_token
-    except NotFound:
-        pass
+        state.clear()
 
     return deleted_count
 
 
-def delete_collection() -> None:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="count the data objects and exit without deleting anything",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=8, help="concurrent batch deletes"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=10.0,
+        help="maximum delete requests per second (keep under the quota)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_DELETE_SIZE,
+        help="data objects per batch delete request",
+    )
+    parser.add_argument(
+        "--state",
+        type=Path,
+        default=Path(".delete_collection_state.json"),
+        help="progress file used to resume an interrupted run",
+    )
+    return parser.parse_args(argv)
+
+
+def delete_collection(args: argparse.Namespace) -> None:
     """Delete the knowledge Collection in Vector Search 2.0."""
     project_id = get_env_or_exit("GCP_PROJECT_ID")
     location = os.environ.get("GCP_LOCATION", "us-central1")
@@ -109,10 +344,26 @@ def delete_collection() -> None:
     search_client = vectorsearch_v1beta.DataObjectSearchServiceClient()
 
     try:
+        if args.dry_run:
+            count = len(list_data_object_ids(search_client, collection_path))
+            requests = -(-count // args.batch_size)
+            print(
+                f"Dry run: '{collection_id}' has {count} data objects "
+                f"({requests} batch delete requests, "
+                f"~{requests / args.rate:.0f}s at {args.rate:g} requests/s)."
+            )
+            return
+
         # Step 1: Delete all data objects
         print(f"Deleting all data objects in '{collection_id}'...")
         deleted_count = delete_all_data_objects(
-            data_client, search_client, collection_path
+            data_client,
+            search_client,
+            collection_path,
+            workers=args.workers,
+            rate=args.rate,
+            batch_size=args.batch_size,
+            state=DeletionState(args.state, collection_path),
         )
         print(f"  Total deleted: {deleted_count} data objects.")
 
@@ -126,4 +377,4 @@ def delete_collection() -> None:
 
 
 if __name__ == "__main__":
-    delete_collection()
+    delete_collection(parse_args())
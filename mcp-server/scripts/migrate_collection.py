@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Export and re-import Vector Search 2.0 data objects for schema changes.
+
+Vector Search 2.0 validates data objects against the collection schema
+strictly, so adding a data field (e.g. content_hash and source_hash) to
+create_collection.py means recreating the collection. This script keeps
+the data across the recreation:
+
+1. export: write the data of every object to a JSON Lines file
+2. (delete_collection.py, then create_collection.py)
+3. import: create the objects again in the new collection; vectors are
+   recomputed by the collection's auto-embedding
+
+Import is resumable: objects that already exist are skipped, so an
+interrupted import can simply be run again.
+
+Environment Variables:
+    GCP_PROJECT_ID: GCP project ID (required)
+    GCP_LOCATION: GCP region for Vector Search (default: us-central1)
+    COLLECTION_ID: Collection name (default: knowledge)
+
+Usage:
+    export GCP_PROJECT_ID=your-project-id
+    uv run python scripts/migrate_collection.py export [--file PATH]
+    uv run python scripts/migrate_collection.py import [--file PATH]
+        [--rate REQUESTS_PER_SECOND] [--batch-size N]
+
+Prerequisites:
+    - gcloud auth application-default login
+    - google-cloud-vectorsearch installed
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+from delete_collection import (
+    LIST_PAGE_SIZE,
+    TokenBucket,
+    get_env_or_exit,
+    with_retries,
+)
+from google.api_core.exceptions import AlreadyExists
+from google.cloud import vectorsearch_v1beta
+
+# Objects per BatchCreateDataObjects call
+BATCH_CREATE_SIZE = 100
+
+# Data fields exported by default: every field of the knowledge schema
+# before content_hash and source_hash were added (both are filled in
+# again by the server on the next save or sync)
+EXPORT_FIELDS = [
+    "id",
+    "title",
+    "content",
+    "tags",
+    "user_id",
+    "source",
+    "status",
+    "github_path",
+    "pr_url",
+    "promoted_from_id",
+    "created_at",
+    "updated_at",
+]
+
+
+def export_data_objects(
+    search_client: vectorsearch_v1beta.DataObjectSearchServiceClient,
+    collection_path: str,
+    path: Path,
+    fields: list[str],
+) -> int:
+    """Write the ID and data of every data object to path (JSON Lines).
+
+    Returns:
+        Number of exported objects
+    """
+    request = vectorsearch_v1beta.QueryDataObjectsRequest(
+        parent=collection_path,
+        output_fields=vectorsearch_v1beta.OutputFields(data_fields=fields),
+        page_size=LIST_PAGE_SIZE,
+    )
+    count = 0
+    with path.open("w", encoding="utf-8") as f:
+        for data_object in search_client.query_data_objects(request=request):
+            record = {
+                "id": data_object.name.split("/")[-1],
+                "data": dict(data_object.data),
+            }
+            f.write(json.dumps(record, default=list) + "\n")
+            count += 1
+    return count
+
+
+def read_export(path: Path) -> Iterator[dict]:
+    """Yield the records of an export file."""
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _create_request(
+    collection_path: str, record: dict
+) -> vectorsearch_v1beta.CreateDataObjectRequest:
+    return vectorsearch_v1beta.CreateDataObjectRequest(
+        parent=collection_path,
+        data_object_id=record["id"],
+        data_object=vectorsearch_v1beta.DataObject(
+            data=record["data"],
+            vectors={},  # Auto-Embeddings will generate vectors
+        ),
+    )
+
+
+def import_batch(
+    data_client: vectorsearch_v1beta.DataObjectServiceClient,
+    collection_path: str,
+    records: list[dict],
+    bucket: TokenBucket,
+) -> int:
+    """Create one batch of data objects, skipping those already present.
+
+    Returns:
+        Number of objects created
+    """
+    requests = [_create_request(collection_path, record) for record in records]
+    try:
+        with_retries(
+            lambda: data_client.batch_create_data_objects(
+                request=vectorsearch_v1beta.BatchCreateDataObjectsRequest(
+                    parent=collection_path, requests=requests
+                )
+            ),
+            bucket,
+        )
+        return len(requests)
+    except AlreadyExists:
+        pass  # imported by an earlier run; create the rest one at a time
+
+    created = 0
+    for request in requests:
+        try:
+            with_retries(
+                lambda request=request: data_client.create_data_object(request=request),
+                bucket,
+            )
+            created += 1
+        except AlreadyExists:
+            pass
+    return created
+
+
+def import_data_objects(
+    data_client: vectorsearch_v1beta.DataObjectServiceClient,
+    collection_path: str,
+    path: Path,
+    *,
+    rate: float = 10.0,
+    batch_size: int = BATCH_CREATE_SIZE,
+) -> int:
+    """Create the data objects of an export file in the collection.
+
+    Returns:
+        Number of objects created
+    """
+    bucket = TokenBucket(rate)
+    created = 0
+    batch: list[dict] = []
+    for record in read_export(path):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            created += import_batch(data_client, collection_path, batch, bucket)
+            batch = []
+            print(f"  Imported {created} data objects...")
+    if batch:
+        created += import_batch(data_client, collection_path, batch, bucket)
+    return created
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument(
+        "--file",
+        type=Path,
+        default=Path("collection-export.jsonl"),
+        help="export file written by export and read by import",
+    )
+    parser.add_argument(
+        "--fields",
+        default=",".join(EXPORT_FIELDS),
+        help="comma-separated data fields to export",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=10.0,
+        help="maximum create requests per second (keep under the quota)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_CREATE_SIZE,
+        help="data objects per batch create request",
+    )
+    return parser.parse_args(argv)
+
+
+def migrate_collection(args: argparse.Namespace) -> None:
+    """Run the export or import step."""
+    project_id = get_env_or_exit("GCP_PROJECT_ID")
+    location = os.environ.get("GCP_LOCATION", "us-central1")
+    collection_id = os.environ.get("COLLECTION_ID", "knowledge")
+    collection_path = (
+        f"projects/{project_id}/locations/{location}/collections/{collection_id}"
+    )
+
+    if args.command == "export":
+        print(f"Exporting data objects of '{collection_id}' to {args.file}...")
+        count = export_data_objects(
+            vectorsearch_v1beta.DataObjectSearchServiceClient(),
+            collection_path,
+            args.file,
+            [field for field in args.fields.split(",") if field],
+        )
+        print(f"  Exported {count} data objects.")
+        return
+
+    if not args.file.exists():
+        print(f"Error: export file {args.file} not found", file=sys.stderr)
+        sys.exit(1)
+    print(f"Importing data objects from {args.file} into '{collection_id}'...")
+    count = import_data_objects(
+        vectorsearch_v1beta.DataObjectServiceClient(),
+        collection_path,
+        args.file,
+        rate=args.rate,
+        batch_size=args.batch_size,
+    )
+    print(f"  Total imported: {count} data objects.")
+
+
+if __name__ == "__main__":
+    migrate_collection(parse_args())
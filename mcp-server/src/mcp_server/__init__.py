@@ -1,3 +1,6 @@
 """Knowledge sharing MCP server."""
 
+# Imported first so the boot timer covers every later import
+from .startup import boot_timer
+
 __version__ = "0.1.0"
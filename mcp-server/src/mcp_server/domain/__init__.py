@@ -3,7 +3,24 @@
 This package contains domain models and repository interfaces.
 """
 
-from .models import Knowledge, SearchResult
-from .repositories import KnowledgeRepository
+from .exceptions import (
+    BackendUnavailableError,
+    InvalidCursorError,
+    RepositoryError,
+    StatusConflictError,
+)
+from .models import Knowledge, SaveResult, SearchFilter, SearchResult
+from .repositories import AsyncKnowledgeRepository, KnowledgeRepository
 
-__all__ = ["Knowledge", "SearchResult", "KnowledgeRepository"]
+__all__ = [
+    "BackendUnavailableError",
+    "InvalidCursorError",
+    "RepositoryError",
+    "StatusConflictError",
+    "Knowledge",
+    "SaveResult",
+    "SearchFilter",
+    "SearchResult",
+    "KnowledgeRepository",
+    "AsyncKnowledgeRepository",
+]
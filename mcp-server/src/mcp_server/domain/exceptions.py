@@ -0,0 +1,32 @@
+"""Domain exceptions raised by repositories."""
+
+
+class RepositoryError(Exception):
+    """Base class for errors raised by knowledge repositories."""
+
+
+class StatusConflictError(RepositoryError):
+    """A conditional status update found an unexpected current status.
+
+    Attributes:
+        id: Knowledge identifier
+        current_status: Status found at update time ("" if it changed
+            concurrently and is unknown)
+    """
+
+    def __init__(self, id: str, current_status: str = ""):
+        self.id = id
+        self.current_status = current_status
+        super().__init__(
+            f"knowledge {id} has status {current_status!r}"
+            if current_status
+            else f"knowledge {id} was modified concurrently"
+        )
+
+
+class InvalidCursorError(RepositoryError):
+    """A search cursor is malformed, expired or belongs to another search."""
+
+
+class BackendUnavailableError(RepositoryError):
+    """The backend is failing and calls are rejected until it recovers."""
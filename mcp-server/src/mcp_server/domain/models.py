@@ -4,11 +4,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Knowledge:
     """Knowledge domain model.
 
-    Represents a piece of knowledge stored in the system.
+    Represents a piece of knowledge stored in the system. Slotted, as
+    searches build one per hit; not frozen, as that would slow down every
+    construction.
 
     Attributes:
         id: Unique identifier for the knowledge
@@ -21,6 +23,8 @@ class Knowledge:
         github_path: GitHub file path (team/promoted only)
         pr_url: Promotion PR URL (personal/proposed only)
         promoted_from_id: Original knowledge ID (team/promoted only)
+        source_hash: Hash of the GitHub file last synced into this
+            knowledge, as sent by POST /sync (team/promoted only)
         created_at: Creation timestamp (ISO 8601)
         updated_at: Last update timestamp (ISO 8601)
         score: Search relevance score (only for search results)
@@ -46,6 +50,7 @@ class Knowledge:
     github_path: str = ""
     pr_url: str = ""
     promoted_from_id: str = ""
+    source_hash: str = ""
 
     # Timestamps
     created_at: datetime | None = None
@@ -55,25 +60,77 @@ class Knowledge:
     score: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Search result container.
 
     Attributes:
         items: List of matching Knowledge objects
         total: Total number of matches
+        next_cursor: Opaque cursor for the page after items, or None if
+            there are no more results
+        stale: True if served from recent results while the backend is
+            unavailable, instead of from a live search
     """
 
     items: list[Knowledge]
     total: int
+    next_cursor: str | None = None
+    stale: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class SearchFilter:
+    """Metadata constraints applied by the backend before top-k ranking.
+
+    Unset attributes do not constrain the search.
+
+    Attributes:
+        status: Only match this lifecycle status
+        source: Only match this origin ("personal" or "team")
+        tags: Only match knowledge having at least one of these tags
+        user_id: Only match knowledge of this developer
+    """
+
+    status: str | None = None
+    source: str | None = None
+    tags: tuple[str, ...] = ()
+    user_id: str | None = None
+
+    def is_empty(self) -> bool:
+        """Whether no constraint is set."""
+        return not (self.status or self.source or self.tags or self.user_id)
+
+
+@dataclass(slots=True)
+class SaveResult:
+    """Per-item result of a batch save.
+
+    Attributes:
+        knowledge: The knowledge as saved (ID and timestamps populated),
+            or as it would have been saved if the write failed
+        error: Error message if the item could not be saved
+        retryable: Whether the error was transient (the backend was
+            unavailable rather than rejecting the item)
+    """
+
+    knowledge: Knowledge
+    error: str = ""
+    retryable: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was saved."""
+        return not self.error
+
+
+@dataclass(frozen=True, slots=True)
 class ArchivedKnowledge:
     """Archived knowledge domain model.
 
     Represents a knowledge that has been promoted and archived.
     Stored in the archived_knowledge collection for audit trail.
+    Immutable once built.
 
     Attributes:
         id: Original knowledge ID (before archival)
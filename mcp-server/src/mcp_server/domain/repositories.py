@@ -4,9 +4,16 @@ This module defines the Protocol (interface) for knowledge repositories,
 following the Dependency Inversion Principle (DIP).
 """
 
+from collections.abc import AsyncIterator, Iterator, Sequence
 from typing import Protocol
 
-from .models import ArchivedKnowledge, Knowledge, SearchResult
+from .models import (
+    ArchivedKnowledge,
+    Knowledge,
+    SaveResult,
+    SearchFilter,
+    SearchResult,
+)
 
 
 class KnowledgeRepository(Protocol):
@@ -31,20 +38,100 @@ class KnowledgeRepository(Protocol):
         """
         ...
 
+    def save_many(self, knowledge_list: Sequence[Knowledge]) -> list[SaveResult]:
+        """Save many knowledge items using batched writes.
+
+        Each item follows the same rules as save(). A failing item does
+        not fail the whole call.
+
+        Args:
+            knowledge_list: The knowledge items to save
+
+        Returns:
+            One SaveResult per input item, in input order
+        """
+        ...
+
     def search(
         self,
         query: str,
         *,
         limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
     ) -> SearchResult:
         """Search knowledge using semantic search.
 
         Args:
             query: Search query text
             limit: Maximum number of results (default: 20)
+            fields: Knowledge fields to fetch (default: all). "id" is
+                always fetched; other fields keep their model defaults.
+            filters: Metadata constraints applied before ranking, so up
+                to limit matching items are returned
+            mode: Ranking strategy: "semantic" (default), "text" for
+                keyword search, or "hybrid" to fuse both rankings
+            cursor: next_cursor of a previous search with the same query,
+                fields, filters and mode; returns the page after it
 
         Returns:
-            SearchResult containing matching items
+            SearchResult containing matching items and, if more results
+            follow, the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If cursor is unknown, expired or was
+                issued for a different search
+        """
+        ...
+
+    def iter_search(
+        self,
+        query: str,
+        *,
+        page_size: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+    ) -> Iterator[Knowledge]:
+        """Stream search results, following the page cursors.
+
+        Items are yielded page by page as each page becomes available, so
+        a caller can stop early without the remaining pages being
+        fetched or buffered.
+
+        Args:
+            query: Search query text
+            page_size: Items per underlying search call (default: 20)
+            fields: Knowledge fields to fetch (default: all)
+            filters: Metadata constraints applied before ranking
+            mode: Ranking strategy, as for search()
+
+        Yields:
+            Matching knowledge, best first
+
+        Raises:
+            ValueError: If page_size is not positive
+        """
+        ...
+
+    def iter_all(
+        self,
+        *,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        page_size: int = 500,
+    ) -> Iterator[Knowledge]:
+        """Stream every stored knowledge item, e.g. to rebuild an index.
+
+        Args:
+            fields: Knowledge fields to fetch (default: all)
+            filters: Metadata constraints (default: everything stored)
+            page_size: Items per underlying query page (default: 500)
+
+        Yields:
+            Stored knowledge, in no particular order
         """
         ...
 
@@ -93,17 +180,229 @@ class KnowledgeRepository(Protocol):
         ...
 
     def update_status(
-        self, id: str, status: str, *, pr_url: str = ""
+        self,
+        id: str,
+        status: str,
+        *,
+        pr_url: str = "",
+        expected_status: str | None = None,
     ) -> Knowledge | None:
         """Update knowledge status.
 
+        Without expected_status this is a single write. A backend without
+        conditional writes (such as Vector Search 2.0) has to read the
+        object before a conditional update, so pass expected_status only
+        when the precondition is needed.
+
         Args:
             id: Knowledge identifier
             status: New status ("draft", "proposed", "promoted")
             pr_url: PR URL (optional, for proposed status)
+            expected_status: If set, only update when the current status
+                equals this value
 
         Returns:
             Updated knowledge if found, None otherwise
+
+        Raises:
+            StatusConflictError: If expected_status is set and the current
+                status differs (or changed during the update)
+        """
+        ...
+
+
+class AsyncKnowledgeRepository(Protocol):
+    """Asyncio counterpart of KnowledgeRepository.
+
+    Same contract as KnowledgeRepository, with every method a coroutine.
+    MCP tools depend on this interface so that a request waiting on the
+    backend does not occupy a worker thread.
+    """
+
+    async def save(self, knowledge: Knowledge) -> Knowledge:
+        """Save knowledge and return the saved instance with ID.
+
+        - If id is empty, creates a new knowledge (auto-generates ID)
+        - If id is provided, updates existing knowledge
+        - created_at and updated_at are auto-assigned by implementation
+
+        Args:
+            knowledge: The knowledge to save
+
+        Returns:
+            The saved knowledge with ID and timestamps populated
+        """
+        ...
+
+    async def save_many(self, knowledge_list: Sequence[Knowledge]) -> list[SaveResult]:
+        """Save many knowledge items using batched writes.
+
+        Each item follows the same rules as save(). A failing item does
+        not fail the whole call.
+
+        Args:
+            knowledge_list: The knowledge items to save
+
+        Returns:
+            One SaveResult per input item, in input order
+        """
+        ...
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
+    ) -> SearchResult:
+        """Search knowledge using semantic search.
+
+        Args:
+            query: Search query text
+            limit: Maximum number of results (default: 20)
+            fields: Knowledge fields to fetch (default: all). "id" is
+                always fetched; other fields keep their model defaults.
+            filters: Metadata constraints applied before ranking, so up
+                to limit matching items are returned
+            mode: Ranking strategy: "semantic" (default), "text" for
+                keyword search, or "hybrid" to fuse both rankings
+            cursor: next_cursor of a previous search with the same query,
+                fields, filters and mode; returns the page after it
+
+        Returns:
+            SearchResult containing matching items and, if more results
+            follow, the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If cursor is unknown, expired or was
+                issued for a different search
+        """
+        ...
+
+    def iter_search(
+        self,
+        query: str,
+        *,
+        page_size: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+    ) -> AsyncIterator[Knowledge]:
+        """Stream search results, following the page cursors.
+
+        Items are yielded page by page as each page becomes available, so
+        a caller can stop early without the remaining pages being
+        fetched or buffered.
+
+        Args:
+            query: Search query text
+            page_size: Items per underlying search call (default: 20)
+            fields: Knowledge fields to fetch (default: all)
+            filters: Metadata constraints applied before ranking
+            mode: Ranking strategy, as for search()
+
+        Yields:
+            Matching knowledge, best first
+
+        Raises:
+            ValueError: If page_size is not positive
+        """
+        ...
+
+    def iter_all(
+        self,
+        *,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Knowledge]:
+        """Stream every stored knowledge item, e.g. to rebuild an index.
+
+        Args:
+            fields: Knowledge fields to fetch (default: all)
+            filters: Metadata constraints (default: everything stored)
+            page_size: Items per underlying query page (default: 500)
+
+        Yields:
+            Stored knowledge, in no particular order
+        """
+        ...
+
+    async def get(self, id: str) -> Knowledge | None:
+        """Get knowledge by ID.
+
+        Args:
+            id: Knowledge identifier
+
+        Returns:
+            Knowledge if found, None otherwise
+        """
+        ...
+
+    async def delete(self, id: str) -> bool:
+        """Delete knowledge by ID.
+
+        Args:
+            id: Knowledge identifier
+
+        Returns:
+            True if deleted, False if not found
+        """
+        ...
+
+    async def find_by_github_path(self, path: str) -> Knowledge | None:
+        """Find knowledge by GitHub file path.
+
+        Args:
+            path: GitHub file path
+
+        Returns:
+            Knowledge if found, None otherwise
+        """
+        ...
+
+    async def find_by_pr_url(self, url: str) -> Knowledge | None:
+        """Find knowledge by PR URL.
+
+        Args:
+            url: Pull request URL
+
+        Returns:
+            Knowledge if found, None otherwise
+        """
+        ...
+
+    async def update_status(
+        self,
+        id: str,
+        status: str,
+        *,
+        pr_url: str = "",
+        expected_status: str | None = None,
+    ) -> Knowledge | None:
+        """Update knowledge status.
+
+        Without expected_status this is a single write. A backend without
+        conditional writes (such as Vector Search 2.0) has to read the
+        object before a conditional update, so pass expected_status only
+        when the precondition is needed.
+
+        Args:
+            id: Knowledge identifier
+            status: New status ("draft", "proposed", "promoted")
+            pr_url: PR URL (optional, for proposed status)
+            expected_status: If set, only update when the current status
+                equals this value
+
+        Returns:
+            Updated knowledge if found, None otherwise
+
+        Raises:
+            StatusConflictError: If expected_status is set and the current
+                status differs (or changed during the update)
         """
         ...
 
@@ -135,3 +434,56 @@ class ArchivedKnowledgeRepository(Protocol):
             ArchivedKnowledge if found, None otherwise
         """
         ...
+
+    def delete(self, id: str) -> bool:
+        """Delete archived knowledge by ID (undoes a save).
+
+        Args:
+            id: Archived knowledge identifier (original knowledge ID)
+
+        Returns:
+            True if deleted, False if not found
+        """
+        ...
+
+
+class AsyncArchivedKnowledgeRepository(Protocol):
+    """Asyncio counterpart of ArchivedKnowledgeRepository.
+
+    Same contract as ArchivedKnowledgeRepository, with every method a
+    coroutine, so promotion can write the archive concurrently with the
+    knowledge collection.
+    """
+
+    async def save(self, archived: ArchivedKnowledge) -> ArchivedKnowledge:
+        """Save archived knowledge.
+
+        Args:
+            archived: The archived knowledge to save
+
+        Returns:
+            The saved archived knowledge
+        """
+        ...
+
+    async def get(self, id: str) -> ArchivedKnowledge | None:
+        """Get archived knowledge by ID.
+
+        Args:
+            id: Archived knowledge identifier (original knowledge ID)
+
+        Returns:
+            ArchivedKnowledge if found, None otherwise
+        """
+        ...
+
+    async def delete(self, id: str) -> bool:
+        """Delete archived knowledge by ID (undoes a save).
+
+        Args:
+            id: Archived knowledge identifier (original knowledge ID)
+
+        Returns:
+            True if deleted, False if not found
+        """
+        ...
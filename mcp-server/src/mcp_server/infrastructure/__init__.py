@@ -3,6 +3,36 @@
 This package contains concrete implementations of repository interfaces.
 """
 
+from .async_vector_search import AsyncVectorSearchKnowledgeRepository
+from .channel_pool import AsyncChannelPool, ChannelPool
+from .circuit_breaker import CircuitBreaker, CircuitBreakerKnowledgeRepository
+from .coalescing_repository import CoalescingKnowledgeRepository
+from .instrumented_repository import InstrumentedKnowledgeRepository
+from .near_duplicates import NearDuplicateIndex
+from .query_embedding import EmbeddingCache, QueryEmbedder
+from .rank_fusion import HybridSearchConfig
+from .resilience import ResilientKnowledgeRepository, RetryPolicy
+from .result_pages import ResultPages
+from .search_cache import SearchCache
+from .single_flight import SingleFlight
 from .vector_search import VectorSearchKnowledgeRepository
 
-__all__ = ["VectorSearchKnowledgeRepository"]
+__all__ = [
+    "AsyncChannelPool",
+    "AsyncVectorSearchKnowledgeRepository",
+    "ChannelPool",
+    "CircuitBreaker",
+    "CircuitBreakerKnowledgeRepository",
+    "CoalescingKnowledgeRepository",
+    "EmbeddingCache",
+    "HybridSearchConfig",
+    "InstrumentedKnowledgeRepository",
+    "NearDuplicateIndex",
+    "QueryEmbedder",
+    "ResilientKnowledgeRepository",
+    "ResultPages",
+    "RetryPolicy",
+    "SearchCache",
+    "SingleFlight",
+    "VectorSearchKnowledgeRepository",
+]
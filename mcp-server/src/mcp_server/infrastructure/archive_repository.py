@@ -1,39 +1,104 @@
 """Vector Search 2.0 implementation of ArchivedKnowledgeRepository."""
 
-import os
+from __future__ import annotations
+
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
-from google.cloud import vectorsearch_v1beta
+from google.protobuf import field_mask_pb2
 
 from ..domain.models import ArchivedKnowledge
+from .gcp import resolve_location, resolve_project_id
+from .vector_search import api_exceptions, parse_datetime, vectorsearch_v1beta
 
+if TYPE_CHECKING:
+    from .channel_pool import AsyncChannelPool, ChannelPool
 
-def _get_project_id() -> str | None:
-    """Get GCP project ID from environment or metadata server."""
-    # First try environment variable
-    project_id = os.environ.get("GCP_PROJECT_ID")
-    if project_id:
-        return project_id
 
-    # Try GOOGLE_CLOUD_PROJECT (set by Cloud Run)
-    project_id = os.environ.get("GOOGLE_CLOUD_PROJECT")
-    if project_id:
-        return project_id
+def _archive_data(archived: ArchivedKnowledge) -> dict:
+    """Build the data map stored for an archive (archived_at must be set)."""
+    return {
+        "id": archived.id,
+        "title": archived.title,
+        "content": archived.content,
+        "tags": archived.tags,
+        "user_id": archived.user_id,
+        "promoted_to_id": archived.promoted_to_id,
+        "archived_at": archived.archived_at.isoformat(),
+        "original_created_at": (
+            archived.original_created_at.isoformat()
+            if archived.original_created_at
+            else None
+        ),
+    }
 
-    # Try GCP metadata server (for Cloud Run / GCE)
-    try:
-        import urllib.request
 
-        req = urllib.request.Request(
-            "http://metadata.google.internal/computeMetadata/v1/project/project-id",
-            headers={"Metadata-Flavor": "Google"},
-        )
-        with urllib.request.urlopen(req, timeout=2) as response:
-            return response.read().decode("utf-8")
-    except Exception:
-        pass
+def prepare_archive(
+    collection_path: str, archived: ArchivedKnowledge
+) -> tuple[vectorsearch_v1beta.CreateDataObjectRequest, ArchivedKnowledge]:
+    """Build the create request for an archive and the record it will yield.
+
+    Args:
+        collection_path: Full resource name of the archive collection
+        archived: The archived knowledge to save
+
+    Returns:
+        Tuple of (CreateDataObjectRequest, saved ArchivedKnowledge with
+        archived_at set)
+    """
+    saved = ArchivedKnowledge(
+        id=archived.id,
+        title=archived.title,
+        content=archived.content,
+        tags=archived.tags,
+        user_id=archived.user_id,
+        promoted_to_id=archived.promoted_to_id,
+        archived_at=archived.archived_at or datetime.now(UTC),
+        original_created_at=archived.original_created_at,
+    )
+    request = vectorsearch_v1beta.CreateDataObjectRequest(
+        parent=collection_path,
+        data_object_id=saved.id,
+        data_object=vectorsearch_v1beta.DataObject(
+            data=_archive_data(saved),
+            vectors={},  # Auto-Embeddings will generate vectors
+        ),
+    )
+    return request, saved
+
 
-    return None
+def build_archive_overwrite(
+    collection_path: str, saved: ArchivedKnowledge
+) -> vectorsearch_v1beta.UpdateDataObjectRequest:
+    """Build an update replacing every data field of an existing archive.
+
+    Sent when the create of prepare_archive() finds the ID taken, e.g.
+    by an earlier attempt of the same promotion whose undo failed, so a
+    retried save overwrites that record instead of failing.
+    """
+    data = _archive_data(saved)
+    return vectorsearch_v1beta.UpdateDataObjectRequest(
+        data_object=vectorsearch_v1beta.DataObject(
+            name=f"{collection_path}/dataObjects/{saved.id}", data=data
+        ),
+        update_mask=field_mask_pb2.FieldMask(
+            paths=[f"data.{field}" for field in data if field != "id"]
+        ),
+    )
+
+
+def archived_from_data(id: str, data) -> ArchivedKnowledge:
+    """Build an ArchivedKnowledge from a data object's data map."""
+    return ArchivedKnowledge(
+        id=id,
+        title=data.get("title", ""),
+        content=data.get("content", ""),
+        tags=list(data.get("tags", [])),
+        user_id=data.get("user_id", "anonymous"),
+        promoted_to_id=data.get("promoted_to_id", ""),
+        archived_at=parse_datetime(data.get("archived_at")),
+        original_created_at=parse_datetime(data.get("original_created_at")),
+    )
 
 
 class VectorSearchArchivedKnowledgeRepository:
@@ -48,6 +113,7 @@ class VectorSearchArchivedKnowledgeRepository:
         project_id: str | None = None,
         location: str | None = None,
         collection_id: str = "archived-knowledge",
+        channel_pool: ChannelPool | None = None,
     ):
         """Initialize the repository.
 
@@ -55,9 +121,11 @@ class VectorSearchArchivedKnowledgeRepository:
             project_id: GCP project ID (auto-detected if not provided)
             location: GCP location (defaults to GCP_LOCATION env var or us-central1)
             collection_id: Collection ID (defaults to "archived-knowledge")
+            channel_pool: Shared gRPC channel pool, e.g. the one used by the
+                knowledge repository (defaults to a dedicated client)
         """
-        self.project_id = project_id or _get_project_id()
-        self.location = location or os.environ.get("GCP_LOCATION", "us-central1")
+        self.project_id = project_id or resolve_project_id()
+        self.location = location or resolve_location()
         self.collection_id = collection_id
 
         if not self.project_id:
@@ -70,61 +138,42 @@ class VectorSearchArchivedKnowledgeRepository:
             f"/collections/{self.collection_id}"
         )
 
-        # Initialize client
-        self._data_object_client = vectorsearch_v1beta.DataObjectServiceClient()
+        self._channel_pool = channel_pool
+
+        # Created on first use
+        self._data_object_client: vectorsearch_v1beta.DataObjectServiceClient | None = (
+            None
+        )
+
+    @property
+    def data_object_client(self) -> vectorsearch_v1beta.DataObjectServiceClient:
+        """DataObjectService client (created on first use)."""
+        if self._data_object_client is None:
+            if self._channel_pool is not None:
+                return self._channel_pool.data_object_client()
+            self._data_object_client = vectorsearch_v1beta.DataObjectServiceClient()
+        return self._data_object_client
 
     def save(self, archived: ArchivedKnowledge) -> ArchivedKnowledge:
         """Save archived knowledge to Vector Search Collection.
 
+        Idempotent: an archive already stored under the same ID is
+        overwritten.
+
         Args:
             archived: The archived knowledge to save
 
         Returns:
             The saved archived knowledge with timestamps populated
         """
-        now = datetime.now(UTC)
-
-        # Set timestamps
-        archived_at = archived.archived_at or now
-
-        # Prepare data object
-        data = {
-            "id": archived.id,
-            "title": archived.title,
-            "content": archived.content,
-            "tags": archived.tags,
-            "user_id": archived.user_id,
-            "promoted_to_id": archived.promoted_to_id,
-            "archived_at": archived_at.isoformat(),
-            "original_created_at": (
-                archived.original_created_at.isoformat()
-                if archived.original_created_at
-                else None
-            ),
-        }
-
-        request = vectorsearch_v1beta.CreateDataObjectRequest(
-            parent=self._collection_path,
-            data_object_id=archived.id,
-            data_object=vectorsearch_v1beta.DataObject(
-                data=data,
-                vectors={},  # Auto-Embeddings will generate vectors
-            ),
-        )
-
-        self._data_object_client.create_data_object(request=request)
-
-        # Return updated archived knowledge
-        return ArchivedKnowledge(
-            id=archived.id,
-            title=archived.title,
-            content=archived.content,
-            tags=archived.tags,
-            user_id=archived.user_id,
-            promoted_to_id=archived.promoted_to_id,
-            archived_at=archived_at,
-            original_created_at=archived.original_created_at,
-        )
+        request, saved = prepare_archive(self._collection_path, archived)
+        try:
+            self.data_object_client.create_data_object(request=request)
+        except api_exceptions.AlreadyExists:
+            self.data_object_client.update_data_object(
+                request=build_archive_overwrite(self._collection_path, saved)
+            )
+        return saved
 
     def get(self, id: str) -> ArchivedKnowledge | None:
         """Get archived knowledge by ID.
@@ -135,34 +184,144 @@ class VectorSearchArchivedKnowledgeRepository:
         Returns:
             ArchivedKnowledge if found, None otherwise
         """
+        request = vectorsearch_v1beta.GetDataObjectRequest(
+            name=f"{self._collection_path}/dataObjects/{id}"
+        )
         try:
-            request = vectorsearch_v1beta.GetDataObjectRequest(
-                name=f"{self._collection_path}/dataObjects/{id}"
+            response = self.data_object_client.get_data_object(request=request)
+        except api_exceptions.NotFound:
+            return None
+        return archived_from_data(id, response.data)
+
+    def delete(self, id: str) -> bool:
+        """Delete archived knowledge by ID (undoes a save).
+
+        Args:
+            id: Archived knowledge identifier (original knowledge ID)
+
+        Returns:
+            True if deleted, False if not found
+        """
+        request = vectorsearch_v1beta.DeleteDataObjectRequest(
+            name=f"{self._collection_path}/dataObjects/{id}"
+        )
+        try:
+            self.data_object_client.delete_data_object(request=request)
+        except api_exceptions.NotFound:
+            return False
+        return True
+
+
+class AsyncVectorSearchArchivedKnowledgeRepository:
+    """Archived knowledge repository using Vertex AI Vector Search 2.0 (asyncio).
+
+    Same behavior as VectorSearchArchivedKnowledgeRepository, built on the
+    async GAPIC client so the archive write of a promotion can run
+    concurrently with the knowledge writes. The client is created on
+    first use so that it binds to the event loop serving requests.
+    """
+
+    def __init__(
+        self,
+        project_id: str | None = None,
+        location: str | None = None,
+        collection_id: str = "archived-knowledge",
+        channel_pool: AsyncChannelPool | None = None,
+    ):
+        """Initialize the repository.
+
+        Args:
+            project_id: GCP project ID (auto-detected if not provided)
+            location: GCP location (defaults to GCP_LOCATION env var or us-central1)
+            collection_id: Collection ID (defaults to "archived-knowledge")
+            channel_pool: Shared gRPC channel pool, e.g. the one used by the
+                knowledge repository (defaults to a dedicated client)
+        """
+        self.project_id = project_id or resolve_project_id()
+        self.location = location or resolve_location()
+        self.collection_id = collection_id
+
+        if not self.project_id:
+            raise ValueError(
+                "project_id must be provided or detectable from environment"
             )
-            response = self._data_object_client.get_data_object(request=request)
-            data = response.data
-
-            return ArchivedKnowledge(
-                id=id,
-                title=data.get("title", ""),
-                content=data.get("content", ""),
-                tags=list(data.get("tags", [])),
-                user_id=data.get("user_id", "anonymous"),
-                promoted_to_id=data.get("promoted_to_id", ""),
-                archived_at=self._parse_datetime(data.get("archived_at")),
-                original_created_at=self._parse_datetime(
-                    data.get("original_created_at")
-                ),
+
+        self._collection_path = (
+            f"projects/{self.project_id}/locations/{self.location}"
+            f"/collections/{self.collection_id}"
+        )
+
+        self._channel_pool = channel_pool
+
+        # Created lazily (see class docstring)
+        self._data_object_client: (
+            vectorsearch_v1beta.DataObjectServiceAsyncClient | None
+        ) = None
+
+    @property
+    def data_object_client(self) -> vectorsearch_v1beta.DataObjectServiceAsyncClient:
+        """Async DataObjectService client (created on first use)."""
+        if self._data_object_client is None:
+            if self._channel_pool is not None:
+                return self._channel_pool.data_object_client()
+            self._data_object_client = (
+                vectorsearch_v1beta.DataObjectServiceAsyncClient()
             )
-        except Exception:
-            # Not found or other error
-            return None
+        return self._data_object_client
 
-    def _parse_datetime(self, value: str | None) -> datetime | None:
-        """Parse ISO 8601 datetime string."""
-        if not value:
-            return None
+    async def save(self, archived: ArchivedKnowledge) -> ArchivedKnowledge:
+        """Save archived knowledge to Vector Search Collection.
+
+        Idempotent: an archive already stored under the same ID is
+        overwritten.
+
+        Args:
+            archived: The archived knowledge to save
+
+        Returns:
+            The saved archived knowledge with timestamps populated
+        """
+        request, saved = prepare_archive(self._collection_path, archived)
         try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+            await self.data_object_client.create_data_object(request=request)
+        except api_exceptions.AlreadyExists:
+            await self.data_object_client.update_data_object(
+                request=build_archive_overwrite(self._collection_path, saved)
+            )
+        return saved
+
+    async def get(self, id: str) -> ArchivedKnowledge | None:
+        """Get archived knowledge by ID.
+
+        Args:
+            id: Archived knowledge identifier (original knowledge ID)
+
+        Returns:
+            ArchivedKnowledge if found, None otherwise
+        """
+        request = vectorsearch_v1beta.GetDataObjectRequest(
+            name=f"{self._collection_path}/dataObjects/{id}"
+        )
+        try:
+            response = await self.data_object_client.get_data_object(request=request)
+        except api_exceptions.NotFound:
             return None
+        return archived_from_data(id, response.data)
+
+    async def delete(self, id: str) -> bool:
+        """Delete archived knowledge by ID (undoes a save).
+
+        Args:
+            id: Archived knowledge identifier (original knowledge ID)
+
+        Returns:
+            True if deleted, False if not found
+        """
+        request = vectorsearch_v1beta.DeleteDataObjectRequest(
+            name=f"{self._collection_path}/dataObjects/{id}"
+        )
+        try:
+            await self.data_object_client.delete_data_object(request=request)
+        except api_exceptions.NotFound:
+            return False
+        return True
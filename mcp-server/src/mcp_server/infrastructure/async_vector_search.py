@@ -0,0 +1,545 @@
+"""Vector Search 2.0 implementation of AsyncKnowledgeRepository."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from ..domain.exceptions import StatusConflictError
+from .rank_fusion import HybridSearchConfig, fuse_hybrid
+from .vector_search import (
+    BatchChunk,
+    BatchSave,
+    VectorSearchRepositoryBase,
+    api_exceptions,
+    build_exact_match_query,
+    build_scan_query,
+    build_status_update_request,
+    check_search_mode,
+    hybrid_search_error,
+    knowledge_from_data,
+    knowledge_from_data_object,
+    prepare_resave,
+    prepare_save,
+    search_key,
+    search_result_from_response,
+    status_update_etag,
+    vectorsearch_v1beta,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from ..domain.models import Knowledge, SaveResult, SearchFilter, SearchResult
+    from .channel_pool import AsyncChannelPool
+    from .query_embedding import QueryEmbedder
+    from .result_pages import ResultPages
+    from .search_cache import SearchCache
+
+
+def _branch_outcome(
+    branch: asyncio.Future,
+) -> tuple[SearchResult | None, BaseException | None]:
+    """Result or error of a hybrid search branch (neither if cut off)."""
+    if not branch.done() or branch.cancelled():
+        return None, None
+    error = branch.exception()
+    if error is not None:
+        return None, error
+    return search_result_from_response(branch.result()), None
+
+
+class AsyncVectorSearchKnowledgeRepository(VectorSearchRepositoryBase):
+    """Knowledge repository using Vertex AI Vector Search 2.0 (asyncio).
+
+    Same behavior as VectorSearchKnowledgeRepository, but built on the
+    async GAPIC clients so a request awaiting a gRPC round trip does not
+    hold a worker thread. Requests are built and responses handled by the
+    same code (see VectorSearchRepositoryBase and BatchSave); this class
+    only awaits the calls.
+
+    Clients are created on first use so that they bind to the event loop
+    serving requests rather than to whichever loop (if any) was current
+    at import time.
+    """
+
+    def __init__(
+        self,
+        project_id: str | None = None,
+        location: str | None = None,
+        collection_id: str = "knowledge",
+        search_cache: SearchCache | None = None,
+        batch_concurrency: int = 4,
+        channel_pool: AsyncChannelPool | None = None,
+        hybrid: HybridSearchConfig | None = None,
+        result_pages: ResultPages | None = None,
+        query_embedder: QueryEmbedder | None = None,
+    ):
+        """Initialize the repository.
+
+        Args:
+            project_id: GCP project ID (auto-detected if not provided)
+            location: GCP location (defaults to GCP_LOCATION env var or us-central1)
+            collection_id: Collection ID (defaults to "knowledge")
+            search_cache: Search result cache (defaults to a 256-entry,
+                60-second cache)
+            batch_concurrency: Batch create chunks in flight at once
+                during save_many
+            channel_pool: Shared gRPC channel pool (defaults to dedicated
+                clients with their own channels)
+            hybrid: Weights and deadline of hybrid search (defaults to
+                equal weights, k=60 and a 3-second deadline)
+            result_pages: Store of rankings behind search cursors
+                (defaults to no prefetched pages, i.e. no cursors)
+            query_embedder: If set, semantic search sends the query vector
+                computed (and cached) by it as a vector search, instead of
+                having the service embed the search text on every request
+        """
+        super().__init__(
+            project_id,
+            location,
+            collection_id,
+            search_cache,
+            channel_pool,
+            hybrid,
+            result_pages,
+            query_embedder,
+        )
+        self.batch_concurrency = batch_concurrency
+
+    @property
+    def data_object_client(self) -> vectorsearch_v1beta.DataObjectServiceAsyncClient:
+        """Async DataObjectService client (created on first use)."""
+        if self._data_object_client is None:
+            if self._channel_pool is not None:
+                return self._channel_pool.data_object_client()
+            self._data_object_client = (
+                vectorsearch_v1beta.DataObjectServiceAsyncClient()
+            )
+        return self._data_object_client
+
+    @property
+    def search_client(
+        self,
+    ) -> vectorsearch_v1beta.DataObjectSearchServiceAsyncClient:
+        """Async DataObjectSearchService client (created on first use)."""
+        if self._search_client is None:
+            if self._channel_pool is not None:
+                return self._channel_pool.search_client()
+            self._search_client = (
+                vectorsearch_v1beta.DataObjectSearchServiceAsyncClient()
+            )
+        return self._search_client
+
+    async def save(self, knowledge: Knowledge) -> Knowledge:
+        """Save knowledge to Vector Search Collection.
+
+        Knowledge whose ID is already stored is updated in place. If its
+        title and content are unchanged (same content hash), only the
+        metadata is written and the stored embedding is kept.
+
+        Args:
+            knowledge: The knowledge to save
+
+        Returns:
+            The saved knowledge with ID and timestamps populated
+        """
+        request, saved = prepare_save(self._collection_path, knowledge)
+
+        existing = await self._stored_data(knowledge.id) if knowledge.id else None
+        if existing is not None:
+            update, saved = prepare_resave(self._collection_path, saved, existing)
+            await self.data_object_client.update_data_object(request=update)
+        else:
+            await self.data_object_client.create_data_object(request=request)
+        return self._written(saved)
+
+    async def save_many(self, knowledge_list: Sequence[Knowledge]) -> list[SaveResult]:
+        """Save many knowledge items with BatchCreateDataObjects.
+
+        Same chunking, retry and re-save rules as the sync repository,
+        with up to batch_concurrency chunks in flight at once.
+
+        Args:
+            knowledge_list: The knowledge items to save
+
+        Returns:
+            One SaveResult per input item, in input order
+        """
+        batch = BatchSave(self._collection_path, knowledge_list)
+        lookups = await asyncio.gather(
+            *(
+                self.search_client.query_data_objects(request=request)
+                for request in batch.lookup_requests()
+            )
+        )
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def send(chunk: BatchChunk) -> None:
+            async with semaphore:
+                await self._send_chunk(batch, chunk)
+
+        await asyncio.gather(*(send(chunk) for chunk in batch.plan(lookups)))
+        return self._batch_written(batch)
+
+    async def _send_chunk(self, batch: BatchSave, chunk: BatchChunk) -> None:
+        """Send a chunk, then the retries and halves it leads to."""
+        pending = [chunk]
+        while pending:
+            chunk = pending.pop()
+            if chunk.delay:
+                await asyncio.sleep(chunk.delay)
+            send = (
+                self.data_object_client.batch_update_data_objects
+                if chunk.update
+                else self.data_object_client.batch_create_data_objects
+            )
+            try:
+                response = await send(request=batch.request(chunk))
+            except Exception as e:
+                follow = batch.failed(chunk, e)
+            else:
+                follow = batch.succeeded(chunk, response)
+            # Depth first, in order
+            pending.extend(reversed(follow))
+
+    async def _stored_data(self, id: str):
+        """Return the data map of a stored object, or None if there is none."""
+        request = vectorsearch_v1beta.GetDataObjectRequest(name=self._object_name(id))
+        try:
+            response = await self.data_object_client.get_data_object(request=request)
+        except api_exceptions.NotFound:
+            return None
+        return response.data
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
+    ) -> SearchResult:
+        """Search knowledge using semantic, text or hybrid search.
+
+        Hybrid search runs the semantic and text searches concurrently,
+        both bounded by the hybrid deadline, and merges the rankings by
+        reciprocal rank fusion. If one branch fails or misses the
+        deadline, the other branch's ranking is returned alone.
+
+        Args:
+            query: Search query text
+            limit: Maximum number of results (default: 20)
+            fields: Knowledge fields to fetch (default: all), pushed down
+                into OutputFields.data_fields
+            filters: Metadata constraints, pushed down as the search filter
+            mode: "semantic", "text" (keyword search over title and
+                content) or "hybrid"
+            cursor: next_cursor of a previous page of the same search;
+                the page is served from the stored ranking
+
+        Returns:
+            SearchResult containing matching items and the cursor of the
+            next page, if any
+
+        Raises:
+            ValueError: If mode is not a valid search mode
+            InvalidCursorError: If cursor is unknown, expired or was
+                issued for a different search
+        """
+        check_search_mode(mode)
+        key = search_key(query, fields=fields, filters=filters, mode=mode)
+        answered = self._answered_search(key, limit, cursor)
+        if answered is not None:
+            return answered
+        # A write landing while the backend is queried invalidates the
+        # result before it is stored; the generation check drops it
+        generation = self._search_cache.generation
+
+        # Fetch several pages at once; the rest is kept for the cursor
+        window = self._result_pages.window(limit)
+        if mode == "hybrid":
+            ranking = await self._hybrid_search(
+                query, limit=window, fields=fields, filters=filters
+            )
+        else:
+            vector = await self._query_vector(query) if mode == "semantic" else None
+            request = self._search_request(
+                query, vector, mode=mode, limit=window, fields=fields, filters=filters
+            )
+            response = await self.search_client.search_data_objects(request=request)
+            ranking = search_result_from_response(response)
+
+        return self._first_page(key, ranking, limit, generation)
+
+    async def _query_vector(self, query: str) -> list[float] | None:
+        # With a query embedder, send the (cached) query vector instead of
+        # having the service embed the search text again
+        if self.query_embedder is None:
+            return None
+        return await self.query_embedder.aembed(query)
+
+    async def _semantic_branch(
+        self,
+        query: str,
+        *,
+        limit: int,
+        fields: Sequence[str] | None,
+        filters: SearchFilter | None,
+        timeout: float,
+    ):
+        request = self._search_request(
+            query,
+            await self._query_vector(query),
+            mode="semantic",
+            limit=limit,
+            fields=fields,
+            filters=filters,
+        )
+        return await self.search_client.search_data_objects(
+            request=request, timeout=timeout
+        )
+
+    async def _hybrid_search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        fields: Sequence[str] | None,
+        filters: SearchFilter | None,
+    ) -> SearchResult:
+        config = self.hybrid
+        candidates = config.candidates(limit)
+        text_request = self._search_request(
+            query, None, mode="text", limit=candidates, fields=fields, filters=filters
+        )
+        branches = [
+            asyncio.ensure_future(
+                self._semantic_branch(
+                    query,
+                    limit=candidates,
+                    fields=fields,
+                    filters=filters,
+                    timeout=config.deadline,
+                )
+            ),
+            asyncio.ensure_future(
+                self.search_client.search_data_objects(
+                    request=text_request, timeout=config.deadline
+                )
+            ),
+        ]
+        try:
+            await asyncio.wait(branches, timeout=config.deadline)
+        finally:
+            for branch in branches:
+                if not branch.done():
+                    branch.cancel()
+
+        (semantic, semantic_error), (text, text_error) = map(_branch_outcome, branches)
+        if semantic is None and text is None:
+            raise hybrid_search_error(semantic_error, text_error)
+        return fuse_hybrid(semantic, text, config=config, limit=limit)
+
+    async def iter_search(
+        self,
+        query: str,
+        *,
+        page_size: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+    ) -> AsyncIterator[Knowledge]:
+        """Stream search results, following the page cursors.
+
+        Each page is requested only after the previous one was consumed,
+        and later pages come from the ranking stored by the first, so a
+        caller that stops early leaves nothing buffered or recomputed.
+
+        Args:
+            query: Search query text
+            page_size: Items per page (default: 20)
+            fields: Knowledge fields to fetch (default: all)
+            filters: Metadata constraints, pushed down as the search filter
+            mode: "semantic", "text" or "hybrid"
+
+        Yields:
+            Matching knowledge, best first
+
+        Raises:
+            ValueError: If page_size is not positive
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        cursor = None
+        while True:
+            page = await self.search(
+                query,
+                limit=page_size,
+                fields=fields,
+                filters=filters,
+                mode=mode,
+                cursor=cursor,
+            )
+            for item in page.items:
+                yield item
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
+    async def iter_all(
+        self,
+        *,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Knowledge]:
+        """Stream the stored knowledge matching filters, in collection order.
+
+        Args:
+            fields: Knowledge fields to fetch (default: all)
+            filters: Metadata constraints (default: the whole collection)
+            page_size: Objects per underlying query page (default: 500)
+
+        Yields:
+            Stored knowledge
+        """
+        request = build_scan_query(self._collection_path, fields, filters, page_size)
+        # The pager transparently follows next_page_token
+        pager = await self.search_client.query_data_objects(request=request)
+        async for data_object in pager:
+            yield knowledge_from_data(data_object.data)
+
+    async def get(self, id: str) -> Knowledge | None:
+        """Get knowledge by ID.
+
+        Args:
+            id: Knowledge identifier
+
+        Returns:
+            Knowledge if found, None otherwise
+        """
+        data = await self._stored_data(id)
+        return knowledge_from_data(data) if data is not None else None
+
+    async def delete(self, id: str) -> bool:
+        """Delete knowledge by ID.
+
+        Args:
+            id: Knowledge identifier
+
+        Returns:
+            True if deleted, False if not found
+        """
+        request = vectorsearch_v1beta.DeleteDataObjectRequest(
+            name=self._object_name(id)
+        )
+        try:
+            await self.data_object_client.delete_data_object(request=request)
+        except api_exceptions.NotFound:
+            return False
+
+        self._deleted(id)
+        return True
+
+    async def find_by_github_path(self, path: str) -> Knowledge | None:
+        """Find knowledge by GitHub file path.
+
+        Resolves the ID from the in-process index when possible, otherwise
+        runs an exact-match metadata query and indexes the result.
+
+        Args:
+            path: GitHub file path
+
+        Returns:
+            Knowledge if found, None otherwise
+        """
+        if not path:
+            return None
+        return await self._find_by("github_path", path, self._index.id_for_path(path))
+
+    async def find_by_pr_url(self, url: str) -> Knowledge | None:
+        """Find knowledge by PR URL.
+
+        Resolves the ID from the in-process index when possible, otherwise
+        runs an exact-match metadata query and indexes the result.
+
+        Args:
+            url: Pull request URL
+
+        Returns:
+            Knowledge if found, None otherwise
+        """
+        if not url:
+            return None
+        return await self._find_by("pr_url", url, self._index.id_for_pr_url(url))
+
+    async def _find_by(
+        self, field: str, value: str, indexed_id: str | None
+    ) -> Knowledge | None:
+        """Look up the knowledge whose field equals value."""
+        if indexed_id is not None:
+            knowledge = await self.get(indexed_id)
+            hinted = self._hinted(field, value, indexed_id, knowledge)
+            if hinted is not None:
+                return hinted
+
+        request = build_exact_match_query(self._collection_path, field, value)
+        response = await self.search_client.query_data_objects(request=request)
+        return self._first_match(response)
+
+    async def update_status(
+        self,
+        id: str,
+        status: str,
+        *,
+        pr_url: str = "",
+        expected_status: str | None = None,
+    ) -> Knowledge | None:
+        """Update knowledge status.
+
+        Same semantics as VectorSearchKnowledgeRepository.update_status:
+        one masked update without expected_status, a read plus an update
+        carrying the etag with it.
+
+        Args:
+            id: Knowledge identifier
+            status: New status ("draft", "proposed", "promoted")
+            pr_url: PR URL (optional, for proposed status)
+            expected_status: If set, only update when the current status
+                equals this value
+
+        Returns:
+            Updated knowledge if found, None otherwise
+
+        Raises:
+            StatusConflictError: If the current status is not
+                expected_status, or the object changed before the update
+        """
+        etag = ""
+        if expected_status is not None:
+            try:
+                current = await self.data_object_client.get_data_object(
+                    request=vectorsearch_v1beta.GetDataObjectRequest(
+                        name=self._object_name(id)
+                    )
+                )
+            except api_exceptions.NotFound:
+                return None
+            etag = status_update_etag(id, current, expected_status)
+
+        request = build_status_update_request(
+            self._collection_path, id, status, pr_url=pr_url, etag=etag
+        )
+        try:
+            response = await self.data_object_client.update_data_object(request=request)
+        except api_exceptions.NotFound:
+            return None
+        except (api_exceptions.FailedPrecondition, api_exceptions.Aborted):
+            if etag:
+                raise StatusConflictError(id) from None
+            raise
+
+        return self._written(knowledge_from_data_object(id, response))
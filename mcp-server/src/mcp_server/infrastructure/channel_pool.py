@@ -0,0 +1,279 @@
+"""Shared gRPC channel pool for the Vector Search repositories."""
+
+import functools
+import inspect
+import os
+import threading
+from dataclasses import dataclass, field
+
+from .gcp import LazyModule
+
+google_auth = LazyModule("google.auth")
+grpc = LazyModule("grpc")
+grpc_aio = LazyModule("grpc.aio")
+_data_object_transports = LazyModule(
+    "google.cloud.vectorsearch_v1beta.services.data_object_service.transports"
+)
+_search_transports = LazyModule(
+    "google.cloud.vectorsearch_v1beta.services.data_object_search_service.transports"
+)
+vectorsearch_v1beta = LazyModule("google.cloud.vectorsearch_v1beta")
+
+DEFAULT_HOST = "vectorsearch.googleapis.com"
+
+_AUTH_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+
+# Client kinds handed out by the pool
+_DATA_OBJECT = "data_object"
+_SEARCH = "search"
+
+
+@dataclass
+class _Slot:
+    """One channel plus the clients bound to it."""
+
+    channel: object
+    clients: dict[str, object] = field(default_factory=dict)
+    in_flight: int = 0
+
+
+class _CountedClient:
+    """Proxies a GAPIC client, tracking calls in flight on its channel."""
+
+    def __init__(self, client, slot: _Slot, lock: threading.Lock):
+        self._client = client
+        self._slot = slot
+        self._lock = lock
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        if inspect.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            async def call_async(*args, **kwargs):
+                self._enter()
+                try:
+                    return await attr(*args, **kwargs)
+                finally:
+                    self._exit()
+
+            return call_async
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            self._enter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self._exit()
+
+        return call
+
+    def _enter(self) -> None:
+        with self._lock:
+            self._slot.in_flight += 1
+
+    def _exit(self) -> None:
+        with self._lock:
+            self._slot.in_flight -= 1
+
+
+class ChannelPool:
+    """Pool of gRPC channels shared by the Vector Search repositories.
+
+    Every repository built with the same pool sends its DataObjectService
+    and DataObjectSearchService calls over the same warm connections, with
+    a single set of credentials refreshed once for all of them.
+
+    Channels are opened on demand: a client is handed out on the channel
+    with the fewest calls in flight, and a new channel is only opened
+    (up to size) once every open channel has max_concurrent_streams calls
+    in flight. The first channel is opened on first use.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 2,
+        max_concurrent_streams: int = 100,
+        keepalive_time_ms: int = 60_000,
+        keepalive_timeout_ms: int = 20_000,
+        keepalive_without_calls: bool = False,
+        host: str = DEFAULT_HOST,
+        credentials=None,
+        insecure: bool = False,
+    ):
+        """Initialize the pool.
+
+        Args:
+            size: Maximum number of channels to open
+            max_concurrent_streams: Calls in flight on a channel before
+                another channel is opened
+            keepalive_time_ms: Interval between HTTP/2 keepalive pings
+            keepalive_timeout_ms: Time to wait for a ping ack before the
+                connection is considered dead
+            keepalive_without_calls: Also ping while no call is in flight,
+                keeping idle connections warm
+            host: Service endpoint
+            credentials: Credentials for all channels (defaults to
+                application default credentials, resolved on first use)
+            insecure: Use plaintext channels without credentials (for a
+                local emulator only)
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if max_concurrent_streams < 1:
+            raise ValueError("max_concurrent_streams must be at least 1")
+
+        self.size = size
+        self.max_concurrent_streams = max_concurrent_streams
+        self.keepalive_time_ms = keepalive_time_ms
+        self.keepalive_timeout_ms = keepalive_timeout_ms
+        self.keepalive_without_calls = keepalive_without_calls
+        self.host = host
+        self.insecure = insecure
+
+        self._credentials = credentials
+        self._slots: list[_Slot] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        """Create a pool configured from GRPC_* environment variables.
+
+        Reads GRPC_CHANNEL_POOL_SIZE, GRPC_MAX_CONCURRENT_STREAMS and
+        GRPC_KEEPALIVE_TIME_MS; unset variables keep the defaults. If
+        VECTOR_SEARCH_EMULATOR_HOST is set, channels connect to that
+        host:port in plaintext instead of the real service.
+
+        Args:
+            **kwargs: Overrides for any other constructor argument
+        """
+        for env, name in (
+            ("GRPC_CHANNEL_POOL_SIZE", "size"),
+            ("GRPC_MAX_CONCURRENT_STREAMS", "max_concurrent_streams"),
+            ("GRPC_KEEPALIVE_TIME_MS", "keepalive_time_ms"),
+        ):
+            value = os.environ.get(env)
+            if value:
+                kwargs.setdefault(name, int(value))
+        emulator_host = os.environ.get("VECTOR_SEARCH_EMULATOR_HOST")
+        if emulator_host:
+            kwargs.setdefault("host", emulator_host)
+            kwargs.setdefault("insecure", True)
+        return cls(**kwargs)
+
+    def channel_options(self) -> list[tuple[str, int]]:
+        """Return the gRPC channel arguments used for every channel."""
+        return [
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+            ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", int(self.keepalive_without_calls)),
+            ("grpc.http2.max_pings_without_data", 0),
+            # Without this, gRPC dedupes identical channels onto one
+            # process-wide connection and the pool would not spread load
+            ("grpc.use_local_subchannel_pool", 1),
+        ]
+
+    def data_object_client(self):
+        """Return a DataObjectService client on the least-loaded channel."""
+        return self._client(_DATA_OBJECT)
+
+    def search_client(self):
+        """Return a DataObjectSearchService client on the least-loaded channel."""
+        return self._client(_SEARCH)
+
+    def in_flight(self) -> list[int]:
+        """Return the number of calls in flight on each open channel."""
+        with self._lock:
+            return [slot.in_flight for slot in self._slots]
+
+    def close(self) -> None:
+        """Close all channels."""
+        for slot in self._take_slots():
+            slot.channel.close()
+
+    def _client(self, kind: str) -> _CountedClient:
+        with self._lock:
+            slot = min(self._slots, key=lambda s: s.in_flight, default=None)
+            if slot is None or (
+                slot.in_flight >= self.max_concurrent_streams
+                and len(self._slots) < self.size
+            ):
+                slot = _Slot(self._create_channel())
+                self._slots.append(slot)
+            client = slot.clients.get(kind)
+            if client is None:
+                client = slot.clients[kind] = self._create_client(kind, slot.channel)
+        return _CountedClient(client, slot, self._lock)
+
+    def _take_slots(self) -> list[_Slot]:
+        with self._lock:
+            slots, self._slots = self._slots, []
+        return slots
+
+    def _get_credentials(self):
+        if self._credentials is None:
+            self._credentials, _ = google_auth.default(scopes=_AUTH_SCOPES)
+        return self._credentials
+
+    def _create_channel(self):
+        if self.insecure:
+            return grpc.insecure_channel(self.host, options=self.channel_options())
+        return _data_object_transports.DataObjectServiceGrpcTransport.create_channel(
+            self.host,
+            credentials=self._get_credentials(),
+            options=self.channel_options(),
+        )
+
+    def _create_client(self, kind: str, channel):
+        if kind == _DATA_OBJECT:
+            transport = _data_object_transports.DataObjectServiceGrpcTransport(
+                host=self.host, channel=channel
+            )
+            return vectorsearch_v1beta.DataObjectServiceClient(transport=transport)
+        transport = _search_transports.DataObjectSearchServiceGrpcTransport(
+            host=self.host, channel=channel
+        )
+        return vectorsearch_v1beta.DataObjectSearchServiceClient(transport=transport)
+
+
+class AsyncChannelPool(ChannelPool):
+    """ChannelPool of grpc.aio channels for the asyncio clients.
+
+    Channels are opened on first use, so they bind to the event loop
+    serving requests.
+    """
+
+    async def close(self) -> None:
+        """Close all channels."""
+        for slot in self._take_slots():
+            await slot.channel.close()
+
+    def _create_channel(self):
+        if self.insecure:
+            return grpc_aio.insecure_channel(self.host, options=self.channel_options())
+        transports = _data_object_transports
+        return transports.DataObjectServiceGrpcAsyncIOTransport.create_channel(
+            self.host,
+            credentials=self._get_credentials(),
+            options=self.channel_options(),
+        )
+
+    def _create_client(self, kind: str, channel):
+        if kind == _DATA_OBJECT:
+            transport = _data_object_transports.DataObjectServiceGrpcAsyncIOTransport(
+                host=self.host, channel=channel
+            )
+            return vectorsearch_v1beta.DataObjectServiceAsyncClient(transport=transport)
+        transport = _search_transports.DataObjectSearchServiceGrpcAsyncIOTransport(
+            host=self.host, channel=channel
+        )
+        return vectorsearch_v1beta.DataObjectSearchServiceAsyncClient(
+            transport=transport
+        )
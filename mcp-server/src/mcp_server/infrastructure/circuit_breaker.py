@@ -0,0 +1,335 @@
+"""Circuit breaker with a stale-while-revalidate fallback for search."""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import replace
+from typing import TypeVar
+
+from ..domain.exceptions import BackendUnavailableError
+from ..domain.models import Knowledge, SaveResult, SearchFilter, SearchResult
+from ..domain.repositories import AsyncKnowledgeRepository
+from ..metrics import Metrics
+from .resilience import is_retryable
+from .search_cache import SearchCache
+from .vector_search import search_key
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+# Value of the circuit state gauge per state
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    Closed: calls pass, and failure_threshold consecutive failures open
+    the circuit. Open: calls are rejected until reset_timeout has passed,
+    then the circuit is half-open. Half-open: one call at a time is let
+    through as a probe; its success closes the circuit, its failure opens
+    it for another reset_timeout.
+
+    Not thread-safe; use from one event loop.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before probing
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        """Create a breaker configured from CIRCUIT_* environment variables.
+
+        Reads CIRCUIT_FAILURE_THRESHOLD and CIRCUIT_RESET_MS; unset
+        variables keep the defaults.
+
+        Args:
+            **kwargs: Overrides for any other constructor argument
+        """
+        threshold = os.environ.get("CIRCUIT_FAILURE_THRESHOLD")
+        if threshold:
+            kwargs.setdefault("failure_threshold", int(threshold))
+        reset_ms = os.environ.get("CIRCUIT_RESET_MS")
+        if reset_ms:
+            kwargs.setdefault("reset_timeout", int(reset_ms) / 1000)
+        return cls(**kwargs)
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        if self._opened_at is None:
+            return CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go to the backend now.
+
+        In the half-open state, True admits the caller as the probe; it
+        must then report the outcome with record_success, record_failure
+        or release.
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN or self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Report a call the backend answered; closes the circuit."""
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Report a call the backend failed (transient error or timeout)."""
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def release(self) -> None:
+        """Report a call that ended without an outcome (e.g. cancelled)."""
+        self._probing = False
+
+
+class CircuitBreakerKnowledgeRepository:
+    """AsyncKnowledgeRepository that fails fast while the backend is down.
+
+    Every backend call goes through a CircuitBreaker. Only transient
+    errors (see is_retryable) count as failures; a terminal error means
+    the backend answered. While the circuit is open, calls raise
+    BackendUnavailableError at once instead of waiting for their timeout.
+
+    Searches fall back to recent results (stale-while-revalidate): every
+    successful search is kept in a stale store that writes do not clear.
+    If a search cannot be answered live and the same search succeeded
+    recently, its result is returned with stale=True. Once the circuit
+    is half-open, a stale hit is still returned at once and the search
+    is re-run in the background as the probe, which refreshes the store
+    and closes the circuit if the backend has recovered.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncKnowledgeRepository,
+        breaker: CircuitBreaker | None = None,
+        stale_results: SearchCache | None = None,
+        metrics: Metrics | None = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            repository: Repository to delegate to
+            breaker: Circuit breaker (defaults to CircuitBreaker())
+            stale_results: Store of recent search results served while
+                the backend is unavailable (defaults to 1024 entries kept
+                for an hour)
+            metrics: Metrics to record state, rejections and stale
+                answers into (optional)
+        """
+        self._repository = repository
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self._stale = (
+            stale_results
+            if stale_results is not None
+            else SearchCache(maxsize=1024, ttl=3600.0)
+        )
+        self._metrics = metrics
+        self._revalidations: set[asyncio.Task] = set()
+        if metrics is not None:
+            metrics.repository_circuit_state.set_function(
+                lambda: STATE_VALUES[self.breaker.state]
+            )
+
+    def __getattr__(self, name: str):
+        """Delegate anything not guarded (e.g. iter_all)."""
+        return getattr(self._repository, name)
+
+    async def _guard(
+        self,
+        method: str,
+        call: Callable[[], Awaitable[T]],
+        *,
+        admitted: bool = False,
+        failed: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Run call through the breaker.
+
+        Args:
+            method: Repository method name (for metrics and errors)
+            call: Starts the backend call
+            admitted: The caller already got allow() from the breaker
+            failed: For calls that report errors in their result instead
+                of raising: whether a result counts as a failure
+
+        Raises:
+            BackendUnavailableError: If the circuit rejects the call
+        """
+        if not admitted and not self.breaker.allow():
+            if self._metrics is not None:
+                self._metrics.repository_rejected.labels(method).inc()
+            raise BackendUnavailableError(
+                f"{method} rejected: the knowledge backend is unavailable"
+            )
+        try:
+            result = await call()
+        except Exception as e:
+            if is_retryable(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        if failed is not None and failed(result):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return result
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
+    ) -> SearchResult:
+        """Search knowledge, answering from recent results if needed."""
+        key = (
+            search_key(query, fields=fields, filters=filters, mode=mode),
+            limit,
+            cursor,
+        )
+
+        def call() -> Awaitable[SearchResult]:
+            return self._repository.search(
+                query,
+                limit=limit,
+                fields=fields,
+                filters=filters,
+                mode=mode,
+                cursor=cursor,
+            )
+
+        if self.breaker.state != CLOSED:
+            stale = self._stale.get(key)
+            if stale is not None:
+                if self.breaker.allow():
+                    self._revalidate(key, call)
+                return self._serve_stale(stale)
+
+        try:
+            result = await self._guard("search", call)
+        except Exception as e:
+            if not (isinstance(e, BackendUnavailableError) or is_retryable(e)):
+                raise
+            stale = self._stale.get(key)
+            if stale is None:
+                raise
+            return self._serve_stale(stale)
+        self._stale.put(key, replace(result, stale=True))
+        return result
+
+    def _serve_stale(self, stale: SearchResult) -> SearchResult:
+        if self._metrics is not None:
+            self._metrics.repository_stale_results.inc()
+        return stale
+
+    def _revalidate(self, key, call: Callable[[], Awaitable[SearchResult]]) -> None:
+        """Re-run an admitted probe search in the background."""
+
+        async def probe() -> None:
+            try:
+                result = await self._guard("search", call, admitted=True)
+            except Exception:
+                logger.info("search probe failed; circuit stays open")
+                return
+            self._stale.put(key, replace(result, stale=True))
+
+        task = asyncio.create_task(probe())
+        self._revalidations.add(task)
+        task.add_done_callback(self._revalidations.discard)
+
+    async def save(self, knowledge: Knowledge) -> Knowledge:
+        """Save knowledge."""
+        return await self._guard("save", lambda: self._repository.save(knowledge))
+
+    async def save_many(self, knowledge_list: Sequence[Knowledge]) -> list[SaveResult]:
+        """Save many knowledge items.
+
+        save_many reports errors per item, so a batch with items that
+        failed on a transient error counts as a failure.
+        """
+        return await self._guard(
+            "save_many",
+            lambda: self._repository.save_many(knowledge_list),
+            failed=lambda results: any(result.retryable for result in results),
+        )
+
+    async def get(self, id: str) -> Knowledge | None:
+        """Get knowledge by ID."""
+        return await self._guard("get", lambda: self._repository.get(id))
+
+    async def delete(self, id: str) -> bool:
+        """Delete knowledge by ID."""
+        return await self._guard("delete", lambda: self._repository.delete(id))
+
+    async def find_by_github_path(self, path: str) -> Knowledge | None:
+        """Find knowledge by GitHub path."""
+        return await self._guard(
+            "find_by_github_path", lambda: self._repository.find_by_github_path(path)
+        )
+
+    async def find_by_pr_url(self, url: str) -> Knowledge | None:
+        """Find knowledge by PR URL."""
+        return await self._guard(
+            "find_by_pr_url", lambda: self._repository.find_by_pr_url(url)
+        )
+
+    async def update_status(
+        self,
+        id: str,
+        status: str,
+        *,
+        pr_url: str = "",
+        expected_status: str | None = None,
+    ) -> Knowledge | None:
+        """Update status of knowledge."""
+        return await self._guard(
+            "update_status",
+            lambda: self._repository.update_status(
+                id, status, pr_url=pr_url, expected_status=expected_status
+            ),
+        )
@@ -0,0 +1,146 @@
+"""AsyncKnowledgeRepository wrapper that coalesces identical concurrent reads."""
+
+from collections.abc import Sequence
+
+from ..domain.models import Knowledge, SaveResult, SearchFilter, SearchResult
+from ..domain.repositories import AsyncKnowledgeRepository
+from ..metrics import Metrics
+from .single_flight import KeyStats, SingleFlight
+from .vector_search import search_key
+
+
+class CoalescingKnowledgeRepository:
+    """AsyncKnowledgeRepository that shares in-flight searches and gets.
+
+    When several agents ask the same question at the same moment, only
+    the first search goes to the backend (including its query embedding)
+    and every concurrent identical search receives its result; the same
+    applies to gets of one ID. Writes make later reads start new calls,
+    so a read issued after a write never receives a result fetched
+    before it.
+
+    Shared results must be treated as read-only, as with the search
+    cache. Every other method is delegated unchanged.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncKnowledgeRepository,
+        metrics: Metrics | None = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            repository: Repository to delegate to
+            metrics: Metrics to record coalesced calls into (optional)
+        """
+        self._repository = repository
+        self._searches = SingleFlight()
+        self._gets = SingleFlight()
+        self._flights = self._coalesced = None
+        if metrics is not None:
+            self._flights = {
+                method: metrics.repository_flights.labels(method)
+                for method in ("search", "get")
+            }
+            self._coalesced = {
+                method: metrics.repository_coalesced.labels(method)
+                for method in ("search", "get")
+            }
+
+    def __getattr__(self, name: str):
+        """Delegate anything not coalesced (e.g. iter_all)."""
+        return getattr(self._repository, name)
+
+    def _count(self, method: str, shared: bool) -> None:
+        if self._flights is not None:
+            (self._coalesced if shared else self._flights)[method].inc()
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
+    ) -> SearchResult:
+        """Search knowledge, sharing an identical search in flight."""
+        key = (
+            search_key(query, fields=fields, filters=filters, mode=mode),
+            limit,
+            cursor,
+        )
+        result, shared = await self._searches.do(
+            key,
+            lambda: self._repository.search(
+                query,
+                limit=limit,
+                fields=fields,
+                filters=filters,
+                mode=mode,
+                cursor=cursor,
+            ),
+        )
+        self._count("search", shared)
+        return result
+
+    async def get(self, id: str) -> Knowledge | None:
+        """Get knowledge by ID, sharing a get of the same ID in flight."""
+        knowledge, shared = await self._gets.do(id, lambda: self._repository.get(id))
+        self._count("get", shared)
+        return knowledge
+
+    def _written(self, *ids: str) -> None:
+        self._searches.forget_all()
+        for id in ids:
+            self._gets.forget(id)
+
+    async def save(self, knowledge: Knowledge) -> Knowledge:
+        """Save knowledge."""
+        try:
+            return await self._repository.save(knowledge)
+        finally:
+            self._written(knowledge.id)
+
+    async def save_many(self, knowledge_list: Sequence[Knowledge]) -> list[SaveResult]:
+        """Save many knowledge items."""
+        try:
+            return await self._repository.save_many(knowledge_list)
+        finally:
+            self._written(*(k.id for k in knowledge_list if k.id))
+
+    async def delete(self, id: str) -> bool:
+        """Delete knowledge by ID."""
+        try:
+            return await self._repository.delete(id)
+        finally:
+            self._written(id)
+
+    async def update_status(
+        self,
+        id: str,
+        status: str,
+        *,
+        pr_url: str = "",
+        expected_status: str | None = None,
+    ) -> Knowledge | None:
+        """Update status of knowledge."""
+        try:
+            return await self._repository.update_status(
+                id, status, pr_url=pr_url, expected_status=expected_status
+            )
+        finally:
+            self._written(id)
+
+    def flight_stats(self, limit: int = 10) -> dict[str, list[KeyStats]]:
+        """Return the most coalesced search and get keys.
+
+        Args:
+            limit: Maximum number of keys per method
+        """
+        return {
+            "search": self._searches.stats(limit),
+            "get": self._gets.stats(limit),
+        }
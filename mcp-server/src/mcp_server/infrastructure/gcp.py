@@ -0,0 +1,95 @@
+"""GCP environment helpers shared by the Vector Search repositories."""
+
+import functools
+import importlib
+import os
+import threading
+import urllib.request
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+DEFAULT_LOCATION = "us-central1"
+
+_METADATA_PROJECT_URL = (
+    "http://metadata.google.internal/computeMetadata/v1/project/project-id"
+)
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Lets repository modules reference heavy client libraries at module
+    level without paying their import cost until a client or request is
+    actually built. Attributes set on the proxy (e.g. by ``mock.patch``)
+    shadow those of the real module.
+    """
+
+    def __init__(self, name: str):
+        """Initialize the proxy.
+
+        Args:
+            name: Fully qualified name of the module to import
+        """
+        self._name = name
+        self._module: ModuleType | None = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr: str):
+        """Import the module if needed and return one of its attributes."""
+        module = self._module
+        if module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+                module = self._module
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        """Return a representation naming the proxied module."""
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+@functools.cache
+def _metadata_project_id() -> str | None:
+    """Ask the GCP metadata server for the project ID (once per process).
+
+    Failures are cached as well, so off-GCP processes pay the timeout only
+    once rather than once per repository.
+    """
+    try:
+        req = urllib.request.Request(
+            _METADATA_PROJECT_URL,
+            headers={"Metadata-Flavor": "Google"},
+        )
+        with urllib.request.urlopen(req, timeout=2) as response:
+            return response.read().decode("utf-8")
+    except Exception:
+        return None
+
+
+def resolve_project_id() -> str | None:
+    """Get GCP project ID from environment or metadata server.
+
+    Environment variables are read on every call; the metadata server is
+    queried at most once per process.
+
+    Returns:
+        The project ID, or None if it cannot be determined
+    """
+    # First try environment variable, then GOOGLE_CLOUD_PROJECT
+    project_id = os.environ.get("GCP_PROJECT_ID") or os.environ.get(
+        "GOOGLE_CLOUD_PROJECT"
+    )
+    if project_id:
+        return project_id
+
+    # Fall back to the metadata server (for Cloud Run / GCE)
+    return _metadata_project_id()
+
+
+def resolve_location() -> str:
+    """Get GCP location from the GCP_LOCATION env var or the default."""
+    return os.environ.get("GCP_LOCATION") or DEFAULT_LOCATION
@@ -0,0 +1,181 @@
+"""AsyncKnowledgeRepository wrapper that records Prometheus metrics."""
+
+import time
+from collections.abc import AsyncIterator, Awaitable, Sequence
+from typing import TypeVar
+
+from ..domain.models import Knowledge, SaveResult, SearchFilter, SearchResult
+from ..domain.repositories import AsyncKnowledgeRepository
+from ..metrics import Metrics, error_code
+
+T = TypeVar("T")
+
+INSTRUMENTED_METHODS = (
+    "save",
+    "save_many",
+    "search",
+    "get",
+    "delete",
+    "find_by_github_path",
+    "find_by_pr_url",
+    "update_status",
+)
+
+
+def _payload_bytes(knowledge: Knowledge) -> int:
+    return len(knowledge.title.encode()) + len(knowledge.content.encode())
+
+
+class InstrumentedKnowledgeRepository:
+    """AsyncKnowledgeRepository that records metrics for every call.
+
+    Records latency, errors by gRPC status, calls in flight, result counts
+    and payload sizes, then delegates to the wrapped repository. Labelled
+    metric children are resolved once per method up front, so a call
+    costs two clock reads and a few counter updates.
+    """
+
+    def __init__(self, repository: AsyncKnowledgeRepository, metrics: Metrics):
+        """Initialize the wrapper.
+
+        Args:
+            repository: Repository to delegate to
+            metrics: Metrics to record into
+        """
+        self._repository = repository
+        self._metrics = metrics
+        self._duration = {
+            method: metrics.repository_duration.labels(method)
+            for method in INSTRUMENTED_METHODS
+        }
+        self._in_flight = {
+            method: metrics.repository_in_flight.labels(method)
+            for method in INSTRUMENTED_METHODS
+        }
+        self._results = {
+            method: metrics.repository_results.labels(method)
+            for method in ("save_many", "search")
+        }
+        self._payload = {
+            method: metrics.repository_payload_bytes.labels(method)
+            for method in ("save", "save_many", "search", "get")
+        }
+
+    def __getattr__(self, name: str):
+        """Delegate anything not instrumented (e.g. search_cache_stats)."""
+        return getattr(self._repository, name)
+
+    async def _call(self, method: str, call: Awaitable[T]) -> T:
+        in_flight = self._in_flight[method]
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            return await call
+        except Exception as e:
+            self._metrics.repository_errors.labels(method, error_code(e)).inc()
+            raise
+        finally:
+            self._duration[method].observe(time.perf_counter() - started)
+            in_flight.dec()
+
+    async def save(self, knowledge: Knowledge) -> Knowledge:
+        """Save knowledge."""
+        self._payload["save"].observe(_payload_bytes(knowledge))
+        return await self._call("save", self._repository.save(knowledge))
+
+    async def save_many(self, knowledge_list: Sequence[Knowledge]) -> list[SaveResult]:
+        """Save many knowledge items."""
+        self._payload["save_many"].observe(sum(map(_payload_bytes, knowledge_list)))
+        self._results["save_many"].observe(len(knowledge_list))
+        return await self._call("save_many", self._repository.save_many(knowledge_list))
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
+    ) -> SearchResult:
+        """Search knowledge."""
+        result = await self._call(
+            "search",
+            self._repository.search(
+                query,
+                limit=limit,
+                fields=fields,
+                filters=filters,
+                mode=mode,
+                cursor=cursor,
+            ),
+        )
+        self._results["search"].observe(len(result.items))
+        self._payload["search"].observe(sum(map(_payload_bytes, result.items)))
+        return result
+
+    async def iter_search(
+        self,
+        query: str,
+        *,
+        page_size: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+    ) -> AsyncIterator[Knowledge]:
+        """Stream search results; every page is recorded as a search."""
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        cursor = None
+        while True:
+            page = await self.search(
+                query,
+                limit=page_size,
+                fields=fields,
+                filters=filters,
+                mode=mode,
+                cursor=cursor,
+            )
+            for item in page.items:
+                yield item
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
+    async def get(self, id: str) -> Knowledge | None:
+        """Get knowledge by ID."""
+        knowledge = await self._call("get", self._repository.get(id))
+        if knowledge is not None:
+            self._payload["get"].observe(_payload_bytes(knowledge))
+        return knowledge
+
+    async def delete(self, id: str) -> bool:
+        """Delete knowledge by ID."""
+        return await self._call("delete", self._repository.delete(id))
+
+    async def find_by_github_path(self, path: str) -> Knowledge | None:
+        """Find knowledge by GitHub path."""
+        return await self._call(
+            "find_by_github_path", self._repository.find_by_github_path(path)
+        )
+
+    async def find_by_pr_url(self, url: str) -> Knowledge | None:
+        """Find knowledge by PR URL."""
+        return await self._call("find_by_pr_url", self._repository.find_by_pr_url(url))
+
+    async def update_status(
+        self,
+        id: str,
+        status: str,
+        *,
+        pr_url: str = "",
+        expected_status: str | None = None,
+    ) -> Knowledge | None:
+        """Update status of knowledge."""
+        return await self._call(
+            "update_status",
+            self._repository.update_status(
+                id, status, pr_url=pr_url, expected_status=expected_status
+            ),
+        )
@@ -0,0 +1,446 @@
+"""Memory-mapped local read replica for semantic search.
+
+Requires the optional ``replica`` extra (numpy).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..domain.models import Knowledge, SearchFilter, SearchResult
+from .gcp import resolve_location, resolve_project_id
+from .vector_search import (
+    KNOWLEDGE_DATA_FIELDS,
+    knowledge_from_data,
+    vectorsearch_v1beta,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+MANIFEST_FILE = "manifest.json"
+EMBEDDING_FIELD = "content_embedding"
+
+# Rows scored per matmul block; bounds the float32 scratch space per search
+_SCORE_BLOCK_ROWS = 8192
+
+
+def quantize(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """L2-normalize rows and quantize them to int8 with a per-row scale.
+
+    Args:
+        vectors: Float matrix of shape (n, dimensions)
+
+    Returns:
+        Tuple of (int8 rows, float32 scales) where
+        ``rows[i] * scales[i]`` approximates the unit vector of row i
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    unit = vectors / norms
+
+    scales = np.abs(unit).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    rows = np.rint(unit / scales[:, None]).astype(np.int8)
+    return rows, scales.astype(np.float32)
+
+
+@dataclass
+class _Snapshot:
+    """One immutable generation of the replica files."""
+
+    generation: int
+    synced_until: str
+    vectors: np.ndarray  # int8 memmap, shape (count, dimensions)
+    scales: np.ndarray  # float32 memmap, shape (count,)
+    columns: dict[str, list]
+    index: dict[str, int]
+    _arrays: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        return len(self.columns["id"])
+
+    def array(self, name: str) -> np.ndarray:
+        """Return a scalar metadata column as a NumPy array (cached)."""
+        if name not in self._arrays:
+            self._arrays[name] = np.asarray(self.columns[name], dtype=object)
+        return self._arrays[name]
+
+    def mask(self, filters: SearchFilter) -> np.ndarray:
+        """Return a boolean row mask for the filter."""
+        mask = np.ones(self.count, dtype=bool)
+        for name in ("status", "source", "user_id"):
+            value = getattr(filters, name)
+            if value:
+                mask &= self.array(name) == value
+        if filters.tags:
+            wanted = set(filters.tags)
+            mask &= np.fromiter(
+                (not wanted.isdisjoint(tags) for tags in self.columns["tags"]),
+                dtype=bool,
+                count=self.count,
+            )
+        return mask
+
+    def row(self, index: int) -> dict:
+        return {name: values[index] for name, values in self.columns.items()}
+
+
+class LocalReplicaKnowledgeRepository:
+    """Read replica of the knowledge collection answering semantic search locally.
+
+    Vectors are stored as int8-quantized, L2-normalized rows in a
+    memory-mapped file, with per-row scales and columnar metadata in side
+    files. Every process that opens the same directory maps the same
+    pages, so N workers share a single copy of the vectors.
+
+    Each refresh writes a new generation of files and then atomically
+    replaces the manifest; readers notice the new manifest on their next
+    search and remap. Only one process should call refresh() at a time.
+
+    Incremental refreshes fetch objects with ``updated_at`` newer than the
+    last sync. Deletions on the primary are only picked up by a full
+    refresh (``refresh(full=True)``).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        embed_query: Callable[[str], Sequence[float]],
+        project_id: str | None = None,
+        location: str | None = None,
+        collection_id: str = "knowledge",
+        dimensions: int = 768,
+        page_size: int = 500,
+    ):
+        """Initialize the replica.
+
+        Args:
+            path: Directory holding the replica files (created if missing)
+            embed_query: Returns the query embedding for a search text
+            project_id: GCP project ID (auto-detected if not provided)
+            location: GCP location (defaults to GCP_LOCATION env var or us-central1)
+            collection_id: Primary collection ID (defaults to "knowledge")
+            dimensions: Embedding dimensions of content_embedding
+            page_size: Page size used when pulling from the primary
+        """
+        self.project_id = project_id or resolve_project_id()
+        self.location = location or resolve_location()
+        self.collection_id = collection_id
+        self.dimensions = dimensions
+        self.page_size = page_size
+
+        if not self.project_id:
+            raise ValueError(
+                "project_id must be provided or detectable from environment"
+            )
+
+        self._collection_path = (
+            f"projects/{self.project_id}/locations/{self.location}"
+            f"/collections/{self.collection_id}"
+        )
+
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._embed_query = embed_query
+
+        self._snapshot: _Snapshot | None = None
+        self._manifest_mtime_ns: int | None = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        # Only needed for refresh(); created on first use
+        self._search_client: (
+            vectorsearch_v1beta.DataObjectSearchServiceClient | None
+        ) = None
+
+    @property
+    def search_client(self) -> vectorsearch_v1beta.DataObjectSearchServiceClient:
+        """DataObjectSearchService client for the primary (created on first use)."""
+        if self._search_client is None:
+            self._search_client = vectorsearch_v1beta.DataObjectSearchServiceClient()
+        return self._search_client
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
+    ) -> SearchResult:
+        """Search the local replica by cosine similarity.
+
+        Args:
+            query: Search query text
+            limit: Maximum number of results (default: 20)
+            fields: Accepted for interface compatibility; all fields are
+                local, so every hit is returned complete
+            filters: Metadata constraints applied before top-k
+            mode: Must be "semantic"; the replica holds embeddings only
+            cursor: Must be None; the replica does not paginate
+
+        Returns:
+            SearchResult containing matching items, best first
+
+        Raises:
+            ValueError: If mode is not "semantic" or a cursor is given
+        """
+        if mode != "semantic":
+            raise ValueError(f"local replica does not support {mode} search")
+        if cursor is not None:
+            raise ValueError("local replica does not support cursors")
+        snapshot = self._current()
+        count = snapshot.count
+        if count == 0 or limit <= 0:
+            return SearchResult(items=[], total=0)
+
+        query_vector = np.asarray(self._embed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(query_vector)
+        if norm:
+            query_vector /= norm
+
+        scores = np.empty(count, dtype=np.float32)
+        for start in range(0, count, _SCORE_BLOCK_ROWS):
+            end = min(start + _SCORE_BLOCK_ROWS, count)
+            block = snapshot.vectors[start:end].astype(np.float32)
+            np.matmul(block, query_vector, out=scores[start:end])
+        scores *= snapshot.scales
+
+        if filters is not None and not filters.is_empty():
+            mask = snapshot.mask(filters)
+            count = int(mask.sum())
+            if count == 0:
+                return SearchResult(items=[], total=0)
+            scores[~mask] = -np.inf
+
+        k = min(limit, count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        items = [
+            knowledge_from_data(snapshot.row(int(index)), score=float(scores[index]))
+            for index in top
+        ]
+        return SearchResult(items=items, total=len(items))
+
+    def get(self, id: str) -> Knowledge | None:
+        """Get knowledge by ID from the replica.
+
+        Args:
+            id: Knowledge identifier
+
+        Returns:
+            Knowledge if present in the replica, None otherwise
+        """
+        snapshot = self._current()
+        index = snapshot.index.get(id)
+        if index is None:
+            return None
+        return knowledge_from_data(snapshot.row(index))
+
+    def refresh(self, *, full: bool = False) -> int:
+        """Pull changes from the primary collection into a new generation.
+
+        Args:
+            full: Rebuild from scratch instead of fetching only objects
+                updated since the last sync
+
+        Returns:
+            Number of new or changed data objects fetched from the primary
+        """
+        with self._refresh_lock:
+            snapshot = self._current()
+            since = "" if full else snapshot.synced_until
+
+            rows: dict[str, int] = {}
+            columns: dict[str, list] = {name: [] for name in KNOWLEDGE_DATA_FIELDS}
+            kept_vectors = np.empty((0, self.dimensions), dtype=np.int8)
+            kept_scales = np.empty(0, dtype=np.float32)
+            if not full:
+                for name in KNOWLEDGE_DATA_FIELDS:
+                    columns[name] = list(snapshot.columns[name])
+                rows = dict(snapshot.index)
+                kept_vectors = np.asarray(snapshot.vectors)
+                kept_scales = np.asarray(snapshot.scales)
+
+            new_rows: list[int] = []
+            new_vectors: list[Sequence[float]] = []
+            synced_until = since
+            fetched = 0
+            for data_object in self._fetch_changed(since):
+                data = data_object.data
+                record = {
+                    name: (
+                        list(data.get(name, []))
+                        if name == "tags"
+                        else data.get(name, "") or ""
+                    )
+                    for name in KNOWLEDGE_DATA_FIELDS
+                }
+                index = rows.get(record["id"])
+                if (
+                    index is not None
+                    and columns["updated_at"][index] == record["updated_at"]
+                ):
+                    continue  # re-fetched at the synced_until boundary
+                fetched += 1
+                if index is None:
+                    index = len(columns["id"])
+                    rows[record["id"]] = index
+                    for name in KNOWLEDGE_DATA_FIELDS:
+                        columns[name].append(record[name])
+                else:
+                    for name in KNOWLEDGE_DATA_FIELDS:
+                        columns[name][index] = record[name]
+                new_rows.append(index)
+                new_vectors.append(data_object.vectors[EMBEDDING_FIELD].dense.values)
+                synced_until = max(synced_until, record["updated_at"])
+
+            if fetched == 0 and not full:
+                return 0
+
+            count = len(columns["id"])
+            vectors = np.zeros((count, self.dimensions), dtype=np.int8)
+            scales = np.ones(count, dtype=np.float32)
+            vectors[: len(kept_vectors)] = kept_vectors
+            scales[: len(kept_scales)] = kept_scales
+            if new_vectors:
+                quantized, quantized_scales = quantize(np.asarray(new_vectors))
+                vectors[new_rows] = quantized
+                scales[new_rows] = quantized_scales
+
+            self._write_generation(
+                snapshot.generation + 1, vectors, scales, columns, synced_until
+            )
+            return fetched
+
+    def _fetch_changed(self, since: str) -> Iterator:
+        """Yield data objects (with embeddings) updated at or after since.
+
+        Objects sharing the synced_until timestamp may have been written
+        after the last refresh read that page, so the boundary is included
+        and objects already held unchanged are skipped by the caller.
+        """
+        request = vectorsearch_v1beta.QueryDataObjectsRequest(
+            parent=self._collection_path,
+            output_fields=vectorsearch_v1beta.OutputFields(
+                data_fields=KNOWLEDGE_DATA_FIELDS,
+                vector_fields=[EMBEDDING_FIELD],
+            ),
+            page_size=self.page_size,
+        )
+        if since:
+            request.filter = {"updated_at": {"$gte": since}}
+
+        # The pager transparently follows next_page_token
+        yield from self.search_client.query_data_objects(request=request)
+
+    def _write_generation(
+        self,
+        generation: int,
+        vectors: np.ndarray,
+        scales: np.ndarray,
+        columns: dict[str, list],
+        synced_until: str,
+    ) -> None:
+        """Write a generation's files, then publish it via the manifest."""
+        vectors.tofile(self._path / f"vectors-{generation}.i8")
+        scales.tofile(self._path / f"scales-{generation}.f32")
+        with open(self._path / f"metadata-{generation}.json", "w") as f:
+            json.dump(columns, f)
+
+        manifest = {
+            "generation": generation,
+            "count": len(columns["id"]),
+            "dimensions": self.dimensions,
+            "synced_until": synced_until,
+        }
+        tmp = self._path / f"{MANIFEST_FILE}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, self._path / MANIFEST_FILE)
+
+        # Keep the previous generation for readers that have just read the
+        # old manifest. Older files may still be mapped by slow readers;
+        # unlinking them is safe on POSIX.
+        for old in self._path.glob("*-*.*"):
+            old_generation = old.stem.rsplit("-", 1)[-1]
+            if old_generation.isdigit() and int(old_generation) < generation - 1:
+                old.unlink(missing_ok=True)
+
+    def _current(self) -> _Snapshot:
+        """Return the newest published snapshot, remapping if it changed."""
+        manifest_path = self._path / MANIFEST_FILE
+        try:
+            mtime_ns = manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        with self._lock:
+            if self._snapshot is not None and mtime_ns == self._manifest_mtime_ns:
+                return self._snapshot
+            self._snapshot = self._load(mtime_ns is not None)
+            self._manifest_mtime_ns = mtime_ns
+            return self._snapshot
+
+    def _load(self, exists: bool) -> _Snapshot:
+        """Map the generation named by the manifest."""
+        if not exists:
+            return _Snapshot(
+                generation=0,
+                synced_until="",
+                vectors=np.empty((0, self.dimensions), dtype=np.int8),
+                scales=np.empty(0, dtype=np.float32),
+                columns={name: [] for name in KNOWLEDGE_DATA_FIELDS},
+                index={},
+            )
+
+        with open(self._path / MANIFEST_FILE) as f:
+            manifest = json.load(f)
+        generation = manifest["generation"]
+        count = manifest["count"]
+        dimensions = manifest["dimensions"]
+
+        with open(self._path / f"metadata-{generation}.json") as f:
+            columns = json.load(f)
+        # Snapshots written before a field was added lack its column
+        for name in KNOWLEDGE_DATA_FIELDS:
+            columns.setdefault(name, [""] * len(columns["id"]))
+
+        if count == 0:
+            vectors = np.empty((0, dimensions), dtype=np.int8)
+            scales = np.empty(0, dtype=np.float32)
+        else:
+            vectors = np.memmap(
+                self._path / f"vectors-{generation}.i8",
+                dtype=np.int8,
+                mode="r",
+                shape=(count, dimensions),
+            )
+            scales = np.memmap(
+                self._path / f"scales-{generation}.f32",
+                dtype=np.float32,
+                mode="r",
+                shape=(count,),
+            )
+
+        return _Snapshot(
+            generation=generation,
+            synced_until=manifest["synced_until"],
+            vectors=vectors,
+            scales=scales,
+            columns=columns,
+            index={id_: row for row, id_ in enumerate(columns["id"])},
+        )
@@ -0,0 +1,275 @@
+"""In-process near-duplicate detection with MinHash signatures and LSH.
+
+Knowledge text is reduced to a set of character shingles, summarized by
+a MinHash signature (an estimate of Jaccard similarity between shingle
+sets) and indexed by locality-sensitive hashing: signatures are cut into
+bands and two texts become candidates when any band matches exactly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable
+
+    from ..domain.models import Knowledge
+
+# Characters per shingle; character shingles also work for text without
+# word separators (e.g. Japanese)
+SHINGLE_SIZE = 5
+
+_NON_WORD = re.compile(r"\W+")
+_MAX_HASH = 1 << 64
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Return the character shingles of text after normalization.
+
+    Case, punctuation and runs of whitespace are ignored. Text shorter
+    than size is a single shingle.
+    """
+    normalized = _NON_WORD.sub(" ", text.lower()).strip()
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+
+def minhash_signature(text: str, num_perm: int = 64) -> tuple[int, ...]:
+    """Compute the MinHash signature of text.
+
+    Uses one-permutation hashing: every shingle is hashed once, the hash
+    picks one of num_perm bins and each bin keeps its minimum. Empty bins
+    borrow from the next non-empty bin (rotation densification), so the
+    cost is one hash per shingle regardless of num_perm.
+
+    Args:
+        text: Text to summarize
+        num_perm: Signature length
+
+    Returns:
+        num_perm integers; equal positions estimate Jaccard similarity
+    """
+    bins = [_MAX_HASH] * num_perm
+    for shingle in shingles(text):
+        value = int.from_bytes(
+            hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little"
+        )
+        slot, rest = value % num_perm, value // num_perm
+        if rest < bins[slot]:
+            bins[slot] = rest
+    if all(value == _MAX_HASH for value in bins):
+        return tuple(bins)
+
+    signature = list(bins)
+    for slot in range(num_perm):
+        distance = 0
+        while bins[(slot + distance) % num_perm] == _MAX_HASH:
+            distance += 1
+        if distance:
+            signature[slot] = bins[(slot + distance) % num_perm] + distance * _MAX_HASH
+    return tuple(signature)
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b, strict=True)) / len(a)
+
+
+def duplicate_text(title: str, content: str) -> str:
+    """Text of a knowledge item that near-duplicate detection compares."""
+    return f"{title}\n{content}"
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    """An indexed item similar to the probed text.
+
+    Attributes:
+        id: ID of the indexed knowledge
+        similarity: Estimated Jaccard similarity (0.0 - 1.0)
+    """
+
+    id: str
+    similarity: float
+
+
+class _Tables:
+    """Signatures and LSH buckets of one index generation."""
+
+    def __init__(self, bands: int):
+        self.signatures: dict[str, tuple[int, ...]] = {}
+        self.buckets: list[dict[tuple[int, ...], set[str]]] = [{} for _ in range(bands)]
+
+
+class NearDuplicateIndex:
+    """Thread-safe LSH index of knowledge signatures.
+
+    A probe only compares the signatures that share at least one band,
+    so lookups stay cheap as the collection grows. With the defaults (64
+    hashes in 16 bands of 4) an item at similarity 0.7 is a candidate
+    with probability ~0.99 and one at 0.3 with ~0.12; candidates are then
+    accepted only at or above threshold.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 64, bands: int = 16):
+        """Initialize an empty index.
+
+        Args:
+            threshold: Minimum estimated similarity of a duplicate
+            num_perm: Signature length
+            bands: Number of LSH bands (must divide num_perm)
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self._rows = num_perm // bands
+        self._tables = _Tables(bands)
+        self._lock = threading.Lock()
+        # Changes made while a rebuild scans the collection, replayed on swap
+        self._pending: list[tuple[str, tuple[int, ...] | None]] | None = None
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        """Create an index configured from NEAR_DUPLICATE_THRESHOLD.
+
+        Args:
+            **kwargs: Overrides for any other constructor argument
+        """
+        threshold = os.environ.get("NEAR_DUPLICATE_THRESHOLD")
+        if threshold:
+            kwargs.setdefault("threshold", float(threshold))
+        return cls(**kwargs)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tables.signatures)
+
+    def signature(self, title: str, content: str) -> tuple[int, ...]:
+        """Compute the signature the index uses for a knowledge item."""
+        return minhash_signature(duplicate_text(title, content), self.num_perm)
+
+    def add(self, knowledge: Knowledge) -> None:
+        """Index (or re-index) a saved knowledge item."""
+        signature = self.signature(knowledge.title, knowledge.content)
+        with self._lock:
+            self._put_locked(self._tables, knowledge.id, signature)
+            if self._pending is not None:
+                self._pending.append((knowledge.id, signature))
+
+    def remove(self, id: str) -> None:
+        """Drop an item from the index (no-op if absent)."""
+        with self._lock:
+            self._remove_locked(self._tables, id)
+            if self._pending is not None:
+                self._pending.append((id, None))
+
+    def find(self, title: str, content: str) -> list[DuplicateMatch]:
+        """Return indexed items similar to the given text.
+
+        Args:
+            title: Title of the item being saved
+            content: Content of the item being saved
+
+        Returns:
+            Matches at or above threshold, most similar first
+        """
+        signature = self.signature(title, content)
+        with self._lock:
+            tables = self._tables
+            candidates: set[str] = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates.update(tables.buckets[band].get(key, ()))
+            scored = [
+                DuplicateMatch(id, similarity(signature, tables.signatures[id]))
+                for id in candidates
+            ]
+        matches = [m for m in scored if m.similarity >= self.threshold]
+        matches.sort(key=lambda m: m.similarity, reverse=True)
+        return matches
+
+    def rebuild(self, items: Iterable[Knowledge]) -> int:
+        """Replace the index contents with items (e.g. a collection scan).
+
+        Lookups keep using the previous contents until the new tables are
+        complete. Items added or removed during the rebuild are applied
+        on top of the scanned contents.
+
+        Returns:
+            Number of indexed items
+        """
+        self._begin_rebuild()
+        tables = _Tables(self.bands)
+        try:
+            for knowledge in items:
+                self._put(tables, knowledge)
+        except BaseException:
+            self._abort_rebuild()
+            raise
+        return self._finish_rebuild(tables)
+
+    async def arebuild(self, items: AsyncIterable[Knowledge]) -> int:
+        """Async variant of rebuild() for an async collection scan."""
+        self._begin_rebuild()
+        tables = _Tables(self.bands)
+        try:
+            async for knowledge in items:
+                self._put(tables, knowledge)
+        except BaseException:
+            self._abort_rebuild()
+            raise
+        return self._finish_rebuild(tables)
+
+    def _band_keys(self, signature: tuple[int, ...]):
+        rows = self._rows
+        return (signature[i : i + rows] for i in range(0, self.num_perm, rows))
+
+    def _put(self, tables: _Tables, knowledge: Knowledge) -> None:
+        signature = self.signature(knowledge.title, knowledge.content)
+        with self._lock:
+            self._put_locked(tables, knowledge.id, signature)
+
+    def _put_locked(self, tables: _Tables, id: str, signature: tuple[int, ...]) -> None:
+        self._remove_locked(tables, id)
+        tables.signatures[id] = signature
+        for band, key in enumerate(self._band_keys(signature)):
+            tables.buckets[band].setdefault(key, set()).add(id)
+
+    def _remove_locked(self, tables: _Tables, id: str) -> None:
+        signature = tables.signatures.pop(id, None)
+        if signature is None:
+            return
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = tables.buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(id)
+                if not bucket:
+                    del tables.buckets[band][key]
+
+    def _begin_rebuild(self) -> None:
+        with self._lock:
+            if self._pending is not None:
+                raise RuntimeError("a rebuild is already running")
+            self._pending = []
+
+    def _abort_rebuild(self) -> None:
+        with self._lock:
+            self._pending = None
+
+    def _finish_rebuild(self, tables: _Tables) -> int:
+        with self._lock:
+            for id, signature in self._pending:
+                if signature is None:
+                    self._remove_locked(tables, id)
+                else:
+                    self._put_locked(tables, id, signature)
+            self._pending = None
+            self._tables = tables
+            return len(tables.signatures)
@@ -0,0 +1,242 @@
+"""Client-side query embeddings with an LRU (and optional on-disk) cache.
+
+Lets semantic search send a precomputed query vector (VectorSearch)
+instead of search text that the service embeds again on every request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .gcp import LazyModule, resolve_location, resolve_project_id
+from .search_cache import CacheStats, normalize_query
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+google_auth = LazyModule("google.auth")
+auth_requests = LazyModule("google.auth.transport.requests")
+
+# Must match the vertex_embedding_config of content_embedding
+# (scripts/create_collection.py); queries use the retrieval task type
+# that semantic search applies to search_text.
+DEFAULT_MODEL = "gemini-embedding-001"
+DEFAULT_DIMENSIONS = 768
+DEFAULT_TASK_TYPE = "QUESTION_ANSWERING"
+
+# Seconds to wait for the predict endpoint
+PREDICT_TIMEOUT = 10.0
+
+_PREDICT_URL = (
+    "https://{location}-aiplatform.googleapis.com/v1/projects/{project}"
+    "/locations/{location}/publishers/google/models/{model}:predict"
+)
+
+
+class EmbeddingCache:
+    """LRU cache of query vectors keyed by normalized query text.
+
+    With a path, every new vector is also appended to a JSON Lines file
+    that is read back on construction, so a restarted process starts warm.
+    The file is rewritten with only the live entries when it has grown to
+    twice maxsize.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: str | os.PathLike | None = None):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of vectors kept (0 disables caching)
+            path: JSON Lines file to persist vectors in (optional)
+        """
+        self.maxsize = maxsize
+        self._path = Path(path) if path is not None else None
+        self._entries: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._file_lines = 0
+        if self._path is not None and self._path.exists():
+            self._load()
+
+    def get(self, query: str) -> tuple[float, ...] | None:
+        """Return the cached vector for query, or None."""
+        key = normalize_query(query)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return vector
+
+    def put(self, query: str, vector: Sequence[float]) -> tuple[float, ...]:
+        """Store the vector of query and return it as a tuple."""
+        key = normalize_query(query)
+        vector = tuple(vector)
+        if self.maxsize <= 0:
+            return vector
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            if self._path is not None:
+                self._persist_locked(key, vector)
+        return vector
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
+
+    def _load(self) -> None:
+        with self._path.open(encoding="utf-8") as f:
+            for line in f:
+                self._file_lines += 1
+                try:
+                    record = json.loads(line)
+                    self._entries[record["q"]] = tuple(record["v"])
+                except (ValueError, KeyError, TypeError):
+                    continue  # torn write from a crash
+                self._entries.move_to_end(record["q"])
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _persist_locked(self, key: str, vector: tuple[float, ...]) -> None:
+        if self._file_lines >= 2 * self.maxsize:
+            tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                for q, v in self._entries.items():
+                    f.write(json.dumps({"q": q, "v": v}) + "\n")
+            os.replace(tmp, self._path)
+            self._file_lines = len(self._entries)
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"q": key, "v": vector}) + "\n")
+        self._file_lines += 1
+
+
+class QueryEmbedder:
+    """Computes query embeddings with the collection's model, once per query.
+
+    Vectors come from the Vertex AI predict endpoint of the embedding
+    model and are cached by normalized query text, so repeated searches
+    that differ only in limit, filters or fields are not embedded again.
+    """
+
+    def __init__(
+        self,
+        project_id: str | None = None,
+        location: str | None = None,
+        *,
+        model: str = DEFAULT_MODEL,
+        dimensions: int = DEFAULT_DIMENSIONS,
+        task_type: str = DEFAULT_TASK_TYPE,
+        cache: EmbeddingCache | None = None,
+    ):
+        """Initialize the embedder.
+
+        Args:
+            project_id: GCP project ID (auto-detected if not provided)
+            location: GCP location (defaults to GCP_LOCATION env var or us-central1)
+            model: Embedding model ID
+            dimensions: Output dimensionality (must match the collection)
+            task_type: Embedding task type for queries
+            cache: Vector cache (defaults to an in-memory 4096-entry cache)
+        """
+        self.project_id = project_id or resolve_project_id()
+        self.location = location or resolve_location()
+        self.model = model
+        self.dimensions = dimensions
+        self.task_type = task_type
+        self.cache = cache if cache is not None else EmbeddingCache()
+
+        if not self.project_id:
+            raise ValueError(
+                "project_id must be provided or detectable from environment"
+            )
+
+        self._url = _PREDICT_URL.format(
+            location=self.location, project=self.project_id, model=model
+        )
+        # Authorized HTTP session, created on first use
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        """Create an embedder whose cache is configured from the environment.
+
+        Reads QUERY_EMBEDDING_CACHE_SIZE and QUERY_EMBEDDING_CACHE_PATH;
+        unset variables keep the defaults (4096 entries, memory only).
+
+        Args:
+            **kwargs: Overrides for any other constructor argument
+        """
+        size = os.environ.get("QUERY_EMBEDDING_CACHE_SIZE")
+        kwargs.setdefault(
+            "cache",
+            EmbeddingCache(
+                maxsize=int(size) if size else 4096,
+                path=os.environ.get("QUERY_EMBEDDING_CACHE_PATH") or None,
+            ),
+        )
+        return cls(**kwargs)
+
+    @property
+    def session(self):
+        """AuthorizedSession with application default credentials."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    credentials, _ = google_auth.default(
+                        scopes=["https://www.googleapis.com/auth/cloud-platform"]
+                    )
+                    self._session = auth_requests.AuthorizedSession(credentials)
+        return self._session
+
+    def embed(self, query: str) -> tuple[float, ...]:
+        """Return the embedding of a search query.
+
+        Args:
+            query: Search query text
+
+        Returns:
+            The query vector (dimensions floats)
+        """
+        vector = self.cache.get(query)
+        if vector is None:
+            vector = self.cache.put(query, self._predict(query))
+        return vector
+
+    async def aembed(self, query: str) -> tuple[float, ...]:
+        """Async variant of embed(); cache misses run in a worker thread."""
+        vector = self.cache.get(query)
+        if vector is None:
+            vector = self.cache.put(
+                query, await asyncio.to_thread(self._predict, query)
+            )
+        return vector
+
+    def _predict(self, query: str) -> list[float]:
+        response = self.session.post(
+            self._url,
+            json={
+                "instances": [{"content": query, "task_type": self.task_type}],
+                "parameters": {"outputDimensionality": self.dimensions},
+            },
+            timeout=PREDICT_TIMEOUT,
+        )
+        response.raise_for_status()
+        return response.json()["predictions"][0]["embeddings"]["values"]
@@ -0,0 +1,122 @@
+"""Reciprocal rank fusion of semantic and text search rankings."""
+
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+
+from ..domain.models import Knowledge, SearchResult
+from .result_pages import MAX_WINDOW
+
+# Accepted values of the search mode option
+SEARCH_MODES = ("semantic", "text", "hybrid")
+
+
+@dataclass(frozen=True)
+class HybridSearchConfig:
+    """Tuning of hybrid (semantic + text) search.
+
+    Attributes:
+        semantic_weight: Weight of the semantic ranking in the fusion
+        text_weight: Weight of the text ranking in the fusion
+        rrf_k: Rank offset k of reciprocal rank fusion; larger values
+            flatten the advantage of the top ranks
+        candidate_factor: Each branch fetches limit * candidate_factor
+            hits so items ranked just below the limit in one branch can
+            still be lifted by the other
+        deadline: Seconds both branches together may take. A branch
+            still running at the deadline is cancelled and the other
+            branch's ranking is used alone.
+    """
+
+    semantic_weight: float = 1.0
+    text_weight: float = 1.0
+    rrf_k: int = 60
+    candidate_factor: int = 2
+    deadline: float = 3.0
+
+    @classmethod
+    def from_env(cls) -> "HybridSearchConfig":
+        """Create a config from HYBRID_* environment variables.
+
+        Reads HYBRID_SEMANTIC_WEIGHT, HYBRID_TEXT_WEIGHT, HYBRID_RRF_K and
+        HYBRID_DEADLINE_MS; unset variables keep the defaults.
+        """
+        kwargs: dict[str, float] = {}
+        for env, name, parse in (
+            ("HYBRID_SEMANTIC_WEIGHT", "semantic_weight", float),
+            ("HYBRID_TEXT_WEIGHT", "text_weight", float),
+            ("HYBRID_RRF_K", "rrf_k", int),
+        ):
+            value = os.environ.get(env)
+            if value:
+                kwargs[name] = parse(value)
+        deadline_ms = os.environ.get("HYBRID_DEADLINE_MS")
+        if deadline_ms:
+            kwargs["deadline"] = int(deadline_ms) / 1000
+        return cls(**kwargs)
+
+    def candidates(self, limit: int) -> int:
+        """Number of hits to fetch per branch for a search of limit."""
+        return min(max(limit, limit * self.candidate_factor), MAX_WINDOW)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[tuple[Sequence[Knowledge], float]],
+    *,
+    limit: int,
+    k: int = 60,
+) -> list[Knowledge]:
+    """Merge rankings by weighted reciprocal rank fusion.
+
+    Every item scores sum(weight / (k + rank)) over the rankings it
+    appears in (rank starting at 1). Items are matched by ID; the first
+    occurrence supplies the returned fields. Ties keep first-seen order.
+
+    Args:
+        rankings: (ranked items, weight) pairs, best item first
+        limit: Maximum number of items to return
+        k: Rank offset
+
+    Returns:
+        Fused items, best first, with score set to the fused score
+    """
+    scores: dict[str, float] = {}
+    items: dict[str, Knowledge] = {}
+    for ranking, weight in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item.id] = scores.get(item.id, 0.0) + weight / (k + rank)
+            items.setdefault(item.id, item)
+
+    ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [replace(items[id], score=scores[id]) for id in ranked[:limit]]
+
+
+def fuse_hybrid(
+    semantic: SearchResult | None,
+    text: SearchResult | None,
+    *,
+    config: HybridSearchConfig,
+    limit: int,
+) -> SearchResult:
+    """Fuse the branch results of a hybrid search.
+
+    A branch that failed or missed the deadline is passed as None and
+    simply contributes nothing, so the other branch's ranking is used
+    alone (re-scored by rank).
+
+    Args:
+        semantic: Semantic branch result, or None
+        text: Text branch result, or None
+        config: Fusion weights and rank offset
+        limit: Maximum number of items to return
+
+    Returns:
+        Fused SearchResult
+    """
+    rankings = []
+    if semantic is not None:
+        rankings.append((semantic.items, config.semantic_weight))
+    if text is not None:
+        rankings.append((text.items, config.text_weight))
+    items = reciprocal_rank_fusion(rankings, limit=limit, k=config.rrf_k)
+    return SearchResult(items=items, total=len(items))
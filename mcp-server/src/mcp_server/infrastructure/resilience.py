@@ -0,0 +1,293 @@
+"""Retries with jittered backoff and hedged reads for repository calls."""
+
+import asyncio
+import os
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+from ..domain.models import Knowledge, SearchFilter, SearchResult
+from ..domain.repositories import AsyncKnowledgeRepository
+from ..metrics import Metrics
+from .vector_search import api_exceptions, retryable_errors
+
+T = TypeVar("T")
+
+# Idempotent reads: retried and, if enabled, hedged
+READ_METHODS = ("search", "get", "find_by_github_path", "find_by_pr_url")
+
+# Retried but never hedged (see ResilientKnowledgeRepository.delete)
+RETRIED_METHODS = (*READ_METHODS, "delete")
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether the same request may succeed if sent again.
+
+    UNAVAILABLE, DEADLINE_EXCEEDED, ABORTED, INTERNAL and
+    RESOURCE_EXHAUSTED are transient; every other error (NOT_FOUND,
+    INVALID_ARGUMENT, PERMISSION_DENIED, ...) is terminal.
+    """
+    return isinstance(error, retryable_errors())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry and hedging settings of repository calls.
+
+    Attributes:
+        max_attempts: Attempts per call, including the first
+        base_delay: Backoff cap (seconds) before the first retry, doubled
+            per retry
+        max_delay: Largest backoff cap (seconds)
+        deadline: Seconds a call may take across all of its attempts
+        hedge: Send a second request for a read still running after the
+            hedge_quantile latency of recent reads
+        hedge_quantile: Latency quantile after which reads are hedged
+        hedge_min_delay: Smallest hedge delay (seconds)
+        hedge_budget: Largest fraction of reads that may be hedged
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    deadline: float = 10.0
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 0.02
+    hedge_budget: float = 0.1
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Create a policy from RETRY_* and HEDGE_* environment variables.
+
+        Reads RETRY_MAX_ATTEMPTS, RETRY_DEADLINE_MS, HEDGE_READS ("1" or
+        "true" enables hedging) and HEDGE_BUDGET; unset variables keep
+        the defaults.
+        """
+        kwargs: dict[str, object] = {}
+        attempts = os.environ.get("RETRY_MAX_ATTEMPTS")
+        if attempts:
+            kwargs["max_attempts"] = int(attempts)
+        deadline_ms = os.environ.get("RETRY_DEADLINE_MS")
+        if deadline_ms:
+            kwargs["deadline"] = int(deadline_ms) / 1000
+        hedge = os.environ.get("HEDGE_READS")
+        if hedge:
+            kwargs["hedge"] = hedge.lower() in ("1", "true")
+        budget = os.environ.get("HEDGE_BUDGET")
+        if budget:
+            kwargs["hedge_budget"] = float(budget)
+        return cls(**kwargs)
+
+    def backoff(self, retry: int, rand: Callable[[], float] = random.random) -> float:
+        """Delay before the given retry (1-based), with full jitter.
+
+        A uniformly random delay up to the exponential cap spreads the
+        retries of callers that failed together.
+        """
+        cap = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        return cap * rand()
+
+
+class LatencyWindow:
+    """Latencies of the most recent successful calls of one method."""
+
+    def __init__(self, size: int = 256, min_samples: int = 20):
+        """Initialize an empty window.
+
+        Args:
+            size: Latencies kept
+            min_samples: Latencies needed before quantiles are reported
+        """
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a call."""
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Return the q-quantile of the window, or None if too few samples."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ResilientKnowledgeRepository:
+    """AsyncKnowledgeRepository that retries transient errors.
+
+    Reads and deletes failing with a retryable error are sent again after
+    a jittered exponential backoff, as long as attempts and the per-call
+    deadline allow; terminal errors are raised at once. With hedging on,
+    a read still running after the p95 latency of recent reads gets a
+    second, identical request and the first response wins. Only the slow
+    tail is hedged, and hedge_budget caps the extra load.
+
+    Writes other than delete are delegated unchanged: a create whose
+    response was lost cannot be sent again safely, and save_many retries
+    its chunks itself.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncKnowledgeRepository,
+        policy: RetryPolicy | None = None,
+        metrics: Metrics | None = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            repository: Repository to delegate to
+            policy: Retry and hedging settings (defaults to RetryPolicy())
+            metrics: Metrics to count retries and hedges into (optional)
+        """
+        self._repository = repository
+        self.policy = policy if policy is not None else RetryPolicy()
+        self._latency = {method: LatencyWindow() for method in READ_METHODS}
+        self._reads = 0
+        self._hedges = 0
+        self._retries = self._hedged = None
+        if metrics is not None:
+            self._retries = {
+                method: metrics.repository_retries.labels(method)
+                for method in RETRIED_METHODS
+            }
+            self._hedged = {
+                method: metrics.repository_hedges.labels(method)
+                for method in READ_METHODS
+            }
+
+    def __getattr__(self, name: str):
+        """Delegate anything not retried (e.g. save, iter_all)."""
+        return getattr(self._repository, name)
+
+    async def _call(self, method: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run call with retries, hedging it if it is a read."""
+        policy = self.policy
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + policy.deadline
+        hedge = policy.hedge and method in READ_METHODS
+        retry = 0
+        while True:
+            try:
+                async with asyncio.timeout_at(deadline):
+                    if hedge:
+                        return await self._hedged_attempt(method, call)
+                    return await call()
+            except TimeoutError as e:
+                raise api_exceptions.DeadlineExceeded(
+                    f"{method} did not complete within {policy.deadline}s"
+                ) from e
+            except Exception as e:
+                retry += 1
+                if not is_retryable(e) or retry >= policy.max_attempts:
+                    raise
+                delay = policy.backoff(retry)
+                if loop.time() + delay >= deadline:
+                    raise
+            if self._retries is not None:
+                self._retries[method].inc()
+            await asyncio.sleep(delay)
+
+    async def _timed(self, method: str, call: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        result = await call()
+        self._latency[method].observe(time.perf_counter() - started)
+        return result
+
+    def _hedge_delay(self, method: str) -> float | None:
+        """Delay after which a read is hedged, or None to not hedge it."""
+        self._reads += 1
+        if self._hedges >= self.policy.hedge_budget * self._reads:
+            return None
+        p = self._latency[method].quantile(self.policy.hedge_quantile)
+        return None if p is None else max(p, self.policy.hedge_min_delay)
+
+    async def _hedged_attempt(self, method: str, call: Callable[[], Awaitable[T]]) -> T:
+        """One attempt of a read, with a second request if it is slow."""
+        delay = self._hedge_delay(method)
+        first = asyncio.ensure_future(self._timed(method, call))
+        if delay is None:
+            return await first
+
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self._hedges += 1
+                if self._hedged is not None:
+                    self._hedged[method].inc()
+                tasks.add(asyncio.ensure_future(self._timed(method, call)))
+
+            pending, error = tasks, None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
+    ) -> SearchResult:
+        """Search knowledge, retrying transient errors."""
+        return await self._call(
+            "search",
+            lambda: self._repository.search(
+                query,
+                limit=limit,
+                fields=fields,
+                filters=filters,
+                mode=mode,
+                cursor=cursor,
+            ),
+        )
+
+    async def get(self, id: str) -> Knowledge | None:
+        """Get knowledge by ID, retrying transient errors."""
+        return await self._call("get", lambda: self._repository.get(id))
+
+    async def delete(self, id: str) -> bool:
+        """Delete knowledge by ID, retrying transient errors.
+
+        A retry finding nothing to delete reports True: an earlier
+        attempt may have deleted the knowledge and lost its response.
+        """
+        attempts = 0
+
+        def call() -> Awaitable[bool]:
+            nonlocal attempts
+            attempts += 1
+            return self._repository.delete(id)
+
+        deleted = await self._call("delete", call)
+        return deleted or attempts > 1
+
+    async def find_by_github_path(self, path: str) -> Knowledge | None:
+        """Find knowledge by GitHub path, retrying transient errors."""
+        return await self._call(
+            "find_by_github_path", lambda: self._repository.find_by_github_path(path)
+        )
+
+    async def find_by_pr_url(self, url: str) -> Knowledge | None:
+        """Find knowledge by PR URL, retrying transient errors."""
+        return await self._call(
+            "find_by_pr_url", lambda: self._repository.find_by_pr_url(url)
+        )
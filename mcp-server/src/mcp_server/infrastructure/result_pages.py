@@ -0,0 +1,139 @@
+"""Short-lived server-side store of search rankings for cursor pagination."""
+
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+
+from ..domain.exceptions import InvalidCursorError
+from ..domain.models import Knowledge, SearchResult
+
+# Largest top_k the search service accepts
+MAX_WINDOW = 1000
+
+
+class ResultPages:
+    """Keeps the tail of recent search rankings so later pages are free.
+
+    The first page of a search fetches prefetch_pages pages worth of hits
+    in one request. The hits beyond the first page are stored under a
+    random token, and the returned cursor points into them, so following
+    cursors slices the stored ranking instead of re-running the search.
+    Prefetching is opt-in: every prefetched hit is fetched with all its
+    requested fields, so by default (one page) searches fetch only what
+    they return and issue no cursor.
+    Pages come from a snapshot: writes made after the first page do not
+    reorder later pages.
+
+    Rankings expire after ttl seconds; the least recently used ranking is
+    dropped when more than maxsize are stored.
+    """
+
+    def __init__(
+        self,
+        prefetch_pages: int = 1,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the store.
+
+        Args:
+            prefetch_pages: Pages fetched by the first page of a search
+                (1 disables pagination beyond the first page)
+            maxsize: Maximum number of stored rankings
+            ttl: Lifetime of a stored ranking in seconds
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.prefetch_pages = prefetch_pages
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        # token -> (expires_at, search key, ranking)
+        self._rankings: OrderedDict[
+            str, tuple[float, Hashable, Sequence[Knowledge]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        """Create a store configured from SEARCH_PREFETCH_PAGES.
+
+        Args:
+            **kwargs: Overrides for any other constructor argument
+        """
+        prefetch_pages = os.environ.get("SEARCH_PREFETCH_PAGES")
+        if prefetch_pages:
+            kwargs.setdefault("prefetch_pages", int(prefetch_pages))
+        return cls(**kwargs)
+
+    def window(self, limit: int) -> int:
+        """Number of hits to fetch for the first page of a search."""
+        return min(max(limit, limit * self.prefetch_pages), MAX_WINDOW)
+
+    def first_page(
+        self, key: Hashable, ranking: Sequence[Knowledge], limit: int
+    ) -> SearchResult:
+        """Return the first page of a fetched ranking, storing the rest.
+
+        Args:
+            key: The search's options apart from limit; cursors are only
+                accepted for searches with an equal key
+            ranking: Hits fetched with window(limit), best first
+            limit: Page size
+
+        Returns:
+            The first page, with a cursor if more hits were fetched
+        """
+        items = list(ranking[:limit])
+        if len(ranking) <= limit or self.maxsize <= 0:
+            return SearchResult(items=items, total=len(items))
+
+        token = secrets.token_urlsafe(12)
+        with self._lock:
+            self._rankings[token] = (self._clock() + self.ttl, key, ranking)
+            while len(self._rankings) > self.maxsize:
+                self._rankings.popitem(last=False)
+        return SearchResult(
+            items=items, total=len(items), next_cursor=f"{token}:{limit}"
+        )
+
+    def page(self, cursor: str, key: Hashable, limit: int) -> SearchResult:
+        """Return the page a cursor points at.
+
+        Args:
+            cursor: next_cursor of a previous page
+            key: The search's options apart from limit
+            limit: Page size
+
+        Returns:
+            The page, with a cursor if more stored hits follow
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed, expired or was
+                issued for a search with a different key
+        """
+        token, _, offset_text = cursor.partition(":")
+        if not offset_text.isdigit():
+            raise InvalidCursorError(f"malformed cursor: {cursor}")
+        offset = int(offset_text)
+
+        with self._lock:
+            entry = self._rankings.get(token)
+            if entry is not None and entry[0] <= self._clock():
+                del self._rankings[token]
+                entry = None
+            if entry is not None:
+                self._rankings.move_to_end(token)
+        if entry is None:
+            raise InvalidCursorError("cursor expired; run the search again")
+        _, stored_key, ranking = entry
+        if stored_key != key:
+            raise InvalidCursorError("cursor belongs to a different search")
+
+        items = list(ranking[offset : offset + limit])
+        end = offset + len(items)
+        next_cursor = f"{token}:{end}" if end < len(ranking) else None
+        return SearchResult(items=items, total=len(items), next_cursor=next_cursor)
@@ -0,0 +1,131 @@
+"""In-process LRU + TTL cache for search results."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from ..domain.models import SearchResult
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text for use as a cache key.
+
+    Collapses runs of whitespace and folds case so that trivially
+    different spellings of the same query share an entry.
+    """
+    return " ".join(query.split()).casefold()
+
+
+@dataclass
+class CacheStats:
+    """Search cache counters.
+
+    Attributes:
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to go to the backend
+        size: Number of entries currently stored
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+class SearchCache:
+    """Bounded search result cache with LRU eviction and TTL expiry.
+
+    Entries are keyed by the normalized query plus any search options
+    that affect the result. The whole cache is dropped on every write
+    since a single save or delete can change the ranking of any query.
+
+    A search that started before a write must not store the result it
+    got afterwards: it reads ``generation`` before going to the backend
+    and passes it to ``put``, which drops the result if an invalidation
+    happened in between.
+
+    Cached SearchResult instances are shared between callers and must
+    be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries (0 disables caching)
+            ttl: Entry lifetime in seconds
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, SearchResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far."""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> SearchResult | None:
+        """Return the cached result for key, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, result = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(
+        self, key: Hashable, result: SearchResult, generation: int | None = None
+    ) -> None:
+        """Store a result, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            result: Result to store
+            generation: ``generation`` read before the result was computed;
+                if given and the cache was invalidated since, nothing is
+                stored
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (self._clock() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
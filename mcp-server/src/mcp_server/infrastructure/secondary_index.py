@@ -0,0 +1,55 @@
+"""In-process secondary index for exact-match knowledge lookups."""
+
+import threading
+
+from ..domain.models import Knowledge
+
+
+class SecondaryIndex:
+    """Write-through index of github_path -> id and pr_url -> id.
+
+    Repositories update it on every save, status update and delete, and
+    fill it from backend lookups, so repeated lookups resolve the ID in
+    O(1) without querying the collection. Entries are hints: callers must
+    verify the fetched knowledge still matches, since other processes may
+    have changed it.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._by_path: dict[str, str] = {}
+        self._by_pr_url: dict[str, str] = {}
+        # id -> (github_path, pr_url) currently indexed, for removal
+        self._keys: dict[str, tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, knowledge: Knowledge) -> None:
+        """Index (or re-index) a knowledge's github_path and pr_url."""
+        with self._lock:
+            self._remove_locked(knowledge.id)
+            if knowledge.github_path:
+                self._by_path[knowledge.github_path] = knowledge.id
+            if knowledge.pr_url:
+                self._by_pr_url[knowledge.pr_url] = knowledge.id
+            if knowledge.github_path or knowledge.pr_url:
+                self._keys[knowledge.id] = (knowledge.github_path, knowledge.pr_url)
+
+    def remove(self, id: str) -> None:
+        """Drop all entries pointing at id."""
+        with self._lock:
+            self._remove_locked(id)
+
+    def id_for_path(self, path: str) -> str | None:
+        """Return the indexed ID for a GitHub path, if any."""
+        return self._by_path.get(path)
+
+    def id_for_pr_url(self, url: str) -> str | None:
+        """Return the indexed ID for a PR URL, if any."""
+        return self._by_pr_url.get(url)
+
+    def _remove_locked(self, id: str) -> None:
+        path, pr_url = self._keys.pop(id, ("", ""))
+        if path and self._by_path.get(path) == id:
+            del self._by_path[path]
+        if pr_url and self._by_pr_url.get(pr_url) == id:
+            del self._by_pr_url[pr_url]
@@ -0,0 +1,112 @@
+"""Single-flight coalescing of identical concurrent repository reads."""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class KeyStats:
+    """Coalescing counters of one key.
+
+    Attributes:
+        key: The coalescing key
+        calls: Calls made with the key
+        shared: Calls answered by a call already in flight
+    """
+
+    key: Hashable
+    calls: int = 0
+    shared: int = 0
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers of the same key.
+
+    The first caller of a key starts the call; callers arriving before it
+    completes await the same task and receive the same result (or
+    exception). Once it completes, the next caller starts a new call, so
+    nothing is cached. The call runs as its own task: a caller that is
+    cancelled stops waiting without cancelling it for the others.
+
+    Results are shared between callers and must be treated as read-only.
+    Not thread-safe; use from one event loop.
+    """
+
+    def __init__(self, max_tracked_keys: int = 256):
+        """Initialize the group.
+
+        Args:
+            max_tracked_keys: Keys whose counters are kept (least recently
+                used keys are dropped beyond this)
+        """
+        self.max_tracked_keys = max_tracked_keys
+        self._flights: dict[Hashable, asyncio.Future] = {}
+        self._stats: OrderedDict[Hashable, KeyStats] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._flights)
+
+    async def do(
+        self, key: Hashable, call: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        """Run call, or join the call already in flight for key.
+
+        Args:
+            key: Coalescing key; equal keys must mean identical calls
+            call: Starts the backend call (only invoked by the first caller)
+
+        Returns:
+            Tuple of (result, whether it was shared with an earlier caller)
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = asyncio.ensure_future(call())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._finish(key, done))
+        self._record(key, shared)
+        return await asyncio.shield(flight), shared
+
+    def forget(self, key: Hashable) -> None:
+        """Make later callers of key start a new call.
+
+        Used after a write that may change the result: callers already
+        waiting still receive the in-flight result.
+        """
+        self._flights.pop(key, None)
+
+    def forget_all(self) -> None:
+        """Make later callers of every key start new calls."""
+        self._flights.clear()
+
+    def stats(self, limit: int = 10) -> list[KeyStats]:
+        """Return the tracked keys with the most shared calls.
+
+        Args:
+            limit: Maximum number of keys returned
+        """
+        ranked = sorted(self._stats.values(), key=lambda s: s.shared, reverse=True)
+        return [KeyStats(s.key, s.calls, s.shared) for s in ranked[:limit]]
+
+    def _record(self, key: Hashable, shared: bool) -> None:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = KeyStats(key)
+        self._stats.move_to_end(key)
+        stats.calls += 1
+        stats.shared += shared
+        while len(self._stats) > self.max_tracked_keys:
+            self._stats.popitem(last=False)
+
+    def _finish(self, key: Hashable, flight: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the exception retrieved even if every caller stopped waiting
+        if not flight.cancelled():
+            flight.exception()
@@ -1,47 +1,774 @@
 """Vector Search 2.0 implementation of KnowledgeRepository."""
 
-import os
+from __future__ import annotations
+
+import functools
+import hashlib
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from google.protobuf import field_mask_pb2
+
+from ..domain.exceptions import StatusConflictError
+from ..domain.models import Knowledge, SaveResult, SearchFilter, SearchResult
+from .gcp import LazyModule, resolve_location, resolve_project_id
+from .rank_fusion import SEARCH_MODES, HybridSearchConfig, fuse_hybrid
+from .result_pages import ResultPages
+from .search_cache import CacheStats, SearchCache, normalize_query
+from .secondary_index import SecondaryIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+    from .channel_pool import AsyncChannelPool, ChannelPool
+    from .query_embedding import QueryEmbedder
+
+# Client libraries are imported on first use to keep cold starts fast
+api_exceptions = LazyModule("google.api_core.exceptions")
+vectorsearch_v1beta = LazyModule("google.cloud.vectorsearch_v1beta")
+
+
+# Data fields requested for every search hit (all Knowledge fields)
+KNOWLEDGE_DATA_FIELDS = [
+    "id",
+    "title",
+    "content",
+    "tags",
+    "user_id",
+    "source",
+    "status",
+    "github_path",
+    "pr_url",
+    "promoted_from_id",
+    "source_hash",
+    "created_at",
+    "updated_at",
+]
+
+# Text the collection's auto-embedding is computed from; must match the
+# text_template of content_embedding in scripts/create_collection.py
+EMBEDDING_TEXT_TEMPLATE = "{title} {content}"
 
-from google.cloud import vectorsearch_v1beta
+# Data fields that feed the embedding; rewriting them re-embeds the object
+EMBEDDED_FIELDS = ("title", "content", "content_hash")
 
-from ..domain.models import Knowledge, SearchResult
+# Data fields fetched to decide how an existing object is re-saved
+RESAVE_LOOKUP_FIELDS = ["id", "content_hash", "created_at"]
 
+# Data fields matched by keyword (text) search
+TEXT_SEARCH_FIELDS = ["title", "content"]
 
-def _get_project_id() -> str | None:
-    """Get GCP project ID from environment or metadata server."""
-    # First try environment variable
-    project_id = os.environ.get("GCP_PROJECT_ID")
-    if project_id:
-        return project_id
+# Data objects per BatchCreateDataObjects call. Kept well below the
+# service's per-request cap so one auto-embedding batch stays small.
+BATCH_CREATE_SIZE = 100
 
-    # Try GOOGLE_CLOUD_PROJECT (set by Cloud Run)
-    project_id = os.environ.get("GOOGLE_CLOUD_PROJECT")
-    if project_id:
-        return project_id
+# Attempts per batch chunk before items are reported as failed
+BATCH_CREATE_MAX_ATTEMPTS = 3
 
-    # Try GCP metadata server (for Cloud Run / GCE)
+# Base delay (seconds) before retrying a chunk, doubled per attempt
+BATCH_RETRY_BACKOFF = 0.5
+
+
+@functools.cache
+def retryable_errors() -> tuple[type[Exception], ...]:
+    """Errors after which the same request may succeed if sent again."""
+    return (
+        api_exceptions.Aborted,
+        api_exceptions.DeadlineExceeded,
+        api_exceptions.InternalServerError,
+        api_exceptions.ServiceUnavailable,
+        api_exceptions.TooManyRequests,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(value: str | None) -> datetime | None:
+    """Parse ISO 8601 datetime string.
+
+    Cached: the same timestamps come back in every search that returns
+    the same items, and datetimes are immutable so they can be shared.
+    """
+    if not value:
+        return None
     try:
-        import urllib.request
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
 
-        req = urllib.request.Request(
-            "http://metadata.google.internal/computeMetadata/v1/project/project-id",
-            headers={"Metadata-Flavor": "Google"},
-        )
-        with urllib.request.urlopen(req, timeout=2) as response:
-            return response.read().decode("utf-8")
-    except Exception:
-        pass
 
+def _struct_value(value):
+    """Decode one google.protobuf.Value (None for null or unknown kinds)."""
+    kind = value.WhichOneof("kind")
+    if kind == "string_value":
+        return value.string_value
+    if kind == "list_value":
+        return [_struct_value(item) for item in value.list_value.values]
+    if kind == "number_value":
+        return value.number_value
+    if kind == "bool_value":
+        return value.bool_value
+    if kind == "struct_value":
+        return {k: _struct_value(v) for k, v in value.struct_value.fields.items()}
     return None
 
 
-class VectorSearchKnowledgeRepository:
-    """Knowledge repository using Vertex AI Vector Search 2.0.
+def data_values(data) -> Mapping:
+    """Return the fields of a data object's data map as a plain dict.
 
-    This implementation uses Vector Search 2.0's Collection API with
-    auto-embeddings for semantic search capabilities.
+    The proto-plus view of a Struct converts on every lookup (and scans
+    all keys for each one), so the underlying Struct is read once, in a
+    single pass, instead. Null values are left out. Plain mappings are
+    returned as they are.
+
+    Args:
+        data: The ``data`` of a DataObject (proto-plus map, raw Struct)
+            or a dict
+    """
+    if isinstance(data, dict):
+        return data
+    fields = getattr(data, "fields", None)  # raw Struct
+    if fields is None:
+        fields = getattr(data, "pb", None)  # proto-plus map view
+    if fields is None:
+        return data
+    values = {}
+    for key, value in fields.items():
+        decoded = _struct_value(value)
+        if decoded is not None:
+            values[key] = decoded
+    return values
+
+
+def raw_message(message):
+    """Return the protobuf message behind a proto-plus message.
+
+    Reading fields of the raw message skips the per-access wrapping of
+    proto-plus; anything else (e.g. a raw message) is returned as is.
+    """
+    pb = getattr(type(message), "pb", None)
+    return pb(message) if pb is not None else message
+
+
+def knowledge_from_data(
+    data, *, score: float | None = None, default_id: str = ""
+) -> Knowledge:
+    """Build a Knowledge from a data object's data map.
+
+    This is the one decoder from stored data to Knowledge; the data map
+    is read once (see data_values).
+
+    Args:
+        data: The ``data`` Struct (or dict) of a DataObject
+        score: Search relevance score (search results only)
+        default_id: ID to use if the data has none (e.g. the resource
+            name's ID)
+
+    Returns:
+        The decoded Knowledge
+    """
+    get = data_values(data).get
+    return Knowledge(
+        id=get("id") or default_id,
+        title=get("title", ""),
+        content=get("content", ""),
+        tags=list(get("tags", ())),
+        user_id=get("user_id", "anonymous"),
+        source=get("source", "personal"),
+        status=get("status", "draft"),
+        github_path=get("github_path", ""),
+        pr_url=get("pr_url", ""),
+        promoted_from_id=get("promoted_from_id", ""),
+        source_hash=get("source_hash", ""),
+        created_at=parse_datetime(get("created_at")),
+        updated_at=parse_datetime(get("updated_at")),
+        score=score,
+    )
+
+
+def content_hash(title: str, content: str) -> str:
+    """Hash of the text a knowledge's embedding is computed from."""
+    text = EMBEDDING_TEXT_TEMPLATE.format(title=title, content=content)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def knowledge_to_data(knowledge: Knowledge) -> dict:
+    """Build the data map stored for a knowledge (timestamps must be set)."""
+    return {
+        "id": knowledge.id,
+        "title": knowledge.title,
+        "content": knowledge.content,
+        "tags": knowledge.tags,
+        "user_id": knowledge.user_id,
+        "source": knowledge.source,
+        "status": knowledge.status,
+        "github_path": knowledge.github_path,
+        "pr_url": knowledge.pr_url,
+        "promoted_from_id": knowledge.promoted_from_id,
+        "source_hash": knowledge.source_hash,
+        "created_at": knowledge.created_at.isoformat(),
+        "updated_at": knowledge.updated_at.isoformat(),
+        "content_hash": content_hash(knowledge.title, knowledge.content),
+    }
+
+
+def prepare_save(
+    collection_path: str, knowledge: Knowledge
+) -> tuple[vectorsearch_v1beta.CreateDataObjectRequest, Knowledge]:
+    """Build the create request for a save and the Knowledge it will yield.
+
+    Generates an ID if none is set and assigns created_at/updated_at.
+
+    Args:
+        collection_path: Full resource name of the collection
+        knowledge: The knowledge to save
+
+    Returns:
+        Tuple of (CreateDataObjectRequest, saved Knowledge)
+    """
+    now = datetime.now(UTC)
+
+    # Generate ID if not provided
+    knowledge_id = knowledge.id if knowledge.id else str(uuid.uuid4())
+
+    # Set timestamps
+    created_at = knowledge.created_at or now
+    updated_at = now
+
+    saved = replace(
+        knowledge,
+        id=knowledge_id,
+        created_at=created_at,
+        updated_at=updated_at,
+        score=None,
+    )
+    request = vectorsearch_v1beta.CreateDataObjectRequest(
+        parent=collection_path,
+        data_object_id=knowledge_id,
+        data_object=vectorsearch_v1beta.DataObject(
+            data=knowledge_to_data(saved),
+            vectors={},  # Auto-Embeddings will generate vectors
+        ),
+    )
+
+    return request, saved
+
+
+def prepare_resave(
+    collection_path: str, saved: Knowledge, existing_data
+) -> tuple[vectorsearch_v1beta.UpdateDataObjectRequest, Knowledge]:
+    """Turn a prepared create into a masked update of an existing object.
+
+    The original created_at is kept. If the stored content hash equals
+    the new one, the update mask leaves title, content and content_hash
+    out, so the stored vector is kept and nothing is re-embedded. Objects
+    saved before content hashes existed have none and are rewritten in
+    full once.
+
+    Args:
+        collection_path: Full resource name of the collection
+        saved: Knowledge from prepare_save()
+        existing_data: Data map of the stored object (at least the
+            RESAVE_LOOKUP_FIELDS)
+
+    Returns:
+        Tuple of (UpdateDataObjectRequest, saved Knowledge)
+    """
+    created_at = parse_datetime(existing_data.get("created_at"))
+    if created_at is not None:
+        saved = replace(saved, created_at=created_at)
+    data = knowledge_to_data(saved)
+
+    unchanged = existing_data.get("content_hash") == data["content_hash"]
+    paths = [
+        f"data.{field}"
+        for field in data
+        if field != "id" and not (unchanged and field in EMBEDDED_FIELDS)
+    ]
+    request = vectorsearch_v1beta.UpdateDataObjectRequest(
+        data_object=vectorsearch_v1beta.DataObject(
+            name=f"{collection_path}/dataObjects/{saved.id}", data=data
+        ),
+        update_mask=field_mask_pb2.FieldMask(paths=paths),
+    )
+    return request, saved
+
+
+def build_resave_lookup_query(
+    collection_path: str, ids: Sequence[str]
+) -> vectorsearch_v1beta.QueryDataObjectsRequest:
+    """Build a query for the content hashes of already stored objects."""
+    return vectorsearch_v1beta.QueryDataObjectsRequest(
+        parent=collection_path,
+        filter={"id": {"$in": list(ids)}},
+        output_fields=vectorsearch_v1beta.OutputFields(
+            data_fields=RESAVE_LOOKUP_FIELDS
+        ),
+        page_size=len(ids),
+    )
+
+
+def build_batch_update_request(
+    collection_path: str,
+    requests: Sequence[vectorsearch_v1beta.UpdateDataObjectRequest],
+) -> vectorsearch_v1beta.BatchUpdateDataObjectsRequest:
+    """Wrap update requests into one BatchUpdateDataObjectsRequest."""
+    return vectorsearch_v1beta.BatchUpdateDataObjectsRequest(
+        parent=collection_path, requests=list(requests)
+    )
+
+
+def projected_fields(fields: Sequence[str] | None) -> list[str]:
+    """Return the data fields to request for a projection.
+
+    None means all Knowledge fields; "id" is always included.
+    """
+    if fields is None:
+        return KNOWLEDGE_DATA_FIELDS
+    return ["id", *(field for field in fields if field != "id")]
+
+
+def build_batch_create_request(
+    collection_path: str,
+    requests: Sequence[vectorsearch_v1beta.CreateDataObjectRequest],
+) -> vectorsearch_v1beta.BatchCreateDataObjectsRequest:
+    """Wrap create requests into one BatchCreateDataObjectsRequest."""
+    return vectorsearch_v1beta.BatchCreateDataObjectsRequest(
+        parent=collection_path, requests=list(requests)
+    )
+
+
+def created_ids(response) -> set[str]:
+    """Return the IDs of the data objects in a batch create response."""
+    return {
+        data_object.data_object_id or data_object.name.rsplit("/", 1)[-1]
+        for data_object in response.data_objects
+    }
+
+
+def build_exact_match_query(
+    collection_path: str, field: str, value: str
+) -> vectorsearch_v1beta.QueryDataObjectsRequest:
+    """Build a metadata query for objects whose field equals value."""
+    return vectorsearch_v1beta.QueryDataObjectsRequest(
+        parent=collection_path,
+        filter={field: {"$eq": value}},
+        output_fields=vectorsearch_v1beta.OutputFields(
+            data_fields=KNOWLEDGE_DATA_FIELDS
+        ),
+        page_size=1,
+    )
+
+
+def build_scan_query(
+    collection_path: str,
+    fields: Sequence[str] | None,
+    filters: SearchFilter | None,
+    page_size: int,
+) -> vectorsearch_v1beta.QueryDataObjectsRequest:
+    """Build a query that pages through all objects matching filters."""
+    request = vectorsearch_v1beta.QueryDataObjectsRequest(
+        parent=collection_path,
+        output_fields=vectorsearch_v1beta.OutputFields(
+            data_fields=projected_fields(fields)
+        ),
+        page_size=page_size,
+    )
+    expression = build_filter(filters)
+    if expression is not None:
+        request.filter = expression
+    return request
+
+
+def build_filter(filters: SearchFilter | None) -> dict | None:
+    """Translate a SearchFilter into a Vector Search filter expression.
+
+    Args:
+        filters: Metadata constraints (None or empty means no filter)
+
+    Returns:
+        Filter expression dict, or None if nothing is constrained
+    """
+    if filters is None:
+        return None
+
+    conditions = []
+    if filters.status:
+        conditions.append({"status": {"$eq": filters.status}})
+    if filters.source:
+        conditions.append({"source": {"$eq": filters.source}})
+    if filters.user_id:
+        conditions.append({"user_id": {"$eq": filters.user_id}})
+    if filters.tags:
+        conditions.append({"tags": {"$in": list(filters.tags)}})
+
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
+def build_search_request(
+    collection_path: str,
+    query: str,
+    *,
+    limit: int,
+    fields: Sequence[str] | None = None,
+    filters: SearchFilter | None = None,
+) -> vectorsearch_v1beta.SearchDataObjectsRequest:
+    """Build a semantic search request over content_embedding."""
+    semantic_search = vectorsearch_v1beta.SemanticSearch(
+        search_text=query,
+        search_field="content_embedding",
+        task_type="QUESTION_ANSWERING",
+        top_k=limit,
+        output_fields=vectorsearch_v1beta.OutputFields(
+            data_fields=projected_fields(fields)
+        ),
+    )
+    filter_expression = build_filter(filters)
+    if filter_expression is not None:
+        semantic_search.filter = filter_expression
+
+    return vectorsearch_v1beta.SearchDataObjectsRequest(
+        parent=collection_path,
+        semantic_search=semantic_search,
+    )
+
+
+def build_vector_search_request(
+    collection_path: str,
+    vector: Sequence[float],
+    *,
+    limit: int,
+    fields: Sequence[str] | None = None,
+    filters: SearchFilter | None = None,
+) -> vectorsearch_v1beta.SearchDataObjectsRequest:
+    """Build a nearest-neighbor search for a precomputed query vector."""
+    vector_search = vectorsearch_v1beta.VectorSearch(
+        vector=vectorsearch_v1beta.DenseVector(values=vector),
+        search_field="content_embedding",
+        top_k=limit,
+        output_fields=vectorsearch_v1beta.OutputFields(
+            data_fields=projected_fields(fields)
+        ),
+    )
+    filter_expression = build_filter(filters)
+    if filter_expression is not None:
+        vector_search.filter = filter_expression
+
+    return vectorsearch_v1beta.SearchDataObjectsRequest(
+        parent=collection_path,
+        vector_search=vector_search,
+    )
+
+
+def build_text_search_request(
+    collection_path: str,
+    query: str,
+    *,
+    limit: int,
+    fields: Sequence[str] | None = None,
+    filters: SearchFilter | None = None,
+) -> vectorsearch_v1beta.SearchDataObjectsRequest:
+    """Build a keyword (full-text) search request over title and content."""
+    text_search = vectorsearch_v1beta.TextSearch(
+        search_text=query,
+        data_field_names=TEXT_SEARCH_FIELDS,
+        top_k=limit,
+        output_fields=vectorsearch_v1beta.OutputFields(
+            data_fields=projected_fields(fields)
+        ),
+    )
+    filter_expression = build_filter(filters)
+    if filter_expression is not None:
+        text_search.filter = filter_expression
+
+    return vectorsearch_v1beta.SearchDataObjectsRequest(
+        parent=collection_path,
+        text_search=text_search,
+    )
+
+
+def search_key(
+    query: str,
+    *,
+    fields: Sequence[str] | None,
+    filters: SearchFilter | None,
+    mode: str,
+) -> tuple:
+    """Key of a search: every option apart from limit that affects results."""
+    return (
+        normalize_query(query),
+        tuple(fields) if fields is not None else None,
+        filters,
+        mode,
+    )
+
+
+def check_search_mode(mode: str) -> None:
+    """Raise ValueError unless mode is one of SEARCH_MODES."""
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"invalid search mode: {mode}")
+
+
+def hybrid_search_error(
+    semantic_error: BaseException | None, text_error: BaseException | None
+) -> Exception:
+    """Error to raise when neither hybrid branch produced a result.
+
+    Prefers the semantic branch's error; a branch without an error
+    missed the deadline.
+    """
+    error = semantic_error or text_error
+    if isinstance(error, Exception):
+        return error
+    return api_exceptions.DeadlineExceeded("hybrid search deadline exceeded")
+
+
+def search_result_from_response(response) -> SearchResult:
+    """Decode a SearchDataObjectsResponse into a SearchResult.
+
+    Hits are read from the raw protobuf message, so no proto-plus wrapper
+    is built per hit, data object or data map.
+    """
+    items = [
+        knowledge_from_data(
+            result.data_object.data, score=getattr(result, "distance", None)
+        )
+        for result in raw_message(response).results
+    ]
+    return SearchResult(items=items, total=len(items))
+
+
+def build_status_update_request(
+    collection_path: str,
+    id: str,
+    status: str,
+    *,
+    pr_url: str = "",
+    etag: str = "",
+) -> vectorsearch_v1beta.UpdateDataObjectRequest:
+    """Build a masked update request for a status change.
+
+    Only status, updated_at and (if given) pr_url are written; the update
+    mask leaves every other data field and the embedding untouched.
+
+    Args:
+        collection_path: Full resource name of the collection
+        id: Knowledge identifier
+        status: New status
+        pr_url: PR URL (optional, for proposed status)
+        etag: If set, the update only succeeds if the object is unchanged
+
+    Returns:
+        UpdateDataObjectRequest
+    """
+    update_data = {
+        "status": status,
+        "updated_at": datetime.now(UTC).isoformat(),
+    }
+    if pr_url:
+        update_data["pr_url"] = pr_url
+
+    return vectorsearch_v1beta.UpdateDataObjectRequest(
+        data_object=vectorsearch_v1beta.DataObject(
+            name=f"{collection_path}/dataObjects/{id}",
+            data=update_data,
+            etag=etag,
+        ),
+        update_mask=field_mask_pb2.FieldMask(
+            paths=[f"data.{field}" for field in update_data]
+        ),
+    )
+
+
+def knowledge_from_data_object(id: str, data_object) -> Knowledge:
+    """Build a Knowledge from a full DataObject (get/update responses)."""
+    return knowledge_from_data(raw_message(data_object).data, default_id=id)
+
+
+def status_update_etag(id: str, current, expected_status: str) -> str:
+    """Return the etag to send with a status update of current.
+
+    Args:
+        id: Knowledge identifier
+        current: The stored DataObject
+        expected_status: Status the object must currently have
+
+    Raises:
+        StatusConflictError: If the current status is not expected_status
+    """
+    current_status = knowledge_from_data_object(id, current).status
+    if current_status != expected_status:
+        raise StatusConflictError(id, current_status)
+    return current.etag
+
+
+@dataclass
+class BatchChunk:
+    """Items of a save_many call sent in one batch request.
+
+    Attributes:
+        indices: Positions of the items in the save_many input
+        update: True for re-saves of stored objects (batch update), False
+            for new objects (batch create)
+        attempt: Attempt number, starting at 1
+        delay: Seconds to wait before sending (retry backoff)
+    """
+
+    indices: list[int]
+    update: bool = False
+    attempt: int = 1
+    delay: float = 0.0
+
+
+class BatchSave:
+    """Requests and per-item results of one save_many call.
+
+    Decides everything but the I/O: the split into creates and re-saves,
+    the chunks, and which chunks follow a response or an error. A chunk
+    that fails with a retryable error is sent again with exponential
+    backoff; a chunk that fails terminally is split in half until the
+    failing items are isolated. Items missing from a successful create
+    response are sent again as well.
+    """
+
+    def __init__(self, collection_path: str, knowledge_list: Sequence[Knowledge]):
+        """Prepare the save of knowledge_list.
+
+        Args:
+            collection_path: Full resource name of the collection
+            knowledge_list: The knowledge items to save
+        """
+        self.collection_path = collection_path
+        self.knowledge_list = knowledge_list
+        self.prepared = [prepare_save(collection_path, k) for k in knowledge_list]
+        self.resaves: dict[
+            int, tuple[vectorsearch_v1beta.UpdateDataObjectRequest, Knowledge]
+        ] = {}
+        self._results: list[SaveResult | None] = [None] * len(self.prepared)
+
+    def lookup_requests(self) -> list[vectorsearch_v1beta.QueryDataObjectsRequest]:
+        """Queries for the objects of the batch that are already stored."""
+        ids = [k.id for k in self.knowledge_list if k.id]
+        return [
+            build_resave_lookup_query(
+                self.collection_path, ids[start : start + BATCH_CREATE_SIZE]
+            )
+            for start in range(0, len(ids), BATCH_CREATE_SIZE)
+        ]
+
+    def plan(self, lookup_responses: Sequence) -> list[BatchChunk]:
+        """Split the batch into new items and re-saves of stored objects.
+
+        Args:
+            lookup_responses: Responses to lookup_requests()
+
+        Returns:
+            The chunks to send, creates first
+        """
+        stored = {
+            data_object.data.get("id", ""): data_object.data
+            for response in lookup_responses
+            for data_object in response.data_objects
+        }
+        creates = []
+        for i, knowledge in enumerate(self.knowledge_list):
+            existing = stored.get(knowledge.id) if knowledge.id else None
+            if existing is None:
+                creates.append(i)
+            else:
+                self.resaves[i] = prepare_resave(
+                    self.collection_path, self.prepared[i][1], existing
+                )
+        updates = list(self.resaves)
+        return [
+            BatchChunk(creates[start : start + BATCH_CREATE_SIZE])
+            for start in range(0, len(creates), BATCH_CREATE_SIZE)
+        ] + [
+            BatchChunk(updates[start : start + BATCH_CREATE_SIZE], update=True)
+            for start in range(0, len(updates), BATCH_CREATE_SIZE)
+        ]
+
+    def request(self, chunk: BatchChunk):
+        """Build the batch create or batch update request of a chunk."""
+        if chunk.update:
+            return build_batch_update_request(
+                self.collection_path, [self.resaves[i][0] for i in chunk.indices]
+            )
+        return build_batch_create_request(
+            self.collection_path, [self.prepared[i][0] for i in chunk.indices]
+        )
+
+    def succeeded(self, chunk: BatchChunk, response) -> list[BatchChunk]:
+        """Record the response to a chunk; return the chunks to send next."""
+        created = None if chunk.update else created_ids(response)
+        missing = []
+        for i in chunk.indices:
+            knowledge = self._knowledge(chunk, i)
+            if created is None or knowledge.id in created:
+                self._results[i] = SaveResult(knowledge)
+            else:
+                missing.append(i)
+
+        if not missing:
+            return []
+        if chunk.attempt < BATCH_CREATE_MAX_ATTEMPTS:
+            return [BatchChunk(missing, attempt=chunk.attempt + 1)]
+        self._fail(chunk, missing, "not created by batch request")
+        return []
+
+    def failed(self, chunk: BatchChunk, error: Exception) -> list[BatchChunk]:
+        """Record the error of a chunk; return the chunks to send next."""
+        if isinstance(error, retryable_errors()):
+            if chunk.attempt < BATCH_CREATE_MAX_ATTEMPTS:
+                delay = BATCH_RETRY_BACKOFF * 2 ** (chunk.attempt - 1)
+                return [replace(chunk, attempt=chunk.attempt + 1, delay=delay)]
+            self._fail(chunk, chunk.indices, str(error), retryable=True)
+            return []
+        if len(chunk.indices) == 1:
+            self._fail(chunk, chunk.indices, str(error))
+            return []
+        # Isolate the failing items by bisection
+        middle = len(chunk.indices) // 2
+        return [
+            replace(chunk, indices=chunk.indices[:middle], delay=0.0),
+            replace(chunk, indices=chunk.indices[middle:], delay=0.0),
+        ]
+
+    def results(self) -> list[SaveResult]:
+        """One SaveResult per input item, in input order."""
+        return [result for result in self._results if result is not None]
+
+    def _knowledge(self, chunk: BatchChunk, i: int) -> Knowledge:
+        return (self.resaves if chunk.update else self.prepared)[i][1]
+
+    def _fail(
+        self,
+        chunk: BatchChunk,
+        indices: list[int],
+        error: str,
+        *,
+        retryable: bool = False,
+    ) -> None:
+        for i in indices:
+            self._results[i] = SaveResult(
+                self._knowledge(chunk, i), error=error, retryable=retryable
+            )
+
+
+class VectorSearchRepositoryBase:
+    """State and client-independent logic of the Vector Search repositories.
+
+    The sync and async repositories build on this and differ only in how
+    they send requests; the search cache, the cursor pages and the
+    secondary index are maintained here.
     """
 
     def __init__(
@@ -49,6 +776,11 @@ class VectorSearchKnowledgeRepository:
         project_id: str | None = None,
         location: str | None = None,
         collection_id: str = "knowledge",
+        search_cache: SearchCache | None = None,
+        channel_pool: ChannelPool | AsyncChannelPool | None = None,
+        hybrid: HybridSearchConfig | None = None,
+        result_pages: ResultPages | None = None,
+        query_embedder: QueryEmbedder | None = None,
     ):
         """Initialize the repository.
 
@@ -56,10 +788,23 @@ class VectorSearchKnowledgeRepository:
             project_id: GCP project ID (auto-detected if not provided)
             location: GCP location (defaults to GCP_LOCATION env var or us-central1)
             collection_id: Collection ID (defaults to "knowledge")
+            search_cache: Search result cache (defaults to a 256-entry,
+                60-second cache)
+            channel_pool: Shared gRPC channel pool (defaults to dedicated
+                clients with their own channels)
+            hybrid: Weights and deadline of hybrid search (defaults to
+                equal weights, k=60 and a 3-second deadline)
+            result_pages: Store of rankings behind search cursors
+                (defaults to no prefetched pages, i.e. no cursors)
+            query_embedder: If set, semantic search sends the query vector
+                computed (and cached) by it as a vector search, instead of
+                having the service embed the search text on every request
         """
-        self.project_id = project_id or _get_project_id()
-        self.location = location or os.environ.get("GCP_LOCATION", "us-central1")
+        self.project_id = project_id or resolve_project_id()
+        self.location = location or resolve_location()
         self.collection_id = collection_id
+        self.hybrid = hybrid if hybrid is not None else HybridSearchConfig()
+        self.query_embedder = query_embedder
 
         if not self.project_id:
             raise ValueError(
@@ -71,136 +816,456 @@ class VectorSearchKnowledgeRepository:
             f"/collections/{self.collection_id}"
         )
 
-        # Initialize clients
-        self._data_object_client = vectorsearch_v1beta.DataObjectServiceClient()
-        self._search_client = vectorsearch_v1beta.DataObjectSearchServiceClient()
+        self._search_cache = search_cache if search_cache is not None else SearchCache()
+        self._result_pages = result_pages if result_pages is not None else ResultPages()
+        self._index = SecondaryIndex()
+        self._channel_pool = channel_pool
+
+        # Clients are created on first use
+        self._data_object_client = None
+        self._search_client = None
+
+    def _object_name(self, id: str) -> str:
+        return f"{self._collection_path}/dataObjects/{id}"
+
+    def _answered_search(
+        self, key: tuple, limit: int, cursor: str | None
+    ) -> SearchResult | None:
+        """Page of a cursor, or a cached first page, if there is one."""
+        if cursor is not None:
+            return self._result_pages.page(cursor, key, limit)
+        return self._search_cache.get((key, limit))
+
+    def _search_request(
+        self,
+        query: str,
+        vector: Sequence[float] | None,
+        *,
+        mode: str,
+        limit: int,
+        fields: Sequence[str] | None,
+        filters: SearchFilter | None,
+    ) -> vectorsearch_v1beta.SearchDataObjectsRequest:
+        """Build a text or semantic search request.
+
+        A semantic search sends vector (from the query embedder) if given,
+        otherwise the service embeds the search text.
+        """
+        if mode == "text":
+            build, what = build_text_search_request, query
+        elif vector is None:
+            build, what = build_search_request, query
+        else:
+            build, what = build_vector_search_request, vector
+        return build(
+            self._collection_path, what, limit=limit, fields=fields, filters=filters
+        )
+
+    def _first_page(
+        self, key: tuple, ranking: SearchResult, limit: int, generation: int
+    ) -> SearchResult:
+        """Store a fresh ranking and return (and cache) its first page."""
+        result = self._result_pages.first_page(key, ranking.items, limit)
+        self._search_cache.put((key, limit), result, generation)
+        return result
+
+    def _written(self, knowledge: Knowledge) -> Knowledge:
+        """Drop cached searches and index a saved or updated knowledge."""
+        self._search_cache.invalidate()
+        self._index.put(knowledge)
+        return knowledge
+
+    def _deleted(self, id: str) -> None:
+        self._search_cache.invalidate()
+        self._index.remove(id)
+
+    def _batch_written(self, batch: BatchSave) -> list[SaveResult]:
+        saved = batch.results()
+        for result in saved:
+            if result.ok:
+                self._index.put(result.knowledge)
+        if saved:
+            self._search_cache.invalidate()
+        return saved
+
+    def _hinted(
+        self, field: str, value: str, id: str, knowledge: Knowledge | None
+    ) -> Knowledge | None:
+        """Return the knowledge an index hint led to, if it still matches."""
+        if knowledge is not None and getattr(knowledge, field) == value:
+            return knowledge
+        # Stale hint (changed or deleted elsewhere)
+        self._index.remove(id)
+        return None
+
+    def _first_match(self, response) -> Knowledge | None:
+        """Decode and index the first object of an exact-match query."""
+        for data_object in response.data_objects:
+            knowledge = knowledge_from_data(data_object.data)
+            self._index.put(knowledge)
+            return knowledge
+        return None
+
+    def search_cache_stats(self) -> CacheStats:
+        """Return hit/miss counters of the search result cache."""
+        return self._search_cache.stats()
+
+
+class VectorSearchKnowledgeRepository(VectorSearchRepositoryBase):
+    """Knowledge repository using Vertex AI Vector Search 2.0.
+
+    This implementation uses Vector Search 2.0's Collection API with
+    auto-embeddings for semantic search capabilities. gRPC clients are
+    created on first use so constructing the repository stays cheap.
+    """
+
+    def __init__(
+        self,
+        project_id: str | None = None,
+        location: str | None = None,
+        collection_id: str = "knowledge",
+        search_cache: SearchCache | None = None,
+        channel_pool: ChannelPool | None = None,
+        hybrid: HybridSearchConfig | None = None,
+        result_pages: ResultPages | None = None,
+        query_embedder: QueryEmbedder | None = None,
+    ):
+        """Initialize the repository.
+
+        Args:
+            project_id: GCP project ID (auto-detected if not provided)
+            location: GCP location (defaults to GCP_LOCATION env var or us-central1)
+            collection_id: Collection ID (defaults to "knowledge")
+            search_cache: Search result cache (defaults to a 256-entry,
+                60-second cache)
+            channel_pool: Shared gRPC channel pool (defaults to dedicated
+                clients with their own channels)
+            hybrid: Weights and deadline of hybrid search (defaults to
+                equal weights, k=60 and a 3-second deadline)
+            result_pages: Store of rankings behind search cursors
+                (defaults to no prefetched pages, i.e. no cursors)
+            query_embedder: If set, semantic search sends the query vector
+                computed (and cached) by it as a vector search, instead of
+                having the service embed the search text on every request
+        """
+        super().__init__(
+            project_id,
+            location,
+            collection_id,
+            search_cache,
+            channel_pool,
+            hybrid,
+            result_pages,
+            query_embedder,
+        )
+        # Runs the text branch of hybrid searches (started on first use)
+        self._hybrid_executor: ThreadPoolExecutor | None = None
+
+    @property
+    def data_object_client(self) -> vectorsearch_v1beta.DataObjectServiceClient:
+        """DataObjectService client (created on first use)."""
+        if self._data_object_client is None:
+            if self._channel_pool is not None:
+                return self._channel_pool.data_object_client()
+            self._data_object_client = vectorsearch_v1beta.DataObjectServiceClient()
+        return self._data_object_client
+
+    @property
+    def search_client(self) -> vectorsearch_v1beta.DataObjectSearchServiceClient:
+        """DataObjectSearchService client (created on first use)."""
+        if self._search_client is None:
+            if self._channel_pool is not None:
+                return self._channel_pool.search_client()
+            self._search_client = vectorsearch_v1beta.DataObjectSearchServiceClient()
+        return self._search_client
+
+    def close(self) -> None:
+        """Stop the hybrid search thread pool, if it was started.
+
+        A text search still running finishes first (it is bounded by the
+        hybrid deadline). The repository stays usable; the pool is
+        started again by the next hybrid search.
+        """
+        executor, self._hybrid_executor = self._hybrid_executor, None
+        if executor is not None:
+            executor.shutdown()
 
     def save(self, knowledge: Knowledge) -> Knowledge:
         """Save knowledge to Vector Search Collection.
 
+        Knowledge whose ID is already stored is updated in place. If its
+        title and content are unchanged (same content hash), only the
+        metadata is written and the stored embedding is kept.
+
         Args:
             knowledge: The knowledge to save
 
         Returns:
             The saved knowledge with ID and timestamps populated
         """
-        now = datetime.now(UTC)
-
-        # Generate ID if not provided
-        knowledge_id = knowledge.id if knowledge.id else str(uuid.uuid4())
-
-        # Set timestamps
-        created_at = knowledge.created_at or now
-        updated_at = now
-
-        # Prepare data object
-        data = {
-            "id": knowledge_id,
-            "title": knowledge.title,
-            "content": knowledge.content,
-            "tags": knowledge.tags,
-            "user_id": knowledge.user_id,
-            "source": knowledge.source,
-            "status": knowledge.status,
-            "github_path": knowledge.github_path,
-            "pr_url": knowledge.pr_url,
-            "promoted_from_id": knowledge.promoted_from_id,
-            "created_at": created_at.isoformat(),
-            "updated_at": updated_at.isoformat(),
-        }
+        request, saved = prepare_save(self._collection_path, knowledge)
 
-        request = vectorsearch_v1beta.CreateDataObjectRequest(
-            parent=self._collection_path,
-            data_object_id=knowledge_id,
-            data_object=vectorsearch_v1beta.DataObject(
-                data=data,
-                vectors={},  # Auto-Embeddings will generate vectors
-            ),
-        )
+        existing = self._stored_data(knowledge.id) if knowledge.id else None
+        if existing is not None:
+            update, saved = prepare_resave(self._collection_path, saved, existing)
+            self.data_object_client.update_data_object(request=update)
+        else:
+            self.data_object_client.create_data_object(request=request)
+        return self._written(saved)
 
-        self._data_object_client.create_data_object(request=request)
-
-        # Return updated knowledge
-        return Knowledge(
-            id=knowledge_id,
-            title=knowledge.title,
-            content=knowledge.content,
-            tags=knowledge.tags,
-            user_id=knowledge.user_id,
-            source=knowledge.source,
-            status=knowledge.status,
-            github_path=knowledge.github_path,
-            pr_url=knowledge.pr_url,
-            promoted_from_id=knowledge.promoted_from_id,
-            created_at=created_at,
-            updated_at=updated_at,
-        )
+    def save_many(self, knowledge_list: Sequence[Knowledge]) -> list[SaveResult]:
+        """Save many knowledge items with BatchCreateDataObjects.
+
+        Items are sent in chunks of BATCH_CREATE_SIZE. A chunk that fails
+        with a retryable error is retried with exponential backoff; a
+        chunk that fails terminally is split in half until the failing
+        items are isolated. Items missing from a successful response are
+        retried as well.
+
+        Items whose ID is already stored are re-saved like save() does,
+        with BatchUpdateDataObjects and the same chunking and retries, so
+        a resync of unchanged bodies does not re-embed anything.
+
+        Args:
+            knowledge_list: The knowledge items to save
+
+        Returns:
+            One SaveResult per input item, in input order
+        """
+        batch = BatchSave(self._collection_path, knowledge_list)
+        lookups = [
+            self.search_client.query_data_objects(request=request)
+            for request in batch.lookup_requests()
+        ]
+        for chunk in batch.plan(lookups):
+            self._send_chunk(batch, chunk)
+        return self._batch_written(batch)
+
+    def _send_chunk(self, batch: BatchSave, chunk: BatchChunk) -> None:
+        """Send a chunk, then the retries and halves it leads to."""
+        pending = [chunk]
+        while pending:
+            chunk = pending.pop()
+            if chunk.delay:
+                time.sleep(chunk.delay)
+            send = (
+                self.data_object_client.batch_update_data_objects
+                if chunk.update
+                else self.data_object_client.batch_create_data_objects
+            )
+            try:
+                response = send(request=batch.request(chunk))
+            except Exception as e:
+                follow = batch.failed(chunk, e)
+            else:
+                follow = batch.succeeded(chunk, response)
+            # Depth first, in order
+            pending.extend(reversed(follow))
+
+    def _stored_data(self, id: str):
+        """Return the data map of a stored object, or None if there is none."""
+        request = vectorsearch_v1beta.GetDataObjectRequest(name=self._object_name(id))
+        try:
+            return self.data_object_client.get_data_object(request=request).data
+        except api_exceptions.NotFound:
+            return None
 
     def search(
         self,
         query: str,
         *,
         limit: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
     ) -> SearchResult:
-        """Search knowledge using semantic search.
+        """Search knowledge using semantic, text or hybrid search.
+
+        Results are served from the search cache when an identical
+        (normalized) query with the same limit, fields, filters and mode
+        was answered recently.
+
+        Hybrid search runs the semantic and text searches concurrently,
+        both bounded by the hybrid deadline, and merges the rankings by
+        reciprocal rank fusion. If one branch fails or misses the
+        deadline, the other branch's ranking is returned alone.
 
         Args:
             query: Search query text
             limit: Maximum number of results (default: 20)
+            fields: Knowledge fields to fetch (default: all), pushed down
+                into OutputFields.data_fields
+            filters: Metadata constraints, pushed down as the search filter
+            mode: "semantic", "text" (keyword search over title and
+                content) or "hybrid"
+            cursor: next_cursor of a previous page of the same search;
+                the page is served from the stored ranking
 
         Returns:
-            SearchResult containing matching items
+            SearchResult containing matching items and the cursor of the
+            next page, if any
+
+        Raises:
+            ValueError: If mode is not a valid search mode
+            InvalidCursorError: If cursor is unknown, expired or was
+                issued for a different search
         """
-        request = vectorsearch_v1beta.SearchDataObjectsRequest(
-            parent=self._collection_path,
-            semantic_search=vectorsearch_v1beta.SemanticSearch(
-                search_text=query,
-                search_field="content_embedding",
-                task_type="QUESTION_ANSWERING",
-                top_k=limit,
-                output_fields=vectorsearch_v1beta.OutputFields(
-                    data_fields=[
-                        "id",
-                        "title",
-                        "content",
-                        "tags",
-                        "user_id",
-                        "source",
-                        "status",
-                        "github_path",
-                        "pr_url",
-                        "promoted_from_id",
-                        "created_at",
-                        "updated_at",
-                    ]
-                ),
-            ),
+        check_search_mode(mode)
+        key = search_key(query, fields=fields, filters=filters, mode=mode)
+        answered = self._answered_search(key, limit, cursor)
+        if answered is not None:
+            return answered
+        # A write landing while the backend is queried invalidates the
+        # result before it is stored; the generation check drops it
+        generation = self._search_cache.generation
+
+        # Fetch several pages at once; the rest is kept for the cursor
+        window = self._result_pages.window(limit)
+        if mode == "hybrid":
+            ranking = self._hybrid_search(
+                query, limit=window, fields=fields, filters=filters
+            )
+        else:
+            vector = self._query_vector(query) if mode == "semantic" else None
+            request = self._search_request(
+                query, vector, mode=mode, limit=window, fields=fields, filters=filters
+            )
+            response = self.search_client.search_data_objects(request=request)
+            ranking = search_result_from_response(response)
+
+        return self._first_page(key, ranking, limit, generation)
+
+    def _query_vector(self, query: str) -> list[float] | None:
+        # With a query embedder, send the (cached) query vector instead of
+        # having the service embed the search text again
+        if self.query_embedder is None:
+            return None
+        return self.query_embedder.embed(query)
+
+    def _hybrid_search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        fields: Sequence[str] | None,
+        filters: SearchFilter | None,
+    ) -> SearchResult:
+        # The text branch runs on the executor, the semantic branch on the
+        # calling thread; both RPCs carry the deadline as their timeout.
+        config = self.hybrid
+        started = time.monotonic()
+        candidates = config.candidates(limit)
+        text_request = self._search_request(
+            query, None, mode="text", limit=candidates, fields=fields, filters=filters
+        )
+        if self._hybrid_executor is None:
+            self._hybrid_executor = ThreadPoolExecutor(
+                thread_name_prefix="hybrid-search"
+            )
+        text_future = self._hybrid_executor.submit(
+            self.search_client.search_data_objects,
+            request=text_request,
+            timeout=config.deadline,
         )
 
-        response = self._search_client.search_data_objects(request=request)
-
-        items = []
-        for result in response.results:
-            data = result.data_object.data
-            items.append(
-                Knowledge(
-                    id=data.get("id", ""),
-                    title=data.get("title", ""),
-                    content=data.get("content", ""),
-                    tags=list(data.get("tags", [])),
-                    user_id=data.get("user_id", "anonymous"),
-                    source=data.get("source", "personal"),
-                    status=data.get("status", "draft"),
-                    github_path=data.get("github_path", ""),
-                    pr_url=data.get("pr_url", ""),
-                    promoted_from_id=data.get("promoted_from_id", ""),
-                    created_at=self._parse_datetime(data.get("created_at")),
-                    updated_at=self._parse_datetime(data.get("updated_at")),
-                    score=result.distance if hasattr(result, "distance") else None,
+        semantic = text = None
+        semantic_error = text_error = None
+        try:
+            semantic_request = self._search_request(
+                query,
+                self._query_vector(query),
+                mode="semantic",
+                limit=candidates,
+                fields=fields,
+                filters=filters,
+            )
+            semantic = search_result_from_response(
+                self.search_client.search_data_objects(
+                    request=semantic_request, timeout=config.deadline
                 )
             )
+        except Exception as e:
+            semantic_error = e
+
+        remaining = max(0.0, config.deadline - (time.monotonic() - started))
+        try:
+            text = search_result_from_response(text_future.result(timeout=remaining))
+        except FutureTimeoutError:
+            text_future.cancel()
+        except Exception as e:
+            text_error = e
+
+        if semantic is None and text is None:
+            raise hybrid_search_error(semantic_error, text_error)
+        return fuse_hybrid(semantic, text, config=config, limit=limit)
+
+    def iter_search(
+        self,
+        query: str,
+        *,
+        page_size: int = 20,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        mode: str = "semantic",
+    ) -> Iterator[Knowledge]:
+        """Stream search results, following the page cursors.
+
+        Each page is requested only after the previous one was consumed,
+        and later pages come from the ranking stored by the first, so a
+        caller that stops early leaves nothing buffered or recomputed.
+
+        Args:
+            query: Search query text
+            page_size: Items per page (default: 20)
+            fields: Knowledge fields to fetch (default: all)
+            filters: Metadata constraints, pushed down as the search filter
+            mode: "semantic", "text" or "hybrid"
+
+        Yields:
+            Matching knowledge, best first
+
+        Raises:
+            ValueError: If page_size is not positive
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        cursor = None
+        while True:
+            page = self.search(
+                query,
+                limit=page_size,
+                fields=fields,
+                filters=filters,
+                mode=mode,
+                cursor=cursor,
+            )
+            yield from page.items
+            cursor = page.next_cursor
+            if cursor is None:
+                return
 
-        return SearchResult(items=items, total=len(items))
+    def iter_all(
+        self,
+        *,
+        fields: Sequence[str] | None = None,
+        filters: SearchFilter | None = None,
+        page_size: int = 500,
+    ) -> Iterator[Knowledge]:
+        """Stream the stored knowledge matching filters, in collection order.
+
+        Args:
+            fields: Knowledge fields to fetch (default: all)
+            filters: Metadata constraints (default: the whole collection)
+            page_size: Objects per underlying query page (default: 500)
+
+        Yields:
+            Stored knowledge
+        """
+        request = build_scan_query(self._collection_path, fields, filters, page_size)
+        # The pager transparently follows next_page_token
+        for data_object in self.search_client.query_data_objects(request=request):
+            yield knowledge_from_data(data_object.data)
 
     def get(self, id: str) -> Knowledge | None:
         """Get knowledge by ID.
@@ -211,30 +1276,12 @@ class VectorSearchKnowledgeRepository:
         Returns:
             Knowledge if found, None otherwise
         """
+        request = vectorsearch_v1beta.GetDataObjectRequest(name=self._object_name(id))
         try:
-            request = vectorsearch_v1beta.GetDataObjectRequest(
-                name=f"{self._collection_path}/dataObjects/{id}"
-            )
-            response = self._data_object_client.get_data_object(request=request)
-            data = response.data
-
-            return Knowledge(
-                id=data.get("id", ""),
-                title=data.get("title", ""),
-                content=data.get("content", ""),
-                tags=list(data.get("tags", [])),
-                user_id=data.get("user_id", "anonymous"),
-                source=data.get("source", "personal"),
-                status=data.get("status", "draft"),
-                github_path=data.get("github_path", ""),
-                pr_url=data.get("pr_url", ""),
-                promoted_from_id=data.get("promoted_from_id", ""),
-                created_at=self._parse_datetime(data.get("created_at")),
-                updated_at=self._parse_datetime(data.get("updated_at")),
-            )
-        except Exception:
-            # Not found or other error
+            response = self.data_object_client.get_data_object(request=request)
+        except api_exceptions.NotFound:
             return None
+        return knowledge_from_data(response.data)
 
     def delete(self, id: str) -> bool:
         """Delete knowledge by ID.
@@ -245,107 +1292,114 @@ class VectorSearchKnowledgeRepository:
         Returns:
             True if deleted, False if not found
         """
+        request = vectorsearch_v1beta.DeleteDataObjectRequest(
+            name=self._object_name(id)
+        )
         try:
-            request = vectorsearch_v1beta.DeleteDataObjectRequest(
-                name=f"{self._collection_path}/dataObjects/{id}"
-            )
-            self._data_object_client.delete_data_object(request=request)
-            return True
-        except Exception:
-            # Not found or other error
+            self.data_object_client.delete_data_object(request=request)
+        except api_exceptions.NotFound:
             return False
 
+        self._deleted(id)
+        return True
+
     def find_by_github_path(self, path: str) -> Knowledge | None:
         """Find knowledge by GitHub file path.
 
+        Resolves the ID from the in-process index when possible, otherwise
+        runs an exact-match metadata query and indexes the result.
+
         Args:
             path: GitHub file path
 
         Returns:
             Knowledge if found, None otherwise
-
-        Note:
-            Skeleton implementation - returns None.
-            Full implementation in Phase 3.
         """
-        # Skeleton: return None (not implemented)
-        return None
+        if not path:
+            return None
+        return self._find_by("github_path", path, self._index.id_for_path(path))
 
     def find_by_pr_url(self, url: str) -> Knowledge | None:
         """Find knowledge by PR URL.
 
+        Resolves the ID from the in-process index when possible, otherwise
+        runs an exact-match metadata query and indexes the result.
+
         Args:
             url: Pull request URL
 
         Returns:
             Knowledge if found, None otherwise
-
-        Note:
-            Skeleton implementation - returns None.
-            Full implementation in Phase 3.
         """
-        # Skeleton: return None (not implemented)
-        return None
+        if not url:
+            return None
+        return self._find_by("pr_url", url, self._index.id_for_pr_url(url))
+
+    def _find_by(
+        self, field: str, value: str, indexed_id: str | None
+    ) -> Knowledge | None:
+        """Look up the knowledge whose field equals value."""
+        if indexed_id is not None:
+            hinted = self._hinted(field, value, indexed_id, self.get(indexed_id))
+            if hinted is not None:
+                return hinted
+
+        request = build_exact_match_query(self._collection_path, field, value)
+        return self._first_match(self.search_client.query_data_objects(request=request))
 
     def update_status(
-        self, id: str, status: str, *, pr_url: str = ""
+        self,
+        id: str,
+        status: str,
+        *,
+        pr_url: str = "",
+        expected_status: str | None = None,
     ) -> Knowledge | None:
         """Update knowledge status.
 
+        Without expected_status this is a single masked UpdateDataObject
+        call and the returned Knowledge is decoded from its response.
+        Vector Search has no conditional update on data fields, so with
+        expected_status it takes two calls: the current object is read
+        first and the update is sent with its etag, so a concurrent
+        change makes the update fail instead of silently overwriting it.
+
         Args:
             id: Knowledge identifier
             status: New status ("draft", "proposed", "promoted")
             pr_url: PR URL (optional, for proposed status)
+            expected_status: If set, only update when the current status
+                equals this value
 
         Returns:
             Updated knowledge if found, None otherwise
-        """
-        # Get existing knowledge
-        knowledge = self.get(id)
-        if knowledge is None:
-            return None
 
-        now = datetime.now(UTC)
-
-        # Build update data (only fields that change)
-        update_data = {
-            "status": status,
-            "updated_at": now.isoformat(),
-        }
-        if pr_url:
-            update_data["pr_url"] = pr_url
-
-        # Use update API to safely update in place
-        request = vectorsearch_v1beta.UpdateDataObjectRequest(
-            data_object=vectorsearch_v1beta.DataObject(
-                name=f"{self._collection_path}/dataObjects/{id}",
-                data=update_data,
-            ),
-        )
+        Raises:
+            StatusConflictError: If the current status is not
+                expected_status, or the object changed before the update
+        """
+        etag = ""
+        if expected_status is not None:
+            try:
+                current = self.data_object_client.get_data_object(
+                    request=vectorsearch_v1beta.GetDataObjectRequest(
+                        name=self._object_name(id)
+                    )
+                )
+            except api_exceptions.NotFound:
+                return None
+            etag = status_update_etag(id, current, expected_status)
 
-        self._data_object_client.update_data_object(request=request)
-
-        # Return updated knowledge object
-        return Knowledge(
-            id=knowledge.id,
-            title=knowledge.title,
-            content=knowledge.content,
-            tags=knowledge.tags,
-            user_id=knowledge.user_id,
-            source=knowledge.source,
-            status=status,
-            github_path=knowledge.github_path,
-            pr_url=pr_url if pr_url else knowledge.pr_url,
-            promoted_from_id=knowledge.promoted_from_id,
-            created_at=knowledge.created_at,
-            updated_at=now,
+        request = build_status_update_request(
+            self._collection_path, id, status, pr_url=pr_url, etag=etag
         )
-
-    def _parse_datetime(self, value: str | None) -> datetime | None:
-        """Parse ISO 8601 datetime string."""
-        if not value:
-            return None
         try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+            response = self.data_object_client.update_data_object(request=request)
+        except api_exceptions.NotFound:
             return None
+        except (api_exceptions.FailedPrecondition, api_exceptions.Aborted):
+            if etag:
+                raise StatusConflictError(id) from None
+            raise
+
+        return self._written(knowledge_from_data_object(id, response))
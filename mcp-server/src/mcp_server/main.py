@@ -1,19 +1,78 @@
 """Knowledge sharing MCP server for Claude Code."""
 
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
-from .infrastructure.vector_search import VectorSearchKnowledgeRepository
+from .infrastructure.archive_repository import (
+    AsyncVectorSearchArchivedKnowledgeRepository,
+)
+from .infrastructure.async_vector_search import AsyncVectorSearchKnowledgeRepository
+from .infrastructure.channel_pool import AsyncChannelPool
+from .infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerKnowledgeRepository,
+)
+from .infrastructure.coalescing_repository import CoalescingKnowledgeRepository
+from .infrastructure.instrumented_repository import InstrumentedKnowledgeRepository
+from .infrastructure.near_duplicates import NearDuplicateIndex
+from .infrastructure.query_embedding import QueryEmbedder
+from .infrastructure.rank_fusion import HybridSearchConfig
+from .infrastructure.resilience import ResilientKnowledgeRepository, RetryPolicy
+from .infrastructure.result_pages import ResultPages
+from .metrics import METRICS_CONTENT_TYPE, Metrics
+from .middleware import ToolMetricsMiddleware
+from .promotion import PromotionOrchestrator
+from .promotion import register as register_promotions
+from .startup import boot_timer
+from .sync import register as register_sync
 from .tools.delete_knowledge import register as register_delete_knowledge
 from .tools.promote_knowledge import register as register_promote_knowledge
 from .tools.save_knowledge import register as register_save_knowledge
+from .tools.save_knowledge_batch import register as register_save_knowledge_batch
 from .tools.search_knowledge import register as register_search_knowledge
 
+boot_timer.mark("imports")
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_duplicate_index() -> None:
+    """Index the whole collection for near-duplicate detection."""
+    try:
+        count = await duplicate_index.arebuild(
+            repository.iter_all(fields=["title", "content"])
+        )
+    except Exception:
+        logger.exception("near-duplicate index rebuild failed")
+    else:
+        logger.info("near-duplicate index rebuilt with %d items", count)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Rebuild the near-duplicate index in the background while serving."""
+    task = (
+        asyncio.create_task(rebuild_duplicate_index())
+        if duplicate_index is not None
+        else None
+    )
+    try:
+        yield
+    finally:
+        if task is not None:
+            task.cancel()
+
+
 # Stateless mode for Cloud Run horizontal scaling
-mcp = FastMCP("KnowledgeGateway", stateless_http=True)
+mcp = FastMCP("KnowledgeGateway", stateless_http=True, lifespan=lifespan)
+metrics = Metrics()
+mcp.add_middleware(ToolMetricsMiddleware(metrics))
 
 
 @mcp.custom_route("/health", methods=["GET"])
@@ -22,16 +81,68 @@ async def health_check(request: Request) -> JSONResponse:
     return JSONResponse({"status": "healthy"})
 
 
-# Initialize repository with DI
-repository = VectorSearchKnowledgeRepository()
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus scrape endpoint."""
+    return Response(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+# Initialize repository with DI (gRPC channels are opened on first use)
+channel_pool = AsyncChannelPool.from_env()
+# Opt-in: embed queries client-side (cached) and search by vector
+query_embedder = (
+    QueryEmbedder.from_env()
+    if os.environ.get("QUERY_EMBEDDING_ENABLED", "").lower() in ("1", "true")
+    else None
+)
+# Retries and hedges wrap the instrumented repository so that metrics
+# record every attempt
+repository = ResilientKnowledgeRepository(
+    InstrumentedKnowledgeRepository(
+        AsyncVectorSearchKnowledgeRepository(
+            channel_pool=channel_pool,
+            hybrid=HybridSearchConfig.from_env(),
+            result_pages=ResultPages.from_env(),
+            query_embedder=query_embedder,
+        ),
+        metrics,
+    ),
+    RetryPolicy.from_env(),
+    metrics,
+)
+# Fail fast (and search from recent results) while the backend is down
+repository = CircuitBreakerKnowledgeRepository(
+    repository, CircuitBreaker.from_env(), metrics=metrics
+)
+# Opt-out: share identical concurrent searches and gets
+if os.environ.get("REQUEST_COALESCING", "true").lower() in ("1", "true"):
+    repository = CoalescingKnowledgeRepository(repository, metrics)
+# Opt-out: skip saving near-duplicates of stored knowledge
+duplicate_index = (
+    NearDuplicateIndex.from_env()
+    if os.environ.get("NEAR_DUPLICATE_DETECTION", "true").lower() in ("1", "true")
+    else None
+)
+promotions = PromotionOrchestrator(
+    repository,
+    AsyncVectorSearchArchivedKnowledgeRepository(channel_pool=channel_pool),
+    duplicates=duplicate_index,
+)
+boot_timer.mark("repository")
 
 # Register MCP tools with repository
-register_save_knowledge(mcp, repository)
+register_save_knowledge(mcp, repository, duplicate_index)
+register_save_knowledge_batch(mcp, repository, duplicate_index)
 register_search_knowledge(mcp, repository)
-register_delete_knowledge(mcp, repository)
+register_delete_knowledge(mcp, repository, duplicate_index)
 register_promote_knowledge(mcp, repository)
+register_sync(mcp, repository, duplicate_index)
+register_promotions(mcp, promotions)
+boot_timer.mark("tools")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    boot_timer.log()
     port = int(os.environ.get("PORT", 8080))
     mcp.run(transport="http", host="0.0.0.0", port=port)
@@ -0,0 +1,145 @@
+"""Prometheus metrics for the MCP server."""
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+# Content type of render()
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+RESULT_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500, 1000, 10_000)
+PAYLOAD_BYTES_BUCKETS = (256, 1024, 4096, 16_384, 65_536, 262_144, 1_048_576, 4_194_304)
+
+
+class Metrics:
+    """Metric families of the server, kept in their own registry.
+
+    Attributes:
+        registry: Registry holding every metric below
+    """
+
+    def __init__(self, registry: CollectorRegistry | None = None):
+        """Create the metrics.
+
+        Args:
+            registry: Registry to register into (defaults to a new one)
+        """
+        self.registry = registry if registry is not None else CollectorRegistry()
+
+        self.tool_duration = Histogram(
+            "mcp_tool_duration_seconds",
+            "MCP tool call latency.",
+            ["tool", "outcome"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.tool_in_flight = Gauge(
+            "mcp_tool_in_flight",
+            "MCP tool calls currently running.",
+            ["tool"],
+            registry=self.registry,
+        )
+        self.repository_duration = Histogram(
+            "knowledge_repository_duration_seconds",
+            "Knowledge repository call latency.",
+            ["method"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.repository_errors = Counter(
+            "knowledge_repository_errors_total",
+            "Knowledge repository calls that raised, by gRPC status code.",
+            ["method", "code"],
+            registry=self.registry,
+        )
+        self.repository_in_flight = Gauge(
+            "knowledge_repository_in_flight",
+            "Knowledge repository calls currently running.",
+            ["method"],
+            registry=self.registry,
+        )
+        self.repository_results = Histogram(
+            "knowledge_repository_results",
+            "Knowledge items returned or written per repository call.",
+            ["method"],
+            buckets=RESULT_COUNT_BUCKETS,
+            registry=self.registry,
+        )
+        self.repository_payload_bytes = Histogram(
+            "knowledge_repository_payload_bytes",
+            "UTF-8 size of titles and contents sent or received per call.",
+            ["method"],
+            buckets=PAYLOAD_BYTES_BUCKETS,
+            registry=self.registry,
+        )
+        self.repository_retries = Counter(
+            "knowledge_repository_retries_total",
+            "Repository calls sent again after a transient error.",
+            ["method"],
+            registry=self.registry,
+        )
+        self.repository_hedges = Counter(
+            "knowledge_repository_hedges_total",
+            "Repository reads that got a second (hedged) request.",
+            ["method"],
+            registry=self.registry,
+        )
+        self.repository_circuit_state = Gauge(
+            "knowledge_repository_circuit_state",
+            "Repository circuit breaker state (0 closed, 1 half-open, 2 open).",
+            registry=self.registry,
+        )
+        self.repository_rejected = Counter(
+            "knowledge_repository_rejected_total",
+            "Repository calls rejected at once because the circuit was open.",
+            ["method"],
+            registry=self.registry,
+        )
+        self.repository_stale_results = Counter(
+            "knowledge_repository_stale_results_total",
+            "Searches answered with recent (stale) results.",
+            registry=self.registry,
+        )
+        self.repository_flights = Counter(
+            "knowledge_repository_flights_total",
+            "Coalescable repository reads sent to the backend.",
+            ["method"],
+            registry=self.registry,
+        )
+        self.repository_coalesced = Counter(
+            "knowledge_repository_coalesced_total",
+            "Repository reads answered by an identical read already in flight.",
+            ["method"],
+            registry=self.registry,
+        )
+
+    def render(self) -> bytes:
+        """Return all metrics in the Prometheus text exposition format."""
+        return generate_latest(self.registry)
+
+
+def error_code(error: BaseException) -> str:
+    """Return the gRPC status name of an error, or its class name."""
+    code = getattr(error, "grpc_status_code", None)
+    if code is not None:
+        return code.name
+    return type(error).__name__
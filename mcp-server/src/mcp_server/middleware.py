@@ -0,0 +1,41 @@
+"""FastMCP middleware for the MCP server."""
+
+import time
+
+from fastmcp.exceptions import NotFoundError
+from fastmcp.server.middleware import Middleware
+
+from .metrics import Metrics
+
+
+class ToolMetricsMiddleware(Middleware):
+    """FastMCP middleware recording latency and concurrency per tool."""
+
+    def __init__(self, metrics: Metrics):
+        """Initialize the middleware.
+
+        Args:
+            metrics: Metrics to record into
+        """
+        self._metrics = metrics
+
+    async def on_call_tool(self, context, call_next):
+        """Time the tool call."""
+        tool = context.message.name
+        in_flight = self._metrics.tool_in_flight.labels(tool)
+        outcome = "error"
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            result = await call_next(context)
+            outcome = "ok"
+            return result
+        except NotFoundError:
+            # Do not keep a label per unknown tool name sent by clients
+            self._metrics.tool_in_flight.remove(tool)
+            tool = "unknown"
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            in_flight.dec()
+            self._metrics.tool_duration.labels(tool, outcome).observe(elapsed)
@@ -0,0 +1,461 @@
+"""Completion of promotions: personal knowledge becomes team knowledge.
+
+Once the promotion PR is merged, three writes complete a promotion: the
+team knowledge is created, the personal original is archived (with
+promoted_to_id pointing at the team knowledge) and the original is deleted.
+The team ID is derived from the original ID, so the two copies do not
+wait for each other: after one lookup round (the original and any team
+knowledge already synced at the GitHub path, fetched together) both are
+written at once. The original is deleted only after both copies exist.
+
+If a write fails, the ones that succeeded are undone (compensation), so
+a failed promotion leaves the original in place and can simply be
+retried. A copy is never removed while the original may be missing.
+promote_many runs the same rounds for many IDs at once, writing the team
+knowledge with one save_many call, so a bulk promotion takes about as
+long as a single one.
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, TypeVar
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from .domain.models import ArchivedKnowledge, Knowledge
+from .domain.repositories import (
+    AsyncArchivedKnowledgeRepository,
+    AsyncKnowledgeRepository,
+)
+from .sync import NOT_CONFIGURED, authorized
+
+if TYPE_CHECKING:
+    from .infrastructure.near_duplicates import NearDuplicateIndex
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Namespace of team knowledge IDs derived from the original ID
+TEAM_ID_NAMESPACE = uuid.UUID("4f2c8e0a-52d1-4c7e-9a3b-6d0f1e2a7b91")
+
+# Promotions accepted by one POST /promotions request
+MAX_PROMOTIONS = 500
+
+# Per-item RPCs (lookups, archive writes, deletes) in flight at once
+PROMOTION_CONCURRENCY = 16
+
+
+def team_id_for(original_id: str) -> str:
+    """ID of the team knowledge promoted from original_id.
+
+    Deterministic, so a retried promotion writes the same team knowledge
+    instead of creating a second copy.
+    """
+    return str(uuid.uuid5(TEAM_ID_NAMESPACE, original_id))
+
+
+@dataclass(frozen=True)
+class PromotionRequest:
+    """A merged promotion to complete.
+
+    Attributes:
+        id: ID of the proposed personal knowledge
+        github_path: Path of the merged file in the GitHub repository
+    """
+
+    id: str
+    github_path: str
+
+
+@dataclass
+class PromotionResult:
+    """Outcome of one promotion in a promote_many call.
+
+    Attributes:
+        id: ID of the personal knowledge
+        team: The saved team knowledge (None on failure)
+        error: Error message ("" on success)
+    """
+
+    id: str
+    team: Knowledge | None = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the promotion completed."""
+        return not self.error
+
+
+@dataclass
+class _Plan:
+    """The writes of one promotion and what to restore if they fail."""
+
+    original: Knowledge
+    team: Knowledge
+    archived: ArchivedKnowledge
+    # Team knowledge already stored at the GitHub path, if any
+    previous_team: Knowledge | None = None
+
+
+def plan_promotion(
+    original: Knowledge, github_path: str, existing_team: Knowledge | None = None
+) -> _Plan:
+    """Build the writes that promote original to github_path.
+
+    Args:
+        original: The stored personal knowledge
+        github_path: Path of the merged file
+        existing_team: Team knowledge already synced at github_path
+
+    Returns:
+        The promotion plan
+
+    Raises:
+        ValueError: If original is not proposed, or github_path belongs
+            to knowledge promoted from another item
+    """
+    if original.source != "personal" or original.status != "proposed":
+        raise ValueError("only proposed knowledge can be promoted")
+
+    if existing_team is not None:
+        if existing_team.promoted_from_id not in ("", original.id):
+            raise ValueError(
+                f"{github_path} is already promoted from "
+                f"{existing_team.promoted_from_id}"
+            )
+        # The sync got there first; its content mirrors the merged file
+        team = replace(existing_team, promoted_from_id=original.id)
+    else:
+        team = Knowledge(
+            id=team_id_for(original.id),
+            title=original.title,
+            content=original.content,
+            tags=list(original.tags),
+            user_id=original.user_id,
+            source="team",
+            status="promoted",
+            github_path=github_path,
+            promoted_from_id=original.id,
+        )
+
+    archived = ArchivedKnowledge(
+        id=original.id,
+        title=original.title,
+        content=original.content,
+        tags=list(original.tags),
+        user_id=original.user_id,
+        promoted_to_id=team.id,
+        original_created_at=original.created_at,
+    )
+    return _Plan(original, team, archived, existing_team)
+
+
+class PromotionOrchestrator:
+    """Completes promotions with concurrent writes and compensation."""
+
+    def __init__(
+        self,
+        repository: AsyncKnowledgeRepository,
+        archive: AsyncArchivedKnowledgeRepository,
+        *,
+        duplicates: "NearDuplicateIndex | None" = None,
+        concurrency: int = PROMOTION_CONCURRENCY,
+    ):
+        """Initialize the orchestrator.
+
+        Args:
+            repository: Knowledge repository
+            archive: Archived knowledge repository
+            duplicates: Near-duplicate index to keep in sync (optional)
+            concurrency: Per-item RPCs in flight at once
+        """
+        self._repository = repository
+        self._archive = archive
+        self._duplicates = duplicates
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def promote(self, id: str, github_path: str) -> Knowledge:
+        """Complete one promotion.
+
+        Args:
+            id: ID of the proposed personal knowledge
+            github_path: Path of the merged file
+
+        Returns:
+            The saved team knowledge
+
+        Raises:
+            ValueError: If the promotion is invalid or failed (any partial
+                writes have been undone)
+        """
+        (result,) = await self.promote_many([PromotionRequest(id, github_path)])
+        if not result.ok:
+            raise ValueError(result.error)
+        return result.team
+
+    async def promote_many(
+        self, requests: Sequence[PromotionRequest]
+    ) -> list[PromotionResult]:
+        """Complete many promotions in rounds of concurrent RPCs.
+
+        Lookups, then the team and archive writes, then the deletes of
+        the originals whose copies were both written.
+
+        Args:
+            requests: Promotions to complete (IDs must be unique)
+
+        Returns:
+            One PromotionResult per request, in request order
+        """
+        results = [PromotionResult(request.id) for request in requests]
+        plans = await self._plan(requests, results)
+
+        pending = [i for i, plan in enumerate(plans) if plan is not None]
+        if not pending:
+            return results
+        planned = [plans[i] for i in pending]
+        # The copies first: the original is deleted only once both exist
+        team_results, archive_results = await asyncio.gather(
+            self._save_teams([plan.team for plan in planned]),
+            self._each(self._archive.save, [plan.archived for plan in planned]),
+        )
+
+        compensations, copied = [], []
+        for i, plan, team, archived in zip(
+            pending, planned, team_results, archive_results, strict=True
+        ):
+            errors = [
+                f"{step}: {outcome}"
+                for step, outcome in (("team", team), ("archive", archived))
+                if isinstance(outcome, BaseException)
+            ]
+            if not errors:
+                copied.append((i, plan, team))
+                continue
+            results[i].error = "; ".join(errors)
+            compensations.append(
+                self._compensate(
+                    results[i],
+                    plan,
+                    team_saved=not isinstance(team, BaseException),
+                    archived=not isinstance(archived, BaseException),
+                )
+            )
+
+        # A delete reporting "not found" for an item just read is taken as
+        # done: the response of an earlier attempt may have been lost
+        delete_results = await self._each(
+            self._repository.delete, [plan.original.id for _, plan, _ in copied]
+        )
+        for (i, plan, team), deleted in zip(copied, delete_results, strict=True):
+            if isinstance(deleted, BaseException):
+                results[i].error = f"delete: {deleted}"
+                compensations.append(
+                    self._compensate(
+                        results[i],
+                        plan,
+                        team_saved=True,
+                        archived=True,
+                        delete_attempted=True,
+                    )
+                )
+                continue
+            results[i].team = team
+            if self._duplicates is not None:
+                self._duplicates.remove(plan.original.id)
+                self._duplicates.add(team)
+        await asyncio.gather(*compensations)
+        return results
+
+    async def _plan(
+        self, requests: Sequence[PromotionRequest], results: list[PromotionResult]
+    ) -> list[_Plan | None]:
+        """Look up the originals and team knowledge, and plan the writes.
+
+        Requests that cannot be promoted get their error set in results.
+        """
+        originals, existing_teams = await asyncio.gather(
+            self._each(self._repository.get, [r.id for r in requests]),
+            self._each(
+                self._repository.find_by_github_path,
+                [r.github_path for r in requests],
+            ),
+        )
+        plans: list[_Plan | None] = []
+        for request, result, original, existing in zip(
+            requests, results, originals, existing_teams, strict=True
+        ):
+            try:
+                if isinstance(original, BaseException):
+                    raise ValueError(f"lookup failed: {original}")
+                if isinstance(existing, BaseException):
+                    raise ValueError(f"lookup failed: {existing}")
+                if original is None:
+                    raise ValueError("knowledge not found")
+                plans.append(plan_promotion(original, request.github_path, existing))
+            except ValueError as e:
+                result.error = str(e)
+                plans.append(None)
+        return plans
+
+    async def _save_teams(self, teams: list[Knowledge]) -> list[object]:
+        """Save the team knowledge in one batch.
+
+        Returns:
+            Per item, the saved Knowledge or the exception it failed with
+        """
+        try:
+            saved = await self._repository.save_many(teams)
+        except Exception as e:
+            return [e] * len(teams)
+        return [
+            result.knowledge if result.ok else RuntimeError(result.error)
+            for result in saved
+        ]
+
+    async def _each(
+        self, call: Callable[[T], Awaitable[R]], items: Sequence[T]
+    ) -> list[R | BaseException]:
+        """Run call on every item concurrently, collecting exceptions."""
+
+        async def run(item: T) -> R:
+            async with self._semaphore:
+                return await call(item)
+
+        return await asyncio.gather(
+            *(run(item) for item in items), return_exceptions=True
+        )
+
+    async def _compensate(
+        self,
+        result: PromotionResult,
+        plan: _Plan,
+        *,
+        team_saved: bool,
+        archived: bool,
+        delete_attempted: bool = False,
+    ) -> None:
+        """Undo the writes of a failed promotion that did succeed.
+
+        If the delete of the original was attempted, it may have gone
+        through, so the original is restored first; the archive and team
+        copies are removed only once it is back. If it cannot be
+        restored, they are kept and the result is marked for manual
+        repair. Undo steps that fail are added to result.error.
+        """
+        if delete_attempted:
+            try:
+                await self._repository.save(plan.original)
+            except Exception as e:
+                logger.error(
+                    "could not restore %s after a failed promotion; "
+                    "kept its archive and team copies: %s",
+                    plan.original.id,
+                    e,
+                )
+                result.error += (
+                    f"; needs manual repair: original not restored ({e}), "
+                    f"archive and team copy {plan.team.id} kept"
+                )
+                return
+
+        undo, steps = [], []
+        if team_saved:
+            undo.append(
+                self._repository.save(plan.previous_team)
+                if plan.previous_team is not None
+                else self._repository.delete(plan.team.id)
+            )
+            steps.append("team")
+        if archived:
+            undo.append(self._archive.delete(plan.archived.id))
+            steps.append("archive")
+
+        outcomes = await asyncio.gather(*undo, return_exceptions=True)
+        for step, outcome in zip(steps, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "could not undo the %s write of the promotion of %s: %s",
+                    step,
+                    plan.original.id,
+                    outcome,
+                )
+                result.error += f"; {step} write not undone: {outcome}"
+
+
+def parse_promotions(body) -> list[PromotionRequest]:
+    """Validate a POST /promotions body.
+
+    Raises:
+        ValueError: If the body is malformed
+    """
+    entries = body.get("promotions") if isinstance(body, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError("promotions is required")
+    if len(entries) > MAX_PROMOTIONS:
+        raise ValueError(f"at most {MAX_PROMOTIONS} promotions per request")
+
+    requests, seen = [], set()
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"promotions[{index}] must be an object")
+        id, github_path = entry.get("id"), entry.get("github_path")
+        if not isinstance(id, str) or not id:
+            raise ValueError(f"promotions[{index}].id is required")
+        if not isinstance(github_path, str) or not github_path:
+            raise ValueError(f"promotions[{index}].github_path is required")
+        if id in seen:
+            raise ValueError(f"duplicate id: {id}")
+        seen.add(id)
+        requests.append(PromotionRequest(id, github_path))
+    return requests
+
+
+def register(mcp, orchestrator: PromotionOrchestrator):
+    """Register the POST /promotions route to the MCP server.
+
+    The body is {"promotions": [{"id": ..., "github_path": ...}, ...]},
+    posted by the GitHub Actions workflow when promotion PRs are merged.
+    Requests must carry "Authorization: Bearer <SYNC_TOKEN>"; while the
+    SYNC_TOKEN environment variable is unset, the route answers 503.
+
+    Args:
+        mcp: The MCP server instance
+        orchestrator: Orchestrator completing the promotions
+    """
+    token = os.environ.get("SYNC_TOKEN")
+
+    @mcp.custom_route("/promotions", methods=["POST"])
+    async def promotions(request: Request) -> JSONResponse:
+        """Complete merged promotions."""
+        if not token:
+            return JSONResponse(NOT_CONFIGURED, status_code=503)
+        if not authorized(request, token):
+            return JSONResponse({"error": "unauthorized"}, status_code=401)
+        try:
+            requests = parse_promotions(await request.json())
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+
+        results = await orchestrator.promote_many(requests)
+        promoted = sum(result.ok for result in results)
+        return JSONResponse(
+            {
+                "promoted": promoted,
+                "failed": len(results) - promoted,
+                "results": [
+                    {"id": r.id, "team_id": r.team.id}
+                    if r.ok
+                    else {"id": r.id, "error": r.error}
+                    for r in results
+                ],
+            }
+        )
@@ -0,0 +1,49 @@
+"""Startup-time breakdown for diagnosing cold starts."""
+
+import logging
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Records how long each startup phase took.
+
+    Each call to mark() closes the phase that began at the previous mark
+    (or at construction).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """Initialize the timer and start the first phase.
+
+        Args:
+            clock: Monotonic clock returning seconds
+        """
+        self._clock = clock
+        self._started = clock()
+        self._last = self._started
+        self.phases: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        """Close the current phase under the given name."""
+        now = self._clock()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        """Seconds from construction to the last mark."""
+        return self._last - self._started
+
+    def log(self) -> None:
+        """Log the breakdown as a single INFO line."""
+        breakdown = " ".join(
+            f"{phase}={seconds * 1000:.0f}ms" for phase, seconds in self.phases
+        )
+        logger.info("startup %s total=%.0fms", breakdown, self.total * 1000)
+
+
+# Started when the package is first imported, so the first phase covers
+# the server's module imports
+boot_timer = StartupTimer()
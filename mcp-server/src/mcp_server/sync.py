@@ -0,0 +1,564 @@
+"""POST /sync: incremental sync of team knowledge from the GitHub docs tree.
+
+The GitHub Actions workflow posts a manifest of every Markdown file under
+the synced directory with a hash of its content. The stored hashes of
+team knowledge are fetched in one collection scan, and only files whose
+hash changed are written (through the batch save path); stored files
+missing from the manifest are deleted. An empty manifest would delete
+every file under the prefix, so it is rejected unless the request sets
+allow_delete_all.
+
+Manifests are processed as an async pipeline (records -> Markdown and
+frontmatter -> validation -> diff -> batched writes). With an
+application/x-ndjson body, records are parsed as they arrive and writes
+start before the upload finishes; the bounded write queue pauses reading
+while the writer is behind, so memory stays flat for any payload size.
+"""
+
+import asyncio
+import hmac
+import json
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass, field, replace
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from .domain.models import Knowledge, SearchFilter
+from .domain.repositories import AsyncKnowledgeRepository
+
+if TYPE_CHECKING:
+    from .infrastructure.near_duplicates import NearDuplicateIndex
+
+# user_id of knowledge written by the sync
+SYNC_USER_ID = "system:github"
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# Knowledge items per save_many call
+WRITE_BATCH_SIZE = 100
+
+# Batches parsed ahead of the writer before reading pauses
+WRITE_QUEUE_BATCHES = 2
+
+# Deletes of removed files in flight at once
+DELETE_CONCURRENCY = 8
+
+# Largest accepted NDJSON record (one file with its content)
+MAX_RECORD_BYTES = 4 * 1024 * 1024
+
+# Body of the 503 answered while SYNC_TOKEN is unset
+NOT_CONFIGURED = {"error": "SYNC_TOKEN is not configured"}
+
+# Fields fetched by the stored-hash lookup
+_LOOKUP_FIELDS = ["github_path", "source_hash", "promoted_from_id"]
+
+
+@dataclass(frozen=True)
+class SyncFile:
+    """One manifest entry.
+
+    Attributes:
+        github_path: Path of the file in the repository
+        content_hash: Hash of the file content (any stable digest, e.g.
+            the git blob SHA); compared verbatim with the stored hash
+        content: File content. May be omitted for files the client
+            expects to be unchanged; changed files without it are
+            reported back in needs_content.
+        title: Title (default: frontmatter title, first Markdown heading
+            or file name)
+        tags: Tags of the knowledge (default: frontmatter tags)
+    """
+
+    github_path: str
+    content_hash: str
+    content: str | None = None
+    title: str | None = None
+    tags: tuple[str, ...] = ()
+
+
+@dataclass
+class _Progress:
+    """Counters of one sync run."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    invalid: int = 0
+    received: int = 0
+    needs_content: list[str] = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+
+
+def parse_entry(entry, index: int, prefix: str) -> SyncFile:
+    """Validate one manifest entry.
+
+    Args:
+        entry: Decoded JSON object of the entry
+        index: Position of the entry, for error messages
+        prefix: Path prefix the manifest covers
+
+    Returns:
+        The entry as a SyncFile
+
+    Raises:
+        ValueError: If the entry is invalid
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"files[{index}] must be an object")
+    path = entry.get("github_path")
+    content_hash = entry.get("content_hash")
+    content = entry.get("content")
+    if not path or not isinstance(path, str):
+        raise ValueError(f"files[{index}].github_path is required")
+    if not content_hash or not isinstance(content_hash, str):
+        raise ValueError(f"files[{index}].content_hash is required")
+    if content is not None and not isinstance(content, str):
+        raise ValueError(f"files[{index}].content must be a string")
+    title = entry.get("title")
+    if title is not None and not isinstance(title, str):
+        raise ValueError(f"files[{index}].title must be a string")
+    tags = entry.get("tags")
+    if tags is not None and not (
+        isinstance(tags, list) and all(isinstance(tag, str) for tag in tags)
+    ):
+        raise ValueError(f"files[{index}].tags must be a list of strings")
+    if not path.startswith(prefix):
+        raise ValueError(f"files[{index}].github_path is outside prefix")
+    return SyncFile(
+        github_path=path,
+        content_hash=content_hash,
+        content=content,
+        title=title,
+        tags=tuple(tags or ()),
+    )
+
+
+def parse_manifest(body) -> tuple[list[SyncFile], str]:
+    """Validate a JSON /sync request body.
+
+    Args:
+        body: Decoded JSON body: {"files": [...], "prefix": "docs/"}
+
+    Returns:
+        Tuple of (manifest entries, path prefix the manifest covers)
+
+    Raises:
+        ValueError: If the body is not a valid manifest
+    """
+    if not isinstance(body, dict) or not isinstance(body.get("files"), list):
+        raise ValueError("files is required")
+    prefix = body.get("prefix") or ""
+    if not isinstance(prefix, str):
+        raise ValueError("prefix must be a string")
+
+    files = [
+        parse_entry(entry, index, prefix) for index, entry in enumerate(body["files"])
+    ]
+    paths = set()
+    for file in files:
+        if file.github_path in paths:
+            raise ValueError(f"duplicate github_path: {file.github_path}")
+        paths.add(file.github_path)
+    return files, prefix
+
+
+async def ndjson_records(
+    chunks: AsyncIterable[bytes], *, max_record_bytes: int = MAX_RECORD_BYTES
+) -> AsyncIterator[tuple[int, object]]:
+    """Split a byte stream into NDJSON records as chunks arrive.
+
+    Blank lines are skipped. A line that is not valid JSON or is longer
+    than max_record_bytes is yielded as its ValueError so one bad record
+    does not abort the stream (the rest of an overlong line is discarded
+    without being buffered).
+
+    Args:
+        chunks: Body chunks, e.g. Request.stream()
+        max_record_bytes: Longest accepted line
+
+    Yields:
+        (line number, decoded record or ValueError) pairs
+    """
+    buffer = bytearray()
+    line_number = 0
+    skipping = False
+
+    def decode(line: bytes):
+        if len(line) > max_record_bytes:
+            return too_long()
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            return ValueError(f"line {line_number}: {e}")
+
+    def too_long() -> ValueError:
+        return ValueError(f"line {line_number} exceeds {max_record_bytes} bytes")
+
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            if skipping:
+                skipping = False
+                start = end + 1
+                continue
+            line_number += 1
+            line = bytes(buffer[start:end]).strip()
+            start = end + 1
+            if line:
+                yield line_number, decode(line)
+        del buffer[:start]
+        if skipping:
+            buffer.clear()
+        elif len(buffer) > max_record_bytes:
+            line_number += 1
+            yield line_number, too_long()
+            buffer.clear()
+            skipping = True
+    line = bytes(buffer).strip()
+    if line and not skipping:
+        line_number += 1
+        yield line_number, decode(line)
+
+
+def split_frontmatter(content: str) -> tuple[dict[str, str | list[str]], str]:
+    """Split YAML-style frontmatter off a Markdown document.
+
+    Only flat "key: value" pairs are read; values may be inline lists
+    ("[a, b]") or block lists ("- a" lines). Anything else is ignored.
+
+    Args:
+        content: Markdown text, optionally starting with a "---" block
+
+    Returns:
+        Tuple of (frontmatter fields, body without the frontmatter)
+    """
+    if not content.startswith("---\n"):
+        return {}, content
+    end = content.find("\n---", 3)
+    if end == -1 or content[end + 4 : end + 5] not in ("", "\n"):
+        return {}, content
+
+    fields: dict[str, str | list[str]] = {}
+    key = None
+    for line in content[4:end].splitlines():
+        stripped = line.strip()
+        if stripped.startswith("- ") and key is not None:
+            values = fields.setdefault(key, [])
+            if isinstance(values, list):
+                values.append(_unquote(stripped[2:]))
+            continue
+        name, sep, value = line.partition(":")
+        if not sep or line[:1].isspace():
+            continue
+        key, value = name.strip(), value.strip()
+        if value.startswith("[") and value.endswith("]"):
+            fields[key] = [_unquote(v) for v in value[1:-1].split(",") if v.strip()]
+        elif value:
+            fields[key] = _unquote(value)
+    return fields, content[end + 4 :].lstrip("\n")
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def parse_markdown(file: SyncFile) -> SyncFile:
+    """Apply a file's frontmatter and resolve its title.
+
+    Frontmatter "title" and "tags" are used unless the manifest entry
+    sets them; the frontmatter is removed from the stored content. The
+    title falls back to the first "# " heading, then the file name.
+    """
+    if file.content is None:
+        return file
+    meta, body = split_frontmatter(file.content)
+    title = file.title.strip() if file.title and file.title.strip() else ""
+    if not title and isinstance(meta.get("title"), str):
+        title = meta["title"]
+    if not title:
+        title = next(
+            (line[2:].strip() for line in body.splitlines() if line.startswith("# ")),
+            PurePosixPath(file.github_path).stem,
+        )
+    tags = file.tags
+    if not tags and meta.get("tags"):
+        tags = (
+            tuple(meta["tags"]) if isinstance(meta["tags"], list) else (meta["tags"],)
+        )
+    return replace(file, content=body, title=title, tags=tags)
+
+
+async def _aiter(files: Iterable[SyncFile]) -> AsyncIterator[SyncFile]:
+    for file in files:
+        yield file
+
+
+async def _stored_team_knowledge(
+    repository: AsyncKnowledgeRepository, prefix: str
+) -> tuple[dict[str, Knowledge], list[str]]:
+    """Return stored team knowledge by path, plus IDs of extra copies."""
+    stored: dict[str, Knowledge] = {}
+    extra_ids: list[str] = []
+    async for knowledge in repository.iter_all(
+        fields=_LOOKUP_FIELDS, filters=SearchFilter(source="team")
+    ):
+        if not knowledge.github_path or not knowledge.github_path.startswith(prefix):
+            continue
+        if knowledge.github_path in stored:
+            extra_ids.append(knowledge.id)  # keep one object per path
+        else:
+            stored[knowledge.github_path] = knowledge
+    return stored, extra_ids
+
+
+async def sync_files(
+    repository: AsyncKnowledgeRepository,
+    files: Iterable[SyncFile] | AsyncIterable[SyncFile | ValueError],
+    *,
+    prefix: str = "",
+    duplicates: "NearDuplicateIndex | None" = None,
+    batch_size: int = WRITE_BATCH_SIZE,
+    allow_delete_all: bool = False,
+) -> dict:
+    """Bring team knowledge under prefix in line with a manifest.
+
+    Changed files are written in batches of batch_size while the
+    manifest is still being consumed. Invalid entries (yielded as
+    ValueError) are reported per entry; since their paths are unknown,
+    no stored knowledge is deleted in a run that had any.
+
+    Args:
+        repository: Knowledge repository
+        files: Manifest of every file under prefix (may be async)
+        prefix: Only stored knowledge whose github_path starts with
+            prefix is compared (and deleted if missing)
+        duplicates: Near-duplicate index to keep in sync (optional)
+        batch_size: Knowledge items per save_many call
+        allow_delete_all: Accept an empty manifest, deleting all stored
+            knowledge under prefix
+
+    Returns:
+        Summary with created/updated/deleted/unchanged counts, paths that
+        need content, and per-path errors
+
+    Raises:
+        ValueError: If the manifest is empty and allow_delete_all is not
+            set (nothing has been written or deleted)
+    """
+    if not isinstance(files, AsyncIterable):
+        files = _aiter(files)
+    stored, extra_ids = await _stored_team_knowledge(repository, prefix)
+    progress = _Progress()
+    queue: asyncio.Queue[list[Knowledge] | None] = asyncio.Queue(
+        maxsize=WRITE_QUEUE_BATCHES
+    )
+
+    async def produce() -> None:
+        seen: set[str] = set()
+        batch: list[Knowledge] = []
+        async for file in files:
+            if isinstance(file, ValueError):
+                progress.invalid += 1
+                progress.errors.append({"github_path": "", "error": str(file)})
+                continue
+            if file.github_path in seen:
+                progress.invalid += 1
+                progress.errors.append(
+                    {"github_path": file.github_path, "error": "duplicate github_path"}
+                )
+                continue
+            seen.add(file.github_path)
+            progress.received += 1
+            knowledge = _diff(file, stored.pop(file.github_path, None), progress)
+            if knowledge is None:
+                continue
+            batch.append(knowledge)
+            if len(batch) >= batch_size:
+                await queue.put(batch)
+                batch = []
+        if batch:
+            await queue.put(batch)
+        await queue.put(None)
+
+    async def consume() -> None:
+        while (batch := await queue.get()) is not None:
+            results = await repository.save_many(batch)
+            for knowledge, result in zip(batch, results, strict=True):
+                if not result.ok:
+                    progress.errors.append(
+                        {"github_path": knowledge.github_path, "error": result.error}
+                    )
+                    continue
+                if knowledge.id:
+                    progress.updated += 1
+                else:
+                    progress.created += 1
+                if duplicates is not None:
+                    duplicates.add(result.knowledge)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            group.create_task(produce())
+            group.create_task(consume())
+    except ExceptionGroup as e:
+        # The stage that failed first; the other was cancelled
+        raise e.exceptions[0] from None
+
+    if not progress.received and not progress.invalid and not allow_delete_all:
+        raise ValueError(
+            "manifest is empty; set allow_delete_all to delete every file under prefix"
+        )
+    if not progress.invalid:
+        removed = [(k.github_path, k.id) for k in stored.values()]
+        removed += [("", id) for id in extra_ids]
+        await _delete_removed(repository, removed, progress, duplicates)
+
+    return {
+        "status": "synced" if not progress.errors else "partial",
+        "created": progress.created,
+        "updated": progress.updated,
+        "deleted": progress.deleted,
+        "unchanged": progress.unchanged,
+        "needs_content": progress.needs_content,
+        "errors": progress.errors,
+    }
+
+
+def _diff(
+    file: SyncFile, existing: Knowledge | None, progress: _Progress
+) -> Knowledge | None:
+    """Return the knowledge to write for a manifest entry, if any."""
+    if existing is not None and existing.source_hash == file.content_hash:
+        progress.unchanged += 1
+        return None
+    if file.content is None:
+        progress.needs_content.append(file.github_path)
+        return None
+    file = parse_markdown(file)
+    return Knowledge(
+        id=existing.id if existing else "",
+        title=file.title,
+        content=file.content,
+        tags=list(file.tags),
+        user_id=SYNC_USER_ID,
+        source="team",
+        status="promoted",
+        github_path=file.github_path,
+        promoted_from_id=existing.promoted_from_id if existing else "",
+        source_hash=file.content_hash,
+    )
+
+
+async def _delete_removed(
+    repository: AsyncKnowledgeRepository,
+    removed: list[tuple[str, str]],
+    progress: _Progress,
+    duplicates: "NearDuplicateIndex | None",
+) -> None:
+    """Delete the stored knowledge of files missing from the manifest."""
+    semaphore = asyncio.Semaphore(DELETE_CONCURRENCY)
+
+    async def delete(path: str, id: str) -> None:
+        async with semaphore:
+            try:
+                deleted = await repository.delete(id)
+            except Exception as e:
+                progress.errors.append({"github_path": path, "error": str(e)})
+                return
+        progress.deleted += deleted
+        if duplicates is not None:
+            duplicates.remove(id)
+
+    await asyncio.gather(*(delete(path, id) for path, id in removed))
+
+
+async def ndjson_manifest(
+    chunks: AsyncIterable[bytes], prefix: str
+) -> AsyncIterator[SyncFile | ValueError]:
+    """Parse an NDJSON manifest stream into entries, one per line.
+
+    Invalid lines are yielded as ValueError instead of raising.
+    """
+    index = 0
+    async for line_number, record in ndjson_records(chunks):
+        if isinstance(record, ValueError):
+            yield record
+            continue
+        try:
+            yield parse_entry(record, index, prefix)
+        except ValueError as e:
+            yield ValueError(f"line {line_number}: {e}")
+        index += 1
+
+
+def authorized(request: Request, token: str | None) -> bool:
+    """Whether the request carries the sync bearer token.
+
+    Without a configured token no request is authorized.
+    """
+    if not token:
+        return False
+    header = request.headers.get("authorization", "")
+    return hmac.compare_digest(header.encode(), f"Bearer {token}".encode())
+
+
+def register(
+    mcp,
+    repository: AsyncKnowledgeRepository,
+    duplicates: "NearDuplicateIndex | None" = None,
+):
+    """Register the POST /sync route to the MCP server.
+
+    The body is either a JSON manifest ({"files": [...], "prefix": ...})
+    or, with Content-Type application/x-ndjson, one entry object per line
+    and the prefix as a query parameter. An empty manifest is accepted
+    only with "allow_delete_all": true (a query parameter for NDJSON).
+    Requests must carry "Authorization: Bearer <SYNC_TOKEN>"; while the
+    SYNC_TOKEN environment variable is unset, the route answers 503.
+
+    Args:
+        mcp: The MCP server instance
+        repository: Knowledge repository for persistence
+        duplicates: Near-duplicate index to keep in sync (optional)
+    """
+    token = os.environ.get("SYNC_TOKEN")
+
+    @mcp.custom_route("/sync", methods=["POST"])
+    async def sync(request: Request) -> JSONResponse:
+        """Sync team knowledge from a GitHub docs manifest."""
+        if not token:
+            return JSONResponse(NOT_CONFIGURED, status_code=503)
+        if not authorized(request, token):
+            return JSONResponse({"error": "unauthorized"}, status_code=401)
+
+        content_type = request.headers.get("content-type", "")
+        try:
+            if content_type.split(";")[0].strip() == NDJSON_CONTENT_TYPE:
+                prefix = request.query_params.get("prefix", "")
+                allow_delete_all = request.query_params.get(
+                    "allow_delete_all", ""
+                ).lower() in ("1", "true")
+                files = ndjson_manifest(request.stream(), prefix)
+            else:
+                body = await request.json()
+                files, prefix = parse_manifest(body)
+                allow_delete_all = body.get("allow_delete_all") is True
+            summary = await sync_files(
+                repository,
+                files,
+                prefix=prefix,
+                duplicates=duplicates,
+                allow_delete_all=allow_delete_all,
+            )
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+        return JSONResponse(summary)
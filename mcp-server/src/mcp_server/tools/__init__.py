@@ -1,5 +1,15 @@
 """MCP tools for knowledge sharing."""
 
-from . import delete_knowledge, save_knowledge, search_knowledge
+from . import (
+    delete_knowledge,
+    save_knowledge,
+    save_knowledge_batch,
+    search_knowledge,
+)
 
-__all__ = ["save_knowledge", "search_knowledge", "delete_knowledge"]
+__all__ = [
+    "save_knowledge",
+    "save_knowledge_batch",
+    "search_knowledge",
+    "delete_knowledge",
+]
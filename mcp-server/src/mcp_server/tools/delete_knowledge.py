@@ -1,18 +1,28 @@
 """Delete knowledge tool implementation."""
 
-from ..domain.repositories import KnowledgeRepository
+from typing import TYPE_CHECKING
 
+from ..domain.repositories import AsyncKnowledgeRepository
 
-def register(mcp, repository: KnowledgeRepository):
+if TYPE_CHECKING:
+    from ..infrastructure.near_duplicates import NearDuplicateIndex
+
+
+def register(
+    mcp,
+    repository: AsyncKnowledgeRepository,
+    duplicates: "NearDuplicateIndex | None" = None,
+):
     """Register delete_knowledge tool to the MCP server.
 
     Args:
         mcp: The MCP server instance
         repository: Knowledge repository for deletion
+        duplicates: Near-duplicate index to keep in sync (optional)
     """
 
     @mcp.tool
-    def delete_knowledge(id: str) -> dict:
+    async def delete_knowledge(id: str) -> dict:
         """Delete knowledge from the system.
 
         Args:
@@ -28,7 +38,9 @@ def register(mcp, repository: KnowledgeRepository):
             raise ValueError("id is required")
 
         # Delete via repository
-        deleted = repository.delete(id)
+        deleted = await repository.delete(id)
+        if duplicates is not None:
+            duplicates.remove(id)
 
         if deleted:
             return {
@@ -3,10 +3,11 @@
 Skeleton implementation for Phase 2. Full implementation in Phase 3.
 """
 
-from ..domain.repositories import KnowledgeRepository
+from ..domain.exceptions import StatusConflictError
+from ..domain.repositories import AsyncKnowledgeRepository
 
 
-def register(mcp, repository: KnowledgeRepository):
+def register(mcp, repository: AsyncKnowledgeRepository):
     """Register promote_knowledge tool to the MCP server.
 
     Args:
@@ -15,7 +16,7 @@ def register(mcp, repository: KnowledgeRepository):
     """
 
     @mcp.tool
-    def promote_knowledge(id: str = "") -> dict:
+    async def promote_knowledge(id: str = "") -> dict:
         """Promote knowledge from draft to proposed status.
 
         Args:
@@ -32,19 +33,17 @@ def register(mcp, repository: KnowledgeRepository):
         if not id or not id.strip():
             raise ValueError("id is required")
 
-        # 1. Check if knowledge exists
-        knowledge = repository.get(id)
-        if knowledge is None:
-            raise ValueError("knowledge not found")
-
-        # 2. Check if knowledge is in draft state
-        if knowledge.status != "draft":
-            raise ValueError("only draft knowledge can be promoted")
-
-        # 3. Update status to "proposed"
-        updated = repository.update_status(id, "proposed")
+        # Update draft -> proposed; the repository enforces the precondition.
+        # Vector Search cannot check it inside the update, so this is a read
+        # plus an etag-guarded update (two RPCs), down from three.
+        try:
+            updated = await repository.update_status(
+                id, "proposed", expected_status="draft"
+            )
+        except StatusConflictError:
+            raise ValueError("only draft knowledge can be promoted") from None
         if updated is None:
-            raise ValueError("failed to update knowledge status")
+            raise ValueError("knowledge not found")
 
         return {
             "status": updated.status,
@@ -1,56 +1,130 @@
 """Save knowledge tool implementation."""
 
+from typing import TYPE_CHECKING
+
 from ..domain.models import Knowledge
-from ..domain.repositories import KnowledgeRepository
+from ..domain.repositories import AsyncKnowledgeRepository
+
+if TYPE_CHECKING:
+    from ..infrastructure.near_duplicates import NearDuplicateIndex
+
+
+def build_knowledge(
+    title: str | None, content: str, tags: list[str] | None
+) -> Knowledge:
+    """Validate tool input and build a new Knowledge to save.
+
+    Args:
+        title: Title of the knowledge (auto-generated if empty)
+        content: The content of the knowledge (required)
+        tags: Optional list of tags
+
+    Returns:
+        Knowledge with an empty id (assigned by the repository)
+
+    Raises:
+        ValueError: If content is empty or not provided
+    """
+    if not content or not content.strip():
+        raise ValueError("content is required")
+
+    # Auto-generate title from content if not provided
+    if not title or not title.strip():
+        title = content[:30].strip()
+        if len(content) > 30:
+            title += "..."
+
+    if tags is None:
+        tags = []
 
+    return Knowledge(
+        id="",  # Will be auto-generated
+        title=title,
+        content=content,
+        tags=tags,
+    )
 
-def register(mcp, repository: KnowledgeRepository):
+
+async def find_duplicate(
+    repository: AsyncKnowledgeRepository,
+    duplicates: "NearDuplicateIndex",
+    knowledge: Knowledge,
+) -> Knowledge | None:
+    """Return stored knowledge that knowledge near-duplicates, if any.
+
+    Index matches are confirmed with a get, so items deleted by another
+    instance are dropped from the index instead of being reported.
+
+    Args:
+        repository: Knowledge repository
+        duplicates: Near-duplicate index of the collection
+        knowledge: Knowledge about to be saved
+
+    Returns:
+        The most similar stored knowledge, or None
+    """
+    for match in duplicates.find(knowledge.title, knowledge.content):
+        existing = await repository.get(match.id)
+        if existing is not None:
+            return existing
+        duplicates.remove(match.id)
+    return None
+
+
+def register(
+    mcp,
+    repository: AsyncKnowledgeRepository,
+    duplicates: "NearDuplicateIndex | None" = None,
+):
     """Register save_knowledge tool to the MCP server.
 
     Args:
         mcp: The MCP server instance
         repository: Knowledge repository for persistence
+        duplicates: Near-duplicate index (None disables detection)
     """
 
     @mcp.tool
-    def save_knowledge(
-        title: str | None = None, content: str = "", tags: list[str] | None = None
+    async def save_knowledge(
+        title: str | None = None,
+        content: str = "",
+        tags: list[str] | None = None,
+        allow_duplicate: bool = False,
     ) -> dict:
         """Save knowledge to the system.
 
+        Knowledge that closely matches an already saved item (e.g. the
+        same insight reworded) is not saved again; the existing item is
+        returned with status "duplicate_of" instead.
+
         Args:
             title: Title of the knowledge (optional, auto-generated if not provided)
             content: The content of the knowledge (required)
             tags: Optional list of tags
+            allow_duplicate: Save even if a near-duplicate exists
 
         Returns:
-            A dict containing status, id, and title
+            A dict containing status ("saved" or "duplicate_of"), id, and
+            title. For "duplicate_of", id and title are the existing item's
 
         Raises:
             ValueError: If content is empty or not provided
         """
-        if not content or not content.strip():
-            raise ValueError("content is required")
-
-        # Auto-generate title from content if not provided
-        if not title or not title.strip():
-            title = content[:30].strip()
-            if len(content) > 30:
-                title += "..."
-
-        if tags is None:
-            tags = []
-
-        # Create knowledge model
-        knowledge = Knowledge(
-            id="",  # Will be auto-generated
-            title=title,
-            content=content,
-            tags=tags,
-        )
+        knowledge = build_knowledge(title, content, tags)
+
+        if duplicates is not None and not allow_duplicate:
+            existing = await find_duplicate(repository, duplicates, knowledge)
+            if existing is not None:
+                return {
+                    "status": "duplicate_of",
+                    "id": existing.id,
+                    "title": existing.title,
+                }
 
         # Save via repository
-        saved = repository.save(knowledge)
+        saved = await repository.save(knowledge)
+        if duplicates is not None:
+            duplicates.add(saved)
 
         return {
             "status": "saved",
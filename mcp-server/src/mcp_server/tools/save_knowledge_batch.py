@@ -0,0 +1,124 @@
+"""Save knowledge batch tool implementation."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from ..domain.models import Knowledge
+from ..domain.repositories import AsyncKnowledgeRepository
+from .save_knowledge import build_knowledge, find_duplicate
+
+if TYPE_CHECKING:
+    from ..infrastructure.near_duplicates import NearDuplicateIndex
+
+# Maximum number of items accepted per tool call
+MAX_BATCH_ITEMS = 10_000
+
+# Near-duplicate confirmations (repository gets) in flight at once
+DUPLICATE_LOOKUP_CONCURRENCY = 16
+
+
+def register(
+    mcp,
+    repository: AsyncKnowledgeRepository,
+    duplicates: "NearDuplicateIndex | None" = None,
+):
+    """Register save_knowledge_batch tool to the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        repository: Knowledge repository for persistence
+        duplicates: Near-duplicate index (None disables detection)
+    """
+
+    @mcp.tool
+    async def save_knowledge_batch(
+        items: list[dict], allow_duplicates: bool = False
+    ) -> dict:
+        """Save many knowledge items in one call using batched writes.
+
+        Items that near-duplicate already saved knowledge are skipped, as
+        in save_knowledge. Items within one batch are not compared with
+        each other.
+
+        Args:
+            items: List of dicts with "content" (required), and optional
+                "title" and "tags", following save_knowledge's rules
+            allow_duplicates: Save items even if near-duplicates exist
+
+        Returns:
+            A dict with saved/duplicates/failed counts and per-item
+            "results" in input order. Each result has index and status
+            ("saved" with id and title, "duplicate_of" with the existing
+            item's id and title, or "error" with error)
+
+        Raises:
+            ValueError: If items is empty or exceeds MAX_BATCH_ITEMS
+        """
+        if not items:
+            raise ValueError("items is required")
+        if len(items) > MAX_BATCH_ITEMS:
+            raise ValueError(f"at most {MAX_BATCH_ITEMS} items per call")
+
+        results: list[dict] = [{} for _ in items]
+        candidates: list[tuple[int, Knowledge]] = []
+        for index, item in enumerate(items):
+            try:
+                knowledge = build_knowledge(
+                    item.get("title"), item.get("content", ""), item.get("tags")
+                )
+            except ValueError as e:
+                results[index] = {"index": index, "status": "error", "error": str(e)}
+                continue
+            candidates.append((index, knowledge))
+
+        matches: list[Knowledge | None] = [None] * len(candidates)
+        if duplicates is not None and not allow_duplicates:
+            semaphore = asyncio.Semaphore(DUPLICATE_LOOKUP_CONCURRENCY)
+
+            async def lookup(knowledge: Knowledge) -> Knowledge | None:
+                async with semaphore:
+                    return await find_duplicate(repository, duplicates, knowledge)
+
+            matches = await asyncio.gather(*(lookup(k) for _, k in candidates))
+
+        to_save = []
+        positions: list[int] = []
+        for (index, knowledge), existing in zip(candidates, matches, strict=True):
+            if existing is not None:
+                results[index] = {
+                    "index": index,
+                    "status": "duplicate_of",
+                    "id": existing.id,
+                    "title": existing.title,
+                }
+                continue
+            to_save.append(knowledge)
+            positions.append(index)
+
+        # Save via repository
+        saved = await repository.save_many(to_save) if to_save else []
+
+        for index, result in zip(positions, saved, strict=True):
+            if result.ok:
+                if duplicates is not None:
+                    duplicates.add(result.knowledge)
+                results[index] = {
+                    "index": index,
+                    "status": "saved",
+                    "id": result.knowledge.id,
+                    "title": result.knowledge.title,
+                }
+            else:
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "error": result.error,
+                }
+
+        statuses = [result["status"] for result in results]
+        return {
+            "saved": statuses.count("saved"),
+            "duplicates": statuses.count("duplicate_of"),
+            "failed": statuses.count("error"),
+            "results": results,
+        }
@@ -1,9 +1,95 @@
 """Search knowledge tool implementation."""
 
-from ..domain.repositories import KnowledgeRepository
+import re
+from dataclasses import fields as dataclass_fields
 
+from ..domain.models import Knowledge, SearchFilter
+from ..domain.repositories import AsyncKnowledgeRepository
 
-def register(mcp, repository: KnowledgeRepository):
+# Fields that can be requested via the fields parameter
+SELECTABLE_FIELDS = frozenset(f.name for f in dataclass_fields(Knowledge)) - {"score"}
+
+# Fields returned when fields is not specified
+DEFAULT_FIELDS = ("id", "title", "content")
+
+VALID_STATUSES = frozenset({"draft", "proposed", "promoted"})
+VALID_SOURCES = frozenset({"personal", "team"})
+VALID_MODES = frozenset({"semantic", "text", "hybrid"})
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def extract_snippet(text: str, query: str, max_chars: int) -> str:
+    """Extract the passage of text that best matches the query terms.
+
+    Picks the max_chars window containing the most distinct query terms
+    (ties go to the earliest window), snaps it to word boundaries and
+    marks truncation with "...". Falls back to the start of the text when
+    no term matches.
+
+    Args:
+        text: Full text to extract from
+        query: Search query whose terms are located in text
+        max_chars: Maximum snippet length (excluding ellipses)
+
+    Returns:
+        The snippet
+    """
+    if len(text) <= max_chars:
+        return text
+
+    terms = {term for term in _TERM_PATTERN.findall(query.casefold()) if len(term) > 1}
+    lowered = text.casefold()
+    matches = sorted(
+        (match.start(), term)
+        for term in terms
+        for match in re.finditer(re.escape(term), lowered)
+    )
+
+    # Sliding window over match positions, maximizing distinct terms
+    best_start, best_score = 0, 0
+    counts: dict[str, int] = {}
+    right = 0
+    for left, (start, _) in enumerate(matches):
+        while right < len(matches) and matches[right][0] < start + max_chars:
+            term = matches[right][1]
+            counts[term] = counts.get(term, 0) + 1
+            right += 1
+        if len(counts) > best_score:
+            best_start, best_score = start, len(counts)
+        term = matches[left][1]
+        counts[term] -= 1
+        if counts[term] == 0:
+            del counts[term]
+
+    # Lead in a little so the first match is not glued to the edge
+    start = max(0, min(best_start - max_chars // 5, len(text) - max_chars))
+    if start > 0:
+        space = text.find(" ", start)
+        if space != -1 and space < best_start:
+            start = space + 1
+    end = start + max_chars
+    if end < len(text):
+        space = text.rfind(" ", start, end)
+        if space > start:
+            end = space
+
+    snippet = text[start:end].strip()
+    if start > 0:
+        snippet = "..." + snippet
+    if end < len(text):
+        snippet += "..."
+    return snippet
+
+
+def _format_value(value):
+    """Convert a Knowledge field value to a JSON-friendly value."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def register(mcp, repository: AsyncKnowledgeRepository):
     """Register search_knowledge tool to the MCP server.
 
     Args:
@@ -12,32 +98,99 @@ def register(mcp, repository: KnowledgeRepository):
     """
 
     @mcp.tool
-    def search_knowledge(query: str, limit: int = 10) -> list[dict]:
+    async def search_knowledge(
+        query: str,
+        limit: int = 10,
+        fields: list[str] | None = None,
+        snippet_chars: int = 0,
+        status: str | None = None,
+        source: str | None = None,
+        tags: list[str] | None = None,
+        user_id: str | None = None,
+        mode: str = "semantic",
+        cursor: str | None = None,
+    ) -> dict:
         """Search for knowledge in the system using semantic search.
 
         Args:
             query: The search query
             limit: Maximum number of results to return (default: 10)
+            fields: Fields to return for each hit (default: id, title,
+                content). id and score are always returned.
+            snippet_chars: If positive, return a "snippet" of at most this
+                many characters around the best-matching query terms
+                instead of the full content
+            status: Only return knowledge with this status
+                ("draft", "proposed" or "promoted")
+            source: Only return knowledge from this source
+                ("personal" or "team")
+            tags: Only return knowledge having at least one of these tags
+            user_id: Only return knowledge of this user
+            mode: "semantic" (default) ranks by meaning, "text" by keyword
+                match on title and content, and "hybrid" fuses both
+                rankings, which helps queries naming exact identifiers
+            cursor: next_cursor from a previous call with the same query
+                and options, to get the following page of results
 
         Returns:
-            A list of dicts containing id, title, content, and score
+            A dict with "results", a list of dicts containing id, score
+            and the requested fields, and "next_cursor", the cursor of
+            the next page or None if there are no more results. While the
+            search backend is unavailable, recent results for the same
+            search may be returned with "stale": True.
 
         Raises:
             ValueError: If query is empty or not provided
+            ValueError: If fields contains an unknown field name
+            ValueError: If status, source or mode is not a valid value
         """
         if not query or not query.strip():
             raise ValueError("query is required")
 
+        selected = tuple(fields) if fields else DEFAULT_FIELDS
+        unknown = set(selected) - SELECTABLE_FIELDS
+        if unknown:
+            raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}")
+
+        if status and status not in VALID_STATUSES:
+            raise ValueError(f"invalid status: {status}")
+        if source and source not in VALID_SOURCES:
+            raise ValueError(f"invalid source: {source}")
+        if mode not in VALID_MODES:
+            raise ValueError(f"invalid mode: {mode}")
+        search_filter = SearchFilter(
+            status=status or None,
+            source=source or None,
+            tags=tuple(tags or ()),
+            user_id=user_id or None,
+        )
+
+        # Content is needed to build the snippet even if not returned
+        fetch = list(selected)
+        if snippet_chars > 0:
+            fetch = [name for name in fetch if name != "content"] + ["content"]
+            selected = tuple(name for name in selected if name != "content")
+
         # Search via repository
-        result = repository.search(query, limit=limit)
+        result = await repository.search(
+            query,
+            limit=limit,
+            fields=fetch,
+            filters=None if search_filter.is_empty() else search_filter,
+            mode=mode,
+            cursor=cursor or None,
+        )
 
         # Convert to response format
-        return [
-            {
-                "id": item.id,
-                "title": item.title,
-                "content": item.content,
-                "score": item.score,
-            }
-            for item in result.items
-        ]
+        hits = []
+        for item in result.items:
+            hit = {name: _format_value(getattr(item, name)) for name in selected}
+            hit["id"] = item.id
+            if snippet_chars > 0:
+                hit["snippet"] = extract_snippet(item.content, query, snippet_chars)
+            hit["score"] = item.score
+            hits.append(hit)
+        response = {"results": hits, "next_cursor": result.next_cursor}
+        if result.stale:
+            response["stale"] = True
+        return response
@@ -8,7 +8,7 @@ from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
-from google.api_core.exceptions import NotFound
+from google.api_core.exceptions import AlreadyExists, NotFound
 
 from mcp_server.domain.models import ArchivedKnowledge
 from mcp_server.infrastructure.archive_repository import (
@@ -76,6 +76,33 @@ class TestVectorSearchArchivedKnowledgeRepository:
         assert result.title == "Archived Title"
         self.repo._data_object_client.create_data_object.assert_called_once()
 
+    # P2: 正常系 - 同じIDの再保存（リトライ）
+    def test_save_overwrites_existing_archive(self):
+        """Saving an ID that is already archived updates it in place.
+
+        WHEN: 同じ ID のアーカイブが既に存在する状態で save
+        THEN: AlreadyExists にならず、既存のレコードが上書きされる
+        """
+        self.repo._data_object_client.create_data_object.side_effect = AlreadyExists(
+            "exists"
+        )
+        archived = ArchivedKnowledge(
+            id="original-id",
+            title="Archived Title",
+            content="Archived content",
+            promoted_to_id="team-2",
+        )
+
+        result = self.repo.save(archived)
+
+        assert result.promoted_to_id == "team-2"
+        request = self.repo._data_object_client.update_data_object.call_args.kwargs[
+            "request"
+        ]
+        assert request.data_object.name.endswith("/dataObjects/original-id")
+        assert request.data_object.data["promoted_to_id"] == "team-2"
+        assert "data.title" in request.update_mask.paths
+
     # P1: 正常系 - 取得
     def test_get_archived_knowledge(self):
         """Get archived knowledge by ID.
@@ -119,3 +146,17 @@ class TestVectorSearchArchivedKnowledgeRepository:
         result = self.repo.get("nonexistent-id")
 
         assert result is None
+
+    # P1: 正常系 - 削除（補償）
+    def test_delete_archived_knowledge(self):
+        """Delete removes an archive record, and reports missing ones.
+
+        WHEN: 存在する ID / 存在しない ID で delete
+        THEN: True / False が返る
+        """
+        assert self.repo.delete("original-id") is True
+
+        self.repo._data_object_client.delete_data_object.side_effect = NotFound(
+            "Not found"
+        )
+        assert self.repo.delete("original-id") is False
@@ -0,0 +1,279 @@
+"""Tests for AsyncVectorSearchKnowledgeRepository."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.api_core.exceptions import InvalidArgument, NotFound, ServiceUnavailable
+
+from mcp_server.domain.models import Knowledge
+from mcp_server.infrastructure.async_vector_search import (
+    AsyncVectorSearchKnowledgeRepository,
+)
+from mcp_server.infrastructure.rank_fusion import HybridSearchConfig
+from mcp_server.infrastructure.result_pages import ResultPages
+from mcp_server.infrastructure.vector_search import content_hash
+
+
+def search_response(*ids: str) -> MagicMock:
+    """Build a search response whose hits have the given IDs, in order."""
+    return MagicMock(
+        results=[
+            MagicMock(data_object=MagicMock(data={"id": id}), distance=0.5)
+            for id in ids
+        ]
+    )
+
+
+class AsyncPager:
+    """Async pager over data objects with the given IDs."""
+
+    def __init__(self, *ids: str):
+        self.data_objects = [MagicMock(data={"id": id}) for id in ids]
+
+    async def __aiter__(self):
+        for data_object in self.data_objects:
+            yield data_object
+
+
+class TestAsyncVectorSearchKnowledgeRepositoryInit:
+    """Tests for repository initialization."""
+
+    @patch(
+        "mcp_server.infrastructure.async_vector_search.vectorsearch_v1beta"
+        ".DataObjectServiceAsyncClient"
+    )
+    def test_clients_created_on_first_use(self, mock_data):
+        """Clients are not constructed until first accessed."""
+        repo = AsyncVectorSearchKnowledgeRepository(project_id="test-project")
+        mock_data.assert_not_called()
+
+        client = repo.data_object_client
+
+        mock_data.assert_called_once()
+        assert repo.data_object_client is client
+
+
+class TestAsyncVectorSearchKnowledgeRepository:
+    """Tests for AsyncVectorSearchKnowledgeRepository.
+
+    Test selection constraints applied:
+    - C1 coverage: Minimum cases for branch coverage
+    - Priority: P1 normal cases + P2 not-found handling
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
+            self.repo = AsyncVectorSearchKnowledgeRepository()
+        self.repo._data_object_client = AsyncMock()
+        self.repo._search_client = AsyncMock()
+
+    # P1: 正常系 - 保存
+    async def test_save_generates_id(self):
+        """save() creates a data object and returns generated id."""
+        result = await self.repo.save(
+            Knowledge(id="", title="Title", content="Content")
+        )
+
+        assert result.id
+        assert result.created_at is not None
+        self.repo._data_object_client.create_data_object.assert_awaited_once()
+
+    # P1: 正常系 - 本文が変わらない再保存は埋め込みを再計算しない
+    async def test_save_unchanged_body_updates_metadata_only(self):
+        """save() of a stored, unchanged body keeps the stored embedding."""
+        self.repo._data_object_client.get_data_object.return_value = MagicMock(
+            data={"id": "k1", "content_hash": content_hash("Title", "Content")}
+        )
+
+        await self.repo.save(
+            Knowledge(id="k1", title="Title", content="Content", tags=["new"])
+        )
+
+        self.repo._data_object_client.create_data_object.assert_not_awaited()
+        request = self.repo._data_object_client.update_data_object.call_args.kwargs[
+            "request"
+        ]
+        assert "data.tags" in request.update_mask.paths
+        assert "data.title" not in request.update_mask.paths
+        assert "data.content_hash" not in request.update_mask.paths
+
+    # P2: 異常系 - 一括保存での失敗項目の切り分け
+    async def test_save_many_isolates_failing_item(self):
+        """A terminal batch error is narrowed down to the failing item."""
+        self.repo._search_client.query_data_objects.return_value = MagicMock(
+            data_objects=[]
+        )
+
+        async def reject_bad(request):
+            if any(r.data_object.data["title"] == "bad" for r in request.requests):
+                raise InvalidArgument("bad item")
+            return MagicMock(
+                data_objects=[
+                    MagicMock(data_object_id=r.data_object_id) for r in request.requests
+                ]
+            )
+
+        self.repo._data_object_client.batch_create_data_objects.side_effect = reject_bad
+        items = [
+            Knowledge(id="", title=title, content="c")
+            for title in ["ok1", "bad", "ok2", "ok3"]
+        ]
+
+        results = await self.repo.save_many(items)
+
+        assert [r.ok for r in results] == [True, False, True, True]
+        assert "bad item" in results[1].error
+
+    # P1: 正常系 - 検索 (キャッシュ)
+    async def test_search_uses_cache(self):
+        """Repeated search is answered from cache."""
+        self.repo._search_client.search_data_objects.return_value = MagicMock(
+            results=[]
+        )
+
+        await self.repo.search("query", limit=5)
+        await self.repo.search("query", limit=5)
+
+        self.repo._search_client.search_data_objects.assert_awaited_once()
+
+    # P2: 境界 - 検索中の書き込み
+    async def test_search_racing_a_write_is_not_cached(self):
+        """A result the backend returned before a write is not cached."""
+
+        async def search_then_write(request):
+            # The write lands between the cache miss and the put
+            await self.repo.delete("k1")
+            return search_response("k1")
+
+        self.repo._search_client.search_data_objects.side_effect = search_then_write
+
+        await self.repo.search("query", limit=5)
+        self.repo._search_client.search_data_objects.side_effect = None
+        self.repo._search_client.search_data_objects.return_value = search_response()
+        result = await self.repo.search("query", limit=5)
+
+        assert result.items == []
+        assert self.repo._search_client.search_data_objects.await_count == 2
+
+    # P1: 正常系 - カーソルによるページング
+    async def test_iter_search_pages_from_one_request(self):
+        """Later pages come from the first request's stored ranking."""
+        self.repo._result_pages = ResultPages(prefetch_pages=5)
+        self.repo._search_client.search_data_objects.return_value = search_response(
+            "a", "b", "c"
+        )
+
+        ids = [item.id async for item in self.repo.iter_search("q", page_size=2)]
+
+        assert ids == ["a", "b", "c"]
+        self.repo._search_client.search_data_objects.assert_awaited_once()
+        request = self.repo._search_client.search_data_objects.call_args.kwargs[
+            "request"
+        ]
+        assert request.semantic_search.top_k == 10
+
+    # P1: 正常系 - コレクション全件走査
+    async def test_iter_all_scans_collection(self):
+        """iter_all() follows the query pager over the whole collection."""
+        self.repo._search_client.query_data_objects.return_value = AsyncPager("a", "b")
+
+        items = [k async for k in self.repo.iter_all(fields=["title", "content"])]
+
+        assert [k.id for k in items] == ["a", "b"]
+        request = self.repo._search_client.query_data_objects.call_args.kwargs[
+            "request"
+        ]
+        assert not request.filter
+        assert list(request.output_fields.data_fields) == ["id", "title", "content"]
+
+    # P1: 正常系 - クエリ埋め込みキャッシュでベクトル検索
+    async def test_search_with_query_embedder_sends_vector(self):
+        """Semantic search sends the embedder's vector as a vector search."""
+        self.repo.query_embedder = MagicMock()
+        self.repo.query_embedder.aembed = AsyncMock(return_value=(0.1, 0.2))
+        self.repo._search_client.search_data_objects.return_value = search_response()
+
+        await self.repo.search("query", limit=5)
+
+        request = self.repo._search_client.search_data_objects.call_args.kwargs[
+            "request"
+        ]
+        assert list(request.vector_search.vector.values) == [
+            pytest.approx(0.1),
+            pytest.approx(0.2),
+        ]
+        self.repo.query_embedder.aembed.assert_awaited_once_with("query")
+
+    # P1: 正常系 - ハイブリッド検索 (RRF 統合)
+    async def test_hybrid_search_fuses_both_branches(self):
+        """Hybrid search ranks items found by both branches first."""
+
+        async def search(request, timeout=None):
+            if request.text_search.search_text:
+                return search_response("b", "c")
+            return search_response("a", "b")
+
+        self.repo._search_client.search_data_objects.side_effect = search
+
+        result = await self.repo.search("query", limit=2, mode="hybrid")
+
+        assert [item.id for item in result.items] == ["b", "a"]
+        assert self.repo._search_client.search_data_objects.await_count == 2
+
+    # P2: 異常系 - 片方のブランチ失敗時はもう片方で応答
+    async def test_hybrid_search_degrades_to_surviving_branch(self):
+        """A failed or late branch is dropped; the other ranking is used."""
+        self.repo.hybrid = HybridSearchConfig(deadline=0.05)
+
+        async def search(request, timeout=None):
+            if request.text_search.search_text:
+                await asyncio.sleep(1)
+            return search_response("a")
+
+        self.repo._search_client.search_data_objects.side_effect = search
+
+        result = await self.repo.search("query", mode="hybrid")
+
+        assert [item.id for item in result.items] == ["a"]
+
+    # P2: 異常系 - 両方のブランチ失敗
+    async def test_hybrid_search_raises_when_both_branches_fail(self):
+        """Hybrid search raises the semantic branch's error if both fail."""
+        self.repo._search_client.search_data_objects.side_effect = ServiceUnavailable(
+            "down"
+        )
+
+        with pytest.raises(ServiceUnavailable):
+            await self.repo.search("query", mode="hybrid")
+
+    # P2: 境界 - 存在しないID
+    async def test_get_returns_none_on_not_found(self):
+        """get() returns None when knowledge not found."""
+        self.repo._data_object_client.get_data_object.side_effect = NotFound(
+            "Not found"
+        )
+
+        assert await self.repo.get("nonexistent-id") is None
+
+    async def test_update_status_success(self):
+        """update_status() decodes the result from the update response."""
+        mock_update_response = MagicMock()
+        mock_update_response.data = {
+            "id": "test-id",
+            "title": "Test Title",
+            "content": "Test content",
+            "status": "proposed",
+        }
+        self.repo._data_object_client.update_data_object.return_value = (
+            mock_update_response
+        )
+
+        result = await self.repo.update_status("test-id", "proposed")
+
+        assert result is not None
+        assert result.status == "proposed"
+        self.repo._data_object_client.get_data_object.assert_not_awaited()
+        self.repo._data_object_client.update_data_object.assert_awaited_once()
@@ -0,0 +1,113 @@
+"""Tests for ChannelPool."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from google.auth.credentials import AnonymousCredentials
+
+from mcp_server.infrastructure.archive_repository import (
+    VectorSearchArchivedKnowledgeRepository,
+)
+from mcp_server.infrastructure.channel_pool import AsyncChannelPool, ChannelPool
+from mcp_server.infrastructure.vector_search import VectorSearchKnowledgeRepository
+
+
+class FakeChannelPool(ChannelPool):
+    """ChannelPool opening fake channels with mock clients."""
+
+    def _create_channel(self):
+        return MagicMock(name=f"channel-{len(self._slots)}")
+
+    def _create_client(self, kind, channel):
+        return MagicMock()
+
+
+class TestChannelPool:
+    """Tests for ChannelPool."""
+
+    def test_clients_share_one_channel(self):
+        """Knowledge and archive repositories share the pool's channel."""
+        pool = ChannelPool(credentials=AnonymousCredentials())
+        knowledge = VectorSearchKnowledgeRepository(
+            project_id="test-project", channel_pool=pool
+        )
+        archive = VectorSearchArchivedKnowledgeRepository(
+            project_id="test-project", channel_pool=pool
+        )
+
+        search_transport = knowledge.search_client.transport
+        data_transport = archive.data_object_client.transport
+
+        assert search_transport.grpc_channel is data_transport.grpc_channel
+        assert pool.in_flight() == [0]
+        pool.close()
+
+    def test_opens_channel_when_saturated(self):
+        """A new channel is opened only once every open one is saturated."""
+        pool = FakeChannelPool(size=2, max_concurrent_streams=1)
+
+        first = pool.data_object_client()
+        first._enter()  # a call is in flight on the first channel
+        second = pool.data_object_client()
+        second._enter()
+        third = pool.search_client()
+
+        assert first._slot is not second._slot
+        # size reached: an open channel is reused
+        assert third._slot in (first._slot, second._slot)
+        assert pool.in_flight() == [1, 1]
+
+    def test_counts_calls_in_flight(self):
+        """Calls are counted on their channel while running."""
+        pool = FakeChannelPool()
+        client = pool.data_object_client()
+        seen = []
+        client._client.get_data_object.side_effect = lambda **kw: seen.append(
+            pool.in_flight()
+        )
+
+        client.get_data_object(request="r")
+
+        assert seen == [[1]]
+        assert pool.in_flight() == [0]
+
+    async def test_counts_async_calls_in_flight(self):
+        """Coroutine methods are counted until awaited to completion."""
+        pool = FakeChannelPool()
+        client = pool.search_client()
+        seen = []
+
+        async def search(**kwargs):
+            seen.append(pool.in_flight())
+
+        client._client.search_data_objects = AsyncMock(side_effect=search)
+
+        await client.search_data_objects(request="r")
+
+        assert seen == [[1]]
+        assert pool.in_flight() == [0]
+
+    def test_channel_options(self):
+        """Keepalive settings and a local subchannel pool are configured."""
+        pool = AsyncChannelPool(keepalive_time_ms=5_000, keepalive_without_calls=True)
+
+        options = dict(pool.channel_options())
+
+        assert options["grpc.keepalive_time_ms"] == 5_000
+        assert options["grpc.keepalive_permit_without_calls"] == 1
+        assert options["grpc.use_local_subchannel_pool"] == 1
+
+    def test_from_env_emulator_host(self):
+        """VECTOR_SEARCH_EMULATOR_HOST switches to plaintext channels."""
+        with patch.dict(
+            os.environ,
+            {
+                "VECTOR_SEARCH_EMULATOR_HOST": "localhost:9000",
+                "GRPC_CHANNEL_POOL_SIZE": "3",
+            },
+        ):
+            pool = ChannelPool.from_env()
+
+        assert pool.host == "localhost:9000"
+        assert pool.insecure is True
+        assert pool.size == 3
@@ -0,0 +1,176 @@
+"""Tests for the circuit breaker and the stale search fallback."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from google.api_core.exceptions import InvalidArgument, ServiceUnavailable
+
+from mcp_server.domain.exceptions import BackendUnavailableError
+from mcp_server.domain.models import Knowledge, SaveResult, SearchResult
+from mcp_server.infrastructure.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerKnowledgeRepository,
+)
+from mcp_server.metrics import Metrics
+
+RESULT = SearchResult(items=[Knowledge(id="k1", title="t", content="c")], total=1)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker.
+
+    Test selection constraints:
+    - Focus on state transitions: open, half-open probe, close, reopen
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=10, clock=self.clock
+        )
+
+    # P1: 正常系 - 連続失敗で開き、タイムアウト後に半開
+    def test_opens_after_consecutive_failures(self):
+        """Threshold consecutive failures open; reset_timeout half-opens."""
+        self.breaker.record_failure()
+        assert self.breaker.state == CLOSED
+        self.breaker.record_failure()
+        assert self.breaker.state == OPEN
+        assert not self.breaker.allow()
+
+        self.clock.now = 10
+        assert self.breaker.state == HALF_OPEN
+
+    # P1: 正常系 - 半開状態のプローブは1つだけ
+    def test_half_open_admits_one_probe(self):
+        """Only one probe is in flight; its success closes the circuit."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+
+        assert self.breaker.allow()
+        assert not self.breaker.allow()
+        self.breaker.record_success()
+        assert self.breaker.state == CLOSED
+
+    # P2: 異常系 - プローブ失敗で再び開く
+    def test_failed_probe_reopens(self):
+        """A failed probe opens the circuit for another reset_timeout."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+        assert self.breaker.allow()
+
+        self.breaker.record_failure()
+
+        assert self.breaker.state == OPEN
+        self.clock.now = 19
+        assert self.breaker.state == OPEN
+
+
+class TestCircuitBreakerKnowledgeRepository:
+    """Tests for CircuitBreakerKnowledgeRepository."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.metrics = Metrics()
+        self.inner = AsyncMock()
+        self.inner.search.return_value = RESULT
+        self.repo = CircuitBreakerKnowledgeRepository(
+            self.inner,
+            CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=self.clock),
+            metrics=self.metrics,
+        )
+
+    def sample(self, name: str, **labels) -> float | None:
+        """Read one sample value from the metrics registry."""
+        return self.metrics.registry.get_sample_value(name, labels)
+
+    # P1: 正常系 - 開いている間は直近の結果を stale として返す
+    async def test_open_circuit_serves_stale_results(self):
+        """After an outage opens the circuit, known searches answer stale."""
+        assert (await self.repo.search("q")).stale is False
+        self.inner.search.side_effect = ServiceUnavailable("down")
+
+        failed = await self.repo.search("q")
+        again = await self.repo.search("q")
+
+        assert failed.stale and again.stale
+        assert failed.items == RESULT.items
+        assert self.inner.search.await_count == 2  # no call while open
+        assert self.sample("knowledge_repository_circuit_state") == 2
+        assert self.sample("knowledge_repository_stale_results_total") == 2
+
+    # P2: 異常系 - 開いている間、既知でない呼び出しは即時失敗
+    async def test_open_circuit_fails_fast_without_stale_result(self):
+        """Calls with no fallback raise BackendUnavailableError at once."""
+        self.inner.get.side_effect = ServiceUnavailable("down")
+        with pytest.raises(ServiceUnavailable):
+            await self.repo.get("k1")
+
+        with pytest.raises(BackendUnavailableError):
+            await self.repo.search("unknown")
+        with pytest.raises(BackendUnavailableError):
+            await self.repo.get("k1")
+        assert self.inner.get.await_count == 1
+        value = self.sample("knowledge_repository_rejected_total", method="get")
+        assert value == 1
+
+    # P1: 正常系 - 半開状態ではバックグラウンドで再検証して閉じる
+    async def test_half_open_revalidates_in_background(self):
+        """A stale hit is returned while the probe refreshes and closes."""
+        await self.repo.search("q")
+        self.inner.search.side_effect = ServiceUnavailable("down")
+        await self.repo.search("q")
+        self.clock.now = 10
+        self.inner.search.side_effect = None
+
+        result = await self.repo.search("q")
+        await asyncio.sleep(0)
+
+        assert result.stale
+        assert self.inner.search.await_count == 3
+        assert self.repo.breaker.state == CLOSED
+        assert (await self.repo.search("q")).stale is False
+
+    # P2: 境界 - 恒久的エラーでは開かない
+    async def test_terminal_errors_do_not_open_the_circuit(self):
+        """INVALID_ARGUMENT means the backend answered."""
+        self.inner.search.side_effect = InvalidArgument("bad")
+
+        with pytest.raises(InvalidArgument):
+            await self.repo.search("q")
+        assert self.repo.breaker.state == CLOSED
+
+    # P2: 境界 - 一括保存の一時的エラーは結果に含まれても失敗と数える
+    async def test_save_many_transient_item_errors_open_the_circuit(self):
+        """save_many reports errors per item; transient ones count."""
+        item = Knowledge(id="k1", title="t", content="c")
+        self.inner.save_many.return_value = [SaveResult(item, error="bad item")]
+        await self.repo.save_many([item])
+        assert self.repo.breaker.state == CLOSED
+
+        self.inner.save_many.return_value = [
+            SaveResult(item, error="unavailable", retryable=True)
+        ]
+        await self.repo.save_many([item])
+
+        assert self.repo.breaker.state == OPEN
+        with pytest.raises(BackendUnavailableError):
+            await self.repo.save_many([item])
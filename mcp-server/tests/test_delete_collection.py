@@ -0,0 +1,190 @@
+"""Tests for scripts/delete_collection.py."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.api_core.exceptions import InvalidArgument, NotFound, ServiceUnavailable
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import delete_collection  # noqa: E402
+from delete_collection import (  # noqa: E402
+    MAX_ATTEMPTS,
+    DeletionState,
+    TokenBucket,
+    delete_batch,
+)
+
+COLLECTION = "projects/p/locations/l/collections/knowledge"
+
+
+class FakeClock:
+    """Monotonic clock that only advances when slept on."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Replace the script's clock and sleep with a fake clock."""
+    fake = FakeClock()
+    with (
+        patch.object(delete_collection.time, "monotonic", fake.monotonic),
+        patch.object(delete_collection.time, "sleep", fake.sleep),
+    ):
+        yield fake
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket.
+
+    Test selection constraints:
+    - Focus on the burst capacity and the refill rate
+    """
+
+    # P1: 正常系 - バースト後はレートで待機
+    def test_burst_then_waits_for_refill(self, clock):
+        """A full bucket allows a burst; further tokens wait 1/rate each."""
+        bucket = TokenBucket(rate=2.0)
+
+        for _ in range(2):
+            bucket.acquire()
+        assert clock.sleeps == []
+
+        bucket.acquire()
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+
+class TestDeletionState:
+    """Tests for DeletionState.
+
+    Test selection constraints:
+    - Focus on resuming: recorded batches, torn lines, other collections
+    """
+
+    # P1: 正常系 - 中断後の再開
+    def test_resumes_recorded_batches(self, tmp_path):
+        """A new state loads the IDs and the batches already done."""
+        path = tmp_path / "state.json"
+        state = DeletionState(path, COLLECTION)
+        state.start(["a", "b", "c"])
+        state.mark_done(0)
+        state.mark_done(2)
+
+        resumed = DeletionState(path, COLLECTION)
+
+        assert resumed.ids == ["a", "b", "c"]
+        assert resumed.done == {0, 2}
+
+    # P2: 境界 - 書き込み途中で中断された行
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        """A partially written progress line does not break resuming."""
+        path = tmp_path / "state.json"
+        header = {"collection": COLLECTION, "ids": ["a", "b"]}
+        path.write_text(json.dumps(header) + '\n{"done": 0}\n{"do')
+
+        resumed = DeletionState(path, COLLECTION)
+
+        assert resumed.done == {0}
+
+    # P2: 境界 - 別コレクションの進捗ファイル
+    def test_state_of_other_collection_is_ignored(self, tmp_path):
+        """Progress recorded for another collection starts over."""
+        path = tmp_path / "state.json"
+        DeletionState(path, "other").start(["a"])
+
+        assert DeletionState(path, COLLECTION).ids is None
+
+    # P1: 正常系 - 完了後の削除
+    def test_clear_removes_file(self, tmp_path):
+        """Clearing forgets the listing and removes the file."""
+        path = tmp_path / "state.json"
+        state = DeletionState(path, COLLECTION)
+        state.start(["a"])
+
+        state.clear()
+
+        assert state.ids is None
+        assert not path.exists()
+
+
+class TestDeleteBatch:
+    """Tests for delete_batch.
+
+    Test selection constraints:
+    - Focus on retries and the batch to per-object fallback
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.client = MagicMock()
+        self.bucket = MagicMock()
+
+    # P1: 正常系 - 一括削除
+    def test_batch_delete(self, clock):
+        """All IDs are deleted with one batch request."""
+        assert delete_batch(self.client, COLLECTION, ["a", "b"], self.bucket) == 2
+        self.client.delete_data_object.assert_not_called()
+
+    # P2: 正常系 - 一時的エラー後の再試行
+    def test_transient_batch_error_is_retried(self, clock):
+        """A batch failing with UNAVAILABLE is sent again after a backoff."""
+        self.client.batch_delete_data_objects.side_effect = [
+            ServiceUnavailable("down"),
+            None,
+        ]
+
+        assert delete_batch(self.client, COLLECTION, ["a"], self.bucket) == 1
+        assert clock.sleeps == [0.5]
+
+    # P2: 正常系 - 削除済みオブジェクトを含むバッチ
+    def test_missing_object_falls_back_to_single_deletes(self, clock):
+        """Objects already gone are skipped; the rest are deleted singly."""
+        self.client.batch_delete_data_objects.side_effect = NotFound("a")
+        self.client.delete_data_object.side_effect = [NotFound("a"), None]
+
+        assert delete_batch(self.client, COLLECTION, ["a", "b"], self.bucket) == 1
+        names = [
+            call.kwargs["request"].name
+            for call in self.client.delete_data_object.call_args_list
+        ]
+        assert names == [f"{COLLECTION}/dataObjects/a", f"{COLLECTION}/dataObjects/b"]
+
+    # P2: 正常系 - 個別削除中の一時的エラー
+    def test_transient_single_delete_error_is_retried(self, clock):
+        """Per-object deletes retry transient errors instead of aborting."""
+        self.client.batch_delete_data_objects.side_effect = NotFound("a")
+        self.client.delete_data_object.side_effect = [
+            NotFound("a"),
+            ServiceUnavailable("quota"),
+            None,
+        ]
+
+        assert delete_batch(self.client, COLLECTION, ["a", "b"], self.bucket) == 1
+        assert self.client.delete_data_object.call_count == 3
+
+    # P3: 異常系 - 再試行の上限と恒久的エラー
+    def test_gives_up_after_max_attempts_and_on_terminal_errors(self, clock):
+        """Transient errors raise after MAX_ATTEMPTS; terminal ones at once."""
+        self.client.batch_delete_data_objects.side_effect = ServiceUnavailable("down")
+        with pytest.raises(ServiceUnavailable):
+            delete_batch(self.client, COLLECTION, ["a"], self.bucket)
+        assert self.client.batch_delete_data_objects.call_count == MAX_ATTEMPTS
+
+        self.client.batch_delete_data_objects.reset_mock()
+        self.client.batch_delete_data_objects.side_effect = InvalidArgument("bad")
+        with pytest.raises(InvalidArgument):
+            delete_batch(self.client, COLLECTION, ["a"], self.bucket)
+        assert self.client.batch_delete_data_objects.call_count == 1
@@ -0,0 +1,67 @@
+"""Tests for GCP environment helpers."""
+
+import os
+import sys
+from unittest.mock import patch
+
+from mcp_server.infrastructure import gcp
+from mcp_server.infrastructure.gcp import (
+    LazyModule,
+    resolve_location,
+    resolve_project_id,
+)
+
+
+class TestResolveProjectId:
+    """Tests for resolve_project_id."""
+
+    def setup_method(self):
+        """Forget any cached metadata lookup."""
+        gcp._metadata_project_id.cache_clear()
+
+    def teardown_method(self):
+        """Do not leak the mocked lookup into other tests."""
+        gcp._metadata_project_id.cache_clear()
+
+    def test_env_var_takes_precedence(self):
+        """GCP_PROJECT_ID wins without querying the metadata server."""
+        with (
+            patch.dict(os.environ, {"GCP_PROJECT_ID": "env-project"}),
+            patch("urllib.request.urlopen") as mock_urlopen,
+        ):
+            assert resolve_project_id() == "env-project"
+        mock_urlopen.assert_not_called()
+
+    def test_metadata_lookup_is_memoized(self):
+        """The metadata server is queried once per process, failures included."""
+        env = {
+            k: v
+            for k, v in os.environ.items()
+            if k not in ("GCP_PROJECT_ID", "GOOGLE_CLOUD_PROJECT")
+        }
+        with (
+            patch.dict(os.environ, env, clear=True),
+            patch("urllib.request.urlopen", side_effect=OSError) as mock_urlopen,
+        ):
+            assert resolve_project_id() is None
+            assert resolve_project_id() is None
+        mock_urlopen.assert_called_once()
+
+    def test_location_defaults(self):
+        """Location falls back to us-central1."""
+        with patch.dict(os.environ, {"GCP_LOCATION": ""}):
+            assert resolve_location() == "us-central1"
+
+
+class TestLazyModule:
+    """Tests for LazyModule."""
+
+    def test_imports_on_first_attribute_access(self):
+        """The module is imported only when an attribute is read."""
+        with patch.dict(sys.modules):
+            sys.modules.pop("colorsys", None)
+            lazy = LazyModule("colorsys")
+            assert "colorsys" not in sys.modules
+
+            assert lazy.rgb_to_hsv(0, 0, 0) == (0.0, 0.0, 0.0)
+            assert "colorsys" in sys.modules
@@ -0,0 +1,163 @@
+"""Tests for LocalReplicaKnowledgeRepository."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mcp_server.domain.models import SearchFilter  # noqa: E402
+from mcp_server.infrastructure.local_replica import (  # noqa: E402
+    LocalReplicaKnowledgeRepository,
+    quantize,
+)
+
+
+def make_data_object(id: str, vector: list[float], updated_at: str, **data):
+    """Build a DataObject-like object as returned by query_data_objects."""
+    return SimpleNamespace(
+        data={"id": id, "title": id, "updated_at": updated_at, **data},
+        vectors={
+            "content_embedding": SimpleNamespace(dense=SimpleNamespace(values=vector))
+        },
+    )
+
+
+EMBEDDINGS = {
+    "alpha": [1.0, 0.0, 0.0, 0.0],
+    "beta": [0.0, 1.0, 0.0, 0.0],
+}
+
+
+class TestQuantize:
+    """Tests for int8 quantization."""
+
+    def test_round_trip_preserves_direction(self):
+        """Dequantized rows approximate the unit vectors."""
+        vectors = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, -2.0]])
+
+        rows, scales = quantize(vectors)
+
+        assert rows.dtype == np.int8
+        np.testing.assert_allclose(
+            rows * scales[:, None], [[0.6, 0.8, 0.0], [0.0, 0.0, -1.0]], atol=0.01
+        )
+
+
+class TestLocalReplicaKnowledgeRepository:
+    """Tests for LocalReplicaKnowledgeRepository.
+
+    Test selection constraints applied:
+    - C1 coverage: Minimum cases for branch coverage
+    - Priority: P1 normal cases + P2 incremental refresh
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Set up a replica backed by a mocked primary."""
+        self.path = tmp_path / "replica"
+        self.repo = self._open()
+
+    def _open(self):
+        repo = LocalReplicaKnowledgeRepository(
+            self.path,
+            embed_query=lambda query: EMBEDDINGS[query],
+            project_id="test-project",
+            dimensions=4,
+        )
+        repo._search_client = MagicMock()
+        return repo
+
+    # P1: 正常系 - 空のレプリカ
+    def test_search_empty_replica(self):
+        """Search on an empty replica returns no results."""
+        result = self.repo.search("alpha")
+
+        assert result.items == []
+        assert result.total == 0
+
+    # P1: 正常系 - 検索
+    def test_search_ranks_by_similarity(self):
+        """Nearest vectors are returned first."""
+        self.repo._search_client.query_data_objects.return_value = [
+            make_data_object("a", [0.9, 0.1, 0.0, 0.0], "2024-01-01T00:00:00"),
+            make_data_object("b", [0.1, 0.9, 0.0, 0.0], "2024-01-01T00:00:00"),
+        ]
+        assert self.repo.refresh() == 2
+
+        result = self.repo.search("beta", limit=1)
+
+        assert [item.id for item in result.items] == ["b"]
+        assert result.items[0].score == pytest.approx(0.99, abs=0.02)
+
+    def test_search_applies_filters_before_top_k(self):
+        """Filtered-out rows never take a top-k slot."""
+        self.repo._search_client.query_data_objects.return_value = [
+            make_data_object("a", [0.0, 1.0, 0.0, 0.0], "2024-01-01", status="draft"),
+            make_data_object(
+                "b", [0.1, 0.9, 0.0, 0.0], "2024-01-01", status="promoted"
+            ),
+        ]
+        self.repo.refresh()
+
+        result = self.repo.search(
+            "beta", limit=1, filters=SearchFilter(status="promoted")
+        )
+
+        assert [item.id for item in result.items] == ["b"]
+
+    # P2: 差分更新
+    def test_incremental_refresh_filters_by_updated_at(self):
+        """Incremental refresh asks only for newer objects and upserts them."""
+        client = self.repo._search_client
+        client.query_data_objects.return_value = [
+            make_data_object("a", [1.0, 0.0, 0.0, 0.0], "2024-01-01T00:00:00"),
+        ]
+        self.repo.refresh()
+
+        client.query_data_objects.return_value = [
+            make_data_object(
+                "a", [0.0, 1.0, 0.0, 0.0], "2024-01-02T00:00:00", title="new"
+            ),
+        ]
+        self.repo.refresh()
+
+        request = client.query_data_objects.call_args.kwargs["request"]
+        assert request.filter["updated_at"]["$gte"] == "2024-01-01T00:00:00"
+        result = self.repo.search("beta", limit=5)
+        assert [item.title for item in result.items] == ["new"]
+
+    # P2: 境界 - synced_until と同じ updated_at
+    def test_incremental_refresh_includes_boundary_timestamp(self):
+        """Objects at synced_until are fetched again; new ones are added once."""
+        client = self.repo._search_client
+        client.query_data_objects.return_value = [
+            make_data_object("a", [1.0, 0.0, 0.0, 0.0], "2024-01-01T00:00:00"),
+        ]
+        self.repo.refresh()
+
+        client.query_data_objects.return_value = [
+            make_data_object("a", [1.0, 0.0, 0.0, 0.0], "2024-01-01T00:00:00"),
+            make_data_object("b", [0.0, 1.0, 0.0, 0.0], "2024-01-01T00:00:00"),
+        ]
+        assert self.repo.refresh() == 1
+        assert self.repo.refresh() == 0
+
+        result = self.repo.search("alpha", limit=5)
+        assert sorted(item.id for item in result.items) == ["a", "b"]
+
+    # P2: 複数プロセス共有
+    def test_other_instance_sees_published_generation(self):
+        """A second replica on the same directory maps the refreshed data."""
+        reader = self._open()
+        assert reader.get("a") is None
+
+        self.repo._search_client.query_data_objects.return_value = [
+            make_data_object("a", [1.0, 0.0, 0.0, 0.0], "2024-01-01T00:00:00"),
+        ]
+        self.repo.refresh()
+
+        knowledge = reader.get("a")
+        assert knowledge is not None
+        assert knowledge.title == "a"
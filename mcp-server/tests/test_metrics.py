@@ -0,0 +1,91 @@
+"""Tests for metrics recording."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastmcp import Client, FastMCP
+from google.api_core.exceptions import ServiceUnavailable
+
+from mcp_server.domain.models import Knowledge, SearchResult
+from mcp_server.infrastructure.instrumented_repository import (
+    InstrumentedKnowledgeRepository,
+)
+from mcp_server.metrics import Metrics
+from mcp_server.middleware import ToolMetricsMiddleware
+
+
+def sample(metrics: Metrics, name: str, **labels) -> float | None:
+    """Read one sample value from the metrics registry."""
+    return metrics.registry.get_sample_value(name, labels)
+
+
+class TestInstrumentedKnowledgeRepository:
+    """Tests for InstrumentedKnowledgeRepository."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.metrics = Metrics()
+        self.inner = AsyncMock()
+        self.repo = InstrumentedKnowledgeRepository(self.inner, self.metrics)
+
+    async def test_search_records_latency_and_results(self):
+        """A search records its latency, result count and payload size."""
+        self.inner.search.return_value = SearchResult(
+            items=[Knowledge(id="1", title="ab", content="cde")], total=1
+        )
+
+        result = await self.repo.search("q", limit=5)
+
+        assert result.total == 1
+        self.inner.search.assert_awaited_once_with(
+            "q", limit=5, fields=None, filters=None, mode="semantic", cursor=None
+        )
+        m = self.metrics
+        name = "knowledge_repository_duration_seconds_count"
+        assert sample(m, name, method="search") == 1
+        assert sample(m, "knowledge_repository_results_sum", method="search") == 1
+        assert sample(m, "knowledge_repository_payload_bytes_sum", method="search") == 5
+        assert sample(m, "knowledge_repository_in_flight", method="search") == 0
+
+    async def test_error_counted_by_grpc_status(self):
+        """Errors are counted by gRPC status code and re-raised."""
+        self.inner.get.side_effect = ServiceUnavailable("down")
+
+        with pytest.raises(ServiceUnavailable):
+            await self.repo.get("id")
+
+        value = sample(
+            self.metrics,
+            "knowledge_repository_errors_total",
+            method="get",
+            code="UNAVAILABLE",
+        )
+        assert value == 1
+
+    def test_uninstrumented_attributes_are_delegated(self):
+        """Other attributes fall through to the wrapped repository."""
+        self.inner.search_cache_stats = lambda: "stats"
+
+        assert self.repo.search_cache_stats() == "stats"
+
+
+class TestToolMetricsMiddleware:
+    """Tests for ToolMetricsMiddleware."""
+
+    async def test_tool_latency_recorded_by_outcome(self):
+        """Tool calls are timed and labelled by outcome."""
+        metrics = Metrics()
+        mcp = FastMCP("test")
+        mcp.add_middleware(ToolMetricsMiddleware(metrics))
+
+        @mcp.tool
+        def fails() -> str:
+            raise ValueError("boom")
+
+        async with Client(mcp) as client:
+            await client.call_tool("fails", {}, raise_on_error=False)
+
+        name = "mcp_tool_duration_seconds_count"
+        assert sample(metrics, name, tool="fails", outcome="error") == 1
+        assert sample(metrics, "mcp_tool_in_flight", tool="fails") == 0
+        assert b"mcp_tool_duration_seconds_bucket" in metrics.render()
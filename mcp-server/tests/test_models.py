@@ -1,7 +1,10 @@
 """Tests for domain models."""
 
+import dataclasses
 from datetime import UTC, datetime
 
+import pytest
+
 from mcp_server.domain.models import ArchivedKnowledge, Knowledge, SearchResult
 
 
@@ -129,6 +132,15 @@ class TestKnowledge:
         assert knowledge.pr_url == ""
         assert knowledge.promoted_from_id == ""
 
+    def test_slotted_and_mutable(self):
+        """Knowledge has no per-instance __dict__ but can still be updated."""
+        knowledge = Knowledge(id="id", title="Title", content="Content")
+
+        knowledge.status = "proposed"
+
+        assert not hasattr(knowledge, "__dict__")
+        assert knowledge.status == "proposed"
+
 
 class TestSearchResult:
     """Tests for SearchResult dataclass."""
@@ -206,3 +218,11 @@ class TestArchivedKnowledge:
         assert archived.promoted_to_id == ""
         assert archived.archived_at is None
         assert archived.original_created_at is None
+
+    def test_archived_knowledge_is_immutable(self):
+        """ArchivedKnowledge is slotted and cannot be modified."""
+        archived = ArchivedKnowledge(id="id", title="Title", content="Content")
+
+        assert not hasattr(archived, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            archived.title = "Changed"  # type: ignore[misc]
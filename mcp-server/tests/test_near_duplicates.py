@@ -0,0 +1,125 @@
+"""Tests for near-duplicate detection."""
+
+import pytest
+
+from mcp_server.domain.models import Knowledge
+from mcp_server.infrastructure.near_duplicates import (
+    NearDuplicateIndex,
+    minhash_signature,
+    similarity,
+)
+
+INSIGHT = (
+    "Cloud Run cold starts are dominated by importing the Google client "
+    "libraries; import them lazily so the health check answers quickly."
+)
+REWORDED = (
+    "Cloud Run cold starts are dominated by importing the Google client "
+    "libraries. Import them lazily so that the health check answers fast!"
+)
+UNRELATED = (
+    "Use reciprocal rank fusion to merge text and semantic rankings; "
+    "the rank offset k flattens the advantage of the top results."
+)
+
+
+def knowledge(id: str, content: str, title: str = "tip") -> Knowledge:
+    """Build a knowledge item with the given ID and content."""
+    return Knowledge(id=id, title=title, content=content)
+
+
+async def scan(*items: Knowledge):
+    """Yield items like an async collection scan."""
+    for item in items:
+        yield item
+
+
+class TestMinhashSignature:
+    """Tests for minhash_signature.
+
+    Test selection constraints:
+    - Signatures are deterministic and estimate Jaccard similarity
+    """
+
+    # P1: 正常系 - 言い換えは類似、無関係は非類似
+    def test_similarity_separates_rewording_from_unrelated_text(self):
+        """Reworded text scores high, unrelated text low."""
+        base = minhash_signature(INSIGHT)
+
+        assert similarity(base, minhash_signature(REWORDED)) >= 0.7
+        assert similarity(base, minhash_signature(UNRELATED)) < 0.3
+
+    # P1: 正常系 - 大文字小文字・句読点を無視
+    def test_case_and_punctuation_are_ignored(self):
+        """Normalization makes formatting-only changes identical."""
+        assert minhash_signature("Hello, World!") == minhash_signature("hello world")
+
+    # P2: 境界 - 単語区切りのない文
+    def test_text_without_spaces(self):
+        """Character shingles also compare Japanese text."""
+        a = minhash_signature("ベクトル検索のフィルタはランキング前に適用される")
+        b = minhash_signature("ベクトル検索のフィルタはランキングの前に適用される")
+
+        assert similarity(a, b) >= 0.7
+
+
+class TestNearDuplicateIndex:
+    """Tests for NearDuplicateIndex.
+
+    Test selection constraints:
+    - Focus on lookups, removal and bulk rebuild
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.index = NearDuplicateIndex(threshold=0.7)
+
+    # P1: 正常系 - 近似重複を検出
+    def test_find_returns_reworded_item(self):
+        """A reworded insight matches the indexed original."""
+        self.index.add(knowledge("a", INSIGHT))
+        self.index.add(knowledge("b", UNRELATED))
+
+        matches = self.index.find("tip", REWORDED)
+
+        assert [m.id for m in matches] == ["a"]
+        assert matches[0].similarity >= 0.7
+
+    # P1: 正常系 - 削除後は検出しない
+    def test_removed_item_is_not_found(self):
+        """Removed items no longer match."""
+        self.index.add(knowledge("a", INSIGHT))
+        self.index.remove("a")
+
+        assert self.index.find("tip", INSIGHT) == []
+        assert len(self.index) == 0
+
+    # P1: 正常系 - 一括再構築
+    async def test_arebuild_replaces_contents(self):
+        """A rebuild replaces the contents with the scanned items."""
+        self.index.add(knowledge("stale", UNRELATED))
+
+        count = await self.index.arebuild(scan(knowledge("a", INSIGHT)))
+
+        assert count == 1
+        assert [m.id for m in self.index.find("tip", INSIGHT)] == ["a"]
+        assert self.index.find("tip", UNRELATED) == []
+
+    # P2: 並行 - 再構築中の変更を保持
+    def test_changes_during_rebuild_are_kept(self):
+        """Adds and removes made during a scan survive the swap."""
+        self.index.add(knowledge("gone", UNRELATED))
+
+        def items():
+            yield knowledge("gone", UNRELATED)
+            self.index.add(knowledge("new", INSIGHT))
+            self.index.remove("gone")
+
+        assert self.index.rebuild(items()) == 1
+        assert [m.id for m in self.index.find("tip", INSIGHT)] == ["new"]
+
+    # P3: 異常系 - 不正なバンド数
+    def test_bands_must_divide_num_perm(self):
+        """Signature length must split evenly into bands."""
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(num_perm=64, bands=10)
@@ -1,9 +1,10 @@
 """Tests for promote_knowledge tool."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
+from mcp_server.domain.exceptions import StatusConflictError
 from mcp_server.domain.models import Knowledge
 from mcp_server.tools.promote_knowledge import register
 
@@ -32,25 +33,18 @@ class TestPromoteKnowledge:
     def setup_method(self):
         """Set up test fixtures."""
         self.mock_mcp = MockMCP()
-        self.mock_repository = MagicMock()
+        self.mock_repository = AsyncMock()
         register(self.mock_mcp, self.mock_repository)
         self.promote_knowledge = self.mock_mcp.tools["promote_knowledge"]
 
     # P1: 正常系 - コアパス
-    def test_promote_success(self):
+    async def test_promote_success(self):
         """Promote knowledge from draft to proposed status.
 
         WHEN: personal/draft の knowledge ID を指定
         THEN: status が "proposed" に更新される
         """
-        # Arrange: draft 状態の knowledge をモック
-        self.mock_repository.get.return_value = Knowledge(
-            id="draft-id",
-            title="Draft Title",
-            content="Draft content",
-            source="personal",
-            status="draft",
-        )
+        # Arrange: draft からの条件付き更新をモック
         self.mock_repository.update_status.return_value = Knowledge(
             id="draft-id",
             title="Draft Title",
@@ -60,62 +54,53 @@ class TestPromoteKnowledge:
         )
 
         # Act
-        result = self.promote_knowledge(id="draft-id")
+        result = await self.promote_knowledge(id="draft-id")
 
         # Assert
         assert result["status"] == "proposed"
         assert result["id"] == "draft-id"
-        self.mock_repository.get.assert_called_once_with("draft-id")
+        self.mock_repository.get.assert_not_called()
         self.mock_repository.update_status.assert_called_once_with(
-            "draft-id", "proposed"
+            "draft-id", "proposed", expected_status="draft"
         )
 
     # P2: バリデーション - id空
-    def test_promote_empty_id(self):
+    async def test_promote_empty_id(self):
         """Empty id raises ValueError.
 
         WHEN: id が空文字列
         THEN: ValueError("id is required") が発生
         """
         with pytest.raises(ValueError, match="id is required"):
-            self.promote_knowledge(id="")
+            await self.promote_knowledge(id="")
 
-    def test_promote_whitespace_id(self):
+    async def test_promote_whitespace_id(self):
         """Whitespace-only id raises ValueError."""
         with pytest.raises(ValueError, match="id is required"):
-            self.promote_knowledge(id="   ")
+            await self.promote_knowledge(id="   ")
 
     # P2: エラーハンドリング - 存在しないID
-    def test_promote_not_found(self):
+    async def test_promote_not_found(self):
         """Non-existent id raises error.
 
         WHEN: 存在しない ID を指定
         THEN: ValueError("knowledge not found") が発生
         """
-        self.mock_repository.get.return_value = None
+        self.mock_repository.update_status.return_value = None
 
         with pytest.raises(ValueError, match="knowledge not found"):
-            self.promote_knowledge(id="non-existent-id")
-
-        self.mock_repository.get.assert_called_once_with("non-existent-id")
+            await self.promote_knowledge(id="non-existent-id")
 
     # P2: ビジネスルール - 昇格不可状態
-    def test_promote_invalid_state(self):
+    async def test_promote_invalid_state(self):
         """Non-draft knowledge cannot be promoted.
 
         WHEN: status が "proposed" の knowledge を昇格しようとする
         THEN: ValueError("only draft knowledge can be promoted") が発生
         """
-        self.mock_repository.get.return_value = Knowledge(
-            id="proposed-id",
-            title="Proposed Title",
-            content="Proposed content",
-            source="personal",
-            status="proposed",
+        self.mock_repository.update_status.side_effect = StatusConflictError(
+            "proposed-id", "proposed"
         )
 
         with pytest.raises(ValueError, match="only draft knowledge can be promoted"):
-            self.promote_knowledge(id="proposed-id")
-
-        self.mock_repository.get.assert_called_once_with("proposed-id")
-        self.mock_repository.update_status.assert_not_called()
+            await self.promote_knowledge(id="proposed-id")
@@ -0,0 +1,251 @@
+"""Tests for the promotion orchestrator and the POST /promotions route."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastmcp import FastMCP
+from starlette.testclient import TestClient
+
+from mcp_server.domain.models import Knowledge, SaveResult
+from mcp_server.promotion import (
+    PromotionOrchestrator,
+    PromotionRequest,
+    register,
+    team_id_for,
+)
+
+
+def proposed(id: str) -> Knowledge:
+    """Build stored personal knowledge awaiting promotion."""
+    return Knowledge(
+        id=id,
+        title=f"Title {id}",
+        content=f"Content {id}",
+        tags=["python"],
+        status="proposed",
+        pr_url=f"https://github.com/org/repo/pull/{id}",
+    )
+
+
+def repository_with(*stored: Knowledge) -> AsyncMock:
+    """Build a repository mock whose collection holds stored."""
+    by_id = {knowledge.id: knowledge for knowledge in stored}
+    repository = AsyncMock()
+    repository.get.side_effect = lambda id: by_id.get(id)
+    repository.find_by_github_path.return_value = None
+    repository.save_many.side_effect = lambda items: [
+        SaveResult(item) for item in items
+    ]
+    repository.delete.return_value = True
+    return repository
+
+
+class TestPromotionOrchestrator:
+    """Tests for PromotionOrchestrator.
+
+    Test selection constraints:
+    - Focus on the concurrent writes, compensation and bulk results
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.archive = AsyncMock()
+        self.archive.save.side_effect = lambda archived: archived
+
+    # P1: 正常系 - 昇格完了
+    async def test_promote_writes_team_archive_and_deletes_original(self):
+        """The team copy, the archive and the delete are all issued."""
+        repository = repository_with(proposed("k1"))
+        duplicates = MagicMock()
+        orchestrator = PromotionOrchestrator(
+            repository, self.archive, duplicates=duplicates
+        )
+
+        team = await orchestrator.promote("k1", "docs/k1.md")
+
+        assert team.id == team_id_for("k1")
+        assert (team.source, team.status, team.github_path, team.promoted_from_id) == (
+            "team",
+            "promoted",
+            "docs/k1.md",
+            "k1",
+        )
+        archived = self.archive.save.await_args[0][0]
+        assert (archived.id, archived.promoted_to_id) == ("k1", team.id)
+        repository.delete.assert_awaited_once_with("k1")
+        duplicates.remove.assert_called_once_with("k1")
+        duplicates.add.assert_called_once_with(team)
+
+    # P1: 正常系 - 同期済みのチーム知見を再利用
+    async def test_reuses_team_knowledge_already_synced(self):
+        """Knowledge synced at the path first is linked, not duplicated."""
+        repository = repository_with(proposed("k1"))
+        repository.find_by_github_path.return_value = Knowledge(
+            id="synced",
+            title="From GitHub",
+            content="body",
+            source="team",
+            status="promoted",
+            github_path="docs/k1.md",
+        )
+        orchestrator = PromotionOrchestrator(repository, self.archive)
+
+        team = await orchestrator.promote("k1", "docs/k1.md")
+
+        assert (team.id, team.title, team.promoted_from_id) == (
+            "synced",
+            "From GitHub",
+            "k1",
+        )
+
+    # P2: 異常系 - アーカイブ失敗時の補償
+    async def test_failed_archive_undoes_team_and_keeps_original(self):
+        """A failed archive deletes the team copy; the original is never deleted."""
+        repository = repository_with(proposed("k1"))
+        self.archive.save.side_effect = RuntimeError("unavailable")
+        orchestrator = PromotionOrchestrator(repository, self.archive)
+
+        (result,) = await orchestrator.promote_many(
+            [PromotionRequest("k1", "docs/k1.md")]
+        )
+
+        assert not result.ok
+        assert "archive: unavailable" in result.error
+        repository.delete.assert_awaited_once_with(team_id_for("k1"))
+        repository.save.assert_not_called()
+        self.archive.delete.assert_not_called()
+
+    # P2: 正常系 - 削除済み応答は成功扱い
+    async def test_delete_not_found_counts_as_done(self):
+        """A delete answering "not found" completes the promotion."""
+        repository = repository_with(proposed("k1"))
+        repository.delete.return_value = False
+        orchestrator = PromotionOrchestrator(repository, self.archive)
+
+        team = await orchestrator.promote("k1", "docs/k1.md")
+
+        assert team.id == team_id_for("k1")
+        repository.delete.assert_awaited_once_with("k1")
+        self.archive.delete.assert_not_called()
+
+    # P2: 異常系 - 削除失敗時は元を復元してからコピーを削除
+    async def test_failed_delete_restores_original_before_undo(self):
+        """The original is restored before its copies are removed."""
+        original = proposed("k1")
+        repository = repository_with(original)
+        calls = []
+
+        def delete(id):
+            calls.append(("delete", id))
+            if id == "k1":
+                raise RuntimeError("deadline")
+            return True
+
+        def save(knowledge):
+            calls.append(("save", knowledge.id))
+            return knowledge
+
+        repository.delete.side_effect = delete
+        repository.save.side_effect = save
+        self.archive.delete.side_effect = lambda id: calls.append(("unarchive", id))
+        orchestrator = PromotionOrchestrator(repository, self.archive)
+
+        (result,) = await orchestrator.promote_many(
+            [PromotionRequest("k1", "docs/k1.md")]
+        )
+
+        assert result.error == "delete: deadline"
+        assert calls[:2] == [("delete", "k1"), ("save", "k1")]
+        assert set(calls[2:]) == {("delete", team_id_for("k1")), ("unarchive", "k1")}
+
+    # P3: 異常系 - 復元失敗時はコピーを残す
+    async def test_failed_restore_keeps_copies(self):
+        """If the original cannot be restored, archive and team copy are kept."""
+        repository = repository_with(proposed("k1"))
+        repository.delete.side_effect = RuntimeError("deadline")
+        repository.save.side_effect = RuntimeError("unavailable")
+        orchestrator = PromotionOrchestrator(repository, self.archive)
+
+        (result,) = await orchestrator.promote_many(
+            [PromotionRequest("k1", "docs/k1.md")]
+        )
+
+        assert "needs manual repair" in result.error
+        repository.delete.assert_awaited_once_with("k1")
+        self.archive.delete.assert_not_called()
+
+    # P1: 正常系 - 一括昇格
+    async def test_promote_many_reports_per_item_results(self):
+        """Valid items are saved in one batch; invalid ones get errors."""
+        draft = Knowledge(id="k3", title="t", content="c")
+        repository = repository_with(proposed("k1"), proposed("k2"), draft)
+        orchestrator = PromotionOrchestrator(repository, self.archive)
+
+        results = await orchestrator.promote_many(
+            [
+                PromotionRequest("k1", "docs/k1.md"),
+                PromotionRequest("missing", "docs/m.md"),
+                PromotionRequest("k2", "docs/k2.md"),
+                PromotionRequest("k3", "docs/k3.md"),
+            ]
+        )
+
+        assert [r.ok for r in results] == [True, False, True, False]
+        assert results[1].error == "knowledge not found"
+        assert results[3].error == "only proposed knowledge can be promoted"
+        repository.save_many.assert_awaited_once()
+        saved = repository.save_many.await_args[0][0]
+        assert [k.promoted_from_id for k in saved] == ["k1", "k2"]
+        assert self.archive.save.await_count == 2
+
+
+class TestPromotionsRoute:
+    """Tests for the /promotions route."""
+
+    def client(self, orchestrator) -> TestClient:
+        """Build a test client for an app with the route registered."""
+        mcp = FastMCP("test")
+        with patch.dict("os.environ", {"SYNC_TOKEN": "secret"}):
+            register(mcp, orchestrator)
+        return TestClient(mcp.http_app())
+
+    # P1: 正常系 - 認証付き一括昇格
+    def test_promotions_with_token_returns_results(self):
+        """An authorized request returns the per-item results."""
+        orchestrator = PromotionOrchestrator(
+            repository_with(proposed("k1")), AsyncMock()
+        )
+
+        response = self.client(orchestrator).post(
+            "/promotions",
+            json={
+                "promotions": [
+                    {"id": "k1", "github_path": "docs/k1.md"},
+                    {"id": "k2", "github_path": "docs/k2.md"},
+                ]
+            },
+            headers={"Authorization": "Bearer secret"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "promoted": 1,
+            "failed": 1,
+            "results": [
+                {"id": "k1", "team_id": team_id_for("k1")},
+                {"id": "k2", "error": "knowledge not found"},
+            ],
+        }
+
+    # P3: 異常系 - 認証エラーと不正リクエスト
+    def test_rejects_bad_token_and_bad_body(self):
+        """Wrong tokens get 401 and invalid bodies 400."""
+        client = self.client(PromotionOrchestrator(AsyncMock(), AsyncMock()))
+
+        assert client.post("/promotions", json={}).status_code == 401
+        response = client.post(
+            "/promotions",
+            json={"promotions": [{"id": "k1"}]},
+            headers={"Authorization": "Bearer secret"},
+        )
+        assert response.status_code == 400
+        assert response.json() == {"error": "promotions[0].github_path is required"}
@@ -0,0 +1,77 @@
+"""Tests for query embeddings and their cache."""
+
+from unittest.mock import MagicMock
+
+from mcp_server.infrastructure.query_embedding import EmbeddingCache, QueryEmbedder
+
+
+def predict_response(values: list[float]) -> MagicMock:
+    """Build a predict endpoint response carrying one embedding."""
+    response = MagicMock()
+    response.json.return_value = {"predictions": [{"embeddings": {"values": values}}]}
+    return response
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache.
+
+    Test selection constraints applied:
+    - C1 coverage: Minimum cases for branch coverage
+    - Priority: P1 normal cases + P2 eviction/persistence boundaries
+    """
+
+    # P1: 正常系 - 正規化したクエリでヒット
+    def test_hit_on_normalized_query(self):
+        """Queries differing in case and whitespace share an entry."""
+        cache = EmbeddingCache()
+        cache.put("Cloud  Run", [0.1, 0.2])
+
+        assert cache.get("cloud run") == (0.1, 0.2)
+        assert cache.stats().hits == 1
+
+    # P2: 境界 - LRU 追い出し
+    def test_least_recently_used_evicted(self):
+        """The least recently used vector is dropped when full."""
+        cache = EmbeddingCache(maxsize=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")
+        cache.put("c", [3.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == (1.0,)
+
+    # P2: 境界 - ディスク永続化と再読み込み
+    def test_persisted_vectors_survive_restart(self, tmp_path):
+        """A new cache on the same file starts with the stored vectors."""
+        path = tmp_path / "embeddings.jsonl"
+        cache = EmbeddingCache(maxsize=1, path=path)
+        for query in ("a", "b", "c"):
+            cache.put(query, [float(ord(query))])
+
+        restarted = EmbeddingCache(maxsize=1, path=path)
+
+        assert restarted.get("c") == (99.0,)
+        assert restarted.get("a") is None
+        assert len(path.read_text().splitlines()) <= 2
+
+
+class TestQueryEmbedder:
+    """Tests for QueryEmbedder."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.embedder = QueryEmbedder(project_id="test-project")
+        self.embedder._session = MagicMock()
+        self.embedder._session.post.return_value = predict_response([0.5, 0.5])
+
+    # P1: 正常系 - 2 回目はキャッシュから
+    async def test_repeated_query_embedded_once(self):
+        """Only the first embedding of a query calls the endpoint."""
+        assert self.embedder.embed("deploy") == (0.5, 0.5)
+        assert await self.embedder.aembed("Deploy ") == (0.5, 0.5)
+
+        self.embedder._session.post.assert_called_once()
+        body = self.embedder._session.post.call_args.kwargs["json"]
+        assert body["instances"][0]["task_type"] == "QUESTION_ANSWERING"
+        assert body["parameters"]["outputDimensionality"] == 768
@@ -0,0 +1,41 @@
+"""Tests for reciprocal rank fusion."""
+
+import pytest
+
+from mcp_server.domain.models import Knowledge
+from mcp_server.infrastructure.rank_fusion import reciprocal_rank_fusion
+
+
+def ranking(*ids: str) -> list[Knowledge]:
+    """Build a ranking of knowledge items with the given IDs."""
+    return [Knowledge(id=id, title=id, content="") for id in ids]
+
+
+class TestReciprocalRankFusion:
+    """Tests for reciprocal_rank_fusion."""
+
+    # P1: 正常系 - 両方に出現するものが上位
+    def test_items_in_both_rankings_win(self):
+        """Items ranked by both inputs outrank items ranked by one."""
+        fused = reciprocal_rank_fusion(
+            [(ranking("a", "b"), 1.0), (ranking("c", "b"), 1.0)], limit=10, k=60
+        )
+
+        assert [item.id for item in fused] == ["b", "a", "c"]
+        assert fused[0].score == pytest.approx(1 / 62 + 1 / 62)
+
+    # P1: 正常系 - 重み付け
+    def test_weights_shift_the_order(self):
+        """A heavier ranking decides between singly-ranked items."""
+        fused = reciprocal_rank_fusion(
+            [(ranking("a"), 1.0), (ranking("c"), 2.0)], limit=10
+        )
+
+        assert [item.id for item in fused] == ["c", "a"]
+
+    # P2: 境界 - limit
+    def test_limit_truncates(self):
+        """At most limit items are returned."""
+        fused = reciprocal_rank_fusion([(ranking("a", "b", "c"), 1.0)], limit=2)
+
+        assert [item.id for item in fused] == ["a", "b"]
@@ -0,0 +1,140 @@
+"""Tests for retries and hedged reads of repository calls."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from google.api_core.exceptions import (
+    DeadlineExceeded,
+    InvalidArgument,
+    ServiceUnavailable,
+)
+
+from mcp_server.domain.models import Knowledge
+from mcp_server.infrastructure.resilience import (
+    ResilientKnowledgeRepository,
+    RetryPolicy,
+    is_retryable,
+)
+from mcp_server.metrics import Metrics
+
+STORED = Knowledge(id="k1", title="t", content="c")
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy and error classification."""
+
+    # P1: 正常系 - 指数バックオフ上限内のジッター
+    def test_backoff_is_jittered_below_exponential_cap(self):
+        """Delays are random fractions of a doubling, capped bound."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+        assert policy.backoff(1, rand=lambda: 1.0) == pytest.approx(0.1)
+        assert policy.backoff(2, rand=lambda: 0.5) == pytest.approx(0.1)
+        assert policy.backoff(5, rand=lambda: 1.0) == pytest.approx(0.3)
+
+    # P1: 正常系 - 一時的エラーと恒久的エラーの分類
+    def test_classification(self):
+        """UNAVAILABLE and DEADLINE_EXCEEDED retry; INVALID_ARGUMENT does not."""
+        assert is_retryable(ServiceUnavailable("down"))
+        assert is_retryable(DeadlineExceeded("slow"))
+        assert not is_retryable(InvalidArgument("bad"))
+
+
+class TestResilientKnowledgeRepository:
+    """Tests for ResilientKnowledgeRepository.
+
+    Test selection constraints:
+    - Focus on retry, terminal errors, deadline and hedging
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.metrics = Metrics()
+        self.inner = AsyncMock()
+
+    def repo(self, **policy) -> ResilientKnowledgeRepository:
+        """Build a wrapper with a zero-backoff policy."""
+        policy.setdefault("base_delay", 0.0)
+        return ResilientKnowledgeRepository(
+            self.inner, RetryPolicy(**policy), self.metrics
+        )
+
+    def sample(self, name: str, method: str) -> float | None:
+        """Read one sample value from the metrics registry."""
+        return self.metrics.registry.get_sample_value(name, {"method": method})
+
+    # P1: 正常系 - 一時的エラー後に再試行で成功
+    async def test_transient_error_is_retried(self):
+        """A get failing with UNAVAILABLE succeeds on the next attempt."""
+        self.inner.get.side_effect = [ServiceUnavailable("down"), STORED]
+
+        assert await self.repo().get("k1") is STORED
+        assert self.inner.get.await_count == 2
+        assert self.sample("knowledge_repository_retries_total", "get") == 1
+
+    # P2: 異常系 - 恒久的エラーは再試行しない
+    async def test_terminal_error_is_raised_at_once(self):
+        """INVALID_ARGUMENT is raised without a retry."""
+        self.inner.search.side_effect = InvalidArgument("bad filter")
+
+        with pytest.raises(InvalidArgument):
+            await self.repo().search("q")
+        assert self.inner.search.await_count == 1
+
+    # P2: 異常系 - 試行回数の上限
+    async def test_gives_up_after_max_attempts(self):
+        """The last transient error is raised once attempts run out."""
+        self.inner.delete.side_effect = ServiceUnavailable("down")
+
+        with pytest.raises(ServiceUnavailable):
+            await self.repo(max_attempts=3).delete("k1")
+        assert self.inner.delete.await_count == 3
+
+    # P2: 正常系 - 応答喪失後の削除再試行
+    async def test_retried_delete_finding_nothing_reports_deleted(self):
+        """A retry answering "not found" reports the delete as done."""
+        self.inner.delete.side_effect = [ServiceUnavailable("lost"), False]
+
+        assert await self.repo().delete("k1") is True
+
+    # P2: 正常系 - 初回の削除で見つからない
+    async def test_first_delete_finding_nothing_reports_not_found(self):
+        """Without a retry, "not found" is reported as is."""
+        self.inner.delete.return_value = False
+
+        assert await self.repo().delete("k1") is False
+
+    # P2: 異常系 - 呼び出し全体の期限
+    async def test_deadline_bounds_all_attempts(self):
+        """A call still running at the deadline raises DeadlineExceeded."""
+
+        async def hang(id):
+            await asyncio.sleep(10)
+
+        self.inner.get.side_effect = hang
+
+        with pytest.raises(DeadlineExceeded):
+            await self.repo(deadline=0.05).get("k1")
+
+    # P1: 正常系 - 遅いリクエストのヘッジ
+    async def test_slow_read_is_hedged(self):
+        """A read slower than the recent p95 is answered by a second request."""
+        calls = 0
+
+        async def get(id):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(10)  # stuck request
+            return STORED
+
+        repo = self.repo(hedge=True, hedge_min_delay=0.01, hedge_budget=1.0)
+        self.inner.get.return_value = STORED
+        for _ in range(20):
+            await repo.get("k1")  # warm up the latency window
+        self.inner.get.side_effect = get
+
+        assert await asyncio.wait_for(repo.get("k1"), timeout=1) is STORED
+        assert calls == 2
+        assert self.sample("knowledge_repository_hedges_total", "get") == 1
@@ -0,0 +1,81 @@
+"""Tests for ResultPages."""
+
+import pytest
+
+from mcp_server.domain.exceptions import InvalidCursorError
+from mcp_server.domain.models import Knowledge
+from mcp_server.infrastructure.result_pages import ResultPages
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def ranking(count: int) -> list[Knowledge]:
+    """Build a ranking of count knowledge items with IDs "0", "1", ..."""
+    return [Knowledge(id=str(i), title="", content="") for i in range(count)]
+
+
+class TestResultPages:
+    """Tests for ResultPages.
+
+    Test selection constraints applied:
+    - C1 coverage: Minimum cases for branch coverage
+    - Priority: P1 normal cases + P2 expiry/mismatch boundaries
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.pages = ResultPages(prefetch_pages=3, ttl=10.0, clock=self.clock)
+
+    # P1: 正常系 - カーソルを辿って全件取得
+    def test_cursor_walks_the_stored_ranking(self):
+        """Following cursors returns the remaining hits in order."""
+        assert self.pages.window(2) == 6
+        first = self.pages.first_page("key", ranking(5), 2)
+
+        second = self.pages.page(first.next_cursor, "key", 2)
+        third = self.pages.page(second.next_cursor, "key", 2)
+
+        ids = [item.id for page in (first, second, third) for item in page.items]
+        assert ids == ["0", "1", "2", "3", "4"]
+        assert third.next_cursor is None
+
+    # P1: 正常系 - 1ページに収まる場合
+    def test_no_cursor_when_ranking_fits_one_page(self):
+        """No cursor is issued when there is nothing beyond the first page."""
+        assert self.pages.first_page("key", ranking(2), 2).next_cursor is None
+
+    # P2: 境界 - 有効期限切れ
+    def test_expired_cursor_raises(self):
+        """A cursor stops working once its ranking expired."""
+        first = self.pages.first_page("key", ranking(5), 2)
+        self.clock.now = 10.0
+
+        with pytest.raises(InvalidCursorError, match="expired"):
+            self.pages.page(first.next_cursor, "key", 2)
+
+    # P2: 異常系 - 別の検索のカーソル
+    def test_cursor_of_other_search_raises(self):
+        """A cursor is only valid for the search that issued it."""
+        first = self.pages.first_page("key", ranking(5), 2)
+
+        with pytest.raises(InvalidCursorError, match="different search"):
+            self.pages.page(first.next_cursor, "other", 2)
+        with pytest.raises(InvalidCursorError, match="malformed"):
+            self.pages.page("garbage", "key", 2)
+
+    # P2: 境界 - 既定では先読みしない
+    def test_default_fetches_one_page(self):
+        """Without prefetch_pages, a search fetches one page and no cursor."""
+        pages = ResultPages()
+
+        assert pages.window(10) == 10
+        assert pages.first_page("key", ranking(10), 10).next_cursor is None
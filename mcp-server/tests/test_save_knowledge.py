@@ -1,12 +1,22 @@
 """Tests for save_knowledge tool."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
 from mcp_server.domain.models import Knowledge
+from mcp_server.infrastructure.near_duplicates import NearDuplicateIndex
 from mcp_server.tools.save_knowledge import register
 
+INSIGHT = (
+    "Cloud Run cold starts are dominated by importing the Google client "
+    "libraries; import them lazily so the health check answers quickly."
+)
+REWORDED = (
+    "Cloud Run cold starts are dominated by importing the Google client "
+    "libraries. Import them lazily so that the health check answers fast!"
+)
+
 
 class MockMCP:
     """Mock MCP server for testing."""
@@ -26,11 +36,11 @@ class TestSaveKnowledge:
     def setup_method(self):
         """Set up test fixtures."""
         self.mock_mcp = MockMCP()
-        self.mock_repository = MagicMock()
+        self.mock_repository = AsyncMock()
         register(self.mock_mcp, self.mock_repository)
         self.save_knowledge = self.mock_mcp.tools["save_knowledge"]
 
-    def test_save_with_title_and_content(self):
+    async def test_save_with_title_and_content(self):
         """Save knowledge with title and content."""
         self.mock_repository.save.return_value = Knowledge(
             id="generated-id",
@@ -38,7 +48,7 @@ class TestSaveKnowledge:
             content="Test content",
         )
 
-        result = self.save_knowledge(
+        result = await self.save_knowledge(
             title="Test Title",
             content="Test content",
             tags=["tag1"],
@@ -55,7 +65,7 @@ class TestSaveKnowledge:
         assert saved_knowledge.content == "Test content"
         assert saved_knowledge.tags == ["tag1"]
 
-    def test_save_auto_generates_title_from_content(self):
+    async def test_save_auto_generates_title_from_content(self):
         """Title is auto-generated from content when not provided."""
         content = "This is a long content that should be truncated"
         expected_title = content[:30] + "..."
@@ -66,7 +76,7 @@ class TestSaveKnowledge:
             content=content,
         )
 
-        result = self.save_knowledge(
+        result = await self.save_knowledge(
             title=None,
             content=content,
         )
@@ -77,7 +87,7 @@ class TestSaveKnowledge:
         saved_knowledge = self.mock_repository.save.call_args[0][0]
         assert saved_knowledge.title == expected_title
 
-    def test_save_auto_generates_title_short_content(self):
+    async def test_save_auto_generates_title_short_content(self):
         """Title is auto-generated without truncation for short content."""
         self.mock_repository.save.return_value = Knowledge(
             id="generated-id",
@@ -85,7 +95,7 @@ class TestSaveKnowledge:
             content="Short",
         )
 
-        result = self.save_knowledge(
+        result = await self.save_knowledge(
             title=None,
             content="Short",
         )
@@ -95,17 +105,17 @@ class TestSaveKnowledge:
         saved_knowledge = self.mock_repository.save.call_args[0][0]
         assert saved_knowledge.title == "Short"
 
-    def test_save_empty_content_raises_error(self):
+    async def test_save_empty_content_raises_error(self):
         """Empty content raises ValueError."""
         with pytest.raises(ValueError, match="content is required"):
-            self.save_knowledge(title="Title", content="")
+            await self.save_knowledge(title="Title", content="")
 
-    def test_save_whitespace_content_raises_error(self):
+    async def test_save_whitespace_content_raises_error(self):
         """Whitespace-only content raises ValueError."""
         with pytest.raises(ValueError, match="content is required"):
-            self.save_knowledge(title="Title", content="   ")
+            await self.save_knowledge(title="Title", content="   ")
 
-    def test_save_none_tags_defaults_to_empty_list(self):
+    async def test_save_none_tags_defaults_to_empty_list(self):
         """None tags defaults to empty list."""
         self.mock_repository.save.return_value = Knowledge(
             id="generated-id",
@@ -114,7 +124,77 @@ class TestSaveKnowledge:
             tags=[],
         )
 
-        self.save_knowledge(title="Title", content="Content", tags=None)
+        await self.save_knowledge(title="Title", content="Content", tags=None)
 
         saved_knowledge = self.mock_repository.save.call_args[0][0]
         assert saved_knowledge.tags == []
+
+
+class TestSaveKnowledgeDuplicates:
+    """Tests for near-duplicate detection in save_knowledge.
+
+    Test selection constraints:
+    - Focus on the duplicate_of status and index maintenance
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_mcp = MockMCP()
+        self.mock_repository = AsyncMock()
+        self.index = NearDuplicateIndex()
+        self.original = Knowledge(id="orig", title="Cold starts", content=INSIGHT)
+        self.index.add(self.original)
+        register(self.mock_mcp, self.mock_repository, self.index)
+        self.save_knowledge = self.mock_mcp.tools["save_knowledge"]
+
+    # P1: 正常系 - 近似重複は保存せず既存IDを返す
+    async def test_near_duplicate_returns_existing_id(self):
+        """A reworded insight is reported as a duplicate, not saved."""
+        self.mock_repository.get.return_value = self.original
+
+        result = await self.save_knowledge(title="Cold starts", content=REWORDED)
+
+        assert result == {
+            "status": "duplicate_of",
+            "id": "orig",
+            "title": "Cold starts",
+        }
+        self.mock_repository.save.assert_not_called()
+
+    # P1: 正常系 - 保存した項目は索引される
+    async def test_saved_item_is_indexed(self):
+        """Saved knowledge is added to the index."""
+        saved = Knowledge(id="new", title="Other", content="Unrelated content")
+        self.mock_repository.save.return_value = saved
+
+        result = await self.save_knowledge(title="Other", content="Unrelated content")
+
+        assert result["status"] == "saved"
+        assert [m.id for m in self.index.find("Other", "Unrelated content")] == ["new"]
+
+    # P2: 境界 - 明示的に重複を許可
+    async def test_allow_duplicate_saves_anyway(self):
+        """allow_duplicate skips the check."""
+        self.mock_repository.save.return_value = Knowledge(
+            id="dup", title="Cold starts", content=REWORDED
+        )
+
+        result = await self.save_knowledge(
+            title="Cold starts", content=REWORDED, allow_duplicate=True
+        )
+
+        assert result["status"] == "saved"
+        self.mock_repository.get.assert_not_called()
+
+    # P2: 異常系 - 他インスタンスで削除済みの索引エントリ
+    async def test_stale_match_is_dropped(self):
+        """A match that no longer exists is removed and the item saved."""
+        self.mock_repository.get.return_value = None
+        self.mock_repository.save.return_value = Knowledge(
+            id="dup", title="Cold starts", content=REWORDED
+        )
+
+        result = await self.save_knowledge(title="Cold starts", content=REWORDED)
+
+        assert result["status"] == "saved"
+        assert [m.id for m in self.index.find("Cold starts", INSIGHT)] == ["dup"]
@@ -0,0 +1,139 @@
+"""Tests for save_knowledge_batch tool."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mcp_server.domain.models import Knowledge, SaveResult
+from mcp_server.infrastructure.near_duplicates import NearDuplicateIndex
+from mcp_server.tools import save_knowledge_batch
+from mcp_server.tools.save_knowledge_batch import register
+
+
+class MockMCP:
+    """Mock MCP server for testing."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, func):
+        """Register a tool function."""
+        self.tools[func.__name__] = func
+        return func
+
+
+class TestSaveKnowledgeBatch:
+    """Tests for save_knowledge_batch tool.
+
+    Test selection constraints applied:
+    - C1 coverage: Minimum cases for branch coverage
+    - Priority: P1 normal case + P2 per-item failures
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_mcp = MockMCP()
+        self.mock_repository = AsyncMock()
+        register(self.mock_mcp, self.mock_repository)
+        self.save_knowledge_batch = self.mock_mcp.tools["save_knowledge_batch"]
+
+    # P1: 正常系 - 一括保存
+    async def test_batch_save_success(self):
+        """All valid items are saved through save_many."""
+        self.mock_repository.save_many.return_value = [
+            SaveResult(Knowledge(id="id-1", title="First", content="a")),
+            SaveResult(Knowledge(id="id-2", title="b", content="b")),
+        ]
+
+        result = await self.save_knowledge_batch(
+            items=[{"title": "First", "content": "a"}, {"content": "b"}]
+        )
+
+        assert result["saved"] == 2
+        assert result["failed"] == 0
+        assert result["results"][1] == {
+            "index": 1,
+            "status": "saved",
+            "id": "id-2",
+            "title": "b",
+        }
+        saved = self.mock_repository.save_many.call_args[0][0]
+        assert [k.title for k in saved] == ["First", "b"]
+
+    # P2: 項目単位のエラー
+    async def test_batch_save_reports_per_item_errors(self):
+        """Invalid and failed items are reported without failing the call."""
+        self.mock_repository.save_many.return_value = [
+            SaveResult(Knowledge(id="id-2", title="b", content="b"), error="boom"),
+        ]
+
+        result = await self.save_knowledge_batch(
+            items=[{"content": ""}, {"content": "b"}]
+        )
+
+        assert result["saved"] == 0
+        assert result["failed"] == 2
+        assert result["results"][0]["error"] == "content is required"
+        assert result["results"][1]["error"] == "boom"
+
+    # P2: 近似重複の項目はスキップ
+    async def test_batch_save_skips_near_duplicates(self):
+        """Items matching indexed knowledge are reported, not saved."""
+        index = NearDuplicateIndex()
+        original = Knowledge(
+            id="orig", title="Tip", content="Import client libraries lazily."
+        )
+        index.add(original)
+        register(self.mock_mcp, self.mock_repository, index)
+        self.mock_repository.get.return_value = original
+        self.mock_repository.save_many.return_value = [
+            SaveResult(Knowledge(id="id-2", title="b", content="b")),
+        ]
+
+        result = await self.mock_mcp.tools["save_knowledge_batch"](
+            items=[
+                {"title": "Tip", "content": "Import client libraries lazily!"},
+                {"content": "b"},
+            ]
+        )
+
+        assert (result["saved"], result["duplicates"], result["failed"]) == (1, 1, 0)
+        assert result["results"][0]["status"] == "duplicate_of"
+        assert result["results"][0]["id"] == "orig"
+        saved = self.mock_repository.save_many.call_args[0][0]
+        assert [k.content for k in saved] == ["b"]
+        assert [m.id for m in index.find("b", "b")] == ["id-2"]
+
+    # P2: 近似重複の確認は上限付きで並行実行
+    async def test_batch_duplicate_lookups_run_concurrently(self, monkeypatch):
+        """Index matches are confirmed concurrently, at most N at a time."""
+        monkeypatch.setattr(save_knowledge_batch, "DUPLICATE_LOOKUP_CONCURRENCY", 2)
+        index = NearDuplicateIndex()
+        for i in range(4):
+            index.add(Knowledge(id=f"orig-{i}", title=f"Tip {i}", content=f"c{i}"))
+        register(self.mock_mcp, self.mock_repository, index)
+        in_flight, peak = 0, 0
+
+        async def get(id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return Knowledge(id=id, title="", content="")
+
+        self.mock_repository.get.side_effect = get
+
+        result = await self.mock_mcp.tools["save_knowledge_batch"](
+            items=[{"title": f"Tip {i}", "content": f"c{i}"} for i in range(4)]
+        )
+
+        assert result["duplicates"] == 4
+        assert peak == 2
+        self.mock_repository.save_many.assert_not_called()
+
+    async def test_batch_save_empty_items_raises_error(self):
+        """Empty items raises ValueError."""
+        with pytest.raises(ValueError, match="items is required"):
+            await self.save_knowledge_batch(items=[])
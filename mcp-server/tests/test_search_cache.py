@@ -0,0 +1,96 @@
+"""Tests for SearchCache."""
+
+from mcp_server.domain.models import SearchResult
+from mcp_server.infrastructure.search_cache import SearchCache, normalize_query
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestNormalizeQuery:
+    """Tests for query normalization."""
+
+    def test_collapses_whitespace_and_case(self):
+        """Whitespace and case differences map to the same key."""
+        assert normalize_query("  Cloud   Run\tDeploy ") == "cloud run deploy"
+
+
+class TestSearchCache:
+    """Tests for SearchCache.
+
+    Test selection constraints applied:
+    - C1 coverage: Minimum cases for branch coverage
+    - Priority: P1 normal cases + P2 eviction/expiry boundaries
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.cache = SearchCache(maxsize=2, ttl=10.0, clock=self.clock)
+        self.result = SearchResult(items=[], total=0)
+
+    # P1: 正常系 - ヒット/ミス
+    def test_hit_and_miss_counters(self):
+        """Lookups are counted as hits or misses."""
+        assert self.cache.get(("q", 10)) is None
+        self.cache.put(("q", 10), self.result)
+
+        assert self.cache.get(("q", 10)) is self.result
+
+        stats = self.cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+
+    # P2: 境界 - TTL 期限切れ
+    def test_entry_expires_after_ttl(self):
+        """Entries older than ttl are treated as misses."""
+        self.cache.put(("q", 10), self.result)
+        self.clock.now = 10.0
+
+        assert self.cache.get(("q", 10)) is None
+        assert self.cache.stats().size == 0
+
+    # P2: 境界 - LRU 追い出し
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted when full."""
+        self.cache.put("a", self.result)
+        self.cache.put("b", self.result)
+        self.cache.get("a")
+        self.cache.put("c", self.result)
+
+        assert self.cache.get("a") is self.result
+        assert self.cache.get("b") is None
+        assert self.cache.get("c") is self.result
+
+    def test_invalidate_clears_entries(self):
+        """invalidate() drops all entries."""
+        self.cache.put("a", self.result)
+
+        self.cache.invalidate()
+
+        assert self.cache.get("a") is None
+
+    # P2: 境界 - 計算中に無効化された結果
+    def test_put_after_invalidate_is_dropped(self):
+        """A result computed before an invalidation is not stored."""
+        generation = self.cache.generation
+        self.cache.invalidate()
+
+        self.cache.put("a", self.result, generation)
+
+        assert self.cache.get("a") is None
+
+    def test_zero_maxsize_disables_cache(self):
+        """maxsize=0 never stores entries."""
+        cache = SearchCache(maxsize=0)
+        cache.put("a", self.result)
+
+        assert cache.get("a") is None
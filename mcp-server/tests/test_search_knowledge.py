@@ -1,11 +1,11 @@
 """Tests for search_knowledge tool."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
-from mcp_server.domain.models import Knowledge, SearchResult
-from mcp_server.tools.search_knowledge import register
+from mcp_server.domain.models import Knowledge, SearchFilter, SearchResult
+from mcp_server.tools.search_knowledge import extract_snippet, register
 
 
 class MockMCP:
@@ -26,11 +26,11 @@ class TestSearchKnowledge:
     def setup_method(self):
         """Set up test fixtures."""
         self.mock_mcp = MockMCP()
-        self.mock_repository = MagicMock()
+        self.mock_repository = AsyncMock()
         register(self.mock_mcp, self.mock_repository)
         self.search_knowledge = self.mock_mcp.tools["search_knowledge"]
 
-    def test_search_returns_results(self):
+    async def test_search_returns_results(self):
         """Search returns results from repository."""
         self.mock_repository.search.return_value = SearchResult(
             items=[
@@ -50,48 +50,194 @@ class TestSearchKnowledge:
             total=2,
         )
 
-        result = self.search_knowledge(query="test query", limit=10)
+        result = await self.search_knowledge(query="test query", limit=10)
 
-        assert len(result) == 2
-        assert result[0]["id"] == "1"
-        assert result[0]["title"] == "First Result"
-        assert result[0]["content"] == "Content 1"
-        assert result[0]["score"] == 0.95
-        assert result[1]["id"] == "2"
+        assert len(result["results"]) == 2
+        assert result["results"][0]["id"] == "1"
+        assert result["results"][0]["title"] == "First Result"
+        assert result["results"][0]["content"] == "Content 1"
+        assert result["results"][0]["score"] == 0.95
+        assert result["results"][1]["id"] == "2"
 
         # Verify repository was called with correct arguments
-        self.mock_repository.search.assert_called_once_with("test query", limit=10)
+        self.mock_repository.search.assert_called_once_with(
+            "test query",
+            limit=10,
+            fields=["id", "title", "content"],
+            filters=None,
+            mode="semantic",
+            cursor=None,
+        )
 
-    def test_search_returns_empty_list(self):
+    async def test_search_returns_empty_list(self):
         """Search returns empty list when no results."""
         self.mock_repository.search.return_value = SearchResult(items=[], total=0)
 
-        result = self.search_knowledge(query="no match", limit=10)
+        result = await self.search_knowledge(query="no match", limit=10)
+
+        assert result == {"results": [], "next_cursor": None}
+
+    async def test_search_marks_stale_results(self):
+        """Results served while the backend is down are marked stale."""
+        self.mock_repository.search.return_value = SearchResult(
+            items=[], total=0, stale=True
+        )
+
+        result = await self.search_knowledge(query="outage", limit=10)
 
-        assert result == []
+        assert result == {"results": [], "next_cursor": None, "stale": True}
 
-    def test_search_empty_query_raises_error(self):
+    async def test_search_empty_query_raises_error(self):
         """Empty query raises ValueError."""
         with pytest.raises(ValueError, match="query is required"):
-            self.search_knowledge(query="")
+            await self.search_knowledge(query="")
 
-    def test_search_whitespace_query_raises_error(self):
+    async def test_search_whitespace_query_raises_error(self):
         """Whitespace-only query raises ValueError."""
         with pytest.raises(ValueError, match="query is required"):
-            self.search_knowledge(query="   ")
+            await self.search_knowledge(query="   ")
 
-    def test_search_uses_default_limit(self):
+    async def test_search_uses_default_limit(self):
         """Search uses default limit of 10."""
         self.mock_repository.search.return_value = SearchResult(items=[], total=0)
 
-        self.search_knowledge(query="test")
+        await self.search_knowledge(query="test")
 
-        self.mock_repository.search.assert_called_once_with("test", limit=10)
+        self.mock_repository.search.assert_called_once_with(
+            "test",
+            limit=10,
+            fields=["id", "title", "content"],
+            filters=None,
+            mode="semantic",
+            cursor=None,
+        )
 
-    def test_search_with_custom_limit(self):
+    async def test_search_with_custom_limit(self):
         """Search respects custom limit."""
         self.mock_repository.search.return_value = SearchResult(items=[], total=0)
 
-        self.search_knowledge(query="test", limit=5)
+        await self.search_knowledge(query="test", limit=5)
+
+        self.mock_repository.search.assert_called_once_with(
+            "test",
+            limit=5,
+            fields=["id", "title", "content"],
+            filters=None,
+            mode="semantic",
+            cursor=None,
+        )
+
+    async def test_search_with_fields_projection(self):
+        """Requested fields are pushed down and returned with id and score."""
+        self.mock_repository.search.return_value = SearchResult(
+            items=[Knowledge(id="1", title="", content="", tags=["a"], score=0.9)],
+            total=1,
+        )
+
+        result = await self.search_knowledge(query="test", fields=["tags"])
+
+        assert result["results"] == [{"tags": ["a"], "id": "1", "score": 0.9}]
+        self.mock_repository.search.assert_called_once_with(
+            "test",
+            limit=10,
+            fields=["tags"],
+            filters=None,
+            mode="semantic",
+            cursor=None,
+        )
+
+    async def test_search_unknown_field_raises_error(self):
+        """Unknown field names raise ValueError."""
+        with pytest.raises(ValueError, match="unknown fields: bogus"):
+            await self.search_knowledge(query="test", fields=["bogus"])
+
+    async def test_search_with_snippet_replaces_content(self):
+        """snippet_chars returns a snippet instead of the full content."""
+        content = "intro " * 50 + "deploy to cloud run with gcloud " + "tail " * 50
+        self.mock_repository.search.return_value = SearchResult(
+            items=[Knowledge(id="1", title="T", content=content, score=0.9)],
+            total=1,
+        )
+
+        result = await self.search_knowledge(query="cloud run", snippet_chars=60)
+
+        assert "content" not in result["results"][0]
+        assert "cloud run" in result["results"][0]["snippet"]
+        assert len(result["results"][0]["snippet"]) <= 66
+        self.mock_repository.search.assert_called_once_with(
+            "cloud run",
+            limit=10,
+            fields=["id", "title", "content"],
+            filters=None,
+            mode="semantic",
+            cursor=None,
+        )
+
+    async def test_search_with_filters(self):
+        """Filter arguments are passed to the repository as a SearchFilter."""
+        self.mock_repository.search.return_value = SearchResult(items=[], total=0)
+
+        await self.search_knowledge(
+            query="test", status="promoted", source="team", tags=["gcp"]
+        )
+
+        filters = self.mock_repository.search.call_args.kwargs["filters"]
+        assert filters == SearchFilter(status="promoted", source="team", tags=("gcp",))
+
+    async def test_search_with_hybrid_mode(self):
+        """mode is passed through to the repository."""
+        self.mock_repository.search.return_value = SearchResult(items=[], total=0)
+
+        await self.search_knowledge(query="ERR_CONN_RESET", mode="hybrid")
+
+        assert self.mock_repository.search.call_args.kwargs["mode"] == "hybrid"
+
+    async def test_search_returns_and_follows_cursor(self):
+        """next_cursor is returned and a given cursor is passed through."""
+        self.mock_repository.search.return_value = SearchResult(
+            items=[Knowledge(id="1", title="T", content="C", score=0.9)],
+            total=1,
+            next_cursor="token:10",
+        )
+
+        result = await self.search_knowledge(query="test", cursor="token:0")
+
+        assert result["next_cursor"] == "token:10"
+        assert self.mock_repository.search.call_args.kwargs["cursor"] == "token:0"
+
+    async def test_search_invalid_mode_raises_error(self):
+        """Unknown modes raise ValueError."""
+        with pytest.raises(ValueError, match="invalid mode: fuzzy"):
+            await self.search_knowledge(query="test", mode="fuzzy")
+
+    async def test_search_invalid_status_raises_error(self):
+        """Unknown status values raise ValueError."""
+        with pytest.raises(ValueError, match="invalid status: archived"):
+            await self.search_knowledge(query="test", status="archived")
+
+
+class TestExtractSnippet:
+    """Tests for extract_snippet."""
+
+    def test_short_text_returned_whole(self):
+        """Text within max_chars is returned unchanged."""
+        assert extract_snippet("short text", "text", 50) == "short text"
+
+    def test_window_with_most_distinct_terms_wins(self):
+        """The window covering the most distinct terms is chosen."""
+        text = "alpha " + "x " * 40 + "alpha beta gamma " + "y " * 40
+
+        snippet = extract_snippet(text, "alpha beta gamma", 30)
+
+        assert "alpha beta gamma" in snippet
+        assert snippet.startswith("...")
+        assert snippet.endswith("...")
+
+    def test_no_match_falls_back_to_start(self):
+        """Without matches the snippet starts at the beginning."""
+        text = "first words " + "z " * 50
+
+        snippet = extract_snippet(text, "missing", 20)
 
-        self.mock_repository.search.assert_called_once_with("test", limit=5)
+        assert snippet.startswith("first words")
+        assert snippet.endswith("...")
@@ -0,0 +1,38 @@
+"""Tests for SecondaryIndex."""
+
+from mcp_server.domain.models import Knowledge
+from mcp_server.infrastructure.secondary_index import SecondaryIndex
+
+
+class TestSecondaryIndex:
+    """Tests for SecondaryIndex write-through maintenance."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.index = SecondaryIndex()
+
+    def test_put_indexes_path_and_pr_url(self):
+        """Both lookup keys resolve to the knowledge ID."""
+        self.index.put(
+            Knowledge(id="k1", title="", content="", github_path="a.md", pr_url="pr/1")
+        )
+
+        assert self.index.id_for_path("a.md") == "k1"
+        assert self.index.id_for_pr_url("pr/1") == "k1"
+
+    def test_reindex_drops_old_keys(self):
+        """Re-putting with new values removes the previous entries."""
+        self.index.put(Knowledge(id="k1", title="", content="", pr_url="pr/1"))
+        self.index.put(Knowledge(id="k1", title="", content="", pr_url="pr/2"))
+
+        assert self.index.id_for_pr_url("pr/1") is None
+        assert self.index.id_for_pr_url("pr/2") == "k1"
+
+    def test_remove_keeps_entries_owned_by_other_ids(self):
+        """Removing an ID does not drop a key that now points elsewhere."""
+        self.index.put(Knowledge(id="k1", title="", content="", github_path="a.md"))
+        self.index.put(Knowledge(id="k2", title="", content="", github_path="a.md"))
+
+        self.index.remove("k1")
+
+        assert self.index.id_for_path("a.md") == "k2"
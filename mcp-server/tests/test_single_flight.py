@@ -0,0 +1,159 @@
+"""Tests for single-flight coalescing of repository reads."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mcp_server.domain.models import Knowledge, SearchResult
+from mcp_server.infrastructure.coalescing_repository import (
+    CoalescingKnowledgeRepository,
+)
+from mcp_server.infrastructure.single_flight import SingleFlight
+from mcp_server.metrics import Metrics
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.
+
+    Test selection constraints:
+    - Focus on sharing, error fan-out, cancellation and forget
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.group = SingleFlight()
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def backend(self, value="result"):
+        """Count the call and block until released."""
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    # P1: 正常系 - 同時呼び出しは1回にまとめる
+    async def test_concurrent_callers_share_one_call(self):
+        """Concurrent calls of one key run the backend once."""
+        tasks = [
+            asyncio.create_task(self.group.do("k", self.backend)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        self.release.set()
+
+        results = await asyncio.gather(*tasks)
+
+        assert self.calls == 1
+        assert results == [("result", False), ("result", True), ("result", True)]
+        assert len(self.group) == 0
+        (stats,) = self.group.stats()
+        assert (stats.key, stats.calls, stats.shared) == ("k", 3, 2)
+
+    # P2: 異常系 - 例外も全員に伝わる
+    async def test_error_is_raised_to_every_caller(self):
+        """A failing call raises in every waiting caller."""
+        tasks = [
+            asyncio.create_task(
+                self.group.do("k", lambda: self.backend(RuntimeError("down")))
+            )
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        self.release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert self.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    # P2: 境界 - 先頭の呼び出し元のキャンセル
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Cancelling the first caller leaves the shared call running."""
+        first = asyncio.create_task(self.group.do("k", self.backend))
+        second = asyncio.create_task(self.group.do("k", self.backend))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        self.release.set()
+
+        assert await second == ("result", True)
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    # P1: 正常系 - forget後は新しい呼び出し
+    async def test_forget_starts_a_new_call(self):
+        """Callers after forget() do not join the earlier call."""
+        first = asyncio.create_task(self.group.do("k", self.backend))
+        await asyncio.sleep(0)
+        self.group.forget("k")
+        second = asyncio.create_task(self.group.do("k", self.backend))
+        await asyncio.sleep(0)
+        self.release.set()
+
+        assert await asyncio.gather(first, second) == [
+            ("result", False),
+            ("result", False),
+        ]
+        assert self.calls == 2
+
+
+class TestCoalescingKnowledgeRepository:
+    """Tests for CoalescingKnowledgeRepository."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.metrics = Metrics()
+        self.inner = AsyncMock()
+        self.repo = CoalescingKnowledgeRepository(self.inner, self.metrics)
+
+    def sample(self, name: str, method: str) -> float | None:
+        """Read one sample value from the metrics registry."""
+        return self.metrics.registry.get_sample_value(name, {"method": method})
+
+    # P1: 正常系 - 同一検索の共有とメトリクス
+    async def test_identical_searches_share_one_backend_call(self):
+        """Identical concurrent searches reach the backend once."""
+        release = asyncio.Event()
+        result = SearchResult(items=[], total=0)
+
+        async def search(*args, **kwargs):
+            await release.wait()
+            return result
+
+        self.inner.search.side_effect = search
+        tasks = [
+            asyncio.create_task(self.repo.search(query, limit=5))
+            for query in ("Cloud Run", "cloud  run", "other")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [result] * 3
+        assert self.inner.search.await_count == 2
+        assert self.sample("knowledge_repository_flights_total", "search") == 2
+        assert self.sample("knowledge_repository_coalesced_total", "search") == 1
+
+    # P1: 正常系 - 書き込み後の取得は新しい呼び出し
+    async def test_get_after_write_does_not_join_older_get(self):
+        """A get issued after a delete does not receive a stale result."""
+        release = asyncio.Event()
+        stored = Knowledge(id="k1", title="t", content="c")
+
+        async def get(id):
+            await release.wait()
+            return stored
+
+        self.inner.get.side_effect = get
+        before = asyncio.create_task(self.repo.get("k1"))
+        await asyncio.sleep(0)
+        await self.repo.delete("k1")
+        after = asyncio.create_task(self.repo.get("k1"))
+        await asyncio.sleep(0)
+        release.set()
+
+        await asyncio.gather(before, after)
+
+        assert self.inner.get.await_count == 2
+        assert self.sample("knowledge_repository_coalesced_total", "get") == 0
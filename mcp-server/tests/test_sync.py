@@ -0,0 +1,323 @@
+"""Tests for the POST /sync endpoint."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastmcp import FastMCP
+from starlette.testclient import TestClient
+
+from mcp_server.domain.models import Knowledge, SaveResult
+from mcp_server.sync import (
+    ndjson_manifest,
+    ndjson_records,
+    parse_manifest,
+    register,
+    split_frontmatter,
+    sync_files,
+)
+
+
+def team(id: str, path: str, source_hash: str) -> Knowledge:
+    """Build stored team knowledge as returned by the hash lookup."""
+    return Knowledge(
+        id=id,
+        title="",
+        content="",
+        source="team",
+        status="promoted",
+        github_path=path,
+        source_hash=source_hash,
+    )
+
+
+def repository_with(*stored: Knowledge) -> AsyncMock:
+    """Build a repository mock whose collection holds stored."""
+
+    async def iter_all(**kwargs):
+        for knowledge in stored:
+            yield knowledge
+
+    repository = AsyncMock()
+    repository.iter_all = iter_all
+    repository.save_many.side_effect = lambda items: [
+        SaveResult(item) for item in items
+    ]
+    repository.delete.return_value = True
+    return repository
+
+
+class TestSyncFiles:
+    """Tests for sync_files.
+
+    Test selection constraints:
+    - Focus on the diff: unchanged, changed, new and removed files
+    """
+
+    # P1: 正常系 - 差分のみ書き込み
+    async def test_only_changed_files_are_written(self):
+        """Unchanged files are skipped, changed and new ones saved."""
+        repository = repository_with(
+            team("k1", "docs/same.md", "h1"),
+            team("k2", "docs/changed.md", "old"),
+        )
+        files, _ = parse_manifest(
+            {
+                "files": [
+                    {"github_path": "docs/same.md", "content_hash": "h1"},
+                    {
+                        "github_path": "docs/changed.md",
+                        "content_hash": "new",
+                        "content": "# Changed\nbody",
+                    },
+                    {
+                        "github_path": "docs/new.md",
+                        "content_hash": "h3",
+                        "content": "no heading",
+                    },
+                ]
+            }
+        )
+
+        summary = await sync_files(repository, files)
+
+        assert summary["status"] == "synced"
+        assert summary["created"] == summary["updated"] == summary["unchanged"] == 1
+        saved = repository.save_many.call_args[0][0]
+        assert [(k.id, k.title, k.source_hash) for k in saved] == [
+            ("k2", "Changed", "new"),
+            ("", "new", "h3"),
+        ]
+        assert all(k.source == "team" and k.status == "promoted" for k in saved)
+        repository.delete.assert_not_called()
+
+    # P1: 正常系 - 削除されたファイル
+    async def test_removed_files_are_deleted_within_prefix(self):
+        """Stored files missing from the manifest are deleted under prefix."""
+        repository = repository_with(
+            team("k1", "docs/gone.md", "h1"),
+            team("k2", "other/kept.md", "h2"),
+        )
+
+        summary = await sync_files(
+            repository, [], prefix="docs/", allow_delete_all=True
+        )
+
+        assert summary["deleted"] == 1
+        repository.delete.assert_awaited_once_with("k1")
+        repository.save_many.assert_not_called()
+
+    # P3: 異常系 - 空のマニフェスト
+    async def test_empty_manifest_is_rejected(self):
+        """An empty manifest deletes nothing without allow_delete_all."""
+        repository = repository_with(team("k1", "docs/a.md", "h1"))
+
+        with pytest.raises(ValueError, match="allow_delete_all"):
+            await sync_files(repository, [])
+        repository.delete.assert_not_called()
+
+    # P2: 境界 - 変更ありだが本文なし
+    async def test_changed_file_without_content_is_reported(self):
+        """A changed file sent without content is listed in needs_content."""
+        repository = repository_with(team("k1", "docs/a.md", "old"))
+        files, _ = parse_manifest(
+            {"files": [{"github_path": "docs/a.md", "content_hash": "new"}]}
+        )
+
+        summary = await sync_files(repository, files)
+
+        assert summary["needs_content"] == ["docs/a.md"]
+        assert summary["deleted"] == 0
+        repository.save_many.assert_not_called()
+
+
+class TestStreamingSync:
+    """Tests for NDJSON streaming ingestion.
+
+    Test selection constraints:
+    - Focus on record splitting, early writes and invalid records
+    """
+
+    # P1: 正常系 - チャンク境界をまたぐレコード
+    async def test_records_split_across_chunks(self):
+        """Records are decoded regardless of how the body is chunked."""
+
+        async def chunks():
+            for chunk in (b'{"a": 1}\n{"a"', b": 2}\n\n", b'{"a": 3}'):
+                yield chunk
+
+        records = [record async for record in ndjson_records(chunks())]
+
+        assert records == [(1, {"a": 1}), (2, {"a": 2}), (4, {"a": 3})]
+
+    # P2: 異常系 - 上限を超える行
+    async def test_overlong_line_is_reported_not_raised(self):
+        """An overlong line becomes an invalid record; later lines still parse."""
+
+        async def chunks():
+            for chunk in (b'{"a": 1}\n{"a": "', b"x" * 20, b'x"}\n{"a": 3}\n'):
+                yield chunk
+
+        records = [
+            record async for record in ndjson_records(chunks(), max_record_bytes=16)
+        ]
+
+        assert records[0] == (1, {"a": 1})
+        assert records[1][0] == 2
+        assert "exceeds 16 bytes" in str(records[1][1])
+        assert records[2] == (3, {"a": 3})
+
+    # P1: 正常系 - アップロード完了前に書き込み開始
+    async def test_writes_start_before_stream_ends(self):
+        """Full batches are written while later records are still coming."""
+        repository = repository_with()
+        writes_seen_mid_stream = []
+
+        async def chunks():
+            for i in range(3):
+                record = {"github_path": f"d/{i}.md", "content_hash": "h"}
+                yield (json.dumps({**record, "content": "x"}) + "\n").encode()
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+                writes_seen_mid_stream.append(repository.save_many.await_count)
+
+        summary = await sync_files(
+            repository, ndjson_manifest(chunks(), ""), batch_size=1
+        )
+
+        assert summary["created"] == 3
+        assert writes_seen_mid_stream[0] >= 1
+
+    # P2: 異常系 - 不正なレコードがあれば削除しない
+    async def test_invalid_record_is_reported_and_skips_deletes(self):
+        """Bad lines become errors and no stored knowledge is deleted."""
+        repository = repository_with(team("k1", "docs/old.md", "h1"))
+
+        async def chunks():
+            yield b'not json\n{"github_path": "docs/a.md"}\n'
+
+        summary = await sync_files(repository, ndjson_manifest(chunks(), ""))
+
+        assert summary["status"] == "partial"
+        assert len(summary["errors"]) == 2
+        repository.delete.assert_not_called()
+
+
+class TestSplitFrontmatter:
+    """Tests for split_frontmatter."""
+
+    # P1: 正常系 - タイトルとタグ
+    def test_reads_title_and_tags(self):
+        """Scalar and list values are read and the block removed."""
+        meta, body = split_frontmatter(
+            '---\ntitle: "Lazy imports"\ntags:\n  - python\n  - perf\n---\n# H\n'
+        )
+
+        assert meta == {"title": "Lazy imports", "tags": ["python", "perf"]}
+        assert body == "# H\n"
+
+    # P2: 境界 - フロントマターなし
+    def test_without_frontmatter(self):
+        """Documents without a leading block are returned unchanged."""
+        assert split_frontmatter("# Title\n---\n") == ({}, "# Title\n---\n")
+
+
+class TestParseManifest:
+    """Tests for parse_manifest."""
+
+    # P3: 異常系 - 不正なマニフェスト
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {},
+            {"files": [{"github_path": "a.md"}]},
+            {"files": [{"github_path": "a.md", "content_hash": "h"}] * 2},
+            {"files": [{"github_path": "a.md", "content_hash": "h"}], "prefix": "d/"},
+            {"files": [{"github_path": "a.md", "content_hash": "h", "title": 5}]},
+            {"files": [{"github_path": "a.md", "content_hash": "h", "tags": "py"}]},
+            {"files": [{"github_path": "a.md", "content_hash": "h", "tags": [1]}]},
+        ],
+    )
+    def test_invalid_manifest_raises(self, body):
+        """Malformed manifests are rejected."""
+        with pytest.raises(ValueError):
+            parse_manifest(body)
+
+
+class TestSyncRoute:
+    """Tests for the /sync route."""
+
+    def client(self, repository) -> TestClient:
+        """Build a test client for an app with the route registered."""
+        mcp = FastMCP("test")
+        with patch.dict("os.environ", {"SYNC_TOKEN": "secret"}):
+            register(mcp, repository)
+        return TestClient(mcp.http_app())
+
+    # P1: 正常系 - 認証付き同期
+    def test_sync_with_token_returns_summary(self):
+        """An authorized request returns the sync summary."""
+        response = self.client(repository_with()).post(
+            "/sync",
+            json={"files": [], "allow_delete_all": True},
+            headers={"Authorization": "Bearer secret"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "synced"
+
+    # P3: 異常系 - 認証エラーと不正リクエスト
+    def test_rejects_bad_token_and_bad_body(self):
+        """Wrong tokens get 401 and invalid manifests 400."""
+        client = self.client(repository_with())
+
+        assert client.post("/sync", json={"files": []}).status_code == 401
+        response = client.post(
+            "/sync", json={}, headers={"Authorization": "Bearer secret"}
+        )
+        assert response.status_code == 400
+        assert response.json() == {"error": "files is required"}
+        response = client.post(
+            "/sync", json={"files": []}, headers={"Authorization": "Bearer secret"}
+        )
+        assert response.status_code == 400
+
+    # P3: 異常系 - トークン未設定
+    def test_unconfigured_token_rejects_all_requests(self):
+        """Without SYNC_TOKEN the route answers 503 instead of running."""
+        mcp = FastMCP("test")
+        repository = repository_with(team("k1", "docs/a.md", "h1"))
+        with patch.dict("os.environ", {"SYNC_TOKEN": ""}):
+            register(mcp, repository)
+
+        response = TestClient(mcp.http_app()).post("/sync", json={"files": []})
+
+        assert response.status_code == 503
+        repository.delete.assert_not_called()
+
+    # P1: 正常系 - NDJSON本文
+    def test_ndjson_body(self):
+        """NDJSON bodies are synced with the prefix from the query string."""
+        repository = repository_with(team("k1", "docs/gone.md", "h1"))
+        body = json.dumps(
+            {
+                "github_path": "docs/a.md",
+                "content_hash": "h2",
+                "content": "---\ntags: [a, b]\n---\n# A\n",
+            }
+        )
+
+        response = self.client(repository).post(
+            "/sync?prefix=docs/",
+            content=body + "\n",
+            headers={
+                "Authorization": "Bearer secret",
+                "Content-Type": "application/x-ndjson",
+            },
+        )
+
+        assert response.json()["created"] == 1
+        assert response.json()["deleted"] == 1
+        saved = repository.save_many.call_args[0][0][0]
+        assert (saved.title, saved.tags, saved.content) == ("A", ["a", "b"], "# A\n")
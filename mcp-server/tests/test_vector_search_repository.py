@@ -1,13 +1,33 @@
 """Tests for VectorSearchKnowledgeRepository error handling."""
 
 import os
+from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
-from google.api_core.exceptions import GoogleAPICallError, NotFound
-
-from mcp_server.domain.models import Knowledge
-from mcp_server.infrastructure.vector_search import VectorSearchKnowledgeRepository
+from google.api_core.exceptions import (
+    FailedPrecondition,
+    GoogleAPICallError,
+    InvalidArgument,
+    NotFound,
+    ServiceUnavailable,
+)
+from google.cloud import vectorsearch_v1beta
+
+from mcp_server.domain.exceptions import StatusConflictError
+from mcp_server.domain.models import Knowledge, SearchFilter
+from mcp_server.infrastructure.vector_search import (
+    KNOWLEDGE_DATA_FIELDS,
+    VectorSearchKnowledgeRepository,
+    build_filter,
+    content_hash,
+    data_values,
+    knowledge_from_data,
+    knowledge_from_data_object,
+    knowledge_to_data,
+    parse_datetime,
+    search_result_from_response,
+)
 
 
 class TestVectorSearchKnowledgeRepositoryInit:
@@ -42,6 +62,20 @@ class TestVectorSearchKnowledgeRepositoryInit:
             repo = VectorSearchKnowledgeRepository()
             assert repo.project_id == "env-project"
 
+    @patch(
+        "mcp_server.infrastructure.vector_search.vectorsearch_v1beta"
+        ".DataObjectServiceClient"
+    )
+    def test_clients_created_on_first_use(self, mock_data):
+        """Clients are not constructed until first accessed."""
+        repo = VectorSearchKnowledgeRepository(project_id="test-project")
+        mock_data.assert_not_called()
+
+        client = repo.data_object_client
+
+        mock_data.assert_called_once()
+        assert repo.data_object_client is client
+
     def test_init_raises_without_project_id(self):
         """Repository raises ValueError without project_id."""
         with patch.dict(
@@ -78,15 +112,14 @@ class TestVectorSearchKnowledgeRepositoryErrorHandling:
 
         assert result is None
 
-    def test_get_returns_none_on_api_error(self):
-        """get() returns None on API error."""
-        self.repo._data_object_client.get_data_object.side_effect = GoogleAPICallError(
+    def test_get_raises_on_api_error(self):
+        """get() raises API errors other than NOT_FOUND (e.g. UNAVAILABLE)."""
+        self.repo._data_object_client.get_data_object.side_effect = ServiceUnavailable(
             "API error"
         )
 
-        result = self.repo.get("some-id")
-
-        assert result is None
+        with pytest.raises(ServiceUnavailable):
+            self.repo.get("some-id")
 
     def test_delete_returns_false_on_not_found(self):
         """delete() returns False when knowledge not found."""
@@ -98,15 +131,29 @@ class TestVectorSearchKnowledgeRepositoryErrorHandling:
 
         assert result is False
 
-    def test_delete_returns_false_on_api_error(self):
-        """delete() returns False on API error."""
+    def test_delete_raises_on_api_error(self):
+        """delete() raises API errors other than NOT_FOUND."""
         self.repo._data_object_client.delete_data_object.side_effect = (
             GoogleAPICallError("API error")
         )
 
-        result = self.repo.delete("some-id")
+        with pytest.raises(GoogleAPICallError):
+            self.repo.delete("some-id")
 
-        assert result is False
+    def test_save_changed_body_of_stored_knowledge_rewrites_it(self):
+        """save() of a stored ID with a new body updates every field."""
+        self.repo._data_object_client.get_data_object.return_value = MagicMock(
+            data={"id": "k1", "content_hash": content_hash("t", "old")}
+        )
+
+        self.repo.save(Knowledge(id="k1", title="t", content="new"))
+
+        self.repo._data_object_client.create_data_object.assert_not_called()
+        request = self.repo._data_object_client.update_data_object.call_args.kwargs[
+            "request"
+        ]
+        assert "data.content" in request.update_mask.paths
+        assert request.data_object.data["content_hash"] == content_hash("t", "new")
 
     def test_save_raises_on_api_error(self):
         """save() raises RepositoryError on API error."""
@@ -129,41 +176,497 @@ class TestVectorSearchKnowledgeRepositoryErrorHandling:
             self.repo.search("test query")
 
     def test_update_status_success(self):
-        """update_status() updates status using update API."""
-        # Mock get_data_object to return existing knowledge
-        mock_get_response = MagicMock()
-        mock_get_response.data = {
+        """update_status() is one masked update decoded from its response."""
+        # Mock update_data_object to return the updated data object
+        mock_update_response = MagicMock()
+        mock_update_response.data = {
             "id": "test-id",
             "title": "Test Title",
             "content": "Test content",
             "tags": ["tag1"],
             "user_id": "user-123",
             "source": "personal",
-            "status": "draft",
+            "status": "proposed",
             "github_path": "",
             "pr_url": "",
             "promoted_from_id": "",
             "created_at": "2024-01-01T00:00:00+00:00",
-            "updated_at": "2024-01-01T00:00:00+00:00",
+            "updated_at": "2024-01-02T00:00:00+00:00",
         }
-        self.repo._data_object_client.get_data_object.return_value = mock_get_response
+        self.repo._data_object_client.update_data_object.return_value = (
+            mock_update_response
+        )
 
         result = self.repo.update_status("test-id", "proposed")
 
         assert result is not None
         assert result.status == "proposed"
         assert result.id == "test-id"
-        # Verify update_data_object was called (safe in-place update)
-        self.repo._data_object_client.update_data_object.assert_called_once()
+        assert result.title == "Test Title"
+        # Single round trip: no get before the update
+        self.repo._data_object_client.get_data_object.assert_not_called()
+        request = self.repo._data_object_client.update_data_object.call_args.kwargs[
+            "request"
+        ]
+        assert list(request.update_mask.paths) == ["data.status", "data.updated_at"]
 
     def test_update_status_returns_none_when_not_found(self):
         """update_status() returns None when knowledge not found."""
-        self.repo._data_object_client.get_data_object.side_effect = NotFound(
+        self.repo._data_object_client.update_data_object.side_effect = NotFound(
             "Not found"
         )
 
         result = self.repo.update_status("nonexistent-id", "proposed")
 
         assert result is None
-        # Verify update was not called
+
+    def test_update_status_expected_status_mismatch(self):
+        """Conditional update raises StatusConflictError on wrong status."""
+        self.repo._data_object_client.get_data_object.return_value = MagicMock(
+            data={"id": "test-id", "status": "proposed"}
+        )
+
+        with pytest.raises(StatusConflictError):
+            self.repo.update_status("test-id", "proposed", expected_status="draft")
+
         self.repo._data_object_client.update_data_object.assert_not_called()
+
+    def test_update_status_expected_status_sends_etag(self):
+        """Conditional update is guarded by the etag of the read object."""
+        self.repo._data_object_client.get_data_object.return_value = MagicMock(
+            data={"id": "test-id", "status": "draft"}, etag="etag-1"
+        )
+        self.repo._data_object_client.update_data_object.return_value = MagicMock(
+            data={"id": "test-id", "status": "proposed"}
+        )
+
+        result = self.repo.update_status("test-id", "proposed", expected_status="draft")
+
+        assert result is not None
+        assert result.status == "proposed"
+        request = self.repo._data_object_client.update_data_object.call_args.kwargs[
+            "request"
+        ]
+        assert request.data_object.etag == "etag-1"
+
+    def test_update_status_concurrent_change_is_conflict(self):
+        """A rejected etag surfaces as StatusConflictError."""
+        self.repo._data_object_client.get_data_object.return_value = MagicMock(
+            data={"id": "test-id", "status": "draft"}, etag="etag-1"
+        )
+        self.repo._data_object_client.update_data_object.side_effect = (
+            FailedPrecondition("etag mismatch")
+        )
+
+        with pytest.raises(StatusConflictError):
+            self.repo.update_status("test-id", "proposed", expected_status="draft")
+
+
+class TestVectorSearchKnowledgeRepositorySearchCache:
+    """Tests for search result caching and write invalidation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
+            self.repo = VectorSearchKnowledgeRepository()
+            self.repo._data_object_client = MagicMock()
+            self.repo._search_client = MagicMock()
+        self.repo._search_client.search_data_objects.return_value = MagicMock(
+            results=[]
+        )
+
+    def test_repeated_search_hits_cache(self):
+        """Identical normalized queries reuse the cached result."""
+        first = self.repo.search("Cloud Run", limit=5)
+        second = self.repo.search("  cloud   run ", limit=5)
+
+        assert second is first
+        self.repo._search_client.search_data_objects.assert_called_once()
+        stats = self.repo.search_cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_different_limit_misses_cache(self):
+        """Limit is part of the cache key."""
+        self.repo.search("query", limit=5)
+        self.repo.search("query", limit=10)
+
+        assert self.repo._search_client.search_data_objects.call_count == 2
+
+    def test_save_invalidates_cache(self):
+        """save() drops cached search results."""
+        self.repo.search("query")
+        self.repo.save(Knowledge(id="", title="Test", content="Content"))
+        self.repo.search("query")
+
+        assert self.repo._search_client.search_data_objects.call_count == 2
+
+    def test_delete_invalidates_cache(self):
+        """delete() drops cached search results."""
+        self.repo.search("query")
+        self.repo.delete("some-id")
+        self.repo.search("query")
+
+        assert self.repo._search_client.search_data_objects.call_count == 2
+
+
+class TestVectorSearchKnowledgeRepositorySaveMany:
+    """Tests for batched saves."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
+            self.repo = VectorSearchKnowledgeRepository()
+            self.repo._data_object_client = MagicMock()
+            self.repo._search_client = MagicMock()
+        self.client = self.repo._data_object_client
+
+        def echo(request):
+            return MagicMock(
+                data_objects=[
+                    MagicMock(data_object_id=r.data_object_id) for r in request.requests
+                ]
+            )
+
+        self.echo = echo
+
+    def test_save_many_chunks_requests(self):
+        """Items are sent in chunks of BATCH_CREATE_SIZE."""
+        self.client.batch_create_data_objects.side_effect = self.echo
+        items = [Knowledge(id="", title=f"t{i}", content="c") for i in range(250)]
+
+        results = self.repo.save_many(items)
+
+        assert len(results) == 250
+        assert all(r.ok for r in results)
+        assert self.client.batch_create_data_objects.call_count == 3
+
+    @patch("mcp_server.infrastructure.vector_search.time.sleep")
+    def test_save_many_retries_transient_error(self, mock_sleep):
+        """A retryable error re-sends the chunk."""
+        calls = []
+
+        def flaky(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise ServiceUnavailable("unavailable")
+            return self.echo(request)
+
+        self.client.batch_create_data_objects.side_effect = flaky
+
+        results = self.repo.save_many([Knowledge(id="", title="t", content="c")])
+
+        assert results[0].ok
+        mock_sleep.assert_called_once()
+
+    @patch("mcp_server.infrastructure.vector_search.time.sleep")
+    def test_save_many_marks_exhausted_transient_error(self, mock_sleep):
+        """Items still failing transiently after all attempts are retryable."""
+        self.client.batch_create_data_objects.side_effect = ServiceUnavailable(
+            "unavailable"
+        )
+
+        results = self.repo.save_many([Knowledge(id="", title="t", content="c")])
+
+        assert not results[0].ok
+        assert results[0].retryable
+
+    def test_save_many_isolates_failing_item(self):
+        """A terminal error is narrowed down to the failing item."""
+
+        def reject_bad(request):
+            if any(r.data_object.data["title"] == "bad" for r in request.requests):
+                raise InvalidArgument("bad item")
+            return self.echo(request)
+
+        self.client.batch_create_data_objects.side_effect = reject_bad
+        items = [
+            Knowledge(id="", title=title, content="c")
+            for title in ["ok1", "bad", "ok2", "ok3"]
+        ]
+
+        results = self.repo.save_many(items)
+
+        assert [r.ok for r in results] == [True, False, True, True]
+        assert "bad item" in results[1].error
+        assert not results[1].retryable
+
+    def test_save_many_updates_stored_items_without_reembedding(self):
+        """Stored items with unchanged bodies are batch-updated, not created."""
+        stored = Knowledge(id="k1", title="t", content="c")
+        self.repo._search_client.query_data_objects.return_value = MagicMock(
+            data_objects=[
+                MagicMock(
+                    data={
+                        "id": "k1",
+                        "content_hash": content_hash("t", "c"),
+                        "created_at": "2024-01-01T00:00:00+00:00",
+                    }
+                )
+            ]
+        )
+        self.client.batch_create_data_objects.side_effect = self.echo
+
+        results = self.repo.save_many(
+            [stored, Knowledge(id="", title="new", content="c")]
+        )
+
+        assert all(r.ok for r in results)
+        assert results[0].knowledge.created_at.year == 2024
+        request = self.client.batch_update_data_objects.call_args.kwargs["request"]
+        paths = list(request.requests[0].update_mask.paths)
+        assert "data.status" in paths
+        assert "data.content" not in paths
+        created = self.client.batch_create_data_objects.call_args.kwargs["request"]
+        assert len(created.requests) == 1
+
+
+class TestDecodeDataObjects:
+    """Tests for decoding data objects into Knowledge.
+
+    Test selection constraints applied:
+    - C1 coverage: proto-plus map, raw Struct and dict inputs
+    - Priority: P1 decoding, P2 fallbacks
+    """
+
+    def _data_object(self, **data):
+        return vectorsearch_v1beta.DataObject(data=data)
+
+    # P1: 正常系 - 検索レスポンスのデコード
+    def test_search_response_is_decoded_in_one_pass(self):
+        """Every hit becomes a Knowledge with its distance as score."""
+        data_object = self._data_object(
+            id="k-1",
+            title="Title",
+            tags=["gcp", "run"],
+            status="promoted",
+            created_at="2024-05-01T12:00:00Z",
+        )
+        response = vectorsearch_v1beta.SearchDataObjectsResponse(
+            results=[
+                vectorsearch_v1beta.SearchResult(data_object=data_object, distance=0.25)
+            ]
+        )
+
+        result = search_result_from_response(response)
+
+        assert result.total == 1
+        knowledge = result.items[0]
+        assert knowledge.id == "k-1"
+        assert knowledge.title == "Title"
+        assert knowledge.content == ""
+        assert knowledge.tags == ["gcp", "run"]
+        assert knowledge.status == "promoted"
+        assert knowledge.created_at == datetime(2024, 5, 1, 12, tzinfo=UTC)
+        assert knowledge.updated_at is None
+        assert knowledge.score == 0.25
+
+    # P1: 正常系 - 入力形式
+    def test_data_values_accepts_struct_and_dict(self):
+        """proto-plus maps, raw Structs and dicts decode alike; nulls are dropped."""
+        data_object = self._data_object(id="k-1", tags=["a"], pr_url=None)
+        raw = vectorsearch_v1beta.DataObject.pb(data_object).data
+
+        expected = {"id": "k-1", "tags": ["a"]}
+        assert data_values(data_object.data) == expected
+        assert data_values(raw) == expected
+        assert data_values(expected) is expected
+
+    # P1: 正常系 - 書き込んだフィールドの読み戻し
+    def test_written_fields_are_read_back(self):
+        """Every Knowledge field written survives the read projection."""
+        now = datetime(2024, 5, 1, tzinfo=UTC)
+        knowledge = Knowledge(
+            id="k-1",
+            title="T",
+            content="C",
+            tags=["a"],
+            source="team",
+            status="promoted",
+            github_path="docs/a.md",
+            promoted_from_id="k-0",
+            source_hash="sha-123",
+            created_at=now,
+            updated_at=now,
+        )
+        written = knowledge_to_data(knowledge)
+
+        # Reads return only the requested data fields
+        read = knowledge_from_data(
+            {name: written[name] for name in KNOWLEDGE_DATA_FIELDS}
+        )
+
+        assert read == knowledge
+        assert read.source_hash == "sha-123"
+
+    # P2: 正常系 - ID フォールバック
+    def test_data_object_without_id_uses_resource_id(self):
+        """The resource name's ID is used when the data has none."""
+        knowledge = knowledge_from_data_object("k-9", self._data_object(title="T"))
+
+        assert knowledge.id == "k-9"
+        assert knowledge.title == "T"
+
+    # P2: 正常系 - 日時パースのキャッシュ
+    def test_parse_datetime_is_cached(self):
+        """The same timestamp string yields the same datetime object."""
+        value = "2024-05-01T12:00:00+00:00"
+
+        assert parse_datetime(value) is parse_datetime(value)
+        assert parse_datetime("not a date") is None
+        assert parse_datetime(None) is None
+
+
+class TestBuildFilter:
+    """Tests for SearchFilter translation."""
+
+    def test_empty_filter_is_none(self):
+        """No constraints means no filter expression."""
+        assert build_filter(None) is None
+        assert build_filter(SearchFilter()) is None
+
+    def test_single_condition(self):
+        """A single constraint is not wrapped in $and."""
+        assert build_filter(SearchFilter(status="draft")) == {
+            "status": {"$eq": "draft"}
+        }
+
+    def test_combined_conditions(self):
+        """Multiple constraints are combined with $and."""
+        expression = build_filter(
+            SearchFilter(source="team", user_id="u1", tags=("a", "b"))
+        )
+
+        assert expression == {
+            "$and": [
+                {"source": {"$eq": "team"}},
+                {"user_id": {"$eq": "u1"}},
+                {"tags": {"$in": ["a", "b"]}},
+            ]
+        }
+
+    def test_search_pushes_filter_into_request(self):
+        """search() sends the filter with the semantic search."""
+        with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
+            repo = VectorSearchKnowledgeRepository()
+        repo._search_client = MagicMock()
+        repo._search_client.search_data_objects.return_value = MagicMock(results=[])
+
+        repo.search("q", filters=SearchFilter(status="promoted"))
+
+        request = repo._search_client.search_data_objects.call_args.kwargs["request"]
+        assert request.semantic_search.filter["status"]["$eq"] == "promoted"
+
+    def test_search_text_mode_sends_text_search(self):
+        """mode="text" sends a keyword search over title and content."""
+        with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
+            repo = VectorSearchKnowledgeRepository()
+        repo._search_client = MagicMock()
+        repo._search_client.search_data_objects.return_value = MagicMock(results=[])
+
+        repo.search("ERR_CONN_RESET", mode="text")
+
+        request = repo._search_client.search_data_objects.call_args.kwargs["request"]
+        assert request.text_search.search_text == "ERR_CONN_RESET"
+        assert list(request.text_search.data_field_names) == ["title", "content"]
+
+    def test_hybrid_search_survives_failed_branch(self):
+        """Hybrid search falls back to the branch that succeeded."""
+        with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
+            repo = VectorSearchKnowledgeRepository()
+
+        def search(request, timeout=None):
+            if request.text_search.search_text:
+                raise GoogleAPICallError("text search unavailable")
+            hit = MagicMock(data_object=MagicMock(data={"id": "a"}), distance=0.1)
+            return MagicMock(results=[hit])
+
+        repo._search_client = MagicMock()
+        repo._search_client.search_data_objects.side_effect = search
+
+        result = repo.search("q", mode="hybrid")
+
+        assert [item.id for item in result.items] == ["a"]
+
+    def test_close_stops_hybrid_thread_pool(self):
+        """close() shuts down the pool that runs hybrid text branches."""
+        with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
+            repo = VectorSearchKnowledgeRepository()
+        repo._search_client = MagicMock()
+        repo._search_client.search_data_objects.return_value = MagicMock(results=[])
+        repo.search("q", mode="hybrid")
+        executor = repo._hybrid_executor
+
+        repo.close()
+
+        assert repo._hybrid_executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+
+class TestVectorSearchKnowledgeRepositoryFindBy:
+    """Tests for exact-match lookups backed by the secondary index."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
+            self.repo = VectorSearchKnowledgeRepository()
+            self.repo._data_object_client = MagicMock()
+            self.repo._search_client = MagicMock()
+
+    def test_find_by_github_path_queries_and_indexes(self):
+        """A miss runs an exact-match query; the next lookup uses get()."""
+        data = {"id": "k1", "title": "T", "github_path": "docs/a.md"}
+        self.repo._search_client.query_data_objects.return_value = MagicMock(
+            data_objects=[MagicMock(data=data)]
+        )
+        self.repo._data_object_client.get_data_object.return_value = MagicMock(
+            data=data
+        )
+
+        first = self.repo.find_by_github_path("docs/a.md")
+        second = self.repo.find_by_github_path("docs/a.md")
+
+        assert first is not None
+        assert first.id == "k1"
+        assert second is not None
+        assert second.id == "k1"
+        request = self.repo._search_client.query_data_objects.call_args.kwargs[
+            "request"
+        ]
+        assert request.filter["github_path"]["$eq"] == "docs/a.md"
+        self.repo._search_client.query_data_objects.assert_called_once()
+        self.repo._data_object_client.get_data_object.assert_called_once()
+
+    def test_find_by_pr_url_not_found(self):
+        """No matching object returns None."""
+        self.repo._search_client.query_data_objects.return_value = MagicMock(
+            data_objects=[]
+        )
+
+        assert self.repo.find_by_pr_url("https://github.com/o/r/pull/1") is None
+
+    def test_update_status_indexes_pr_url(self):
+        """update_status() writes the new pr_url through to the index."""
+        data = {"id": "k1", "title": "T", "pr_url": "https://pr/1"}
+        self.repo._data_object_client.update_data_object.return_value = MagicMock(
+            data=data
+        )
+        self.repo.update_status("k1", "proposed", pr_url="https://pr/1")
+
+        self.repo._data_object_client.get_data_object.return_value = MagicMock(
+            data=data
+        )
+        result = self.repo.find_by_pr_url("https://pr/1")
+
+        assert result is not None
+        assert result.id == "k1"
+        self.repo._search_client.query_data_objects.assert_not_called()
+
+    def test_delete_drops_index_entry(self):
+        """delete() removes the knowledge from the index."""
+        self.repo._index.put(Knowledge(id="k1", title="", content="", pr_url="u"))
+
+        self.repo.delete("k1")
+
+        assert self.repo._index.id_for_pr_url("u") is None